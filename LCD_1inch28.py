@@ -1,6 +1,11 @@
-from machine import Pin,I2C,SPI,PWM,Timer,ADC
+from machine import Pin,I2C,SPI,PWM,Timer,ADC,mem32
 import framebuf
 import time
+import sys
+try:
+    import rp2
+except ImportError:
+    rp2 = None
 Vbat_Pin = 29
 
 #Pin definition  引脚定义
@@ -18,9 +23,36 @@ RST = 13
 
 BL = 25
 
+#SPI1 registers and DMA request line for DMA flushes  DMA刷新用的SPI1寄存器和DREQ
+if 'RP2040' in getattr(sys.implementation, '_machine', ''):
+    SPI1_BASE = 0x40040000
+    DREQ_SPI1_TX = 18
+else:  # RP2350
+    SPI1_BASE = 0x40088000
+    DREQ_SPI1_TX = 26
+SPI_SSPDR = 0x008    # Data register
+SPI_SSPSR = 0x00C    # Status register
+SPI_SSPICR = 0x020   # Interrupt clear register
+SSPSR_RNE = 0x04     # RX FIFO not empty
+SSPSR_BSY = 0x10     # Shifting a frame out
+
+#GC9A01 sleep in/out: wait this long before the opposite command (and
+#before display on after sleep out)  睡眠进出所需等待时间
+SLEEP_SETTLE_MS = 120
+
 #LCD Driver  LCD驱动
+#Double buffering: drawing always goes to self.buffer; show() and
+#show_rect() copy the frame (or the rectangle, packed) into self.txbuf
+#and start a DMA transfer from it, then return while the panel is still
+#being written. The next flush, or any command, waits for that transfer
+#first (wait()). The copy is a memcpy (~0.3 ms for a full frame) because
+#a FrameBuffer cannot be pointed at another buffer after it is created.
+#Without rp2.DMA, or with dma=False, flushes block as before.
+#双缓冲：绘图写入self.buffer，刷新时复制到self.txbuf并用DMA发送
 class LCD_1inch28(framebuf.FrameBuffer):
-    def __init__(self): #SPI initialization  SPI初始化
+    #clear=False skips the initial white frame (the caller pushes the
+    #first frame; the backlight stays off until set_bl_pwm())
+    def __init__(self, dma=True, clear=True): #SPI initialization  SPI初始化
         self.width = 240
         self.height = 240
         
@@ -33,6 +65,19 @@ class LCD_1inch28(framebuf.FrameBuffer):
         self.dc(1)
         self.buffer = bytearray(self.height * self.width * 2)
         super().__init__(self.buffer, self.width, self.height, framebuf.RGB565)
+
+        #DMA flush: second buffer owned by the transfer in progress
+        self.txbuf = None
+        self._dma = None
+        self._busy = False
+        self.flush_waits = 0  #Flushes that had to wait for the previous one
+        self.asleep = False
+        self._sleep_at = time.ticks_ms()  #Last sleep in/out command
+        if dma and rp2 is not None:
+            self.txbuf = bytearray(len(self.buffer))
+            self._dma = rp2.DMA()
+            self._dma_ctrl = self._dma.pack_ctrl(size=0, inc_read=True, inc_write=False,
+                                                 treq_sel=DREQ_SPI1_TX)
         self.init_display()
         
         #Define color, Micropython fixed to BRG format  定义颜色，Micropython固定为BRG格式
@@ -43,13 +88,16 @@ class LCD_1inch28(framebuf.FrameBuffer):
         self.black =   0x0000
         self.brown =   0X8430
         
-        self.fill(self.white) #Clear screen  清屏
-        self.show()#Show  显示
+        if clear:
+            self.fill(self.white) #Clear screen  清屏
+            self.show()#Show  显示
 
         self.pwm = PWM(Pin(BL))
         self.pwm.freq(5000) #Turn on the backlight  开背光
         
     def write_cmd(self, cmd): #Write command  写命令
+        if self._busy:
+            self.wait()
         self.cs(1)
         self.dc(0)
         self.cs(0)
@@ -57,6 +105,8 @@ class LCD_1inch28(framebuf.FrameBuffer):
         self.cs(1)
 
     def write_data(self, buf): #Write data  写数据
+        if self._busy:
+            self.wait()
         self.cs(1)
         self.dc(1)
         self.cs(0)
@@ -65,7 +115,32 @@ class LCD_1inch28(framebuf.FrameBuffer):
         
     def set_bl_pwm(self,duty): #Set screen brightness  设置屏幕亮度
         self.pwm.duty_u16(duty)#max 65535
-        
+
+    #Display off and sleep in; the panel keeps its RAM and still accepts
+    #frames (show()) while asleep  关显示并进入睡眠
+    def sleep(self):
+        self.write_cmd(0x28)
+        self.write_cmd(0x10)
+        self.asleep = True
+        self._sleep_at = time.ticks_ms()
+
+    #Sleep out; the panel stays dark until display_on(), so a frame can be
+    #drawn and flushed while it settles  退出睡眠
+    def wake(self):
+        wait = SLEEP_SETTLE_MS - time.ticks_diff(time.ticks_ms(), self._sleep_at)
+        if wait > 0:
+            time.sleep_ms(wait)  #Sleep out no sooner than 120 ms after sleep in
+        self.write_cmd(0x11)
+        self.asleep = False
+        self._sleep_at = time.ticks_ms()
+
+    #Display on once SLEEP_SETTLE_MS have passed since wake()  开显示
+    def display_on(self):
+        wait = SLEEP_SETTLE_MS - time.ticks_diff(time.ticks_ms(), self._sleep_at)
+        if wait > 0:
+            time.sleep_ms(wait)
+        self.write_cmd(0x29)
+
     def init_display(self): #LCD initialization  LCD初始化
         """Initialize dispaly"""  
         self.rst(1)
@@ -325,8 +400,45 @@ class LCD_1inch28(framebuf.FrameBuffer):
         
         self.write_cmd(0x2C)
      
+    #Wait until the DMA flush in progress has finished (fence before
+    #reusing txbuf or the SPI bus)  等待DMA刷新完成
+    def wait(self):
+        if not self._busy:
+            return
+        if self._dma.active():
+            self.flush_waits += 1
+            while self._dma.active():
+                time.sleep_us(10)
+        while mem32[SPI1_BASE + SPI_SSPSR] & SSPSR_BSY:
+            pass
+        #Drop what was clocked in during the TX-only transfer
+        while mem32[SPI1_BASE + SPI_SSPSR] & SSPSR_RNE:
+            mem32[SPI1_BASE + SPI_SSPDR]
+        mem32[SPI1_BASE + SPI_SSPICR] = 1  #Clear RX overrun
+        self.cs(1)
+        self._busy = False
+
+    #True while a DMA flush is still writing the panel  DMA刷新进行中
+    def busy(self):
+        return self._busy and self._dma.active()
+
+    #Start sending txbuf[:n] (window already set); returns at once
+    def _start_dma(self, n):
+        self.cs(1)
+        self.dc(1)
+        self.cs(0)
+        self._busy = True
+        self._dma.config(read=self.txbuf, write=SPI1_BASE + SPI_SSPDR, count=n,
+                         ctrl=self._dma_ctrl, trigger=True)
+
     #Show  显示   
     def show(self): 
+        if self._dma is not None:
+            self.wait()
+            self.txbuf[:] = self.buffer
+            self.setWindows(0,0,self.width,self.height)
+            self._start_dma(len(self.txbuf))
+            return
         self.setWindows(0,0,self.width,self.height)
         
         self.cs(1)
@@ -334,7 +446,43 @@ class LCD_1inch28(framebuf.FrameBuffer):
         self.cs(0)
         self.spi.write(self.buffer)
         self.cs(1)
-        
+
+    #Partial display of exactly the rectangle x, y, w, h (no padding)
+    #局部显示，仅刷新给定矩形
+    def show_rect(self,x,y,w,h):
+        if w <= 0 or h <= 0:
+            return
+        if self._dma is not None:
+            #Pack the rectangle's rows so one transfer fills the window
+            self.wait()
+            buf = memoryview(self.buffer)
+            tx = memoryview(self.txbuf)
+            row = self.width * 2
+            n = w * 2
+            if x == 0 and w == self.width:
+                tx[:h*row] = buf[y*row : (y+h)*row]
+            else:
+                Addr = (x * 2) + (y * row)
+                for i in range(h):
+                    tx[i*n : (i+1)*n] = buf[Addr : Addr+n]
+                    Addr += row
+            self.setWindows(x,y,x+w,y+h)
+            self._start_dma(w*h*2)
+            return
+        self.setWindows(x,y,x+w,y+h)
+        self.cs(1)
+        self.dc(1)
+        self.cs(0)
+        buf = memoryview(self.buffer)
+        row = self.width * 2
+        if x == 0 and w == self.width:
+            self.spi.write(buf[y*row : (y+h)*row])
+        else:
+            for i in range(y,y+h):
+                Addr = (x * 2) + (i * row)
+                self.spi.write(buf[Addr : Addr+(w*2)])
+        self.cs(1)
+
     '''
         Partial display, the starting point of the local
         display here is reduced by 10, and the end point
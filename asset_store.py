@@ -0,0 +1,127 @@
+# Asset Store
+# Read-only access to converted images, without copying them.
+#
+# A store knows each image's name, format and size without loading it, and
+# hands out the image data as a memoryview over wherever it already lives:
+#
+#     ModuleStore  image_data.py + img_<name>.py modules. Built with
+#                  "chunk_size": 0 and frozen into the firmware, each image
+#                  is one bytes object in flash, and its memoryview reads
+#                  it in place (XIP), costing no RAM. Chunked modules (the
+#                  default, for mpremote cp) give their tuple of chunks.
+#     BinStore     A directory of <name>.bin files and index.json from
+#                  tools/build_assets.py ("bin" bundle). Memory-mapped
+#                  where mmap exists (the host), otherwise read once into
+#                  a bytearray.
+#
+# image() returns what image_display.py draws: an RGB565 memoryview (or
+# tuple of chunks), or for palette-indexed images a (format, width,
+# height, palette, data) tuple whose palette and data are memoryviews.
+# load_image_to_framebuffer() and restore_background() copy straight from
+# these views into the LCD buffer. framebuf can only blit from writable
+# buffers, so indexed images get one RAM copy when prepared
+# (image_display.prepare_image()).
+#
+# Example:
+#     from asset_store import ModuleStore
+#     from image_display import display_image_background
+#
+#     store = ModuleStore()
+#     print(store.names(), store.info('background1'))
+#     display_image_background(lcd, store.image('background1'))
+
+try:
+    import mmap
+except ImportError:
+    mmap = None  # MicroPython: bin files are read into RAM
+
+
+class ModuleStore:
+    """Images from the generated image_data index and img_<name>.py modules."""
+
+    def __init__(self):
+        import image_data
+        self.catalog = image_data
+
+    def names(self):
+        """Image names, in assets.json order."""
+        return self.catalog.get_image_names()
+
+    def info(self, name):
+        """(format, width, height, bytes) of an image, or None if unknown."""
+        return self.catalog.get_image_info(name)
+
+    def image(self, name):
+        """
+        The image data, viewed in place.
+
+        Returns:
+            memoryview (or tuple of chunks) for RGB565 images, a (format,
+            width, height, palette, data) tuple for indexed images, or None
+        """
+        data = self.catalog.get_image(name)
+        if isinstance(data, bytes):
+            return memoryview(data)
+        if isinstance(data, tuple) and len(data) == 5 and isinstance(data[0], str):
+            fmt, width, height, palette, chunks = data
+            if isinstance(chunks, bytes):
+                chunks = memoryview(chunks)
+            return (fmt, width, height, memoryview(palette), chunks)
+        return data
+
+    def release(self, name):
+        """Drop the image's module; views handed out keep its data alive."""
+        self.catalog.unload_image(name)
+
+
+class BinStore:
+    """Images from a directory of raw .bin/.pal files with an index.json."""
+
+    def __init__(self, path):
+        """
+        Args:
+            path: Directory written by a "bin" bundle of tools/build_assets.py
+        """
+        import json
+        self.path = path
+        with open(path + "/index.json") as f:
+            index = json.load(f)
+        self._names = index["names"]
+        self._images = index["images"]
+
+    def names(self):
+        """Image names, in assets.json order."""
+        return list(self._names)
+
+    def info(self, name):
+        """(format, width, height, bytes) of an image, or None if unknown."""
+        info = self._images.get(name)
+        return tuple(info) if info else None
+
+    def _view(self, filename):
+        with open(self.path + "/" + filename, "rb") as f:
+            if mmap is not None:
+                # The mapping outlives the file and is unmapped once the
+                # last view of it is gone
+                return memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+            return memoryview(f.read())
+
+    def image(self, name):
+        """
+        The image data as read-only memoryviews (memory-mapped where possible).
+
+        Returns:
+            memoryview for RGB565 images, a (format, width, height, palette,
+            data) tuple for indexed images, or None if unknown
+        """
+        info = self._images.get(name)
+        if info is None:
+            return None
+        fmt, width, height = info[0], info[1], info[2]
+        data = self._view(name + ".bin")
+        if fmt == "RGB565":
+            return data
+        return (fmt, width, height, self._view(name + ".pal"), data)
+
+    def release(self, name):
+        """Nothing to drop: each view holds its own mapping."""
@@ -9,8 +9,7 @@ Copy this file to your HA-Waveshare-Display repository.
 
 from LCD_1inch28 import LCD_1inch28
 from circular_gauge import CircularGauge, rgb_to_brg565
-from image_display import display_image_with_overlays
-from image_data import get_image
+from image_display import display_image_with_overlays, restore_background
 import time
 
 class BatteryMonitor:
@@ -31,13 +30,15 @@ class BatteryMonitor:
     # Staleness threshold (3x poll interval = 15 seconds)
     STALENESS_TIMEOUT_MS = 15000
 
-    def __init__(self, lcd, image_index=0):
+    def __init__(self, lcd, image_index=0, images=None):
         """
         Initialize battery monitor display
 
         Args:
             lcd: LCD_1inch28 display instance
             image_index: Which background image to use (default 0)
+            images: ImageCache the background comes from (default: a
+                    cache of its own, created on the first render)
         """
         self.lcd = lcd
         self.current_soc = None
@@ -59,27 +60,50 @@ class BatteryMonitor:
             clockwise=True
         )
 
-        # Load background image
+        # Background image: looked up in the image cache on the first
+        # render rather than at boot (see load_image()), then fetched from
+        # it for each render so the cache decides what stays in RAM
+        self.image_index = image_index
+        self.image_name = None
+        self.images = images
+        self.image_loaded = False
+
+        # Filled segments on screen since the last render(), or None when
+        # the screen may show something else (update_gauge() redraws then)
+        self.drawn_filled = None
+
+    def load_image(self):
+        """Pick the background image by index (once)"""
+        if self.image_loaded:
+            return
+        self.image_loaded = True
         try:
-            from image_data import get_image_names
-            img_names = get_image_names()
-            if img_names and len(img_names) > image_index:
-                img_name = img_names[image_index]
-                self.image_data = get_image(img_name)
-                print(f"Battery monitor: Loaded image '{img_name}'")
+            if self.images is None:
+                from image_cache import ImageCache
+                self.images = ImageCache()
+            img_names = self.images.names()
+            if img_names and len(img_names) > self.image_index:
+                self.image_name = img_names[self.image_index]
+                print(f"Battery monitor: Using image '{self.image_name}'")
             else:
-                print(f"Warning: No image at index {image_index}")
-                self.image_data = None
+                print(f"Warning: No image at index {self.image_index}")
         except Exception as e:
-            print(f"Warning: Failed to load image {image_index}: {e}")
-            self.image_data = None
+            print(f"Warning: Failed to load image {self.image_index}: {e}")
 
-    def update_soc(self, soc_percentage):
+    def background(self):
+        """The prepared background image (from the cache), or None"""
+        self.load_image()
+        if self.image_name is None:
+            return None
+        return self.images.get(self.image_name)
+
+    def update_soc(self, soc_percentage, render=True):
         """
         Update displayed battery SOC
 
         Args:
             soc_percentage: Battery SOC 0-100
+            render: Render now (False when another core draws the page)
 
         Returns:
             True if updated successfully, False otherwise
@@ -102,27 +126,95 @@ class BatteryMonitor:
         self.last_update_ms = time.ticks_ms()
 
         # Render to display
-        self.render()
+        if render:
+            self.render()
 
         return True
 
-    def render(self):
-        """Render image + gauge to display"""
+    def render(self, soc=None, show=True):
+        """
+        Render image + gauge to display
+
+        Args:
+            soc: SOC to draw (default: the last value from update_soc())
+            show: Flush to the panel (False: caller draws more, then show())
+        """
+        image = self.background()
+
         # Use default if no data yet
-        soc = self.current_soc if self.current_soc is not None else 0
+        if soc is None:
+            soc = self.current_soc if self.current_soc is not None else 0
 
         # Render image with gauge overlay
-        if self.image_data:
+        if image:
             display_image_with_overlays(
                 lcd=self.lcd,
-                image_data=self.image_data,
-                gauge_items=[(self.gauge, soc)]
+                image_data=image,
+                gauge_items=[(self.gauge, soc)],
+                show=show
             )
         else:
             # Fallback: just draw gauge on black background
             self.lcd.fill(0x0000)  # Black
             self.gauge.draw_full(soc)
-            self.lcd.show()
+            if show:
+                self.lcd.show()
+        self.drawn_filled = self.gauge.filled_count(soc)
+
+    def update_gauge(self, soc, show=True):
+        """
+        Redraw only the gauge segments that changed since the last render
+        and flush each one's bounding box, instead of the whole frame.
+        Needs the last render() still on screen: call render() after
+        anything else drew over the page (falls back to it before the
+        first render).
+
+        A filled segment is drawn in the gauge colour, an emptied one in
+        its unfilled colour, or, for a gauge without one, the background
+        image's pixels under it are copied back.
+
+        Args:
+            soc: SOC to draw
+            show: Flush the changed segments to the panel
+
+        Returns:
+            List of changed (x, y, w, h) segment boxes (flushed if show)
+        """
+        if self.drawn_filled is None:
+            self.render(soc, show)
+            return [(0, 0, self.lcd.width, self.lcd.height)]
+
+        gauge = self.gauge
+        gauge.value = max(0, min(100, soc))
+        filled = gauge.filled_count(soc)
+        old = self.drawn_filled
+        if filled == old:
+            return []
+        self.drawn_filled = filled
+
+        rects = []
+        for i in range(min(old, filled), max(old, filled)):
+            if i < filled:
+                gauge.draw_segment(i, gauge.color)
+            elif gauge.background_color is not None:
+                gauge.draw_segment(i, gauge.background_color)
+            else:
+                self._restore_segment(i)
+            rect = gauge.segment_bbox(i)
+            if rect:
+                rects.append(rect)
+                if show:
+                    self.lcd.show_rect(*rect)
+        return rects
+
+    def _restore_segment(self, i):
+        """Copy the background pixels under segment i back (black without one)"""
+        image = self.background()
+        spans = self.gauge.segment_spans(i)
+        for k in range(0, len(spans), 3):
+            y, x, w = spans[k], spans[k + 1], spans[k + 2]
+            if not (image and restore_background(self.lcd, image, x, y, w, 1)):
+                self.lcd.hline(x, y, w, 0x0000)
 
     def is_stale(self, timeout_ms=None):
         """
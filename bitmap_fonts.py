@@ -1,322 +1,37 @@
 # Bitmap Font Handler for LCD_1inch28
 # This module provides custom bitmap fonts for better-looking large text displays
 
-# Large digit font (16x24 pixels per character)
-# Format: Each digit is represented as a list of 24 rows, each row is 16 bits (2 bytes)
-# 1 = pixel on, 0 = pixel off
+# Large digit font (16x24 pixels per character), a fonts.Font
+# Glyphs: 24 rows of 2 bytes each (MONO_HLSB, leftmost pixel in the top bit)
 
-LARGE_DIGITS = {
-    '0': [
-        0b0000111111110000,
-        0b0011111111111100,
-        0b0111111111111110,
-        0b0111100000011110,
-        0b1111000000001111,
-        0b1110000000000111,
-        0b1110000000000111,
-        0b1110000000000111,
-        0b1110000000000111,
-        0b1110000000000111,
-        0b1110000000000111,
-        0b1110000000000111,
-        0b1110000000000111,
-        0b1110000000000111,
-        0b1110000000000111,
-        0b1110000000000111,
-        0b1110000000000111,
-        0b1111000000001111,
-        0b0111100000011110,
-        0b0111111111111110,
-        0b0011111111111100,
-        0b0000111111110000,
-        0b0000000000000000,
-        0b0000000000000000,
-    ],
-    '1': [
-        0b0000000110000000,
-        0b0000001110000000,
-        0b0000011110000000,
-        0b0000111110000000,
-        0b0001111110000000,
-        0b0011101110000000,
-        0b0111001110000000,
-        0b0000001110000000,
-        0b0000001110000000,
-        0b0000001110000000,
-        0b0000001110000000,
-        0b0000001110000000,
-        0b0000001110000000,
-        0b0000001110000000,
-        0b0000001110000000,
-        0b0000001110000000,
-        0b0000001110000000,
-        0b0000001110000000,
-        0b0000001110000000,
-        0b0111111111111110,
-        0b0111111111111110,
-        0b0111111111111110,
-        0b0000000000000000,
-        0b0000000000000000,
-    ],
-    '2': [
-        0b0000111111110000,
-        0b0011111111111100,
-        0b0111111111111110,
-        0b0111100000011110,
-        0b1110000000001111,
-        0b1110000000000111,
-        0b0000000000000111,
-        0b0000000000001111,
-        0b0000000000011110,
-        0b0000000000111100,
-        0b0000000001111000,
-        0b0000000011110000,
-        0b0000000111100000,
-        0b0000001111000000,
-        0b0000011110000000,
-        0b0000111100000000,
-        0b0001111000000000,
-        0b0011110000000000,
-        0b0111100000000000,
-        0b0111111111111110,
-        0b0111111111111110,
-        0b0111111111111110,
-        0b0000000000000000,
-        0b0000000000000000,
-    ],
-    '3': [
-        0b0000111111110000,
-        0b0011111111111100,
-        0b0111111111111110,
-        0b0111100000011110,
-        0b0000000000001111,
-        0b0000000000000111,
-        0b0000000000000111,
-        0b0000000000001111,
-        0b0000000000011110,
-        0b0000001111111100,
-        0b0000001111111100,
-        0b0000001111111100,
-        0b0000000000011110,
-        0b0000000000001111,
-        0b0000000000000111,
-        0b0000000000000111,
-        0b0000000000001111,
-        0b0111100000011110,
-        0b0111111111111110,
-        0b0011111111111100,
-        0b0000111111110000,
-        0b0000000000000000,
-        0b0000000000000000,
-        0b0000000000000000,
-    ],
-    '4': [
-        0b0000000000111000,
-        0b0000000001111000,
-        0b0000000011111000,
-        0b0000000111111000,
-        0b0000001111011000,
-        0b0000011110011000,
-        0b0000111100011000,
-        0b0001111000011000,
-        0b0011110000011000,
-        0b0111100000011000,
-        0b1111000000011000,
-        0b1110000000011000,
-        0b1111111111111111,
-        0b1111111111111111,
-        0b1111111111111111,
-        0b0000000000011000,
-        0b0000000000011000,
-        0b0000000000011000,
-        0b0000000000011000,
-        0b0000000000011000,
-        0b0000000000011000,
-        0b0000000000011000,
-        0b0000000000000000,
-        0b0000000000000000,
-    ],
-    '5': [
-        0b0111111111111110,
-        0b0111111111111110,
-        0b0111111111111110,
-        0b0111000000000000,
-        0b0111000000000000,
-        0b0111000000000000,
-        0b0111000000000000,
-        0b0111111111110000,
-        0b0111111111111100,
-        0b0111111111111110,
-        0b0000000000011110,
-        0b0000000000001111,
-        0b0000000000000111,
-        0b0000000000000111,
-        0b0000000000000111,
-        0b0000000000000111,
-        0b0000000000001111,
-        0b0111100000011110,
-        0b0111111111111110,
-        0b0011111111111100,
-        0b0000111111110000,
-        0b0000000000000000,
-        0b0000000000000000,
-        0b0000000000000000,
-    ],
-    '6': [
-        0b0000011111111000,
-        0b0001111111111110,
-        0b0011111111111110,
-        0b0111110000000000,
-        0b0111000000000000,
-        0b1110000000000000,
-        0b1110000000000000,
-        0b1110111111110000,
-        0b1111111111111100,
-        0b1111111111111110,
-        0b1111100000011110,
-        0b1110000000001111,
-        0b1110000000000111,
-        0b1110000000000111,
-        0b1110000000000111,
-        0b1110000000001111,
-        0b0111100000011110,
-        0b0111111111111110,
-        0b0011111111111100,
-        0b0000111111110000,
-        0b0000000000000000,
-        0b0000000000000000,
-        0b0000000000000000,
-        0b0000000000000000,
-    ],
-    '7': [
-        0b1111111111111110,
-        0b1111111111111110,
-        0b1111111111111110,
-        0b0000000000001110,
-        0b0000000000011110,
-        0b0000000000111100,
-        0b0000000000111000,
-        0b0000000001111000,
-        0b0000000001110000,
-        0b0000000011110000,
-        0b0000000011100000,
-        0b0000000111100000,
-        0b0000000111000000,
-        0b0000001111000000,
-        0b0000001110000000,
-        0b0000011110000000,
-        0b0000011100000000,
-        0b0000111100000000,
-        0b0000111000000000,
-        0b0001111000000000,
-        0b0001110000000000,
-        0b0001110000000000,
-        0b0000000000000000,
-        0b0000000000000000,
-    ],
-    '8': [
-        0b0000111111110000,
-        0b0011111111111100,
-        0b0111111111111110,
-        0b0111100000011110,
-        0b1110000000001111,
-        0b1110000000000111,
-        0b1110000000001111,
-        0b0111100000011110,
-        0b0011111111111100,
-        0b0000111111110000,
-        0b0011111111111100,
-        0b0111111111111110,
-        0b1111100000011111,
-        0b1110000000000111,
-        0b1110000000000111,
-        0b1110000000000111,
-        0b1110000000001111,
-        0b0111100000011110,
-        0b0111111111111110,
-        0b0011111111111100,
-        0b0000111111110000,
-        0b0000000000000000,
-        0b0000000000000000,
-        0b0000000000000000,
-    ],
-    '9': [
-        0b0000111111110000,
-        0b0011111111111100,
-        0b0111111111111110,
-        0b0111100000011110,
-        0b1110000000001111,
-        0b1110000000000111,
-        0b1110000000000111,
-        0b1110000000000111,
-        0b1110000000001111,
-        0b0111100000011111,
-        0b0111111111111111,
-        0b0011111111110111,
-        0b0000111111100111,
-        0b0000000000000111,
-        0b0000000000000111,
-        0b0000000000001110,
-        0b0000000000001110,
-        0b0111111111111110,
-        0b0111111111111100,
-        0b0011111111111000,
-        0b0000000000000000,
-        0b0000000000000000,
-        0b0000000000000000,
-        0b0000000000000000,
-    ],
-    ':': [
-        0b0000000000000000,
-        0b0000000000000000,
-        0b0000000000000000,
-        0b0000000000000000,
-        0b0000000000000000,
-        0b0000001111000000,
-        0b0000001111000000,
-        0b0000001111000000,
-        0b0000001111000000,
-        0b0000000000000000,
-        0b0000000000000000,
-        0b0000000000000000,
-        0b0000000000000000,
-        0b0000000000000000,
-        0b0000001111000000,
-        0b0000001111000000,
-        0b0000001111000000,
-        0b0000001111000000,
-        0b0000000000000000,
-        0b0000000000000000,
-        0b0000000000000000,
-        0b0000000000000000,
-        0b0000000000000000,
-        0b0000000000000000,
-    ],
-}
+from fonts import Font
 
-def draw_char(lcd, char, x, y, color):
-    """Draw a single character using bitmap font"""
-    if char not in LARGE_DIGITS:
-        return 16  # Return character width even if not found
+FONT = Font(16, 24, '0123456789:', (
+    b'\x0f\xf0\x3f\xfc\x7f\xfe\x78\x1e\xf0\x0f\xe0\x07\xe0\x07\xe0\x07\xe0\x07\xe0\x07\xe0\x07\xe0\x07\xe0\x07\xe0\x07\xe0\x07\xe0\x07\xe0\x07\xf0\x0f\x78\x1e\x7f\xfe\x3f\xfc\x0f\xf0\x00\x00\x00\x00'  # 0
+    b'\x01\x80\x03\x80\x07\x80\x0f\x80\x1f\x80\x3b\x80\x73\x80\x03\x80\x03\x80\x03\x80\x03\x80\x03\x80\x03\x80\x03\x80\x03\x80\x03\x80\x03\x80\x03\x80\x03\x80\x7f\xfe\x7f\xfe\x7f\xfe\x00\x00\x00\x00'  # 1
+    b'\x0f\xf0\x3f\xfc\x7f\xfe\x78\x1e\xe0\x0f\xe0\x07\x00\x07\x00\x0f\x00\x1e\x00\x3c\x00\x78\x00\xf0\x01\xe0\x03\xc0\x07\x80\x0f\x00\x1e\x00\x3c\x00\x78\x00\x7f\xfe\x7f\xfe\x7f\xfe\x00\x00\x00\x00'  # 2
+    b'\x0f\xf0\x3f\xfc\x7f\xfe\x78\x1e\x00\x0f\x00\x07\x00\x07\x00\x0f\x00\x1e\x03\xfc\x03\xfc\x03\xfc\x00\x1e\x00\x0f\x00\x07\x00\x07\x00\x0f\x78\x1e\x7f\xfe\x3f\xfc\x0f\xf0\x00\x00\x00\x00\x00\x00'  # 3
+    b'\x00\x38\x00\x78\x00\xf8\x01\xf8\x03\xd8\x07\x98\x0f\x18\x1e\x18\x3c\x18\x78\x18\xf0\x18\xe0\x18\xff\xff\xff\xff\xff\xff\x00\x18\x00\x18\x00\x18\x00\x18\x00\x18\x00\x18\x00\x18\x00\x00\x00\x00'  # 4
+    b'\x7f\xfe\x7f\xfe\x7f\xfe\x70\x00\x70\x00\x70\x00\x70\x00\x7f\xf0\x7f\xfc\x7f\xfe\x00\x1e\x00\x0f\x00\x07\x00\x07\x00\x07\x00\x07\x00\x0f\x78\x1e\x7f\xfe\x3f\xfc\x0f\xf0\x00\x00\x00\x00\x00\x00'  # 5
+    b'\x07\xf8\x1f\xfe\x3f\xfe\x7c\x00\x70\x00\xe0\x00\xe0\x00\xef\xf0\xff\xfc\xff\xfe\xf8\x1e\xe0\x0f\xe0\x07\xe0\x07\xe0\x07\xe0\x0f\x78\x1e\x7f\xfe\x3f\xfc\x0f\xf0\x00\x00\x00\x00\x00\x00\x00\x00'  # 6
+    b'\xff\xfe\xff\xfe\xff\xfe\x00\x0e\x00\x1e\x00\x3c\x00\x38\x00\x78\x00\x70\x00\xf0\x00\xe0\x01\xe0\x01\xc0\x03\xc0\x03\x80\x07\x80\x07\x00\x0f\x00\x0e\x00\x1e\x00\x1c\x00\x1c\x00\x00\x00\x00\x00'  # 7
+    b'\x0f\xf0\x3f\xfc\x7f\xfe\x78\x1e\xe0\x0f\xe0\x07\xe0\x0f\x78\x1e\x3f\xfc\x0f\xf0\x3f\xfc\x7f\xfe\xf8\x1f\xe0\x07\xe0\x07\xe0\x07\xe0\x0f\x78\x1e\x7f\xfe\x3f\xfc\x0f\xf0\x00\x00\x00\x00\x00\x00'  # 8
+    b'\x0f\xf0\x3f\xfc\x7f\xfe\x78\x1e\xe0\x0f\xe0\x07\xe0\x07\xe0\x07\xe0\x0f\x78\x1f\x7f\xff\x3f\xf7\x0f\xe7\x00\x07\x00\x07\x00\x0e\x00\x0e\x7f\xfe\x7f\xfc\x3f\xf8\x00\x00\x00\x00\x00\x00\x00\x00'  # 9
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x03\xc0\x03\xc0\x03\xc0\x03\xc0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x03\xc0\x03\xc0\x03\xc0\x03\xc0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'  # :
+), spacing=2)
 
-    bitmap = LARGE_DIGITS[char]
-    for row_idx, row_data in enumerate(bitmap):
-        for col in range(16):
-            if row_data & (1 << (15 - col)):
-                lcd.pixel(x + col, y + row_idx, color)
+def draw_char(lcd, char, x, y, color):
+    """Draw a single character using the 16x24 bitmap font"""
+    return FONT.draw_char(lcd, char, x, y, color)  # Character width for spacing
 
-    return 16  # Return character width for spacing
+def draw_text(lcd, text, x, y, color, spacing=2, length=None):
+    """Draw text using the 16x24 bitmap font
 
-def draw_text(lcd, text, x, y, color, spacing=2):
-    """Draw text using bitmap font"""
-    current_x = x
-    for char in text:
-        char_width = draw_char(lcd, char, current_x, y, color)
-        current_x += char_width + spacing
-    return current_x - x  # Return total width
+    text may also be a bytes-like buffer such as numfmt.FixedFormatter.buf,
+    with length giving the number of characters to draw.
+    """
+    return FONT.draw(lcd, text, x, y, color, spacing, length)  # Total width
 
 def get_text_width(text, spacing=2):
-    """Calculate the width of text in pixels"""
-    if not text:
-        return 0
-    return (16 * len(text)) + (spacing * (len(text) - 1))
+    """Calculate the width of text in pixels for the 16x24 font"""
+    return FONT.measure(text, spacing)
@@ -1,408 +1,35 @@
 # Large Bitmap Font Handler for LCD_1inch28
-# 24x32 pixel font - scaled up version for prominent displays
-# Format: Each digit is represented as a list of 32 rows, each row is 24 bits (3 bytes)
-# 1 = pixel on, 0 = pixel off
+# 24x32 pixel font - scaled up version for prominent displays, a fonts.Font
+# Glyphs: 32 rows of 3 bytes each (MONO_HLSB, leftmost pixel in the top bit)
 
-LARGE_DIGITS_32 = {
-    '0': [
-        0b000000111111111111000000,
-        0b000011111111111111110000,
-        0b000111111111111111111000,
-        0b001111111111111111111100,
-        0b001111110000000011111100,
-        0b011111000000000000111110,
-        0b011110000000000000011110,
-        0b111110000000000000011111,
-        0b111100000000000000001111,
-        0b111100000000000000001111,
-        0b111100000000000000001111,
-        0b111100000000000000001111,
-        0b111100000000000000001111,
-        0b111100000000000000001111,
-        0b111100000000000000001111,
-        0b111100000000000000001111,
-        0b111100000000000000001111,
-        0b111100000000000000001111,
-        0b111110000000000000011111,
-        0b011110000000000000011110,
-        0b011111000000000000111110,
-        0b001111110000000011111100,
-        0b001111111111111111111100,
-        0b000111111111111111111000,
-        0b000011111111111111110000,
-        0b000000111111111111000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-    ],
-    '1': [
-        0b000000000011110000000000,
-        0b000000000111110000000000,
-        0b000000001111110000000000,
-        0b000000011111110000000000,
-        0b000000111111110000000000,
-        0b000001111011110000000000,
-        0b000011110011110000000000,
-        0b000111100011110000000000,
-        0b001111000011110000000000,
-        0b011110000011110000000000,
-        0b011100000011110000000000,
-        0b000000000011110000000000,
-        0b000000000011110000000000,
-        0b000000000011110000000000,
-        0b000000000011110000000000,
-        0b000000000011110000000000,
-        0b000000000011110000000000,
-        0b000000000011110000000000,
-        0b000000000011110000000000,
-        0b000000000011110000000000,
-        0b000000000011110000000000,
-        0b000000000011110000000000,
-        0b011111111111111111111110,
-        0b011111111111111111111110,
-        0b011111111111111111111110,
-        0b011111111111111111111110,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-    ],
-    '2': [
-        0b000000111111111111000000,
-        0b000011111111111111110000,
-        0b000111111111111111111000,
-        0b001111111111111111111100,
-        0b011111110000000011111110,
-        0b011111000000000001111110,
-        0b111110000000000000111111,
-        0b111100000000000000011111,
-        0b000000000000000000011111,
-        0b000000000000000000111111,
-        0b000000000000000000111110,
-        0b000000000000000001111110,
-        0b000000000000000011111100,
-        0b000000000000000111111000,
-        0b000000000000001111110000,
-        0b000000000000111111100000,
-        0b000000000001111111000000,
-        0b000000000011111100000000,
-        0b000000000111111000000000,
-        0b000000001111110000000000,
-        0b000000011111100000000000,
-        0b000000111111000000000000,
-        0b011111111111111111111110,
-        0b011111111111111111111110,
-        0b011111111111111111111110,
-        0b011111111111111111111110,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-    ],
-    '3': [
-        0b000000111111111111000000,
-        0b000011111111111111110000,
-        0b000111111111111111111000,
-        0b001111111111111111111100,
-        0b011111110000000011111110,
-        0b111111000000000001111111,
-        0b000000000000000000111111,
-        0b000000000000000000111111,
-        0b000000000000000001111110,
-        0b000000000000000011111100,
-        0b000000000000111111111000,
-        0b000000000000111111111000,
-        0b000000000000111111111000,
-        0b000000000000111111111000,
-        0b000000000000000011111100,
-        0b000000000000000001111110,
-        0b000000000000000000111111,
-        0b000000000000000000111111,
-        0b000000000000000000111111,
-        0b111111000000000001111111,
-        0b011111110000000011111110,
-        0b001111111111111111111100,
-        0b000111111111111111111000,
-        0b000011111111111111110000,
-        0b000000111111111111000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-    ],
-    '4': [
-        0b000000000000111110000000,
-        0b000000000001111110000000,
-        0b000000000011111110000000,
-        0b000000000111111110000000,
-        0b000000001111111110000000,
-        0b000000011110011110000000,
-        0b000000111100011110000000,
-        0b000001111000011110000000,
-        0b000011110000011110000000,
-        0b000111100000011110000000,
-        0b001111000000011110000000,
-        0b011110000000011110000000,
-        0b111100000000011110000000,
-        0b111111111111111111111111,
-        0b111111111111111111111111,
-        0b111111111111111111111111,
-        0b111111111111111111111111,
-        0b000000000000011110000000,
-        0b000000000000011110000000,
-        0b000000000000011110000000,
-        0b000000000000011110000000,
-        0b000000000000011110000000,
-        0b000000000000011110000000,
-        0b000000000000011110000000,
-        0b000000000000011110000000,
-        0b000000000000011110000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-    ],
-    '5': [
-        0b011111111111111111111110,
-        0b011111111111111111111110,
-        0b011111111111111111111110,
-        0b011111111111111111111110,
-        0b011111000000000000000000,
-        0b011111000000000000000000,
-        0b011111000000000000000000,
-        0b011111000000000000000000,
-        0b011111000000000000000000,
-        0b011111111111111111000000,
-        0b011111111111111111110000,
-        0b011111111111111111111000,
-        0b011111111111111111111100,
-        0b000000000000000011111110,
-        0b000000000000000001111111,
-        0b000000000000000000111111,
-        0b000000000000000000111111,
-        0b000000000000000000111111,
-        0b000000000000000000111111,
-        0b000000000000000001111111,
-        0b111111000000000011111110,
-        0b001111111111111111111100,
-        0b000111111111111111111000,
-        0b000011111111111111110000,
-        0b000000111111111111000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-    ],
-    '6': [
-        0b000000001111111111110000,
-        0b000000111111111111111100,
-        0b000001111111111111111110,
-        0b000011111111111111111111,
-        0b000111111000000000000000,
-        0b001111110000000000000000,
-        0b011111100000000000000000,
-        0b011111000000000000000000,
-        0b111110000000000000000000,
-        0b111110001111111111000000,
-        0b111110111111111111110000,
-        0b111111111111111111111000,
-        0b111111111111111111111100,
-        0b111111111000000011111110,
-        0b111111100000000001111111,
-        0b111110000000000000111111,
-        0b111110000000000000111111,
-        0b111110000000000000111111,
-        0b111110000000000000111111,
-        0b111111000000000001111111,
-        0b011111100000000011111110,
-        0b001111111000000111111100,
-        0b000111111111111111111000,
-        0b000011111111111111110000,
-        0b000001111111111111100000,
-        0b000000011111111110000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-    ],
-    '7': [
-        0b111111111111111111111111,
-        0b111111111111111111111111,
-        0b111111111111111111111111,
-        0b111111111111111111111111,
-        0b000000000000000000111111,
-        0b000000000000000001111110,
-        0b000000000000000011111100,
-        0b000000000000000111111000,
-        0b000000000000000111110000,
-        0b000000000000001111110000,
-        0b000000000000001111100000,
-        0b000000000000011111100000,
-        0b000000000000011111000000,
-        0b000000000000111111000000,
-        0b000000000000111110000000,
-        0b000000000001111110000000,
-        0b000000000001111100000000,
-        0b000000000011111100000000,
-        0b000000000011111000000000,
-        0b000000000111111000000000,
-        0b000000000111110000000000,
-        0b000000001111110000000000,
-        0b000000001111100000000000,
-        0b000000011111100000000000,
-        0b000000011111000000000000,
-        0b000000011111000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-    ],
-    '8': [
-        0b000000111111111111000000,
-        0b000011111111111111110000,
-        0b000111111111111111111000,
-        0b001111111111111111111100,
-        0b011111110000000011111110,
-        0b111111000000000001111111,
-        0b111110000000000000111111,
-        0b111110000000000000111111,
-        0b111111000000000001111111,
-        0b011111110000000011111110,
-        0b001111111111111111111100,
-        0b000011111111111111110000,
-        0b000011111111111111110000,
-        0b001111111111111111111100,
-        0b011111110000000011111110,
-        0b111111000000000001111111,
-        0b111110000000000000111111,
-        0b111110000000000000111111,
-        0b111110000000000000111111,
-        0b111111000000000001111111,
-        0b011111110000000011111110,
-        0b001111111111111111111100,
-        0b000111111111111111111000,
-        0b000011111111111111110000,
-        0b000000111111111111000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-    ],
-    '9': [
-        0b000000111111111111000000,
-        0b000011111111111111110000,
-        0b000111111111111111111000,
-        0b001111111111111111111100,
-        0b011111110000000011111110,
-        0b111111000000000001111111,
-        0b111110000000000000111111,
-        0b111110000000000000111111,
-        0b111110000000000000111111,
-        0b111110000000000000111111,
-        0b111111000000000001111111,
-        0b011111110000000011111111,
-        0b001111111111111111111111,
-        0b000111111111111111111111,
-        0b000011111111111110111111,
-        0b000000111111111000111111,
-        0b000000000000000000111111,
-        0b000000000000000000111111,
-        0b000000000000000001111110,
-        0b000000000000000001111110,
-        0b000000000000000011111100,
-        0b000000000000000111111100,
-        0b001111111111111111111000,
-        0b000111111111111111110000,
-        0b000011111111111111100000,
-        0b000000111111111110000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-    ],
-    ':': [
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000011111110000000000,
-        0b000000011111110000000000,
-        0b000000011111110000000000,
-        0b000000011111110000000000,
-        0b000000011111110000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000011111110000000000,
-        0b000000011111110000000000,
-        0b000000011111110000000000,
-        0b000000011111110000000000,
-        0b000000011111110000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-    ],
-}
+from fonts import Font
 
-def draw_char_32(lcd, char, x, y, color):
-    """Draw a single character using 24x32 bitmap font"""
-    if char not in LARGE_DIGITS_32:
-        return 24  # Return character width even if not found
+FONT = Font(24, 32, '0123456789:', (
+    b'\x03\xff\xc0\x0f\xff\xf0\x1f\xff\xf8\x3f\xff\xfc\x3f\x00\xfc\x7c\x00\x3e\x78\x00\x1e\xf8\x00\x1f\xf0\x00\x0f\xf0\x00\x0f\xf0\x00\x0f\xf0\x00\x0f\xf0\x00\x0f\xf0\x00\x0f\xf0\x00\x0f\xf0\x00\x0f\xf0\x00\x0f\xf0\x00\x0f\xf8\x00\x1f\x78\x00\x1e\x7c\x00\x3e\x3f\x00\xfc\x3f\xff\xfc\x1f\xff\xf8\x0f\xff\xf0\x03\xff\xc0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'  # 0
+    b'\x00\x3c\x00\x00\x7c\x00\x00\xfc\x00\x01\xfc\x00\x03\xfc\x00\x07\xbc\x00\x0f\x3c\x00\x1e\x3c\x00\x3c\x3c\x00\x78\x3c\x00\x70\x3c\x00\x00\x3c\x00\x00\x3c\x00\x00\x3c\x00\x00\x3c\x00\x00\x3c\x00\x00\x3c\x00\x00\x3c\x00\x00\x3c\x00\x00\x3c\x00\x00\x3c\x00\x00\x3c\x00\x7f\xff\xfe\x7f\xff\xfe\x7f\xff\xfe\x7f\xff\xfe\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'  # 1
+    b'\x03\xff\xc0\x0f\xff\xf0\x1f\xff\xf8\x3f\xff\xfc\x7f\x00\xfe\x7c\x00\x7e\xf8\x00\x3f\xf0\x00\x1f\x00\x00\x1f\x00\x00\x3f\x00\x00\x3e\x00\x00\x7e\x00\x00\xfc\x00\x01\xf8\x00\x03\xf0\x00\x0f\xe0\x00\x1f\xc0\x00\x3f\x00\x00\x7e\x00\x00\xfc\x00\x01\xf8\x00\x03\xf0\x00\x7f\xff\xfe\x7f\xff\xfe\x7f\xff\xfe\x7f\xff\xfe\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'  # 2
+    b'\x03\xff\xc0\x0f\xff\xf0\x1f\xff\xf8\x3f\xff\xfc\x7f\x00\xfe\xfc\x00\x7f\x00\x00\x3f\x00\x00\x3f\x00\x00\x7e\x00\x00\xfc\x00\x0f\xf8\x00\x0f\xf8\x00\x0f\xf8\x00\x0f\xf8\x00\x00\xfc\x00\x00\x7e\x00\x00\x3f\x00\x00\x3f\x00\x00\x3f\xfc\x00\x7f\x7f\x00\xfe\x3f\xff\xfc\x1f\xff\xf8\x0f\xff\xf0\x03\xff\xc0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'  # 3
+    b'\x00\x0f\x80\x00\x1f\x80\x00\x3f\x80\x00\x7f\x80\x00\xff\x80\x01\xe7\x80\x03\xc7\x80\x07\x87\x80\x0f\x07\x80\x1e\x07\x80\x3c\x07\x80\x78\x07\x80\xf0\x07\x80\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x00\x07\x80\x00\x07\x80\x00\x07\x80\x00\x07\x80\x00\x07\x80\x00\x07\x80\x00\x07\x80\x00\x07\x80\x00\x07\x80\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'  # 4
+    b'\x7f\xff\xfe\x7f\xff\xfe\x7f\xff\xfe\x7f\xff\xfe\x7c\x00\x00\x7c\x00\x00\x7c\x00\x00\x7c\x00\x00\x7c\x00\x00\x7f\xff\xc0\x7f\xff\xf0\x7f\xff\xf8\x7f\xff\xfc\x00\x00\xfe\x00\x00\x7f\x00\x00\x3f\x00\x00\x3f\x00\x00\x3f\x00\x00\x3f\x00\x00\x7f\xfc\x00\xfe\x3f\xff\xfc\x1f\xff\xf8\x0f\xff\xf0\x03\xff\xc0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'  # 5
+    b'\x00\xff\xf0\x03\xff\xfc\x07\xff\xfe\x0f\xff\xff\x1f\x80\x00\x3f\x00\x00\x7e\x00\x00\x7c\x00\x00\xf8\x00\x00\xf8\xff\xc0\xfb\xff\xf0\xff\xff\xf8\xff\xff\xfc\xff\x80\xfe\xfe\x00\x7f\xf8\x00\x3f\xf8\x00\x3f\xf8\x00\x3f\xf8\x00\x3f\xfc\x00\x7f\x7e\x00\xfe\x3f\x81\xfc\x1f\xff\xf8\x0f\xff\xf0\x07\xff\xe0\x01\xff\x80\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'  # 6
+    b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x00\x00\x3f\x00\x00\x7e\x00\x00\xfc\x00\x01\xf8\x00\x01\xf0\x00\x03\xf0\x00\x03\xe0\x00\x07\xe0\x00\x07\xc0\x00\x0f\xc0\x00\x0f\x80\x00\x1f\x80\x00\x1f\x00\x00\x3f\x00\x00\x3e\x00\x00\x7e\x00\x00\x7c\x00\x00\xfc\x00\x00\xf8\x00\x01\xf8\x00\x01\xf0\x00\x01\xf0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'  # 7
+    b'\x03\xff\xc0\x0f\xff\xf0\x1f\xff\xf8\x3f\xff\xfc\x7f\x00\xfe\xfc\x00\x7f\xf8\x00\x3f\xf8\x00\x3f\xfc\x00\x7f\x7f\x00\xfe\x3f\xff\xfc\x0f\xff\xf0\x0f\xff\xf0\x3f\xff\xfc\x7f\x00\xfe\xfc\x00\x7f\xf8\x00\x3f\xf8\x00\x3f\xf8\x00\x3f\xfc\x00\x7f\x7f\x00\xfe\x3f\xff\xfc\x1f\xff\xf8\x0f\xff\xf0\x03\xff\xc0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'  # 8
+    b'\x03\xff\xc0\x0f\xff\xf0\x1f\xff\xf8\x3f\xff\xfc\x7f\x00\xfe\xfc\x00\x7f\xf8\x00\x3f\xf8\x00\x3f\xf8\x00\x3f\xf8\x00\x3f\xfc\x00\x7f\x7f\x00\xff\x3f\xff\xff\x1f\xff\xff\x0f\xff\xbf\x03\xfe\x3f\x00\x00\x3f\x00\x00\x3f\x00\x00\x7e\x00\x00\x7e\x00\x00\xfc\x00\x01\xfc\x3f\xff\xf8\x1f\xff\xf0\x0f\xff\xe0\x03\xff\x80\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'  # 9
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\xfc\x00\x01\xfc\x00\x01\xfc\x00\x01\xfc\x00\x01\xfc\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\xfc\x00\x01\xfc\x00\x01\xfc\x00\x01\xfc\x00\x01\xfc\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'  # :
+), spacing=2)
 
-    bitmap = LARGE_DIGITS_32[char]
-    for row_idx, row_data in enumerate(bitmap):
-        for col in range(24):
-            if row_data & (1 << (23 - col)):
-                lcd.pixel(x + col, y + row_idx, color)
+def draw_char_32(lcd, char, x, y, color):
+    """Draw a single character using the 24x32 bitmap font"""
+    return FONT.draw_char(lcd, char, x, y, color)  # Character width for spacing
 
-    return 24  # Return character width for spacing
+def draw_text_32(lcd, text, x, y, color, spacing=2, length=None):
+    """Draw text using the 24x32 bitmap font
 
-def draw_text_32(lcd, text, x, y, color, spacing=2):
-    """Draw text using 24x32 bitmap font"""
-    current_x = x
-    for char in text:
-        char_width = draw_char_32(lcd, char, current_x, y, color)
-        current_x += char_width + spacing
-    return current_x - x  # Return total width
+    text may also be a bytes-like buffer such as numfmt.FixedFormatter.buf,
+    with length giving the number of characters to draw.
+    """
+    return FONT.draw(lcd, text, x, y, color, spacing, length)  # Total width
 
 def get_text_width_32(text, spacing=2):
-    """Calculate the width of text in pixels for 24x32 font"""
-    if not text:
-        return 0
-    return (24 * len(text)) + (spacing * (len(text) - 1))
+    """Calculate the width of text in pixels for the 24x32 font"""
+    return FONT.measure(text, spacing)
@@ -2,539 +2,39 @@
 # Auto-generated from 1to0 greyscale bitmap, with per-digit horizontal centering
 # and removal of stray columns mistakenly shared between adjacent glyphs.
 
-# Large digit font (24x48 pixels per character)
-# Format: Each digit is represented as a list of 48 rows, each row is 24 bits
-# 1 = pixel on, 0 = pixel off
+# Large digit font (24x48 pixels per character), a fonts.Font
+# Glyphs: 48 rows of 3 bytes each (MONO_HLSB, leftmost pixel in the top bit)
 
-LARGE_DIGITS_48 = {
-    '0': [
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000111111110000000000,
-        0b000011111111111100000000,
-        0b000111111111111110000000,
-        0b001111111101111111000000,
-        0b001111110000011111000000,
-        0b001111100000001111100000,
-        0b001111000000001111100000,
-        0b001111000000000111110000,
-        0b001110000000000111110000,
-        0b001110000000000111110000,
-        0b001110000000000111110000,
-        0b001110000000000111110000,
-        0b001100000000000011110000,
-        0b001100000000000011110000,
-        0b001100000000000011110000,
-        0b001100000000000011110000,
-        0b001100000000000011110000,
-        0b001100000000000011110000,
-        0b001110000000000111110000,
-        0b001110000000000111110000,
-        0b001110000000000111110000,
-        0b001110000000000111110000,
-        0b000111000000000111100000,
-        0b000111000000001111100000,
-        0b000111100000011111100000,
-        0b000111100000011111000000,
-        0b000111111001111111000000,
-        0b000111111111111110000000,
-        0b000011111111111100000000,
-        0b000000111111110000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-    ],
-    '1': [
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000111110000000,
-        0b000000000011111110000000,
-        0b000000001111111110000000,
-        0b000000011111111110000000,
-        0b000000011111111110000000,
-        0b000000011110011110000000,
-        0b000000011000011110000000,
-        0b000000000000011110000000,
-        0b000000000000011110000000,
-        0b000000000000011110000000,
-        0b000000000000011110000000,
-        0b000000000000011110000000,
-        0b000000000000011110000000,
-        0b000000000000011110000000,
-        0b000000000000011110000000,
-        0b000000000000011110000000,
-        0b000000000000011110000000,
-        0b000000000000011110000000,
-        0b000000000000011110000000,
-        0b000000000000011110000000,
-        0b000000000000011110000000,
-        0b000000000000011110000000,
-        0b000000000000011110000000,
-        0b000000000000011110000000,
-        0b000000000000011110000000,
-        0b000000000000011110000000,
-        0b000000000000011110000000,
-        0b000000000000011110000000,
-        0b000000000000011110000000,
-        0b000000000000011110000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-    ],
-    '2': [
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000011111111110000000,
-        0b000001111111111111000000,
-        0b000111111111111111100000,
-        0b000111111111111111110000,
-        0b000011110000001111111000,
-        0b000011000000000111111000,
-        0b000000000000000011111000,
-        0b000000000000000011111000,
-        0b000000000000000001111000,
-        0b000000000000000001111000,
-        0b000000000000000011111000,
-        0b000000000000000011111000,
-        0b000000000000000011111000,
-        0b000000000000000111110000,
-        0b000000000000000111110000,
-        0b000000000000001111100000,
-        0b000000000000011111100000,
-        0b000000000000111111000000,
-        0b000000000001111110000000,
-        0b000000000011111100000000,
-        0b000000000111111000000000,
-        0b000000001111110000000000,
-        0b000000011111110000000000,
-        0b000000111111100000000000,
-        0b000001111110000000000000,
-        0b000011111100000000000000,
-        0b000111111111111111111100,
-        0b001111111111111111111100,
-        0b001111111111111111111100,
-        0b001111111111111111111100,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-    ],
-    '3': [
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000111111111100000000,
-        0b000011111111111111000000,
-        0b000111111111111111100000,
-        0b000011111111111111110000,
-        0b000011100000001111110000,
-        0b000010000000000111110000,
-        0b000000000000000111110000,
-        0b000000000000000011110000,
-        0b000000000000000011110000,
-        0b000000000000000111110000,
-        0b000000000000001111110000,
-        0b000000000000011111100000,
-        0b000000000011111111000000,
-        0b000000011111111110000000,
-        0b000000011111111100000000,
-        0b000000011111111111000000,
-        0b000000000001111111110000,
-        0b000000000000001111110000,
-        0b000000000000000111111000,
-        0b000000000000000011111000,
-        0b000000000000000011111000,
-        0b000000000000000001111000,
-        0b000000000000000011111000,
-        0b000000000000000011111000,
-        0b000000000000000111111000,
-        0b000111000000001111110000,
-        0b000111111111111111110000,
-        0b000111111111111111100000,
-        0b000111111111111111000000,
-        0b000001111111111100000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-    ],
-    '4': [
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000111110000000,
-        0b000000000001111110000000,
-        0b000000000011111110000000,
-        0b000000000011111110000000,
-        0b000000000111111110000000,
-        0b000000000111111110000000,
-        0b000000001111111110000000,
-        0b000000011111011110000000,
-        0b000000011110011110000000,
-        0b000000111110011110000000,
-        0b000001111100011110000000,
-        0b000001111100011110000000,
-        0b000011111000011110000000,
-        0b000111110000011110000000,
-        0b000111110000011110000000,
-        0b001111100000011110000000,
-        0b011111000000011110000000,
-        0b011111000000011110000000,
-        0b011110000000011110000000,
-        0b011111111111111111111100,
-        0b011111111111111111111100,
-        0b011111111111111111111100,
-        0b000000000000011110000000,
-        0b000000000000011110000000,
-        0b000000000000011110000000,
-        0b000000000000011110000000,
-        0b000000000000011110000000,
-        0b000000000000011110000000,
-        0b000000000000011110000000,
-        0b000000000000011110000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-    ],
-    '5': [
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000001111111111111110000,
-        0b000001111111111111110000,
-        0b000011111111111111110000,
-        0b000011111111111111110000,
-        0b000011110000000000000000,
-        0b000011110000000000000000,
-        0b000011110000000000000000,
-        0b000011110000000000000000,
-        0b000011110000000000000000,
-        0b000011110000000000000000,
-        0b000111110000000000000000,
-        0b000111111111111000000000,
-        0b000111111111111110000000,
-        0b000111111111111111000000,
-        0b000110000111111111100000,
-        0b000000000000011111100000,
-        0b000000000000001111110000,
-        0b000000000000000111110000,
-        0b000000000000000111110000,
-        0b000000000000000011110000,
-        0b000000000000000011110000,
-        0b000000000000000111110000,
-        0b000000000000000111110000,
-        0b000000000000000111110000,
-        0b000000000000001111100000,
-        0b000110000000111111100000,
-        0b000111111111111111000000,
-        0b000111111111111110000000,
-        0b000111111111111100000000,
-        0b000111111111110000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-    ],
-    '6': [
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000111111100000,
-        0b000000000111111111100000,
-        0b000000001111111111100000,
-        0b000000111111111111100000,
-        0b000001111111100000000000,
-        0b000011111110000000000000,
-        0b000011111000000000000000,
-        0b000111110000000000000000,
-        0b001111110000000000000000,
-        0b001111100000000000000000,
-        0b001111001111111110000000,
-        0b001111111111111111000000,
-        0b001111111111111111100000,
-        0b001111111100111111110000,
-        0b001111110000001111110000,
-        0b001111100000000111111000,
-        0b001111000000000011111000,
-        0b001111000000000011111000,
-        0b001110000000000011111000,
-        0b001110000000000001111000,
-        0b001111000000000001111000,
-        0b001111000000000011111000,
-        0b001111000000000011111000,
-        0b001111100000000011111000,
-        0b001111100000000111110000,
-        0b001111110000001111110000,
-        0b000111111110111111100000,
-        0b000011111111111111000000,
-        0b000001111111111110000000,
-        0b000000011111111100000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-    ],
-    '7': [
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000111111111111111111000,
-        0b000111111111111111111000,
-        0b000111111111111111111000,
-        0b000111111111111111111000,
-        0b000000000000000111110000,
-        0b000000000000000111110000,
-        0b000000000000001111100000,
-        0b000000000000001111100000,
-        0b000000000000011111100000,
-        0b000000000000011111000000,
-        0b000000000000011111000000,
-        0b000000000000111110000000,
-        0b000000000000111110000000,
-        0b000000000001111100000000,
-        0b000000000001111100000000,
-        0b000000000011111000000000,
-        0b000000000011111000000000,
-        0b000000000111110000000000,
-        0b000000000111110000000000,
-        0b000000001111100000000000,
-        0b000000001111100000000000,
-        0b000000011111000000000000,
-        0b000000011111000000000000,
-        0b000000111110000000000000,
-        0b000000111110000000000000,
-        0b000001111100000000000000,
-        0b000001111100000000000000,
-        0b000011111100000000000000,
-        0b000011111000000000000000,
-        0b000111111000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-    ],
-    '8': [
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000111111111100000000,
-        0b000001111111111111000000,
-        0b000011111111111111100000,
-        0b000111111100111111100000,
-        0b000111110000001111110000,
-        0b000111100000000111110000,
-        0b000111000000000111110000,
-        0b000111000000000011110000,
-        0b000111000000000111110000,
-        0b000111100000000111110000,
-        0b000111110000001111100000,
-        0b000111111000011111100000,
-        0b000111111111111111000000,
-        0b000011111111111110000000,
-        0b000001111111111110000000,
-        0b000011111111111111100000,
-        0b000111111000111111110000,
-        0b000111110000001111110000,
-        0b000111100000000111111000,
-        0b000111000000000011111000,
-        0b000111000000000011111000,
-        0b000110000000000001111000,
-        0b000110000000000001111000,
-        0b000111000000000011111000,
-        0b000111000000000011111000,
-        0b000111100000000111111000,
-        0b000111111100111111110000,
-        0b000111111111111111100000,
-        0b000011111111111111000000,
-        0b000000111111111100000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-    ],
-    '9': [
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000111111111000000000,
-        0b000011111111111100000000,
-        0b000111111111111110000000,
-        0b000111111001111111000000,
-        0b000111100000011111100000,
-        0b000111000000001111100000,
-        0b000110000000001111110000,
-        0b000110000000000111110000,
-        0b000110000000000111110000,
-        0b000100000000000111110000,
-        0b000100000000000011110000,
-        0b000110000000000011110000,
-        0b000110000000000111110000,
-        0b000111000000000111110000,
-        0b000111100000011111110000,
-        0b000111111001111111110000,
-        0b000111111111111111110000,
-        0b000111111111111111110000,
-        0b000011111111100111110000,
-        0b000000000000001111100000,
-        0b000000000000001111100000,
-        0b000000000000011111100000,
-        0b000000000000111111000000,
-        0b000000000001111110000000,
-        0b000000000011111110000000,
-        0b000000001111111100000000,
-        0b000111111111111000000000,
-        0b000111111111110000000000,
-        0b000111111111000000000000,
-        0b000111111100000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-        0b000000000000000000000000,
-    ],
-}
+from fonts import Font
 
+FONT = Font(24, 48, '0123456789', (
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x03\xfc\x00\x0f\xff\x00\x1f\xff\x80\x3f\xdf\xc0\x3f\x07\xc0\x3e\x03\xe0\x3c\x03\xe0\x3c\x01\xf0\x38\x01\xf0\x38\x01\xf0\x38\x01\xf0\x38\x01\xf0\x30\x00\xf0\x30\x00\xf0\x30\x00\xf0\x30\x00\xf0\x30\x00\xf0\x30\x00\xf0\x38\x01\xf0\x38\x01\xf0\x38\x01\xf0\x38\x01\xf0\x1c\x01\xe0\x1c\x03\xe0\x1e\x07\xe0\x1e\x07\xc0\x1f\x9f\xc0\x1f\xff\x80\x0f\xff\x00\x03\xfc\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'  # 0
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x0f\x80\x00\x3f\x80\x00\xff\x80\x01\xff\x80\x01\xff\x80\x01\xe7\x80\x01\x87\x80\x00\x07\x80\x00\x07\x80\x00\x07\x80\x00\x07\x80\x00\x07\x80\x00\x07\x80\x00\x07\x80\x00\x07\x80\x00\x07\x80\x00\x07\x80\x00\x07\x80\x00\x07\x80\x00\x07\x80\x00\x07\x80\x00\x07\x80\x00\x07\x80\x00\x07\x80\x00\x07\x80\x00\x07\x80\x00\x07\x80\x00\x07\x80\x00\x07\x80\x00\x07\x80\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'  # 1
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\xff\x80\x07\xff\xc0\x1f\xff\xe0\x1f\xff\xf0\x0f\x03\xf8\x0c\x01\xf8\x00\x00\xf8\x00\x00\xf8\x00\x00\x78\x00\x00\x78\x00\x00\xf8\x00\x00\xf8\x00\x00\xf8\x00\x01\xf0\x00\x01\xf0\x00\x03\xe0\x00\x07\xe0\x00\x0f\xc0\x00\x1f\x80\x00\x3f\x00\x00\x7e\x00\x00\xfc\x00\x01\xfc\x00\x03\xf8\x00\x07\xe0\x00\x0f\xc0\x00\x1f\xff\xfc\x3f\xff\xfc\x3f\xff\xfc\x3f\xff\xfc\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'  # 2
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x03\xff\x00\x0f\xff\xc0\x1f\xff\xe0\x0f\xff\xf0\x0e\x03\xf0\x08\x01\xf0\x00\x01\xf0\x00\x00\xf0\x00\x00\xf0\x00\x01\xf0\x00\x03\xf0\x00\x07\xe0\x00\x3f\xc0\x01\xff\x80\x01\xff\x00\x01\xff\xc0\x00\x1f\xf0\x00\x03\xf0\x00\x01\xf8\x00\x00\xf8\x00\x00\xf8\x00\x00\x78\x00\x00\xf8\x00\x00\xf8\x00\x01\xf8\x1c\x03\xf0\x1f\xff\xf0\x1f\xff\xe0\x1f\xff\xc0\x07\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'  # 3
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x0f\x80\x00\x1f\x80\x00\x3f\x80\x00\x3f\x80\x00\x7f\x80\x00\x7f\x80\x00\xff\x80\x01\xf7\x80\x01\xe7\x80\x03\xe7\x80\x07\xc7\x80\x07\xc7\x80\x0f\x87\x80\x1f\x07\x80\x1f\x07\x80\x3e\x07\x80\x7c\x07\x80\x7c\x07\x80\x78\x07\x80\x7f\xff\xfc\x7f\xff\xfc\x7f\xff\xfc\x00\x07\x80\x00\x07\x80\x00\x07\x80\x00\x07\x80\x00\x07\x80\x00\x07\x80\x00\x07\x80\x00\x07\x80\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'  # 4
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x07\xff\xf0\x07\xff\xf0\x0f\xff\xf0\x0f\xff\xf0\x0f\x00\x00\x0f\x00\x00\x0f\x00\x00\x0f\x00\x00\x0f\x00\x00\x0f\x00\x00\x1f\x00\x00\x1f\xfe\x00\x1f\xff\x80\x1f\xff\xc0\x18\x7f\xe0\x00\x07\xe0\x00\x03\xf0\x00\x01\xf0\x00\x01\xf0\x00\x00\xf0\x00\x00\xf0\x00\x01\xf0\x00\x01\xf0\x00\x01\xf0\x00\x03\xe0\x18\x0f\xe0\x1f\xff\xc0\x1f\xff\x80\x1f\xff\x00\x1f\xfc\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'  # 5
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x0f\xe0\x00\x7f\xe0\x00\xff\xe0\x03\xff\xe0\x07\xf8\x00\x0f\xe0\x00\x0f\x80\x00\x1f\x00\x00\x3f\x00\x00\x3e\x00\x00\x3c\xff\x80\x3f\xff\xc0\x3f\xff\xe0\x3f\xcf\xf0\x3f\x03\xf0\x3e\x01\xf8\x3c\x00\xf8\x3c\x00\xf8\x38\x00\xf8\x38\x00\x78\x3c\x00\x78\x3c\x00\xf8\x3c\x00\xf8\x3e\x00\xf8\x3e\x01\xf0\x3f\x03\xf0\x1f\xef\xe0\x0f\xff\xc0\x07\xff\x80\x01\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'  # 6
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1f\xff\xf8\x1f\xff\xf8\x1f\xff\xf8\x1f\xff\xf8\x00\x01\xf0\x00\x01\xf0\x00\x03\xe0\x00\x03\xe0\x00\x07\xe0\x00\x07\xc0\x00\x07\xc0\x00\x0f\x80\x00\x0f\x80\x00\x1f\x00\x00\x1f\x00\x00\x3e\x00\x00\x3e\x00\x00\x7c\x00\x00\x7c\x00\x00\xf8\x00\x00\xf8\x00\x01\xf0\x00\x01\xf0\x00\x03\xe0\x00\x03\xe0\x00\x07\xc0\x00\x07\xc0\x00\x0f\xc0\x00\x0f\x80\x00\x1f\x80\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'  # 7
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x03\xff\x00\x07\xff\xc0\x0f\xff\xe0\x1f\xcf\xe0\x1f\x03\xf0\x1e\x01\xf0\x1c\x01\xf0\x1c\x00\xf0\x1c\x01\xf0\x1e\x01\xf0\x1f\x03\xe0\x1f\x87\xe0\x1f\xff\xc0\x0f\xff\x80\x07\xff\x80\x0f\xff\xe0\x1f\x8f\xf0\x1f\x03\xf0\x1e\x01\xf8\x1c\x00\xf8\x1c\x00\xf8\x18\x00\x78\x18\x00\x78\x1c\x00\xf8\x1c\x00\xf8\x1e\x01\xf8\x1f\xcf\xf0\x1f\xff\xe0\x0f\xff\xc0\x03\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'  # 8
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x03\xfe\x00\x0f\xff\x00\x1f\xff\x80\x1f\x9f\xc0\x1e\x07\xe0\x1c\x03\xe0\x18\x03\xf0\x18\x01\xf0\x18\x01\xf0\x10\x01\xf0\x10\x00\xf0\x18\x00\xf0\x18\x01\xf0\x1c\x01\xf0\x1e\x07\xf0\x1f\x9f\xf0\x1f\xff\xf0\x1f\xff\xf0\x0f\xf9\xf0\x00\x03\xe0\x00\x03\xe0\x00\x07\xe0\x00\x0f\xc0\x00\x1f\x80\x00\x3f\x80\x00\xff\x00\x1f\xfe\x00\x1f\xfc\x00\x1f\xf0\x00\x1f\xc0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'  # 9
+), spacing=4)
 
-def draw_char_48(lcd, char, x, y, color):
-    """Draw a single 24x48 character using bitmap font"""
-    if char not in LARGE_DIGITS_48:
-        return 24  # character width
 
-    bitmap = LARGE_DIGITS_48[char]
-    for row_idx, row_data in enumerate(bitmap):
-        for col in range(24):
-            if row_data & (1 << (23 - col)):
-                lcd.pixel(x + col, y + row_idx, color)
+def draw_char_48(lcd, char, x, y, color):
+    """Draw a single character using the 24x48 bitmap font"""
+    return FONT.draw_char(lcd, char, x, y, color)  # Character width for spacing
 
-    return 24
 
+def draw_text_48(lcd, text, x, y, color, spacing=4, length=None):
+    """Draw text using the 24x48 bitmap font
 
-def draw_text_48(lcd, text, x, y, color, spacing=4):
-    """Draw text using 24x48 bitmap font"""
-    current_x = x
-    for char in text:
-        char_width = draw_char_48(lcd, char, current_x, y, color)
-        current_x += char_width + spacing
-    return current_x - x
+    text may also be a bytes-like buffer such as numfmt.FixedFormatter.buf,
+    with length giving the number of characters to draw.
+    """
+    return FONT.draw(lcd, text, x, y, color, spacing, length)  # Total width
 
 
 def get_text_width_48(text, spacing=4):
-    """Calculate text width in pixels for 24x48 font"""
-    if not text:
-        return 0
-    return (24 * len(text)) + (spacing * (len(text) - 1))
+    """Calculate the width of text in pixels for the 24x48 font"""
+    return FONT.measure(text, spacing)
@@ -0,0 +1,64 @@
+# Boot Profiler
+# Times each import and init step of main.py so slow steps show up in
+# the boot log. mark() records the time since the previous mark; report()
+# prints the steps and the total, from main.py's first line to the first
+# frame on the panel.
+#
+# On the device ticks_ms() counts from reset, so its value when main.py
+# starts is the time spent in the firmware and boot.py before it.
+#
+# Example:
+#     import time
+#     _t0 = time.ticks_us()            # First line of main.py
+#     from bootprof import BootProfiler
+#     boot = BootProfiler(_t0)
+#
+#     import battery_monitor
+#     boot.mark("import battery_monitor")
+#     lcd = LCD_1inch28()
+#     boot.mark("lcd init")
+#     ...
+#     boot.report("first frame")
+
+import time
+
+
+class BootProfiler:
+    """Named boot steps with their durations in microseconds."""
+
+    def __init__(self, t0_us=None):
+        """
+        Args:
+            t0_us: ticks_us() when main.py started (default: now)
+        """
+        self.t0 = t0_us if t0_us is not None else time.ticks_us()
+        self.start_ms = time.ticks_ms() - time.ticks_diff(time.ticks_us(), self.t0) // 1000
+        self._last = self.t0
+        self.steps = []       # (name, us)
+        self.total_us = None  # Set by report()
+
+    def mark(self, name):
+        """End the current step (since the previous mark) as name."""
+        now = time.ticks_us()
+        self.steps.append((name, time.ticks_diff(now, self._last)))
+        self._last = now
+
+    def elapsed_ms(self):
+        """Milliseconds since main.py started."""
+        return time.ticks_diff(time.ticks_us(), self.t0) // 1000
+
+    def report(self, name):
+        """
+        Mark the final step and print the profile.
+
+        Args:
+            name: The final step (e.g. "first frame")
+        """
+        self.mark(name)
+        self.total_us = time.ticks_diff(self._last, self.t0)
+        print("Boot profile (ms):")
+        for step, us in self.steps:
+            print(f"  {step:<32}{us // 1000:>6}.{us % 1000 // 100}")
+        total = self.total_us
+        print(f"Boot: {name} {total // 1000}.{total % 1000 // 100} ms after main.py started "
+              f"(main.py started {self.start_ms} ms after reset)")
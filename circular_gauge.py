@@ -3,6 +3,7 @@
 # Supports configurable segments, angles, thickness, gaps, and colors
 
 import math
+from array import array
 
 
 class CircularGauge:
@@ -102,6 +103,7 @@ class CircularGauge:
 
         # Pre-calculate segment angles for performance
         self.segment_angles = self._calculate_segment_angles()
+        self._spans = [None] * self.segments  # Per segment, traced on first draw
 
     def _calculate_segment_angles(self):
         """
@@ -149,20 +151,88 @@ class CircularGauge:
         """
         self.value = max(0, min(100, percentage))
 
+    def filled_count(self, percentage=None):
+        """
+        Number of filled segments at a value.
+
+        Args:
+            percentage: Value from 0-100 (default: the current value)
+        """
+        if percentage is None:
+            percentage = self.value
+        percentage = max(0, min(100, percentage))
+        return int((percentage / 100.0) * self.segments)
+
     def draw(self):
         """
         Draw the gauge to the LCD buffer.
         Call lcd.show() or lcd.Windows_show() afterward to display.
         """
-        filled_count = int((self.value / 100.0) * self.segments)
+        filled_count = self.filled_count()
 
-        for i, (start_deg, end_deg) in enumerate(self.segment_angles):
+        for i in range(self.segments):
             if i < filled_count:
                 # Draw filled segment
-                self._draw_thick_arc(start_deg, end_deg, self.color)
+                self.draw_segment(i, self.color)
             elif self.background_color is not None:
                 # Draw unfilled segment
-                self._draw_thick_arc(start_deg, end_deg, self.background_color)
+                self.draw_segment(i, self.background_color)
+
+    def segment_spans(self, i):
+        """
+        Pixels of segment i as horizontal runs: a flat array of
+        (y, x, width) triples covering exactly the pixels _draw_thick_arc()
+        plots. Traced once per segment (a few hundred bytes each), so
+        later draws are a handful of hline() calls instead of trigonometry
+        per pixel.
+        """
+        spans = self._spans[i]
+        if spans is None:
+            rows = {}
+            start_deg, end_deg = self.segment_angles[i]
+            for x, y in self._arc_pixels(start_deg, end_deg):
+                xs = rows.get(y)
+                if xs is None:
+                    rows[y] = xs = set()
+                xs.add(x)
+            spans = array('h')
+            for y in sorted(rows):
+                xs = sorted(rows[y])
+                run = xs[0]
+                for k in range(1, len(xs) + 1):
+                    if k == len(xs) or xs[k] != xs[k - 1] + 1:
+                        spans.extend((y, run, xs[k - 1] - run + 1))
+                        if k < len(xs):
+                            run = xs[k]
+            self._spans[i] = spans
+        return spans
+
+    def segment_bbox(self, i):
+        """
+        Bounding box of segment i.
+
+        Returns:
+            Tuple (x, y, w, h), or None if the segment is off screen
+        """
+        spans = self.segment_spans(i)
+        if not spans:
+            return None
+        x0 = min(spans[k + 1] for k in range(0, len(spans), 3))
+        x1 = max(spans[k + 1] + spans[k + 2] for k in range(0, len(spans), 3))
+        return x0, spans[0], x1 - x0, spans[-3] - spans[0] + 1
+
+    def draw_segment(self, i, color):
+        """
+        Draw segment i in color.
+
+        Args:
+            i: Segment index (0 = first filled)
+            color: RGB565 color value
+        """
+        spans = self.segment_spans(i)
+        hline = self.lcd.hline
+        for k in range(0, len(spans), 3):
+            hline(spans[k + 1], spans[k], spans[k + 2], color)
 
     def _draw_thick_arc(self, start_deg, end_deg, color):
         """
@@ -173,6 +243,18 @@ class CircularGauge:
             end_deg: Ending angle in degrees
             color: RGB565 color value
         """
+        for x, y in self._arc_pixels(start_deg, end_deg):
+            self.lcd.pixel(x, y, color)
+
+    def _arc_pixels(self, start_deg, end_deg):
+        """
+        Pixels of a thick arc (parametric circle algorithm), on screen only.
+        May yield a pixel more than once.
+
+        Args:
+            start_deg: Starting angle in degrees
+            end_deg: Ending angle in degrees
+        """
         # Convert to radians
         start_rad = math.radians(start_deg)
         end_rad = math.radians(end_deg)
@@ -199,7 +281,7 @@ class CircularGauge:
 
                     # Bounds check (display is 240x240)
                     if 0 <= x < 240 and 0 <= y < 240:
-                        self.lcd.pixel(x, y, color)
+                        yield x, y
 
                     angle -= angle_step
             else:
@@ -213,7 +295,7 @@ class CircularGauge:
 
                     # Bounds check (display is 240x240)
                     if 0 <= x < 240 and 0 <= y < 240:
-                        self.lcd.pixel(x, y, color)
+                        yield x, y
 
                     angle += angle_step
 
@@ -248,20 +330,18 @@ class CircularGauge:
         Args:
             old_value: Previous percentage value (0-100)
         """
-        old_filled = int((old_value / 100.0) * self.segments)
-        new_filled = int((self.value / 100.0) * self.segments)
+        old_filled = self.filled_count(old_value)
+        new_filled = self.filled_count()
 
         if new_filled > old_filled:
             # Fill additional segments
             for i in range(old_filled, new_filled):
-                start_deg, end_deg = self.segment_angles[i]
-                self._draw_thick_arc(start_deg, end_deg, self.color)
+                self.draw_segment(i, self.color)
         elif new_filled < old_filled:
             # Unfill segments
             for i in range(new_filled, old_filled):
-                start_deg, end_deg = self.segment_angles[i]
                 if self.background_color is not None:
-                    self._draw_thick_arc(start_deg, end_deg, self.background_color)
+                    self.draw_segment(i, self.background_color)
                 # Note: If no background_color, we can't erase efficiently
                 # In that case, full redraw is needed
 
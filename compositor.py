@@ -0,0 +1,410 @@
+# Layered Compositor
+# Draws a page as a background image (or colour) under ordered layers of
+# items, and after a change recomposes only the damaged regions.
+#
+# Layers, bottom to top (LAYERS): "decor" (static decorations), "gauges",
+# "text" (values and labels) and "popups". Each item has a bounding box and
+# a draw function; changing, moving, hiding or removing an item marks its
+# old and new boxes dirty on its layer. render_dirty() merges the dirty
+# rectangles of all layers and, for each region, restores the background
+# pixels from the image source (image_display.restore_background()),
+# redraws every item overlapping it bottom-up and flushes just that region
+# with lcd.show_rect().
+#
+# Items are drawn whole, not clipped, so a region first grows to cover
+# every item that overlaps it (and any item those overlap): drawing never
+# spills over pixels outside the region, and the result is the same frame
+# a full render() would draw. Gauges are added one item per segment, so a
+# value change damages only the segments that changed.
+#
+# Example:
+#     from compositor import Compositor
+#
+#     page = Compositor(lcd, background=get_image('background1'))
+#     page.layer("gauges").add_gauge(gauge, 60)
+#     label = page.layer("text").add_text("60%", 108, 116, lcd.white)
+#     page.render()                       # Whole frame
+#     page.layer("gauges").set_gauge(gauge, 65)
+#     page.layer("text").set_text(label, "65%")
+#     page.render_dirty()                 # Only the changed segment and label
+
+from image_display import load_image_to_framebuffer, prepare_image, restore_background
+
+LAYERS = ("decor", "gauges", "text", "popups")
+
+# Item fields (each item is a list)
+_X = 0
+_Y = 1
+_W = 2
+_H = 3
+_DRAW = 4   # draw(lcd, *args)
+_ARGS = 5
+_SHOWN = 6  # False while hidden
+
+
+def _overlaps(a, x, y, w, h):
+    """True if item or rect a overlaps the rectangle x, y, w, h."""
+    return (a[_X] < x + w and x < a[_X] + a[_W]
+            and a[_Y] < y + h and y < a[_Y] + a[_H])
+
+
+def _union(a, b):
+    x = min(a[0], b[0])
+    y = min(a[1], b[1])
+    return (x, y, max(a[0] + a[2], b[0] + b[2]) - x, max(a[1] + a[3], b[1] + b[3]) - y)
+
+
+def _draw_text(lcd, text, x, y, color, size):
+    if size is None:
+        lcd.text(text, x, y, color)
+    else:
+        lcd.write_text(text, x, y, size, color)
+
+
+def _draw_segment(lcd, gauge, i, color):
+    gauge.draw_segment(i, color)
+
+
+class Layer:
+    """
+    Ordered drawing items of one compositor layer, with the rectangles
+    that changed since the last render.
+
+    Items are drawn in the order they were added. Handles returned by the
+    add_*() methods stay valid until the item is removed.
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self.items = []     # [x, y, w, h, draw, args, shown]; None once removed
+        self.dirty = []     # (x, y, w, h) rectangles to recompose
+        self._gauges = {}   # gauge -> (first segment item, filled segments)
+
+    def add(self, x, y, w, h, draw, *args):
+        """
+        Add an item drawn by draw(lcd, *args) inside the box x, y, w, h.
+
+        Returns:
+            Item handle
+        """
+        self.items.append([x, y, w, h, draw, args, True])
+        self.dirty.append((x, y, w, h))
+        return len(self.items) - 1
+
+    def update(self, item, draw=None, *args, rect=None):
+        """
+        Change an item's drawing (draw and args) and/or its box; the old
+        and new boxes are recomposed.
+
+        Args:
+            item: Handle from add()
+            draw: New draw function (None keeps the current one)
+            args: New draw arguments (none given keeps the current ones
+                  unless draw is given, e.g. update(item, None, "65%")
+                  changes only the arguments)
+            rect: New (x, y, w, h) box (None keeps the current one)
+        """
+        it = self.items[item]
+        self.dirty.append((it[_X], it[_Y], it[_W], it[_H]))
+        if draw is not None:
+            it[_DRAW] = draw
+        if draw is not None or args:
+            it[_ARGS] = args
+        if rect is not None:
+            it[_X], it[_Y], it[_W], it[_H] = rect
+            self.dirty.append(rect)
+
+    def hide(self, item):
+        """Stop drawing an item (its box is recomposed without it)."""
+        it = self.items[item]
+        if it[_SHOWN]:
+            it[_SHOWN] = False
+            self.dirty.append((it[_X], it[_Y], it[_W], it[_H]))
+
+    def show(self, item):
+        """Draw a hidden item again."""
+        it = self.items[item]
+        if not it[_SHOWN]:
+            it[_SHOWN] = True
+            self.dirty.append((it[_X], it[_Y], it[_W], it[_H]))
+
+    def remove(self, item):
+        """Remove an item for good."""
+        it = self.items[item]
+        if it is not None:
+            self.dirty.append((it[_X], it[_Y], it[_W], it[_H]))
+            self.items[item] = None
+
+    def clear(self):
+        """Remove every item."""
+        for i in range(len(self.items)):
+            self.remove(i)
+        self.items = []
+        self._gauges = {}
+
+    def add_fill(self, x, y, w, h, color):
+        """Add a filled rectangle (decorations, popup panels)."""
+        return self.add(x, y, w, h, _fill_rect, x, y, w, h, color)
+
+    def add_text(self, text, x, y, color, size=None):
+        """
+        Add a line of text.
+
+        Args:
+            text: String to draw
+            x, y: Top-left position
+            color: RGB565 color
+            size: write_text() scale factor, or None for the 8x8 font
+        """
+        s = size or 1
+        return self.add(x, y, 8 * s * len(text), 8 * s, _draw_text, text, x, y, color, size)
+
+    def set_text(self, item, text, color=None):
+        """Change a text item's string (and color); its box follows."""
+        _, x, y, old_color, size = self.items[item][_ARGS]
+        if color is None:
+            color = old_color
+        s = size or 1
+        self.update(item, _draw_text, text, x, y, color, size,
+                    rect=(x, y, 8 * s * len(text), 8 * s))
+
+    def add_bitmap_text(self, font, text, x, y, color, spacing=None):
+        """
+        Add text in a large bitmap font.
+
+        Args:
+            font: fonts.Font, or a font data module holding one (FONT in
+                  bitmap_fonts, bitmap_fonts_32, bitmap_fonts_48)
+            text, x, y, color, spacing: As for Font.draw()
+        """
+        font = getattr(font, "FONT", font)
+        if not hasattr(font, "measure"):
+            raise ValueError("Not a bitmap font")
+        return self.add(x, y, font.measure(text, spacing), font.height, _draw_bitmap_text,
+                        font, text, x, y, color, spacing)
+
+    def add_sprite(self, atlas, name, x, y):
+        """
+        Add an icon from a sprites.SpriteAtlas; its transparent pixels
+        show the layers below.
+        """
+        size = atlas.size(name)
+        if size is None:
+            raise ValueError(f"No sprite '{name}'")
+        w, h = size
+        return self.add(x, y, w, h, _draw_sprite, atlas, name, x, y)
+
+    def add_gauge(self, gauge, value):
+        """
+        Add a CircularGauge as one item per segment, showing value.
+        Unfilled segments of a gauge without a background color are
+        hidden, so the layers below show through.
+        """
+        value = max(0, min(100, value))
+        gauge.value = value
+        filled = gauge.filled_count(value)
+        first = len(self.items)
+        for i in range(gauge.segments):
+            box = gauge.segment_bbox(i) or (0, 0, 0, 0)
+            color = gauge.color if i < filled else gauge.background_color
+            self.add(box[0], box[1], box[2], box[3], _draw_segment, gauge, i, color)
+            if color is None:
+                self.hide(first + i)
+        self._gauges[gauge] = (first, filled)
+        return first
+
+    def set_gauge(self, gauge, value):
+        """Show a new value on a gauge from add_gauge(); marks only the changed segments."""
+        value = max(0, min(100, value))
+        gauge.value = value
+        first, old = self._gauges[gauge]
+        filled = gauge.filled_count(value)
+        for i in range(min(old, filled), max(old, filled)):
+            item = first + i
+            self.show(item)
+            color = gauge.color if i < filled else gauge.background_color
+            if color is None:
+                self.hide(item)
+            else:
+                self.update(item, _draw_segment, gauge, i, color)
+        self._gauges[gauge] = (first, filled)
+
+
+def _fill_rect(lcd, x, y, w, h, color):
+    lcd.fill_rect(x, y, w, h, color)
+
+
+def _draw_bitmap_text(lcd, font, text, x, y, color, spacing):
+    font.draw(lcd, text, x, y, color, spacing)
+
+
+def _draw_sprite(lcd, atlas, name, x, y):
+    atlas.blit(lcd, name, x, y)
+
+
+class Compositor:
+    """
+    A background image (or colour) under ordered layers of items,
+    recomposed region by region as items change.
+    """
+
+    def __init__(self, lcd, background=None, color=0x0000, layers=LAYERS):
+        """
+        Args:
+            lcd: LCD_1inch28 instance
+            background: Full-screen image (any image_display format), or None
+            color: Background colour where there is no image
+            layers: Layer names, bottom to top
+        """
+        self.lcd = lcd
+        self.background = prepare_image(background) if background else None
+        self.color = color
+        self.layers = [Layer(name) for name in layers]
+        self._dirty = []  # Compositor-wide damage (background changes)
+
+    def layer(self, name):
+        """The layer called name."""
+        for layer in self.layers:
+            if layer.name == name:
+                return layer
+        raise ValueError(f"No layer '{name}'")
+
+    def set_background(self, background=None, color=0x0000):
+        """Change the background image or colour (recomposes the whole screen)."""
+        self.background = prepare_image(background) if background else None
+        self.color = color
+        self.invalidate()
+
+    def invalidate(self, rect=None):
+        """Recompose rect (x, y, w, h; default: the whole screen) on the next render_dirty()."""
+        self._dirty.append(rect or (0, 0, self.lcd.width, self.lcd.height))
+
+    def render(self, show=True):
+        """
+        Draw the whole frame: background, then every layer bottom-up.
+
+        Args:
+            show: Flush the frame with lcd.show()
+
+        Returns:
+            True if successful, False if the background image failed to load
+        """
+        lcd = self.lcd
+        if self.background is not None:
+            if not load_image_to_framebuffer(lcd, self.background):
+                return False
+        else:
+            lcd.fill(self.color)
+        for layer in self.layers:
+            for it in layer.items:
+                if it is not None and it[_SHOWN]:
+                    it[_DRAW](lcd, *it[_ARGS])
+            layer.dirty = []
+        self._dirty = []
+        if show:
+            lcd.show()
+        return True
+
+    def damage(self):
+        """
+        Take the dirty rectangles of all layers as regions to recompose:
+        each grown to cover the items it overlaps, overlapping ones merged,
+        clipped to the screen.
+
+        Returns:
+            List of (x, y, w, h) regions
+        """
+        rects = self._dirty
+        self._dirty = []
+        for layer in self.layers:
+            rects.extend(layer.dirty)
+            layer.dirty = []
+
+        regions = []
+        for rect in rects:
+            if rect[2] <= 0 or rect[3] <= 0:
+                continue
+            rect = self._cover(rect)
+            merged = True
+            while merged:
+                merged = False
+                for i in range(len(regions)):
+                    if _overlaps(regions[i], *rect):
+                        rect = self._cover(_union(rect, regions.pop(i)))
+                        merged = True
+                        break
+            regions.append(rect)
+
+        clipped = []
+        for rect in regions:
+            rect = self._clip(rect)
+            if rect[2] > 0 and rect[3] > 0:
+                clipped.append(rect)
+        return clipped
+
+    def _clip(self, rect):
+        x, y, w, h = rect
+        x1 = min(x + w, self.lcd.width)
+        y1 = min(y + h, self.lcd.height)
+        x = max(x, 0)
+        y = max(y, 0)
+        return x, y, max(x1 - x, 0), max(y1 - y, 0)
+
+    def _cover(self, rect):
+        """Grow rect until every visible item overlapping it lies inside it."""
+        grown = True
+        while grown:
+            grown = False
+            x, y, w, h = rect
+            for layer in self.layers:
+                for it in layer.items:
+                    if (it is None or not it[_SHOWN] or not _overlaps(it, x, y, w, h)
+                            or (x <= it[_X] and y <= it[_Y] and it[_X] + it[_W] <= x + w
+                                and it[_Y] + it[_H] <= y + h)):
+                        continue
+                    rect = _union(rect, it)
+                    x, y, w, h = rect
+                    grown = True
+        return rect
+
+    def compose(self, x, y, w, h):
+        """
+        Redraw one region bottom-up: background pixels, then each item
+        overlapping it. The region must cover those items (see damage()).
+
+        Returns:
+            The region drawn (x, y, w, h), which for GS4 backgrounds may
+            start one pixel further left
+        """
+        lcd = self.lcd
+        if self.background is not None:
+            restored = restore_background(lcd, self.background, x, y, w, h)
+            if restored and restored[0] != x:
+                # GS4 restores from an even x: cover what that pulled in
+                x, y, w, h = self._clip(self._cover(restored))
+                restore_background(lcd, self.background, x, y, w, h)
+        else:
+            lcd.fill_rect(x, y, w, h, self.color)
+        for layer in self.layers:
+            for it in layer.items:
+                if it is not None and it[_SHOWN] and _overlaps(it, x, y, w, h):
+                    it[_DRAW](lcd, *it[_ARGS])
+        return x, y, w, h
+
+    def render_dirty(self, flush=True):
+        """
+        Recompose only what changed since the last render.
+
+        Args:
+            flush: Send each recomposed region to the panel with lcd.show_rect()
+
+        Returns:
+            List of (x, y, w, h) regions redrawn
+        """
+        drawn = []
+        for region in self.damage():
+            region = self.compose(*region)
+            drawn.append(region)
+            if flush:
+                self.lcd.show_rect(*region)
+        return drawn
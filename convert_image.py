@@ -7,16 +7,52 @@ for the Waveshare RP2350-Touch-LCD-1.28 display (240x240 pixels).
 
 Usage:
     python convert_image.py image.jpg variable_name > output.py
-
-The output can be copied into image_data.py on the RP2350.
+    python convert_image.py image.jpg variable_name --check > output.py
+    python convert_image.py image.png variable_name --format gs8 > output.py
+    python convert_image.py --batch images/ out/ [--jobs 4]
+    python convert_image.py --atlas icons/ ATLAS > sprite_data.py
+
+The output can be copied into image_data.py on the RP2350. --batch
+converts every JPG/PNG in a directory to <name>.py files in parallel
+(one process per CPU by default); the variable name is the file name.
+
+--format gs8 / gs4 store a palette-indexed image instead: one byte (gs8,
+up to 256 colours) or one nibble (gs4, up to 16 colours) per pixel plus an
+RGB565 palette, 1/2 or 1/4 of the RGB565 size. Images with few enough
+colours convert losslessly; others are quantized (median cut with
+Floyd-Steinberg dithering). image_display.py blits them to the screen
+through the palette with one FrameBuffer.blit() call.
+
+--atlas packs every PNG in a directory, at its own size, into one RGB565
+sprite atlas with an index (name -> x, y, w, h). Transparent pixels
+(alpha below 128) get a key colour no opaque pixel uses; sprites.py
+blits sprites out of the atlas with that key.
+
+Gamma goes through a 256-entry lookup table and the RGB565 packing is
+done on whole NumPy arrays. --check also runs the original per-pixel
+conversion and fails unless both outputs match byte for byte. Without
+NumPy the table is applied pixel by pixel (slower, same output).
 
 Requirements:
-    pip install Pillow
+    pip install Pillow numpy
 """
 
 from PIL import Image
+import argparse
 import sys
 import os
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.bmp', '.gif')
+INDEXED_FORMATS = {'gs4': ('GS4', 16), 'gs8': ('GS8', 256)}  # Tag, palette size
+_HEX = [f'\\x{b:02x}' for b in range(256)]
+CHUNK_SIZE = 2048  # Bytes per literal: keeps lines short for the device's parser
+ATLAS_WIDTH = 128  # Default atlas row width in pixels (wider sprites widen it)
 
 
 def apply_gamma_correction(value, gamma=2.2):
@@ -41,41 +77,93 @@ def apply_gamma_correction(value, gamma=2.2):
     return int(corrected * 255.0)
 
 
-def convert_image_to_rgb565_brg(image_path, variable_name, gamma=2.2):
+def gamma_lut(gamma=2.2):
     """
-    Convert image to RGB565 byte array with BRG color correction.
+    Gamma correction for every 8-bit value, as a 256-entry table.
 
-    Args:
-        image_path: Path to JPG/PNG file
-        variable_name: Variable name for the Python output
-        gamma: Gamma correction value (default 2.2 for sRGB). Set to 1.0 to disable.
+    Built with apply_gamma_correction(), so it gives exactly the same values.
+    """
+    if gamma == 1.0:
+        return list(range(256))
+    return [apply_gamma_correction(v, gamma) for v in range(256)]
+
+
+def load_rgb_image(image_path, size=(240, 240)):
+    """
+    Load an image as RGB at the given size (default: the full 240x240 screen).
 
     Returns:
-        Tuple of (byte_array, image_info_dict)
+        Tuple of (PIL RGB image, original (width, height))
     """
-    # Load image
-    try:
-        img = Image.open(image_path)
-    except Exception as e:
-        print(f"Error loading image: {e}", file=sys.stderr)
-        sys.exit(1)
+    img = Image.open(image_path)
 
     # Get original size
     orig_width, orig_height = img.size
 
-    # Resize to 240x240 if needed
-    if orig_width != 240 or orig_height != 240:
-        print(f"# Resizing from {orig_width}x{orig_height} to 240x240", file=sys.stderr)
-        img = img.resize((240, 240), Image.Resampling.LANCZOS)
+    # Resize if needed
+    width, height = size
+    if orig_width != width or orig_height != height:
+        print(f"# Resizing from {orig_width}x{orig_height} to {width}x{height}", file=sys.stderr)
+        img = img.resize((width, height), Image.Resampling.LANCZOS)
 
     # Convert to RGB (handles RGBA, grayscale, etc.)
-    img = img.convert('RGB')
+    return img.convert('RGB'), (orig_width, orig_height)
 
-    # Convert to RGB565 with BRG correction
+
+def rgb_to_rgb565_brg(img, gamma=2.2):
+    """
+    Pack an RGB image as little-endian RGB565 in the display's BRG layout.
+
+    Args:
+        img: PIL RGB image
+        gamma: Gamma correction value (1.0 = none)
+
+    Returns:
+        bytearray, 2 bytes per pixel
+    """
+    lut = gamma_lut(gamma)
+    if np is not None:
+        rgb = np.asarray(img, dtype=np.uint8)
+        if gamma != 1.0:
+            rgb = np.asarray(lut, dtype=np.uint8)[rgb]
+        rgb = rgb.astype(np.uint16)
+        r = rgb[..., 0]
+        g = rgb[..., 1]
+        b = rgb[..., 2]
+        rgb565 = ((b & 0xF8) << 8) | ((r & 0xFC) << 3) | (g >> 3)
+        return bytearray(rgb565.astype('<u2').tobytes())
+
+    # Without NumPy: the table per pixel over the raw RGB bytes
+    data = img.tobytes()
+    byte_array = bytearray(len(data) // 3 * 2)
+    j = 0
+    for i in range(0, len(data), 3):
+        r = lut[data[i]]
+        g = lut[data[i + 1]]
+        b = lut[data[i + 2]]
+        rgb565 = ((b & 0xF8) << 8) | ((r & 0xFC) << 3) | (g >> 3)
+        byte_array[j] = rgb565 & 0xFF
+        byte_array[j + 1] = rgb565 >> 8
+        j += 2
+    return byte_array
+
+
+def rgb_to_rgb565_brg_reference(img, gamma=2.2):
+    """
+    The original per-pixel conversion (getpixel + pow), kept for --check.
+
+    Args:
+        img: PIL RGB image
+        gamma: Gamma correction value (1.0 = none)
+
+    Returns:
+        bytearray, 2 bytes per pixel
+    """
     byte_array = bytearray()
 
-    for y in range(240):
-        for x in range(240):
+    width, height = img.size
+    for y in range(height):
+        for x in range(width):
             r, g, b = img.getpixel((x, y))
 
             # Apply gamma correction to brighten mid-tones
@@ -95,9 +183,38 @@ def convert_image_to_rgb565_brg(image_path, variable_name, gamma=2.2):
             byte_array.append(rgb565 & 0xFF)
             byte_array.append((rgb565 >> 8) & 0xFF)
 
+    return byte_array
+
+
+def convert_image_to_rgb565_brg(image_path, variable_name, gamma=2.2, check=False,
+                                size=(240, 240)):
+    """
+    Convert image to RGB565 byte array with BRG color correction.
+
+    Args:
+        image_path: Path to JPG/PNG file
+        variable_name: Variable name for the Python output
+        gamma: Gamma correction value (default 2.2 for sRGB). Set to 1.0 to disable.
+        check: Also run the per-pixel reference conversion and raise
+               ValueError unless the bytes match
+        size: Output (width, height)
+
+    Returns:
+        Tuple of (byte_array, image_info_dict)
+    """
+    img, (orig_width, orig_height) = load_rgb_image(image_path, size)
+
+    # Convert to RGB565 with BRG correction
+    byte_array = rgb_to_rgb565_brg(img, gamma)
+    if check:
+        reference = rgb_to_rgb565_brg_reference(img, gamma)
+        if byte_array != reference:
+            first = next(i for i in range(len(reference)) if byte_array[i] != reference[i])
+            raise ValueError(f"{image_path}: output differs from the reference at byte {first}")
+
     info = {
         'original_size': (orig_width, orig_height),
-        'output_size': (240, 240),
+        'output_size': tuple(size),
         'byte_count': len(byte_array),
         'variable_name': variable_name,
         'gamma': gamma
@@ -106,7 +223,8 @@ def convert_image_to_rgb565_brg(image_path, variable_name, gamma=2.2):
     return byte_array, info
 
 
-def generate_python_code(byte_array, variable_name, image_path, info):
+def generate_python_code(byte_array, variable_name, image_path, info, file=None,
+                         chunk_size=CHUNK_SIZE):
     """
     Generate Python code with the byte array using bytes literal format (memory efficient).
 
@@ -115,48 +233,440 @@ def generate_python_code(byte_array, variable_name, image_path, info):
         variable_name: Name for the Python variable
         image_path: Original image path
         info: Dictionary with image info
+        file: Output stream (default: stdout)
+        chunk_size: Bytes per chunk; 0 = one bytes object (for frozen modules)
     """
-    print(f"# Image: {os.path.basename(image_path)}")
-    print(f"# Original size: {info['original_size'][0]}x{info['original_size'][1]}")
-    print(f"# Output size: 240x240 pixels")
-    print(f"# Format: RGB565 (BRG color corrected)")
+    file = file or sys.stdout
+    print(f"# Image: {os.path.basename(image_path)}", file=file)
+    print(f"# Original size: {info['original_size'][0]}x{info['original_size'][1]}", file=file)
+    print(f"# Output size: {info['output_size'][0]}x{info['output_size'][1]} pixels", file=file)
+    print("# Format: RGB565 (BRG color corrected)", file=file)
     gamma_note = f" with gamma correction {info['gamma']}" if info['gamma'] != 1.0 else ""
-    print(f"# Size: {len(byte_array):,} bytes{gamma_note}")
-    print()
+    print(f"# Size: {len(byte_array):,} bytes{gamma_note}", file=file)
+    print(file=file)
 
     # Split into small chunks stored as separate variables
     # Then concatenate at runtime to avoid parser issues
-    # Use 2KB chunks to keep line length reasonable
-    chunk_size = 2048
-    num_chunks = (len(byte_array) + chunk_size - 1) // chunk_size
+    # Store as tuple of chunks - don't concatenate at import time!
+    # The display function will handle chunks to save memory
+    chunks = _print_chunks(byte_array, variable_name, file, chunk_size)
+    print(file=file)
+    print(f"{variable_name} = {chunks}", file=file)
+    print(file=file)
+
 
-    # Generate chunk variables
+def _pack_rgb565_brg(r, g, b):
+    return ((b & 0xF8) << 8) | ((r & 0xFC) << 3) | (g >> 3)
+
+
+def quantize_rgb565(img, gamma=2.2, colors=256):
+    """
+    Palette-index an RGB image for the display.
+
+    If the image has at most `colors` distinct RGB565 values (after gamma)
+    the result is exact. Otherwise the gamma-corrected image is quantized
+    with median cut and Floyd-Steinberg dithering.
+
+    Args:
+        img: PIL RGB image
+        gamma: Gamma correction value (1.0 = none)
+        colors: Largest palette (16 or 256)
+
+    Returns:
+        Tuple of (indices as bytes, one per pixel; list of RGB565 palette
+        values; True if lossless)
+    """
+    rgb565 = rgb_to_rgb565_brg(img, gamma)
+    if np is not None:
+        values = np.frombuffer(bytes(rgb565), dtype='<u2')
+        palette, indices = np.unique(values, return_inverse=True)
+        if len(palette) <= colors:
+            return indices.astype(np.uint8).tobytes(), [int(v) for v in palette], True
+    else:
+        seen = {}
+        indices = bytearray(len(rgb565) // 2)
+        for i in range(len(indices)):
+            v = rgb565[2 * i] | (rgb565[2 * i + 1] << 8)
+            index = seen.setdefault(v, len(seen))
+            if index >= colors:
+                break
+            indices[i] = index
+        else:
+            return bytes(indices), list(seen), True
+
+    # Too many colours: quantize the gamma-corrected image
+    if gamma != 1.0:
+        img = img.point(gamma_lut(gamma) * 3)
+    quantized = img.quantize(colors=colors, method=Image.Quantize.MEDIANCUT,
+                             dither=Image.Dither.FLOYDSTEINBERG)
+    rgb = quantized.getpalette()[:3 * colors]
+    palette = [_pack_rgb565_brg(rgb[i], rgb[i + 1], rgb[i + 2])
+               for i in range(0, len(rgb), 3)]
+    indices = quantized.tobytes()
+    palette = palette[:max(indices) + 1]
+    return indices, palette, False
+
+
+def pack_indices(indices, bits):
+    """
+    Pack one-index-per-byte data as GS8 (unchanged) or GS4_HMSB.
+
+    GS4_HMSB holds two pixels per byte, the left one in the high nibble,
+    rows back to back (framebuf needs an even width for that).
+    """
+    if bits == 8:
+        return bytearray(indices)
+    if len(indices) % 2:
+        indices = bytes(indices) + b'\x00'
+    if np is not None:
+        pairs = np.frombuffer(bytes(indices), dtype=np.uint8).reshape(-1, 2)
+        return bytearray(((pairs[:, 0] << 4) | (pairs[:, 1] & 0x0F)).astype(np.uint8).tobytes())
+    return bytearray((indices[i] << 4) | (indices[i + 1] & 0x0F)
+                     for i in range(0, len(indices), 2))
+
+
+def convert_image_indexed(image_path, variable_name, fmt='gs8', gamma=2.2, check=False,
+                          size=(240, 240)):
+    """
+    Convert an image to palette-indexed GS4/GS8 data with an RGB565 (BRG) palette.
+
+    Args:
+        image_path: Path to JPG/PNG file
+        variable_name: Variable name for the Python output
+        fmt: 'gs4' (16 colours) or 'gs8' (256 colours)
+        gamma: Gamma correction value (default 2.2 for sRGB). Set to 1.0 to disable.
+        check: Raise ValueError unless the image converts losslessly
+        size: Output (width, height)
+
+    Returns:
+        Tuple of (index byte_array, palette bytes, image_info_dict)
+    """
+    tag, colors = INDEXED_FORMATS[fmt]
+    if fmt == 'gs4' and size[0] % 2:
+        raise ValueError(f"{image_path}: gs4 needs an even width, got {size[0]}")
+    img, (orig_width, orig_height) = load_rgb_image(image_path, size)
+    indices, palette, lossless = quantize_rgb565(img, gamma, colors)
+    if check and not lossless:
+        raise ValueError(f"{image_path}: more than {colors} colours, {fmt} is lossy")
+    if not lossless:
+        print(f"# Quantized to {len(palette)} colours (lossy)", file=sys.stderr)
+
+    byte_array = pack_indices(indices, 8 if fmt == 'gs8' else 4)
+    palette_bytes = b''.join(bytes((v & 0xFF, v >> 8)) for v in palette)
+    info = {
+        'original_size': (orig_width, orig_height),
+        'output_size': tuple(size),
+        'byte_count': len(byte_array) + len(palette_bytes),
+        'variable_name': variable_name,
+        'gamma': gamma,
+        'format': tag,
+        'colors': len(palette),
+        'lossless': lossless,
+    }
+    return byte_array, palette_bytes, info
+
+
+def _print_chunks(byte_array, variable_name, file, chunk_size=CHUNK_SIZE):
+    """
+    Print chunk variables; returns the tuple expression joining them.
+
+    chunk_size 0 prints a single bytes object and returns its name
+    instead: frozen into the firmware, it stays in flash and can be read
+    in place through a memoryview (see asset_store.py).
+    """
+    if not chunk_size:
+        hex_str = ''.join(map(_HEX.__getitem__, byte_array))
+        print(f"_{variable_name}_data = b'{hex_str}'", file=file)
+        return f'_{variable_name}_data'
+    num_chunks = (len(byte_array) + chunk_size - 1) // chunk_size
     for chunk_num in range(num_chunks):
         start = chunk_num * chunk_size
-        end = min(start + chunk_size, len(byte_array))
-        chunk = byte_array[start:end]
-        hex_str = ''.join(f'\\x{b:02x}' for b in chunk)
-        print(f"_{variable_name}_p{chunk_num} = b'{hex_str}'")
+        chunk = byte_array[start:start + chunk_size]
+        hex_str = ''.join(map(_HEX.__getitem__, chunk))
+        print(f"_{variable_name}_p{chunk_num} = b'{hex_str}'", file=file)
+    names = [f'_{variable_name}_p{i}' for i in range(num_chunks)]
+    return '(' + ', '.join(names) + (',)' if len(names) == 1 else ')')
 
-    print()
 
-    # Store as tuple of chunks - don't concatenate at import time!
-    # The display function will handle chunks to save memory
-    chunk_vars = ', '.join(f'_{variable_name}_p{i}' for i in range(num_chunks))
-    print(f"{variable_name} = ({chunk_vars})")
-    print()
+def generate_indexed_python_code(byte_array, palette, variable_name, image_path, info,
+                                 file=None, chunk_size=CHUNK_SIZE):
+    """
+    Generate Python code for a palette-indexed image.
+
+    The variable is a tuple (format, width, height, palette, chunks):
+    format is 'GS4' or 'GS8', palette the RGB565 colours (2 bytes each,
+    little-endian) and chunks a tuple of 2 KB bytes objects with the
+    indices (with chunk_size 0: one bytes object).
+    image_display.load_image_to_framebuffer() draws it.
+
+    Args:
+        byte_array: bytearray with packed indices
+        palette: bytes with the RGB565 palette
+        variable_name: Name for the Python variable
+        image_path: Original image path
+        info: Dictionary with image info
+        file: Output stream (default: stdout)
+        chunk_size: Bytes per chunk; 0 = one bytes object (for frozen modules)
+    """
+    file = file or sys.stdout
+    width, height = info['output_size']
+    print(f"# Image: {os.path.basename(image_path)}", file=file)
+    print(f"# Original size: {info['original_size'][0]}x{info['original_size'][1]}", file=file)
+    print(f"# Output size: {width}x{height} pixels", file=file)
+    exact = "exact" if info['lossless'] else "quantized"
+    print(f"# Format: {info['format']} indexed, {info['colors']}-colour RGB565 (BRG) palette ({exact})",
+          file=file)
+    gamma_note = f" with gamma correction {info['gamma']}" if info['gamma'] != 1.0 else ""
+    print(f"# Size: {len(byte_array):,} + {len(palette):,} palette bytes{gamma_note}", file=file)
+    print(file=file)
+    print(f"_{variable_name}_pal = b'{''.join(map(_HEX.__getitem__, palette))}'", file=file)
+    chunks = _print_chunks(byte_array, variable_name, file, chunk_size)
+    print(file=file)
+    print(f"{variable_name} = ('{info['format']}', {width}, {height}, _{variable_name}_pal, {chunks})",
+          file=file)
+    print(file=file)
+
+
+def pack_rects(sizes, width=ATLAS_WIDTH):
+    """
+    Place rectangles in rows (tallest first, left to right).
+
+    Args:
+        sizes: Dictionary name -> (w, h)
+        width: Row width; at most the rectangles side by side, at least
+               the widest one
+
+    Returns:
+        Tuple of (dictionary name -> (x, y, w, h), atlas width, atlas height)
+    """
+    width = min(width, sum(w for w, _ in sizes.values()))
+    width = max([width] + [w for w, _ in sizes.values()])
+    order = sorted(sizes, key=lambda name: (-sizes[name][1], name))
+    rects = {}
+    x = y = row_height = 0
+    for name in order:
+        w, h = sizes[name]
+        if x + w > width:
+            x = 0
+            y += row_height
+            row_height = 0
+        rects[name] = (x, y, w, h)
+        x += w
+        row_height = max(row_height, h)
+    return rects, width, y + row_height
+
+
+def pick_key_color(used):
+    """A transparent key colour not in used: magenta if free, else the highest free value."""
+    key = _pack_rgb565_brg(255, 0, 255)
+    if key in used:
+        key = next(v for v in range(0xFFFF, -1, -1) if v not in used)
+    return key
+
+
+def build_atlas(image_paths, gamma=2.2, width=ATLAS_WIDTH):
+    """
+    Pack icons (at their own size) into one RGB565 (BRG) sprite atlas.
+
+    Args:
+        image_paths: Icon files; each sprite is named after its file
+                     (see variable_name_for())
+        gamma: Gamma correction value (1.0 = none)
+        width: Atlas row width in pixels
+
+    Returns:
+        Tuple of (byte_array, info dictionary with 'size', 'key' and
+        'index': name -> (x, y, w, h))
+    """
+    sprites = {}
+    for path in image_paths:
+        name = variable_name_for(path)
+        if name in sprites:
+            raise ValueError(f"{path}: duplicate sprite name '{name}'")
+        sprites[name] = Image.open(path).convert('RGBA')
+    if not sprites:
+        raise ValueError("No icons to pack")
+
+    index, atlas_w, atlas_h = pack_rects({name: img.size for name, img in sprites.items()}, width)
+    pixels = {}
+    used = set()
+    for name, img in sprites.items():
+        data = rgb_to_rgb565_brg(img.convert('RGB'), gamma)
+        opaque = [a >= 128 for a in img.getchannel('A').tobytes()]
+        values = [data[2 * i] | (data[2 * i + 1] << 8) for i in range(len(opaque))]
+        used.update(v for v, o in zip(values, opaque) if o)
+        pixels[name] = (values, opaque)
+
+    key = pick_key_color(used)
+    atlas = [key] * (atlas_w * atlas_h)
+    for name, (values, opaque) in pixels.items():
+        x, y, w, h = index[name]
+        for row in range(h):
+            dst = (y + row) * atlas_w + x
+            for col in range(w):
+                if opaque[row * w + col]:
+                    atlas[dst + col] = values[row * w + col]
+
+    byte_array = bytearray(2 * len(atlas))
+    byte_array[0::2] = bytes(v & 0xFF for v in atlas)
+    byte_array[1::2] = bytes(v >> 8 for v in atlas)
+    info = {'size': (atlas_w, atlas_h), 'key': key, 'index': index, 'gamma': gamma}
+    return byte_array, info
+
+
+def generate_atlas_python_code(byte_array, variable_name, source, info, file=None,
+                               chunk_size=CHUNK_SIZE):
+    """
+    Generate Python code for a sprite atlas.
+
+    The variable is a tuple ('ATLAS', width, height, key, index, chunks):
+    key is the transparent RGB565 value, index maps sprite names to their
+    (x, y, w, h) in the atlas and chunks holds the RGB565 pixels like an
+    image. sprites.SpriteAtlas draws from it.
+
+    Args:
+        byte_array: bytearray with the atlas pixels
+        variable_name: Name for the Python variable
+        source: Icon directory (for the header)
+        info: Dictionary from build_atlas()
+        file: Output stream (default: stdout)
+        chunk_size: Bytes per chunk; 0 = one bytes object (for frozen modules)
+    """
+    file = file or sys.stdout
+    width, height = info['size']
+    print(f"# Sprite atlas: {len(info['index'])} icons from {os.path.basename(os.path.normpath(source))}/",
+          file=file)
+    print(f"# Output size: {width}x{height} pixels", file=file)
+    print(f"# Format: RGB565 (BRG color corrected), transparent key 0x{info['key']:04X}", file=file)
+    gamma_note = f" with gamma correction {info['gamma']}" if info['gamma'] != 1.0 else ""
+    print(f"# Size: {len(byte_array):,} bytes{gamma_note}", file=file)
+    print(file=file)
+    chunks = _print_chunks(byte_array, variable_name, file, chunk_size)
+    print(file=file)
+    print(f"{variable_name} = ('ATLAS', {width}, {height}, 0x{info['key']:04X}, {{", file=file)
+    for name, rect in sorted(info['index'].items()):
+        print(f"    '{name}': {rect},", file=file)
+    print(f"}}, {chunks})", file=file)
+    print(file=file)
+
+
+def variable_name_for(path):
+    """Python variable name from an image file name (background-1.jpg -> background_1)."""
+    stem = os.path.splitext(os.path.basename(path))[0]
+    name = ''.join(c if c.isalnum() else '_' for c in stem)
+    return name if name and not name[0].isdigit() else '_' + name
+
+
+def convert_file(image_path, output_path, variable_name, gamma=2.2, check=False,
+                 fmt='rgb565'):
+    """
+    Convert one image to a Python module file (batch worker).
+
+    Returns:
+        Tuple of (output_path, byte_count)
+    """
+    if fmt in INDEXED_FORMATS:
+        byte_array, palette, info = convert_image_indexed(image_path, variable_name, fmt,
+                                                          gamma, check)
+        with open(output_path, 'w') as f:
+            generate_indexed_python_code(byte_array, palette, variable_name, image_path, info,
+                                         file=f)
+        return output_path, info['byte_count']
+    byte_array, info = convert_image_to_rgb565_brg(image_path, variable_name, gamma, check)
+    with open(output_path, 'w') as f:
+        generate_python_code(byte_array, variable_name, image_path, info, file=f)
+    return output_path, len(byte_array)
+
+
+def convert_directory(input_dir, output_dir, gamma=2.2, check=False, jobs=None, fmt='rgb565'):
+    """
+    Convert every image in input_dir to <output_dir>/<variable_name>.py.
+
+    Args:
+        jobs: Worker processes (default: one per CPU; 1 = no pool)
+        fmt: 'rgb565', 'gs8' or 'gs4'
+
+    Returns:
+        List of (output_path, byte_count) in file name order
+    """
+    images = sorted(name for name in os.listdir(input_dir)
+                    if name.lower().endswith(IMAGE_EXTENSIONS))
+    os.makedirs(output_dir, exist_ok=True)
+    work = []
+    for name in images:
+        variable_name = variable_name_for(name)
+        work.append((os.path.join(input_dir, name),
+                     os.path.join(output_dir, variable_name + '.py'),
+                     variable_name, gamma, check, fmt))
+    if jobs == 1 or len(work) < 2:
+        return [convert_file(*args) for args in work]
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        return list(pool.map(convert_file, *zip(*work)))
 
 
 def main():
-    if len(sys.argv) != 3:
-        print("Usage: python convert_image.py <image_file> <variable_name>", file=sys.stderr)
-        print("\nExample:", file=sys.stderr)
-        print("  python convert_image.py background.jpg bg_image > temp.py", file=sys.stderr)
-        print("\nThen copy the output from temp.py into image_data.py", file=sys.stderr)
+    parser = argparse.ArgumentParser(
+        description="Convert images to RGB565 (BRG) or palette-indexed Python byte arrays "
+                    "for image_data.py",
+        epilog="Example: python convert_image.py background.jpg bg_image > temp.py, "
+               "then copy the output from temp.py into image_data.py")
+    parser.add_argument('image_file', nargs='?', help='image to convert')
+    parser.add_argument('variable_name', nargs='?', help='Python variable name for the output')
+    parser.add_argument('--batch', nargs=2, metavar=('INPUT_DIR', 'OUTPUT_DIR'),
+                        help='convert every image in INPUT_DIR to OUTPUT_DIR/<name>.py')
+    parser.add_argument('--atlas', nargs=2, metavar=('ICON_DIR', 'VARIABLE_NAME'),
+                        help='pack every PNG in ICON_DIR into one RGB565 sprite atlas')
+    parser.add_argument('--atlas-width', type=int, default=ATLAS_WIDTH,
+                        help=f'atlas row width in pixels (default {ATLAS_WIDTH})')
+    parser.add_argument('--jobs', type=int, help='batch worker processes (default: CPUs)')
+    parser.add_argument('--gamma', type=float, default=2.2, help='gamma (1.0 = none)')
+    parser.add_argument('--format', choices=('rgb565',) + tuple(INDEXED_FORMATS),
+                        default='rgb565',
+                        help='rgb565 (2 bytes/pixel), gs8 (256-colour palette, 1 byte/pixel) '
+                             'or gs4 (16-colour palette, 1/2 byte/pixel)')
+    parser.add_argument('--check', action='store_true',
+                        help='verify against the per-pixel reference conversion '
+                             '(gs4/gs8: fail unless the palette is exact)')
+    args = parser.parse_args()
+
+    if args.batch:
+        input_dir, output_dir = args.batch
+        if not os.path.isdir(input_dir):
+            print(f"Error: Directory not found: {input_dir}", file=sys.stderr)
+            sys.exit(1)
+        try:
+            results = convert_directory(input_dir, output_dir, args.gamma, args.check, args.jobs,
+                                        args.format)
+        except ValueError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            sys.exit(1)
+        for output_path, byte_count in results:
+            print(f"# {output_path}: {byte_count:,} bytes", file=sys.stderr)
+        print(f"# Converted {len(results)} images", file=sys.stderr)
+        return
+
+    if args.atlas:
+        icon_dir, variable_name = args.atlas
+        if not os.path.isdir(icon_dir):
+            print(f"Error: Directory not found: {icon_dir}", file=sys.stderr)
+            sys.exit(1)
+        paths = [os.path.join(icon_dir, name) for name in sorted(os.listdir(icon_dir))
+                 if name.lower().endswith('.png')]
+        try:
+            byte_array, info = build_atlas(paths, args.gamma, args.atlas_width)
+        except (ValueError, OSError) as e:
+            print(f"Error: {e}", file=sys.stderr)
+            sys.exit(1)
+        generate_atlas_python_code(byte_array, variable_name, icon_dir, info)
+        print(f"# Packed {len(info['index'])} icons into {info['size'][0]}x{info['size'][1]} "
+              f"({len(byte_array):,} bytes)", file=sys.stderr)
+        return
+
+    if not args.image_file or not args.variable_name:
+        parser.print_usage(sys.stderr)
         sys.exit(1)
-
-    image_path = sys.argv[1]
-    variable_name = sys.argv[2]
+    image_path = args.image_file
+    variable_name = args.variable_name
 
     # Check if file exists
     if not os.path.exists(image_path):
@@ -165,11 +675,31 @@ def main():
 
     # Convert image
     print(f"# Converting {image_path}...", file=sys.stderr)
-    byte_array, info = convert_image_to_rgb565_brg(image_path, variable_name)
-    print(f"# Generated {len(byte_array):,} bytes", file=sys.stderr)
+    palette = None
+    try:
+        if args.format in INDEXED_FORMATS:
+            byte_array, palette, info = convert_image_indexed(image_path, variable_name,
+                                                              args.format, args.gamma, args.check)
+        else:
+            byte_array, info = convert_image_to_rgb565_brg(image_path, variable_name,
+                                                           args.gamma, args.check)
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+    except OSError as e:
+        print(f"Error loading image: {e}", file=sys.stderr)
+        sys.exit(1)
+    if args.check and palette is None:
+        print("# Output matches the per-pixel reference byte for byte", file=sys.stderr)
+    elif args.check:
+        print(f"# Palette is exact ({info['colors']} colours)", file=sys.stderr)
+    print(f"# Generated {info['byte_count']:,} bytes", file=sys.stderr)
 
     # Generate Python code
-    generate_python_code(byte_array, variable_name, image_path, info)
+    if palette is None:
+        generate_python_code(byte_array, variable_name, image_path, info)
+    else:
+        generate_indexed_python_code(byte_array, palette, variable_name, image_path, info)
 
     print(f"# Conversion complete!", file=sys.stderr)
     print(f"# Copy the output above into image_data.py", file=sys.stderr)
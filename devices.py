@@ -0,0 +1,193 @@
+# Device Table for Multi-Device Telemetry
+# Keeps the state of several Victron devices (e.g. a SmartShunt plus MPPT
+# chargers) reporting through one Pico, in preallocated arrays with a
+# fixed footprint, and maintains aggregates such as the total charge
+# current incrementally so reading them is O(1).
+#
+# Devices are identified by a short tag carried in the command name:
+#     BATSYS@mppt1:52.10,14.5,31.0
+#     CHARGING@mppt1:1
+#     BATTERY@shunt:78
+#     DEVICE@mppt1:charger        (declare the kind: charger / battery / other)
+# Tags are up to TAG_MAX bytes; a numeric id such as @2 works the same way.
+# Untagged commands keep describing the main battery, as before.
+#
+# Each device gets the first free row when its tag is first seen and keeps
+# it, so a display row (see the "Devices" page in layouts.json) maps to a
+# fixed device index.
+#
+# Example:
+#     from devices import DeviceTable, KIND_CHARGER
+#
+#     table = DeviceTable()
+#     i = table.lookup(b'BATSYS@mppt1:52.1,14.5,31', 7, 12, add=True)
+#     table.set_batsys(i, 52100, 14500, 31000)
+#     table.total_charge_ma       # Sum over charging chargers, mA
+
+from array import array
+import time
+
+MAX_DEVICES = 6   # Rows on the Devices page
+TAG_MAX = 8       # Longest device tag in bytes
+
+# Device kinds
+KIND_OTHER = 0
+KIND_CHARGER = 1   # MPPT / AC charger: positive current adds to total charge
+KIND_BATTERY = 2   # Battery monitor (SmartShunt, BMV): reports SOC
+
+KIND_NAMES = (b'other', b'charger', b'battery')
+
+
+def parse_kind(data, start, end):
+    """Kind named by data[start:end] (e.g. b'charger'), or -1 if unknown."""
+    for kind in range(len(KIND_NAMES)):
+        name = KIND_NAMES[kind]
+        if end - start == len(name):
+            for j in range(len(name)):
+                if data[start + j] != name[j]:
+                    break
+            else:
+                return kind
+    return -1
+
+
+class DeviceTable:
+    """
+    Fixed-size table of tagged devices.
+
+    Per-device data lives in parallel arrays indexed by row:
+        tags[i*TAG_MAX : i*TAG_MAX+tag_len[i]]   device tag
+        kind[i]                                  KIND_*
+        voltage_mv[i], current_ma[i], temp_mc[i] last BATSYS values
+        soc[i]                                   last BATTERY value (-1 = none)
+        charging[i]                              last CHARGING state
+        updated[i]                               time.ticks_ms() of last update
+    Rows with tag_len[i] == 0 are free.
+    """
+
+    def __init__(self, max_devices=MAX_DEVICES):
+        """
+        Args:
+            max_devices: Number of rows (devices beyond this are rejected)
+        """
+        self.max_devices = max_devices
+        self.count = 0
+        self.tags = bytearray(max_devices * TAG_MAX)
+        self.tag_len = bytearray(max_devices)
+        self.kind = bytearray(max_devices)
+        self.voltage_mv = array('i', bytes(4 * max_devices))
+        self.current_ma = array('i', bytes(4 * max_devices))
+        self.temp_mc = array('i', bytes(4 * max_devices))
+        self.soc = array('b', b'\xff' * max_devices)
+        self.charging = bytearray(max_devices)
+        self.updated = array('i', bytes(4 * max_devices))
+
+        # Aggregates, updated incrementally by the setters
+        self.total_charge_ma = 0   # Sum of positive current over chargers
+        self.chargers_charging = 0  # Chargers reporting CHARGING:1
+
+    def lookup(self, data, start, end, add=False):
+        """
+        Find the row of the tag in data[start:end] (no allocation).
+
+        Args:
+            data: bytes containing the tag, e.g. the command line
+            start, end: Tag position in data
+            add: Allocate a free row for an unknown tag
+
+        Returns:
+            Row index, or -1 if unknown (or table full / tag invalid when adding)
+        """
+        n = end - start
+        if n <= 0 or n > TAG_MAX:
+            return -1
+        tags = self.tags
+        tag_len = self.tag_len
+        free = -1
+        for i in range(self.max_devices):
+            if tag_len[i] != n:
+                if free < 0 and tag_len[i] == 0:
+                    free = i
+                continue
+            base = i * TAG_MAX
+            for j in range(n):
+                if tags[base + j] != data[start + j]:
+                    break
+            else:
+                return i
+        if not add or free < 0:
+            return -1
+        base = free * TAG_MAX
+        for j in range(n):
+            tags[base + j] = data[start + j]
+        tag_len[free] = n
+        # Tagged devices are chargers unless declared otherwise
+        self.kind[free] = KIND_CHARGER
+        self.soc[free] = -1
+        self.count += 1
+        self._touch(free)
+        return free
+
+    def tag(self, i):
+        """Tag of row i as bytes (allocates)."""
+        base = i * TAG_MAX
+        return bytes(self.tags[base:base + self.tag_len[i]])
+
+    def _touch(self, i):
+        self.updated[i] = time.ticks_ms()
+
+    def _charge(self, i):
+        """Row i's contribution to total_charge_ma."""
+        if self.kind[i] != KIND_CHARGER:
+            return 0
+        current = self.current_ma[i]
+        return current if current > 0 else 0
+
+    def set_kind(self, i, kind):
+        """Change a device's kind, moving its share of the aggregates."""
+        self.total_charge_ma -= self._charge(i)
+        self.chargers_charging -= self.charging[i] if self.kind[i] == KIND_CHARGER else 0
+        self.kind[i] = kind
+        self.total_charge_ma += self._charge(i)
+        self.chargers_charging += self.charging[i] if kind == KIND_CHARGER else 0
+        self._touch(i)
+
+    def set_batsys(self, i, voltage_mv, current_ma, temp_mc):
+        """Store a BATSYS reading (fixed-point mV, mA, m°C)."""
+        self.total_charge_ma -= self._charge(i)
+        self.voltage_mv[i] = voltage_mv
+        self.current_ma[i] = current_ma
+        self.temp_mc[i] = temp_mc
+        self.total_charge_ma += self._charge(i)
+        self._touch(i)
+
+    def set_charging(self, i, state):
+        """Store a CHARGING state (0/1)."""
+        state = 1 if state else 0
+        if self.kind[i] == KIND_CHARGER:
+            self.chargers_charging += state - self.charging[i]
+        self.charging[i] = state
+        self._touch(i)
+
+    def set_soc(self, i, soc):
+        """Store a BATTERY state of charge (0-100)."""
+        self.soc[i] = soc
+        self._touch(i)
+
+    def get_status(self):
+        """Dictionary of devices and aggregates for logging."""
+        now = time.ticks_ms()
+        return {
+            'devices': [
+                {
+                    'tag': self.tag(i).decode(),
+                    'kind': KIND_NAMES[self.kind[i]].decode(),
+                    'current_ma': self.current_ma[i],
+                    'charging': self.charging[i],
+                    'age_ms': time.ticks_diff(now, self.updated[i]),
+                }
+                for i in range(self.max_devices) if self.tag_len[i]
+            ],
+            'total_charge_ma': self.total_charge_ma,
+            'chargers_charging': self.chargers_charging,
+        }
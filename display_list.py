@@ -0,0 +1,510 @@
+# Compiled Display Lists for Page Layouts
+# Compiles the declarative page layouts in layouts.json into a compact
+# display list (opcodes and arguments in arrays) that is replayed with a
+# tight loop - no dict lookups or string parsing at render time
+#
+# Layout file format (see layouts.json):
+#     "colors": name -> "0xRRRR" RGB565 value (as used by the LCD)
+#     "slots":  name -> value slot definition
+#         {"type": "fixed", "scale": 3, "decimals": 1, "unit": "V",
+#          "plus": false, "chars": 6, "color": {"positive": ..,
+#          "negative": .., "zero": ..}}
+#         {"type": "enum", "labels": [...], "default": "Unknown",
+#          "colors": [...], "default_color": ..}
+#         {"type": "text", "chars": 8}            (set with set_text())
+#         Any slot may add "count": N (N slots named "name.0" .. "name.N-1")
+#         and "blank": true (starts as BLANK, which draws nothing)
+#     "pages":  name -> {"background": color, "items": [...]}
+#         {"type": "text", "text": "SOC:", "x": 20, "y": 60, "size": 1, "color": ..}
+#         {"type": "hline", "x": 10, "y": 35, "w": 220, "color": ..}
+#         {"type": "value", "slot": "soc", "x": 140, "y": 57, "size": 2,
+#          "color": .. or "slot"}
+#         {"type": "repeat", "count": N, "dx": 0, "dy": 22, "items": [...]}
+#          (items repeated N times, offset by row * (dx, dy); a counted
+#           slot inside refers to that row's slot "name.<row>")
+#
+# Every item gets a bounding box at compile time. Setting a slot value
+# marks it dirty; render_dirty() then clears only the boxes of the items
+# showing that slot, redraws every item overlapping them and flushes just
+# those rectangles to the panel. Dirty slots are kept in a list, so the
+# cost of an update does not grow with the number of slots or rows.
+#
+# Example:
+#     from display_list import load
+#
+#     dl = load("layouts.json")
+#     page = dl.page("SystemInfo")
+#     VOLTAGE = dl.slot("voltage")
+#     dl.set(VOLTAGE, 48520)          # fixed-point mV
+#     dl.render(lcd, page)            # full page
+#     lcd.show()
+#     dl.set(VOLTAGE, 48610)
+#     dl.render_dirty(lcd, page)      # redraw + flush only the changed value
+
+from array import array
+from numfmt import format_fixed, draw_text, write_text
+from numfmt import UNIT_NONE, UNIT_V, UNIT_A, UNIT_PERCENT, UNIT_DEG_C
+
+# Opcodes (one byte each in DisplayList.ops)
+OP_TEXT = 0   # args: x, y, size, color, string index
+OP_HLINE = 1  # args: x, y, width, color, 0
+OP_VALUE = 2  # args: x, y, size, color (COLOR_SLOT = slot color), slot index
+
+ARGS_PER_OP = 5
+
+# Slot kinds
+SLOT_FIXED = 0
+SLOT_ENUM = 1
+SLOT_TEXT = 2
+
+# Slot value that draws nothing (e.g. an unused table row)
+BLANK = -0x80000000
+
+# Item color taken from the slot (sign or enum dependent)
+COLOR_SLOT = -1
+
+# How a slot picks its color
+_SLOT_COLOR_NONE = 0
+_SLOT_COLOR_SIGN = 1
+_SLOT_COLOR_ENUM = 2
+
+_UNITS = {"": UNIT_NONE, "V": UNIT_V, "A": UNIT_A, "%": UNIT_PERCENT, "C": UNIT_DEG_C}
+
+
+class DisplayList:
+    """
+    Compiled page layouts. Build with load() or compile_layouts().
+
+    Per-op data lives in parallel arrays indexed by op number:
+        ops[i]                   opcode
+        args[i*5 : i*5+5]        opcode arguments
+        bbox[i*4 : i*4+4]        x, y, w, h (clipped to the screen)
+        overlaps[i]              ops on the same page whose boxes intersect
+    Pages are contiguous op ranges; slots hold the current values.
+    """
+
+    def __init__(self):
+        self.ops = array('B')
+        self.args = array('i')
+        self.bbox = array('h')
+        self.overlaps = ()
+        self.strings = ()
+
+        self.page_names = ()
+        self.page_first = array('H')
+        self.page_count = array('H')
+        self.page_bg = array('H')
+
+        self.slot_names = ()
+        self.slot_kind = array('B')
+        self.slot_scale = array('B')
+        self.slot_decimals = array('B')
+        self.slot_plus = array('B')
+        self.slot_unit = array('B')
+        self.slot_color_mode = array('B')
+        self.slot_palette = ()      # Per slot: array of colors
+        self.slot_labels = ()       # Per slot: tuple of string indices (enum)
+        self.slot_default = array('H')  # Enum default label string index
+        self.slot_ops = ()          # Per slot: array of op indices showing it
+        self.slot_text = ()         # Per slot: bytearray (text slots) or None
+
+        self.values = array('i')    # Text slots: length of the text
+        self.slot_color = array('H')
+        self.dirty = array('B')
+        self._dirty_list = array('H')  # Slots with dirty[s] set
+
+        self._buf = bytearray(16)
+
+    def page(self, name):
+        """Return the page index for name, or -1 if no such page."""
+        try:
+            return self.page_names.index(name)
+        except ValueError:
+            return -1
+
+    def slot(self, name, row=-1):
+        """
+        Return the slot index for name (raises ValueError if unknown).
+
+        Args:
+            name: Slot name from layouts.json
+            row: Row of a counted slot (looks up "name.<row>")
+        """
+        if row >= 0:
+            name = "%s.%d" % (name, row)
+        return self.slot_names.index(name)
+
+    def set(self, slot, value):
+        """
+        Set a slot value, marking it dirty if it changed.
+
+        Args:
+            slot: Slot index from slot()
+            value: int (fixed-point for "fixed" slots, label index for "enum")
+
+        Returns:
+            True if the value changed
+        """
+        if self.values[slot] == value:
+            return False
+        self.values[slot] = value
+        self._mark(slot)
+        mode = self.slot_color_mode[slot]
+        if mode == _SLOT_COLOR_SIGN:
+            palette = self.slot_palette[slot]
+            self.slot_color[slot] = palette[0] if value > 0 else palette[1] if value < 0 else palette[2]
+        elif mode == _SLOT_COLOR_ENUM:
+            palette = self.slot_palette[slot]
+            self.slot_color[slot] = palette[value] if 0 <= value < len(palette) - 1 else palette[-1]
+        return True
+
+    def set_text(self, slot, data, start=0, end=-1):
+        """
+        Set a text slot from data[start:end], truncated to the slot width.
+
+        Args:
+            slot: Slot index of a "text" slot
+            data: bytes/bytearray (copied, nothing is kept)
+            start, end: Range of data to use (default: all)
+
+        Returns:
+            True if the text changed
+        """
+        if end < 0:
+            end = len(data)
+        buf = self.slot_text[slot]
+        n = min(end - start, len(buf))
+        changed = self.values[slot] != n
+        for j in range(n):
+            c = data[start + j]
+            if buf[j] != c:
+                buf[j] = c
+                changed = True
+        if changed:
+            self.values[slot] = n
+            self._mark(slot)
+        return changed
+
+    def _mark(self, slot):
+        if not self.dirty[slot]:
+            self.dirty[slot] = 1
+            self._dirty_list.append(slot)
+
+    def _clear_dirty(self):
+        dirty = self.dirty
+        for s in self._dirty_list:
+            dirty[s] = 0
+        self._dirty_list = array('H')
+
+    def _draw(self, lcd, i):
+        args = self.args
+        a = i * ARGS_PER_OP
+        op = self.ops[i]
+        x = args[a]
+        y = args[a + 1]
+        size = args[a + 2]
+        color = args[a + 3]
+        ref = args[a + 4]
+        if op == OP_TEXT:
+            if size == 1:
+                lcd.text(self.strings[ref], x, y, color)
+            else:
+                lcd.write_text(self.strings[ref], x, y, size, color)
+        elif op == OP_HLINE:
+            lcd.hline(x, y, size, color)
+        elif op == OP_VALUE:
+            if color == COLOR_SLOT:
+                color = self.slot_color[ref]
+            value = self.values[ref]
+            if value == BLANK:
+                return
+            kind = self.slot_kind[ref]
+            if kind == SLOT_TEXT:
+                if size == 1:
+                    draw_text(lcd, self.slot_text[ref], value, x, y, color)
+                else:
+                    write_text(lcd, self.slot_text[ref], value, x, y, size, color)
+            elif kind == SLOT_FIXED:
+                buf = self._buf
+                n = format_fixed(buf, value, self.slot_scale[ref], self.slot_decimals[ref],
+                                 self.slot_plus[ref], self.slot_unit[ref])
+                if size == 1:
+                    draw_text(lcd, buf, n, x, y, color)
+                else:
+                    write_text(lcd, buf, n, x, y, size, color)
+            else:
+                labels = self.slot_labels[ref]
+                text = self.strings[labels[value] if 0 <= value < len(labels) else self.slot_default[ref]]
+                if text:
+                    if size == 1:
+                        lcd.text(text, x, y, color)
+                    else:
+                        lcd.write_text(text, x, y, size, color)
+
+    def render(self, lcd, page):
+        """
+        Draw a whole page into the framebuffer (caller does lcd.show()).
+
+        Args:
+            lcd: LCD_1inch28 (or any FrameBuffer with write_text)
+            page: Page index from page()
+        """
+        lcd.fill(self.page_bg[page])
+        first = self.page_first[page]
+        for i in range(first, first + self.page_count[page]):
+            self._draw(lcd, i)
+        self._clear_dirty()
+
+    def damage(self, page):
+        """
+        Collect the rectangles that dirty slots invalidate on a page.
+
+        Returns:
+            List of op indices whose bounding boxes need redrawing
+        """
+        first = self.page_first[page]
+        last = first + self.page_count[page]
+        damaged = []
+        for s in self._dirty_list:
+            for i in self.slot_ops[s]:
+                if first <= i < last:
+                    damaged.append(i)
+        return damaged
+
+    def render_dirty(self, lcd, page, flush=True):
+        """
+        Redraw only what changed since the last render on this page.
+
+        Each damaged box is cleared to the page background, every op
+        overlapping it is replayed, and (if flush) the box alone is sent
+        to the panel with lcd.show_rect().
+
+        Args:
+            lcd: LCD_1inch28 instance
+            page: Page index from page()
+            flush: Send the damaged rectangles to the panel
+
+        Returns:
+            Number of rectangles redrawn
+        """
+        damaged = self.damage(page)
+        bbox = self.bbox
+        bg = self.page_bg[page]
+        for i in damaged:
+            b = i * 4
+            x = bbox[b]
+            y = bbox[b + 1]
+            w = bbox[b + 2]
+            h = bbox[b + 3]
+            lcd.fill_rect(x, y, w, h, bg)
+            for j in self.overlaps[i]:
+                self._draw(lcd, j)
+            if flush:
+                lcd.show_rect(x, y, w, h)
+        self._clear_dirty()
+        return len(damaged)
+
+
+def _color(spec, colors):
+    if isinstance(spec, int):
+        return spec
+    spec = colors.get(spec, spec)
+    return int(spec, 16) if isinstance(spec, str) else spec
+
+
+def _intern(strings, index, text):
+    i = index.get(text)
+    if i is None:
+        i = len(strings)
+        index[text] = i
+        strings.append(text)
+    return i
+
+
+def _clip(x, y, w, h, width, height):
+    x1 = min(x + w, width)
+    y1 = min(y + h, height)
+    x = max(x, 0)
+    y = max(y, 0)
+    return x, y, max(x1 - x, 0), max(y1 - y, 0)
+
+
+def _expand_slots(slots):
+    """Yield (name, definition) with counted slots expanded to name.0 .. name.N-1."""
+    for name, s in slots.items():
+        count = s.get("count")
+        if count is None:
+            yield name, s
+        else:
+            for row in range(count):
+                yield "%s.%d" % (name, row), s
+
+
+def _expand_items(items, dx=0, dy=0, row=-1):
+    """Yield (item, x offset, y offset, row) with repeat items unrolled."""
+    for item in items:
+        if item["type"] == "repeat":
+            for r in range(item["count"]):
+                for sub in _expand_items(item["items"], dx + r * item.get("dx", 0),
+                                         dy + r * item.get("dy", 0), r):
+                    yield sub
+        else:
+            yield item, dx, dy, row
+
+
+def compile_layouts(spec, width=240, height=240):
+    """
+    Compile a parsed layouts.json dict into a DisplayList.
+
+    Args:
+        spec: Layout dict (see module header for the format)
+        width, height: Screen size used to clip bounding boxes
+
+    Returns:
+        DisplayList
+
+    Raises:
+        ValueError: Unknown item type, slot or unit
+    """
+    dl = DisplayList()
+    colors = spec.get("colors", {})
+    strings = []
+    index = {}
+
+    # Slots
+    slot_names = []
+    palettes = []
+    labels_all = []
+    texts = []
+    widths = []
+    for name, s in _expand_slots(spec.get("slots", {})):
+        kind = s.get("type", "fixed")
+        slot_names.append(name)
+        mode = _SLOT_COLOR_NONE
+        palette = array('H')
+        labels = ()
+        default = _intern(strings, index, s.get("default", ""))
+        if kind == "fixed":
+            dl.slot_kind.append(SLOT_FIXED)
+            unit = s.get("unit", "")
+            if unit not in _UNITS:
+                raise ValueError("Unknown unit: %s" % unit)
+            dl.slot_unit.append(_UNITS[unit])
+            sign = s.get("color")
+            if sign:
+                mode = _SLOT_COLOR_SIGN
+                for key in ("positive", "negative", "zero"):
+                    palette.append(_color(sign[key], colors))
+            widths.append(s.get("chars", 8))
+        elif kind == "enum":
+            dl.slot_kind.append(SLOT_ENUM)
+            dl.slot_unit.append(UNIT_NONE)
+            labels = tuple(_intern(strings, index, t) for t in s["labels"])
+            if "colors" in s:
+                mode = _SLOT_COLOR_ENUM
+                for c in s["colors"]:
+                    palette.append(_color(c, colors))
+                palette.append(_color(s.get("default_color", "white"), colors))
+            longest = max([len(t) for t in s["labels"]] + [len(s.get("default", ""))])
+            widths.append(s.get("chars", longest))
+        elif kind == "text":
+            dl.slot_kind.append(SLOT_TEXT)
+            dl.slot_unit.append(UNIT_NONE)
+            widths.append(s.get("chars", 8))
+        else:
+            raise ValueError("Unknown slot type: %s" % kind)
+        dl.slot_scale.append(s.get("scale", 0))
+        dl.slot_decimals.append(s.get("decimals", 0))
+        dl.slot_plus.append(1 if s.get("plus") else 0)
+        dl.slot_color_mode.append(mode)
+        dl.slot_default.append(default)
+        palettes.append(palette)
+        labels_all.append(labels)
+        texts.append(bytearray(widths[-1]) if kind == "text" else None)
+        # Initial value: 0 for fixed, the default label for enums, empty text
+        dl.values.append(BLANK if s.get("blank") else -1 if kind == "enum" else 0)
+        dl.slot_color.append(palette[-1] if mode == _SLOT_COLOR_ENUM
+                             else palette[2] if mode == _SLOT_COLOR_SIGN else 0)
+        dl.dirty.append(0)
+    dl.slot_names = tuple(slot_names)
+    dl.slot_palette = tuple(palettes)
+    dl.slot_labels = tuple(labels_all)
+    dl.slot_text = tuple(texts)
+    slot_ops = [array('H') for _ in slot_names]
+
+    # Pages
+    page_names = []
+    overlaps = []
+    for name, page in spec.get("pages", {}).items():
+        page_names.append(name)
+        first = len(dl.ops)
+        dl.page_first.append(first)
+        dl.page_bg.append(_color(page.get("background", "black"), colors))
+        for item, dx, dy, row in _expand_items(page["items"]):
+            kind = item["type"]
+            x = item["x"] + dx
+            y = item["y"] + dy
+            size = item.get("size", 1)
+            color = item.get("color", "white")
+            if kind == "text":
+                text = item["text"]
+                dl.ops.append(OP_TEXT)
+                dl.args.extend((x, y, size, _color(color, colors),
+                                _intern(strings, index, text)))
+                box = (x, y, 8 * size * len(text), 8 * size)
+            elif kind == "hline":
+                dl.ops.append(OP_HLINE)
+                dl.args.extend((x, y, item["w"], _color(color, colors), 0))
+                box = (x, y, item["w"], 1)
+            elif kind == "value":
+                name = item["slot"]
+                if row >= 0 and name not in slot_names:
+                    name = "%s.%d" % (name, row)  # Counted slot: this row's copy
+                if name not in slot_names:
+                    raise ValueError("Unknown slot: %s" % name)
+                s = slot_names.index(name)
+                slot_ops[s].append(len(dl.ops))
+                dl.ops.append(OP_VALUE)
+                dl.args.extend((x, y, size,
+                                COLOR_SLOT if color == "slot" else _color(color, colors), s))
+                box = (x, y, 8 * size * widths[s], 8 * size)
+            else:
+                raise ValueError("Unknown item type: %s" % kind)
+            dl.bbox.extend(_clip(box[0], box[1], box[2], box[3], width, height))
+        dl.page_count.append(len(dl.ops) - first)
+
+        # Overlap lists (within the page, in draw order)
+        bbox = dl.bbox
+        for i in range(first, len(dl.ops)):
+            ax, ay, aw, ah = bbox[i * 4:i * 4 + 4]
+            hits = array('H')
+            for j in range(first, len(dl.ops)):
+                bx, by, bw, bh = bbox[j * 4:j * 4 + 4]
+                if ax < bx + bw and bx < ax + aw and ay < by + bh and by < ay + ah:
+                    hits.append(j)
+            overlaps.append(hits)
+
+    dl.page_names = tuple(page_names)
+    dl.overlaps = tuple(overlaps)
+    dl.slot_ops = tuple(slot_ops)
+    dl.strings = tuple(strings)
+    # Formatting buffer: widest slot plus room for sign and unit
+    dl._buf = bytearray(max([16] + [w + 4 for w in widths]))
+    return dl
+
+
+def load(path="layouts.json", width=240, height=240):
+    """
+    Read and compile a layout file.
+
+    Args:
+        path: JSON layout file
+        width, height: Screen size used to clip bounding boxes
+
+    Returns:
+        DisplayList
+    """
+    import json
+    with open(path) as f:
+        spec = json.load(f)
+    return compile_layouts(spec, width, height)
@@ -0,0 +1,114 @@
+# Lock-Protected Double Buffer for Handing State Between Cores
+# The core that owns the state (UART, touch) publishes complete snapshots;
+# the render core takes the newest one and draws it. Each snapshot is a
+# preallocated array of ints plus a bytearray, so publishing copies a few
+# hundred bytes and allocates nothing.
+#
+# Two snapshot slots: the render core holds `front` while drawing it; the
+# state core only ever writes the other slot (`back`) under the lock.
+# take() swaps the slots under the lock, so a snapshot is never modified
+# while it is being drawn and intermediate states published during a long
+# frame are simply replaced by the latest one.
+#
+# Works without _thread too (single core: publish() then take() inline),
+# and on CPython with real threads for host testing.
+#
+# Example:
+#     frames = StateBuffer(ints=16, data=48)
+#
+#     def capture(snap):                  # state core
+#         snap.ints[0] = battery_soc
+#     frames.publish(capture)
+#
+#     snap = frames.take()                # render core
+#     if snap is not None:
+#         draw(snap.ints[0])
+
+from array import array
+
+try:
+    import _thread
+except ImportError:
+    _thread = None
+
+
+class _NoLock:
+    """Stand-in lock when _thread is unavailable (single core)."""
+
+    def acquire(self, *args):
+        return True
+
+    def release(self):
+        pass
+
+
+class Snapshot:
+    """One published state: seq number, ints and raw bytes."""
+
+    def __init__(self, ints, data):
+        self.seq = 0
+        self.ints = array('i', bytes(4 * ints))
+        self.data = bytearray(data)
+
+
+class StateBuffer:
+    """
+    Double-buffered snapshots shared between two cores.
+
+    publish(fill) runs fill(snapshot) on the back slot under the lock;
+    take() returns the newest published snapshot (or None if nothing new)
+    and keeps it untouched until the next take().
+    """
+
+    def __init__(self, ints, data=0):
+        """
+        Args:
+            ints: Number of int fields per snapshot
+            data: Number of bytes per snapshot (e.g. device tags)
+        """
+        self.front = Snapshot(ints, data)   # Owned by the reader
+        self._back = Snapshot(ints, data)   # Written by publish()
+        self._lock = _thread.allocate_lock() if _thread else _NoLock()
+        self._fresh = False
+
+        self.published = 0
+        self.taken = 0
+
+    def publish(self, fill):
+        """
+        Write a new snapshot (state core).
+
+        Args:
+            fill: Callable filling the given Snapshot with the whole state
+        """
+        self._lock.acquire()
+        try:
+            fill(self._back)
+            self.published += 1
+            self._back.seq = self.published
+            self._fresh = True
+        finally:
+            self._lock.release()
+
+    def take(self):
+        """
+        Return the newest snapshot not yet taken, or None (render core).
+
+        The returned snapshot stays valid until the next call.
+        """
+        if not self._fresh:
+            return None
+        self._lock.acquire()
+        try:
+            front = self._back
+            self._back = self.front
+            self.front = front
+            self._fresh = False
+        finally:
+            self._lock.release()
+        self.taken += 1
+        return front
+
+    def skipped(self):
+        """Snapshots replaced before the reader took them."""
+        return self.published - self.taken
@@ -0,0 +1,191 @@
+# Bitmap Fonts
+# One Font class for the large digit fonts (bitmap_fonts.py 16x24,
+# bitmap_fonts_32.py 24x32, bitmap_fonts_48.py 24x48), which are data
+# files holding a Font each.
+#
+# Glyph data is one bytes object, MONO_HLSB: each glyph is height
+# rows of (width + 7) // 8 bytes, leftmost pixel in the top bit, glyphs
+# back to back in the order of the font's character string. A glyph is
+# drawn with one FrameBuffer.blit() through a two-colour palette whose
+# "off" colour is the blit key, so only the set pixels are written (what
+# the per-pixel loops of the old modules did, without the Python loop).
+# framebuf needs a writable buffer, so the Font keeps its glyphs as a
+# bytearray copy; the module's bytes literal is garbage once imported (or
+# stays in flash when frozen). A glyph's FrameBuffer view is made the
+# first time it is drawn, and all fonts share one palette, so an idle font
+# holds little more than its glyph bytes.
+#
+# Example:
+#     from bitmap_fonts_48 import FONT
+#
+#     width = FONT.measure("12:34", spacing=4)
+#     FONT.draw(lcd, "12:34", (240 - width) // 2, 100, lcd.white, spacing=4)
+
+import framebuf
+
+
+class Font:
+    """
+    A fixed-width bitmap font over compact glyph bytes.
+    """
+
+    _palette = None  # 2x1 RGB565 [key, color] shared by all fonts, made on first draw
+    _color = None    # Color the palette holds
+
+    def __init__(self, width, height, chars, glyphs, spacing=2):
+        """
+        Args:
+            width, height: Glyph size in pixels
+            chars: String of the characters in the font, in glyph order
+            glyphs: bytes, (width + 7) // 8 * height bytes per glyph (copied)
+            spacing: Default pixels between characters
+        """
+        self.width = width
+        self.height = height
+        self.spacing = spacing
+        self.row_bytes = (width + 7) // 8
+        self.glyph_bytes = self.row_bytes * height
+        if len(glyphs) != self.glyph_bytes * len(chars):
+            raise ValueError(f"{len(chars)} glyphs of {width}x{height} need "
+                             f"{self.glyph_bytes * len(chars)} bytes, got {len(glyphs)}")
+        self.chars = chars
+        self.glyphs = bytearray(glyphs)
+        self._views = [None] * len(chars)  # Per glyph FrameBuffer, made when first drawn
+
+    @classmethod
+    def from_rows(cls, width, height, rows, spacing=2):
+        """
+        Build a font from glyphs given as lists of row ints (the format of
+        BITMAP_FONTS_README.md: bit width-1 is the leftmost pixel).
+
+        Args:
+            rows: Dictionary char -> list of height ints
+        """
+        row_bytes = (width + 7) // 8
+        shift = row_bytes * 8 - width
+        glyphs = bytearray()
+        chars = ''
+        for char, bitmap in rows.items():
+            if len(bitmap) != height:
+                raise ValueError(f"Glyph '{char}' has {len(bitmap)} rows, not {height}")
+            chars += char
+            for row in bitmap:
+                glyphs.extend((row << shift).to_bytes(row_bytes, 'big'))
+        return cls(width, height, chars, bytes(glyphs), spacing)
+
+    def has_char(self, char):
+        """True if the font has a glyph for char."""
+        return len(char) == 1 and self.chars.find(char) >= 0
+
+    def measure(self, text, spacing=None, length=None):
+        """
+        Width of text in pixels (no spacing after the last character).
+
+        Args:
+            text: str, or a bytes-like buffer such as numfmt.FixedFormatter.buf
+            spacing: Pixels between characters (default: the font's)
+            length: Number of characters (default: all of text)
+        """
+        if spacing is None:
+            spacing = self.spacing
+        n = len(text) if length is None else length
+        if not n:
+            return 0
+        return n * (self.width + spacing) - spacing
+
+    def _glyph(self, char):
+        """FrameBuffer view of a glyph, or None if the font has no such char."""
+        i = self.chars.find(char)
+        if i < 0 or len(char) != 1:
+            return None
+        view = self._views[i]
+        if view is None:
+            size = self.glyph_bytes
+            view = self._views[i] = framebuf.FrameBuffer(
+                memoryview(self.glyphs)[i * size:(i + 1) * size], self.width, self.height,
+                framebuf.MONO_HLSB)
+        return view
+
+    def draw_char(self, fb, char, x, y, color):
+        """
+        Draw one character (nothing for characters not in the font).
+
+        Returns:
+            The glyph width
+        """
+        glyph = self._glyph(char)
+        if glyph is not None:
+            key = self._set_color(color)
+            fb.blit(glyph, x, y, key, Font._palette)
+        return self.width
+
+    def _set_color(self, color):
+        """Point the palette at color; returns the key (the "off" colour)."""
+        key = ~color & 0xFFFF
+        if Font._palette is None:
+            Font._palette = framebuf.FrameBuffer(bytearray(4), 2, 1, framebuf.RGB565)
+        if color != Font._color:
+            Font._color = color
+            Font._palette.pixel(0, 0, key)
+            Font._palette.pixel(1, 0, color)
+        return key
+
+    def draw(self, fb, text, x, y, color, spacing=None, length=None):
+        """
+        Draw text with the top-left corner at x, y; only set pixels are
+        written.
+
+        Args:
+            fb: FrameBuffer to draw into (e.g. LCD_1inch28)
+            text: str, or a bytes-like buffer such as numfmt.FixedFormatter.buf
+            x, y: Position
+            color: RGB565 color
+            spacing: Pixels between characters (default: the font's)
+            length: Number of characters (default: all of text)
+
+        Returns:
+            The advance in pixels: the x step to what follows the text
+            (spacing after the last character included)
+        """
+        if spacing is None:
+            spacing = self.spacing
+        if length is None:
+            length = len(text)
+        step = self.width + spacing
+        blit = fb.blit
+        palette = None
+        key = 0
+        for i in range(length):
+            char = text[i]
+            if not isinstance(char, str):
+                char = chr(char)
+            glyph = self._glyph(char)
+            if glyph is not None:
+                if palette is None:
+                    key = self._set_color(color)
+                    palette = Font._palette
+                blit(glyph, x + step * i, y, key, palette)
+        return step * length
+
+    def render_to_buffer(self, text, color, background=0x0000, spacing=None, length=None,
+                         buf=None):
+        """
+        Draw text into an RGB565 buffer of its own size, e.g. to cache a
+        label and blit it later (with key=background for transparency).
+
+        Args:
+            text, color, spacing, length: As for draw()
+            background: RGB565 colour of the unset pixels
+            buf: bytearray to reuse if large enough (default: a new one)
+
+        Returns:
+            Tuple of (FrameBuffer, width, height)
+        """
+        width = self.measure(text, spacing, length)
+        size = width * self.height * 2
+        if buf is None or len(buf) < size:
+            buf = bytearray(size)
+        fb = framebuf.FrameBuffer(buf, width, self.height, framebuf.RGB565)
+        fb.fill(background)
+        self.draw(fb, text, 0, 0, color, spacing, length)
+        return fb, width, self.height
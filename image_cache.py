@@ -0,0 +1,158 @@
+# Image Cache
+# Loads images from an asset store (asset_store.py; default: the
+# image_data index and its img_<name>.py modules) on demand and keeps the
+# ones in use within a RAM budget. Each image is fetched when first asked
+# for, prepared for drawing (see image_display.prepare_image()) and
+# released from the store again, so the cache holds the only reference and
+# evicting an image frees its RAM.
+#
+# The least recently used images are evicted first. Pinned images (the
+# active page's background) are never evicted. An image larger than what
+# is left of the budget is still loaded; the cache then runs over budget
+# until images are unpinned, and says so.
+#
+# Example:
+#     from image_cache import ImageCache
+#
+#     images = ImageCache(budget_bytes=120 * 1024)  # store=BinStore("images") for bin files
+#     images.pin('background1')            # Active page background
+#     bg = images.get('background1')       # Loads on the first call
+#     display_image_background(lcd, bg)
+#     print(images.get_status())           # hits, misses, evictions, ...
+
+from image_display import prepare_image
+
+DEFAULT_BUDGET = 128 * 1024  # Two RGB565 backgrounds would not fit
+
+
+class ImageCache:
+    """
+    LRU cache of prepared images bounded by a byte budget.
+    """
+
+    def __init__(self, budget_bytes=DEFAULT_BUDGET, store=None):
+        """
+        Args:
+            budget_bytes: Most bytes of image data to keep loaded
+            store: Asset store the images come from (default: ModuleStore)
+        """
+        if store is None:
+            from asset_store import ModuleStore
+            store = ModuleStore()
+        self.store = store
+        self.budget = budget_bytes
+        self.used = 0           # Bytes of the loaded images
+        self._images = {}       # name -> prepared image
+        self._lru = []          # Loaded names, least recently used first
+        self._pinned = set()
+
+        # Counters
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.failures = 0       # Unknown names and failed loads
+
+    def names(self):
+        """Image names, in assets.json order (nothing is loaded)."""
+        return self.store.names()
+
+    def size_of(self, name):
+        """Bytes of RAM the image takes once loaded, or 0 if unknown."""
+        info = self.store.info(name)
+        return info[3] if info else 0
+
+    def get(self, name):
+        """
+        Get a prepared image, loading it (and evicting others) if needed.
+
+        Args:
+            name: Image name
+
+        Returns:
+            The prepared image, or None if it is unknown or failed to load
+        """
+        image = self._images.get(name)
+        if image is not None:
+            self.hits += 1
+            if self._lru[-1] != name:
+                self._lru.remove(name)
+                self._lru.append(name)
+            return image
+
+        self.misses += 1
+        size = self.size_of(name)
+        if not size:
+            self.failures += 1
+            print(f"Image cache: unknown image '{name}'")
+            return None
+        self._make_room(size)
+        try:
+            image = prepare_image(self.store.image(name))
+        except (ImportError, OSError, MemoryError, ValueError) as e:
+            self.failures += 1
+            print(f"Image cache: failed to load '{name}': {e}")
+            return None
+        finally:
+            self.store.release(name)
+        self._images[name] = image
+        self._lru.append(name)
+        self.used += size
+        if self.used > self.budget:
+            print(f"Image cache: over budget ({self.used}/{self.budget} bytes, "
+                  f"{len(self._pinned)} pinned)")
+        return image
+
+    def _make_room(self, size):
+        """Evict unpinned images, least recently used first, until size fits."""
+        i = 0
+        while self.used + size > self.budget and i < len(self._lru):
+            name = self._lru[i]
+            if name in self._pinned:
+                i += 1
+                continue
+            self.evict(name)
+
+    def evict(self, name):
+        """
+        Drop a loaded image (pinned or not).
+
+        Returns:
+            True if it was loaded
+        """
+        if name not in self._images:
+            return False
+        del self._images[name]
+        self._lru.remove(name)
+        self.used -= self.size_of(name)
+        self.evictions += 1
+        return True
+
+    def pin(self, name):
+        """Keep name loaded once it is (e.g. the active page's background)."""
+        self._pinned.add(name)
+
+    def unpin(self, name):
+        """Let name be evicted again."""
+        self._pinned.discard(name)
+
+    def pin_only(self, name):
+        """
+        Pin name and unpin everything else (None unpins all), e.g. on a
+        page change.
+        """
+        self._pinned.clear()
+        if name:
+            self._pinned.add(name)
+
+    def get_status(self):
+        """Dictionary of cache state and counters for logging and tuning."""
+        return {
+            'images': len(self._images),
+            'used': self.used,
+            'budget': self.budget,
+            'pinned': len(self._pinned),
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'failures': self.failures,
+        }
@@ -1,112 +1,75 @@
 # Image Data Module
-# Stores converted images as byte arrays for display on Waveshare RP2350
-
-# Each image is 240x240 pixels in RGB565 format (BRG color corrected)
-# Total size per image: 115,200 bytes (240 * 240 * 2)
-
-# To add images:
-# 1. On your PC, run: python convert_image.py your_image.jpg variable_name > temp.py
-# 2. Copy the output from temp.py and paste it below
-# 3. Add the variable to the IMAGES dictionary
-# 4. Upload this file to the RP2350: mpremote cp image_data.py :image_data.py
-
-# Image: jatj_v2.png
-# Original size: 240x240
-# Output size: 240x240 pixels
-# Format: RGB565
-# Size: 115,200 bytes
-
-# Image: jatj_v2.png
-# Original size: 240x240
-# Output size: 240x240 pixels
-# Format: RGB565 (BRG color corrected)
-# Size: 115,200 bytes with gamma correction 2.2
-
-_background1_p0 = b'\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7'
-_background1_p1 = b'\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7'
-_background1_p2 = b'\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7'
-_background1_p3 = b'\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7'
-_background1_p4 = b'\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7'
-_background1_p5 = b'\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7'
-_background1_p6 = b'\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7'
-_background1_p7 = b'\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xff\xff\xff\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xff\xff\xff\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xfe\xff\xfc\xf7\x16\xcf\x16\xcf\xfc\xf7\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xff\xfc\xf7\x16\xcf\x16\xcf\xfc\xf7\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xff\xff\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xf7\xfe\xff\xfe\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x99\xe7\xaf\x9d\x28\x43\x00\x00\xfe\xff\xfe\xff\xfc\xf7\xff\xff\x16\xcf\x00\x00\x00\x00\x99\xe7\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\x99\xe7\x00\x00\x00\x00\xaf\x9d\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\x99\xe7\x73\xb6\xfe\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfe\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7'
-_background1_p8 = b'\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xff\xff\xff\xff\xfc\xf7\x16\xb7\x0c\x64\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x16\xcf\xff\xff\xfc\xf7\xff\xff\x99\xe7\x00\x00\x00\x00\xfc\xf7\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xfc\xf7\x00\x00\x00\x00\x73\xb6\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\x28\x42\x00\x00\x00\x00\x00\x00\x0c\x84\x19\xcf\xfe\xff\xff\xff\xff\xff\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xff\xff\xff\x20\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x20\x42\x0c\x84\xfc\xf7\xfe\xff\xfc\xf7\xff\xff\xf9\xe7\x00\x00\x00\x00\xfc\xf7\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xfc\xf7\x00\x00\x00\x00\x13\xb7\xff\xff\xfc\xf7\xfc\xf7\xfe\xff\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x20\x02\xfe\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\xff\xff\xff\xff\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xff\xff\xf9\xe7\x00\x00\x00\x00\xfc\xf7\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xfc\xf7\x00\x00\x00\x00\x13\xb7\xff\xff\xfc\xf7\xfc\xf7\xff\xff\xfe\xff\x00\x00\x00\x00\x28\x42\xef\x9c\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xfe\xff\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\x13\xb7\xec\x84\xfc\xf7\xff\xff\xff\xff\x0c\x64\x00\x00\x00\x00\xff\xff\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xf9\xe7\x00\x00\x00\x00\xfc\xf7\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xfc\xf7\x00\x00\x00\x00\x13\xb7\xff\xff\xfc\xf7\xfc\xf7\xff\xff\xfc\xf7\x00\x00\x00\x00\x99\xe7\xff\xff\xff\xff\xff\xff\xfe\xff\x16\xcf\x28\x43\x20\x42\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7'
-_background1_p9 = b'\xfc\xf7\xfc\xf7\xff\xff\xff\xff\xff\xff\xfe\xff\xff\xff\x73\xb6\x00\x00\x00\x00\x99\xe7\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xf9\xe7\x00\x00\x00\x00\xfc\xf7\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xfc\xf7\x00\x00\x00\x00\x13\xb7\xff\xff\xfc\xf7\xfc\xf7\xff\xff\x99\xe7\x00\x00\x00\x00\xfc\xf7\xff\xff\xfe\xff\xfe\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xfc\xf7\x00\x00\x00\x00\x13\xb7\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xf9\xe7\x00\x00\x00\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x00\x00\x00\x00\x13\xb7\xff\xff\xfc\xf7\xfc\xf7\xff\xff\xf0\x84\x00\x00\x00\x00\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xff\xff\xff\x00\x00\x00\x00\xaf\x9d\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xf9\xe7\x00\x00\x00\x00\x28\x63\x0c\x84\x28\x63\x28\x63\x28\x63\x0c\x84\x28\x63\x00\x00\x00\x00\x13\xb7\xff\xff\xfc\xf7\xfc\xf7\xff\xff\x00\x00\x00\x00\x28\x63\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xff\xfe\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\x00\x00\x00\x00\x28\x63\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xf9\xe7\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x13\xb7\xff\xff\xfc\xf7\xfe\xff\xff\xff\x00\x00\x00\x00\xec\x84\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xec\x84\x00\x00\x00\x00\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xf9\xe7\x00\x00\x00\x00\x20\x02\x28\x42\x00\x00\x00\x00\x00\x00\x28\x42\x20\x02\x00\x00\x00\x00\x13\xb7\xff\xff\xfc\xf7\xff\xff\xf9\xe7\x00\x00\x00\x00\x00\x00\x00\x00\x20\x42\xaf\x9d\xf9\xe7\xff\xff\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7'
-_background1_p10 = b'\xff\xff\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xff\xff\xff\x73\xb6\x00\x00\x00\x00\x00\x00\xb3\x9d\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\x73\xb6\x00\x00\x00\x00\xfe\xff\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xf9\xe7\x00\x00\x00\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x00\x00\x00\x00\x13\xb7\xff\xff\xfc\xf7\xff\xff\xaf\x9d\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xfe\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\x73\xb6\xaf\x9d\xfe\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\x0c\x64\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x0c\x64\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\x16\xcf\x00\x00\x00\x00\x99\xe7\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xf9\xe7\x00\x00\x00\x00\xfc\xf7\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xfc\xf7\x00\x00\x00\x00\x13\xb7\xff\xff\xfc\xf7\xff\xff\x20\x42\x00\x00\x00\x00\xfe\xff\x73\xb6\x28\x42\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xff\xff\x00\x00\x00\x00\x28\x42\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xfc\xf7\x00\x00\x00\x00\x13\xb7\xfe\xff\x00\x00\x00\x00\x00\x00\xfc\xf7\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xfc\xf7\x00\x00\x00\x00\xef\x9c\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xf9\xe7\x00\x00\x00\x00\xfc\xf7\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xfc\xf7\x00\x00\x00\x00\x13\xb7\xff\xff\xfe\xff\xff\xff\x00\x00\x00\x00\x20\x42\xff\xff\xff\xff\xff\xff\xff\xff\xfc\xf7\x73\xb6\x13\xb7\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\x08\x64\x00\x00\x00\x00\x13\xb7\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xec\x84\x00\x00\x00\x00\xff\xff\xff\xff\xff\xff\x00\x00\x00\x00\xaf\x9d\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xff\xff\xff\x00\x00\x00\x00\x20\x02\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xf9\xe7\x00\x00\x00\x00\xfc\xf7\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xfc\xf7\x00\x00\x00\x00\x13\xb7\xff\xff\xfe\xff\xff\xff\x00\x00\x00\x00\xaf\x9d\xff\xff\xfc\xf7\xfc\xf7\xfe\xff\xff\xff\xff\xff\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xff\xff\x00\x00\x00\x00\x00\x00\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7'
-_background1_p11 = b'\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xaf\x9d\x00\x00\x00\x00\xff\xff\xff\xff\xff\xff\x00\x00\x00\x00\xaf\x9d\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\x28\x42\x00\x00\x00\x00\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xf9\xe7\x00\x00\x00\x00\xfc\xf7\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xfc\xf7\x00\x00\x00\x00\x13\xb7\xff\xff\xff\xff\xfc\xf7\x00\x00\x00\x00\xf9\xe7\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\x28\x43\x00\x00\x00\x00\xfe\xff\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xfe\xff\xff\xff\xfe\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xfe\xff\x00\x00\x00\x00\x28\x42\xff\xff\xff\xff\x00\x00\x00\x00\x16\xb7\xff\xff\xfc\xf7\xfe\xff\xff\xff\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xaf\x9d\x00\x00\x00\x00\xfe\xff\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xf9\xe7\x00\x00\x00\x00\xfc\xf7\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xfc\xf7\x00\x00\x00\x00\x13\xb7\xff\xff\xff\xff\x73\xb6\x00\x00\x00\x00\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xfc\xf7\x00\x00\x00\x00\x00\x00\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\x73\xb6\x00\x00\x73\xb6\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xaf\x9d\x00\x00\x00\x00\x00\x00\xaf\x9d\x00\x00\x00\x00\xff\xff\xfe\xff\xfe\xff\xfe\xff\x20\x42\x28\x43\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\x99\xe7\x00\x00\x00\x00\xfc\xf7\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xf9\xe7\x00\x00\x00\x00\xfc\xf7\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xfc\xf7\x00\x00\x00\x00\x13\xb7\xff\xff\xff\xff\x28\x43\x00\x00\x00\x00\xff\xff\xff\xff\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\x20\x02\x00\x00\x00\x00\xfe\xff\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xff\xff\x00\x00\x00\x00\x00\x00\xfe\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xff\xff\xff\xf0\x84\x00\x00\x00\x00\x00\x00\x00\x00\x28\x43\xff\xff\xff\xff\xff\xff\xaf\x9d\x00\x00\x00\x00\xff\xff\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xfe\xff\x00\x00\x00\x00\x16\xcf\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\x96\xcf\x00\x00\x00\x00\x99\xe7\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\x99\xe7\x00\x00\x00\x00\xaf\x9d\xff\xff\xff\xff\x00\x00\x00\x00\x00\x00\xb3\xb5\x99\xe7\xfe\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xff\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xfe\xff\x00\x00\x00\x00\x0c\x64\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xff\xff\x00\x00\x00\x00\x00\x00\x99\xe7\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7'
-_background1_p12 = b'\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xff\xff\xff\xfe\xff\x28\x43\x00\x00\x00\x00\x00\x00\x00\x00\x99\xe7\xff\xff\xff\xff\x00\x00\x00\x00\xaf\x9d\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xff\xff\xff\x00\x00\x00\x00\x00\x00\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\x99\xe7\x00\x00\x00\x00\xfc\xf7\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xfc\xf7\x00\x00\x00\x00\x16\xcf\xff\xff\xf9\xe7\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x0c\x84\x16\xcf\xfc\xf7\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xfc\xf7\x16\xb7\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xfe\xff\xff\xff\x00\x00\x00\x00\x00\x00\xff\xff\xff\xff\xfc\xf7\xfc\xf7\xfe\xff\xff\xff\x20\x42\x00\x00\x00\x00\xec\x84\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xff\xff\xff\x28\x42\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\xef\x9c\x00\x00\x00\x00\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\x00\x00\x00\x00\x0c\x84\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xff\xff\xff\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xff\xff\xff\xff\xff\xfe\xff\xfe\xff\xfc\xf7\x99\xe7\x73\xb6\x28\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\x20\x02\x00\x00\x00\x00\xfe\xff\xfe\xff\xfc\xf7\xff\xff\x99\xe7\x00\x00\x00\x00\x08\x64\xff\xff\xfc\xf7\xfc\xf7\xfe\xff\xff\xff\x08\x64\x00\x00\x00\x00\x20\x02\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xff\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\x16\xcf\x00\x00\x00\x00\xff\xff\xfe\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xff\xfe\xff\xff\xff\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xf7\xfe\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xf7\xfe\xf7\xfc\xf7\xfc\xf7\xfe\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfc\xf7\x16\xb7\x28\x63\x00\x00\x00\x00\x28\x43\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xfe\xff\x00\x00\x00\x00\x00\x00\xff\xff\xfc\xf7\xfe\xff\xff\xff\x00\x00\x00\x00\x00\x00\xff\xff\xff\xff\xfc\xf7\xfc\xf7\xff\xff\xf9\xe7\x00\x00\x00\x00\x00\x00\xff\xff\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xff\xfe\xff\x16\xb7\xff\xff\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\x00\x00\x00\x00\x00\x00\xff\xff\xff\xff\xff\xff\xfc\xf7\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x13\xb7\xff\xff\xff\xff\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfe\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\x0c\x64\x00\x00\x00\x00\xfc\xf7\xff\xff\xfc\xf7\xff\xff\x16\xcf\x00\x00\x00\x00\xaf\x9d\xff\xff\xfc\xf7\xfc\xf7\xff\xff\xfc\xf7\x00\x00\x00\x00\x00\x00\xff\xff\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\x0c\x64\x00\x00\x00\x00\xfe\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xfc\xf7\xfe\xff\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xff\xff\xff\x00\x00\x00\x00\x28\x42\xff\xff\xfc\xf7\xfe\xff\xff\xff\xff\xff\x99\xe7\x20\x42\x00\x00\x00\x00\x00\x00\x00\x00\x0c\x64\x19\xcf\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7'
-_background1_p13 = b'\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xff\xfe\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xf7\xff\xff\x00\x00\x00\x00\x00\x00\xff\xff\xfe\xff\xff\xff\xff\xff\x00\x00\x00\x00\x00\x00\xff\xff\xff\xff\xfc\xf7\xff\xff\xff\xff\x00\x00\x00\x00\x00\x00\x99\xe7\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\x16\xcf\x00\x00\x00\x00\x00\x00\xfe\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xff\xff\x00\x00\x00\x00\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\x00\x00\x00\x00\x00\x00\xff\xff\xff\xff\xfc\xf7\xfc\xf7\xfe\xff\xff\xff\x0c\x64\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xf0\x84\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\x00\x00\x00\x00\x00\x00\xff\xff\xff\xff\xff\xff\x73\x9e\x00\x00\x00\x00\x13\xb7\xff\xff\xfc\xf7\xfe\xff\xff\xff\x00\x00\x00\x00\x00\x00\x73\x9e\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xfe\xff\x00\x00\x00\x00\x00\x00\xff\xff\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xff\xff\x00\x00\x00\x00\x00\x00\xf9\xe7\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xaf\x7d\x00\x00\x00\x00\xec\x84\xff\xff\xff\xff\xff\xff\xff\xff\xfc\xf7\x00\x00\x00\x00\x99\xe7\xfc\xff\xec\x84\xfe\xff\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xf9\xe7\x00\x00\x00\x00\x00\x00\xb3\xb5\xec\x84\x00\x00\x00\x00\x00\x00\xff\xff\xfe\xff\xfc\xf7\xff\xff\xec\x84\x00\x00\x00\x00\x20\x42\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xff\xff\x00\x00\x00\x00\x00\x00\xf9\xe7\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xff\xff\x00\x00\x00\x00\x00\x00\x16\xcf\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xff\xff\x00\x00\x00\x00\x00\x00\x16\xcf\xff\xff\xff\xff\x9c\xf7\x00\x00\x00\x00\x00\x00\xff\xff\xff\xff\xff\xff\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\x73\xb6\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xfc\xf7\xff\xff\xfc\xf7\xff\xff\x16\xcf\x00\x00\x00\x00\x00\x00\xff\xff\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xff\xff\xff\x00\x00\x00\x00\x00\x00\xaf\x9d\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xff\xff\x00\x00\x00\x00\x00\x00\x16\xcf\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xfc\xf7\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xfe\xff\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xf7\xff\xff\xfe\xff\x0c\x64\x00\x00\x00\x00\x00\x00\xff\xff\xff\xff\xfc\xf7\xff\xff\xff\xff\x00\x00\x00\x00\x00\x00\xff\xff\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xff\xff\xff\xec\x84\x00\x00\x00\x00\x20\x42\xff\xff\xfe\xff'
-_background1_p14 = b'\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xff\xff\xff\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xff\xff\x20\x42\x00\x00\x00\x00\xaf\x7d\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xff\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\x76\xce\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x28\x42\xfc\xf7\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xff\xff\xfe\xff\xfe\xff\xff\xff\xff\xff\xfc\xf7\xfc\xf7\xff\xff\x28\x63\x00\x00\x00\x00\xf9\xe7\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\x73\xb6\x00\x00\x00\x00\x00\x00\xff\xff\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xff\xff\x28\x43\x28\x43\xff\xff\xfe\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xff\xff\xff\x0c\x64\x00\x00\x00\x00\xaf\x9d\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xff\xff\x96\xcf\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xff\xff\x16\xcf\xec\x84\xb3\x9d\xfc\xf7\xff\xff\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xff\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xfe\xff\xff\xff\x00\x00\x00\x00\x00\x00\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xfe\xff\x00\x00\x00\x00\x00\x00\xff\xff\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xff\xff\xec\x84\x00\x00\x00\x00\xaf\x9d\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\x28\x43\x00\x00\x00\x00\x00\x00\xff\xff\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xff\xff\x00\x00\x00\x00\x00\x00\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xff\xff\xff\x00\x00\x00\x00\x28\x42\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xff\xff\x00\x00\x00\x00\x00\x00\xfc\xf7\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xff\xff\x28\x42\x00\x00\x00\x00\x00\x00\x99\xe7\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\x16\xcf\x00\x00\x00\x00\x00\x00\xec\x84\xff\xff\xff\xff\xfc\xf7\xfe\xff\xff\xff\x0c\x64\x00\x00\x00\x00\x00\x00\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xf7\xff\xff\xff\xff\xff\xff\xfe\xff\xfc\xf7\xfe\xff\xfe\xff\xff\xff\xff\xff\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\x28\x43\x00\x00\x00\x00\xff\xff\xff\xff\xfc\xf7\xfc\xf7\xff\xff\xff\xff\x20\x02\x00\x00\x00\x00\xaf\x9d\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7'
-_background1_p15 = b'\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\xff\xff\xff\xff\x08\x64\x00\x00\x00\x00\x0c\x64\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xff\xff\x99\xe7\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x28\x42\x16\xcf\xff\xff\xff\xff\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xff\xff\x00\x00\x00\x00\x00\x00\xff\xff\xff\xff\xff\xff\xff\xff\x20\x42\x00\x00\x00\x00\x0c\x64\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\x96\xcf\x00\x00\x00\x00\x20\x42\xff\xff\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xfc\xf7\x20\x02\x00\x00\x00\x00\x00\x00\x20\x42\x28\x43\x28\x42\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x28\x42\x16\xb7\xff\xff\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\x73\xb6\x00\x00\x00\x00\x00\x00\x76\xce\x19\xe7\x20\x42\x00\x00\x00\x00\x00\x00\xff\xff\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xff\xff\x00\x00\x00\x00\x00\x00\x28\x43\xff\xff\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xff\xff\xff\xff\xff\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xff\xff\xff\x99\xe7\x00\x00\x00\x00\x28\x63\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfe\xff\xb3\x9d\x00\x00\x00\x00\x00\x00\x00\x00\x9c\xf7\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\x99\xe7\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xfc\xf7\x00\x00\x00\x00\x00\x00\xec\x84\xff\xff\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xff\xff\x28\x43\x00\x00\x00\x00\x00\x00\x28\x43\xff\xff\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xff\xff\xff\x28\x43\x00\x00\xfe\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xff\xff\xaf\x9d\x00\x00\x00\x00\x9c\xf7\xff\xff\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x00\x00\x00\x00\x00\x00\xfe\xff\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xfe\xff\x0c\x84\x00\x00\x00\x00\x00\x00\x0c\x84\xff\xff\xff\xff\xfc\xf7\xfc\xf7\xfe\xff\xff\xff\x19\xe7\x00\x00\x00\x00\x00\x00\xb3\xb5\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xff\xff\x28\x43\x00\x00\x00\x00'
-_background1_p16 = b'\x20\x02\xff\xff\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\x73\xb6\x00\x00\x00\x00\x20\x02\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xff\xff\x28\x43\x00\x00\x00\x00\xff\xff\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfe\xff\xfc\xf7\xff\xff\xfe\xff\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xff\xff\xff\xff\xfe\xff\xff\xff\xff\xff\xff\xff\xfc\xf7\xfc\xf7\xfe\xff\xff\xff\x16\xcf\x00\x00\x00\x00\x00\x00\x16\xcf\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xff\xff\xff\xfe\xff\x73\xb6\xec\x84\xaf\x9d\xfc\xf7\xff\xff\xff\xff\xff\xff\xfc\xf7\xfc\xf7\xfe\xff\xff\xff\xaf\x9d\x00\x00\x00\x00\x00\x00\xfc\xf7\xff\xff\xfc\xf7\xfc\xf7\xff\xff\x16\xcf\x00\x00\x00\x00\x00\x00\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xff\xff\x00\x00\x00\x00\x00\x00\xff\xff\xff\xff\xfc\xf7\xff\xff\xff\xff\xff\xff\xff\xff\x16\xcf\x28\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xff\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xff\xff\x0c\x84\x00\x00\x00\x00\x00\x00\x9c\xf7\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xff\xff\x9c\xf7\x28\x43\x00\x00\x00\x00\x00\x00\x00\x00\x13\xb7\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xff\xff\xff\x16\xcf\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x16\xcf\xff\xff\xff\xff\xfe\xff\xfc\xf7\xfe\xff\xff\xff\xaf\x9d\x00\x00\x00\x00\x00\x00\xfc\xf7\xff\xff\xff\xff\xfc\xf7\x00\x00\x00\x00\x00\x00\xff\xff\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xff\xff\x00\x00\x00\x00\x20\x02\xff\xff\xff\xff\xff\xff\xff\xff\xfe\xff\x19\xcf\x28\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xff\xff\xec\x84\x00\x00\x00\x00\x00\x00\xfc\xf7\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xff\xff\xfc\xff\x28\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xaf\x9d\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xaf\x9d\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x73\xb6\xff\xff\xff\xff\xfc\xf7\xfe\xff\xff\xff\x16\xb7\x00\x00\x00\x00\x00\x00\xfe\xff\xff\xff\x00\x00\x00\x00\x00\x00\xff\xff\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xff\xff\xff\x08\x64\x00\x00\x20\x02\xff\xff\xff\xff\xff\xff\x99\xe7\x28\x42\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x20\x02\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xff\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\xff\xff\xfc\xf7\xfc\xf7\xfe\xff\xff\xff\xff\xff\x28\x63\x00\x00\x00\x00\x00\x00\x00\x00\x28\x42\x73\xb6\x16\xcf\x00\x00\x00\x00\x00\x00\x16\xcf\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xfc\xf7\x00\x00\x00\x00\x20\x02\x9c\xf7\xfc\xf7\x99\xe7\x73\xb6\x00\x00\x00\x00\x00\x00\x00\x00\x20\x02\xfc\xf7\xff\xff\xfe\xff\xfc\xf7\xff\xff\x99\xe7\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\x73\x9e\x00\x00\x20\x02\xff\xff\xff\xff\xec\x84\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
-_background1_p17 = b'\x00\x00\x00\x00\xf0\x84\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xff\xff\xff\x00\x00\x00\x00\x00\x00\x20\x02\xff\xff\xff\xff\xfc\xf7\xfc\xf7\xff\xff\xff\xff\x16\xcf\x00\x00\x00\x00\x00\x00\x00\x00\xaf\x9d\xfc\xf7\xff\xff\xff\xff\xff\xff\xff\xff\x28\x42\x00\x00\x00\x00\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xff\xff\xff\x00\x00\x00\x00\x00\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x73\xb6\x00\x00\x00\x00\x00\x00\x00\x00\x16\xcf\xff\xff\xff\xff\xfc\xf7\xff\xff\xfc\xf7\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xff\xff\x00\x00\x00\x00\xff\xff\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x73\xb6\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xaf\x9d\x00\x00\x00\x00\xff\xff\xff\xff\xfc\xf7\xfc\xf7\xff\xff\xff\xff\xec\x84\x00\x00\x00\x00\x00\x00\x00\x00\xfe\xff\xff\xff\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xfe\xff\x00\x00\x00\x00\x96\xcf\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xfc\xf7\x00\x00\x00\x00\x99\xe7\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xff\xff\xff\xff\xff\xf0\x84\x00\x00\x00\x00\x00\x00\x28\x43\xff\xff\xff\xff\xfc\xf7\xff\xff\xfe\xff\x00\x00\x00\x00\xfc\xf7\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\x28\x43\x00\x00\xff\xff\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x19\xcf\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xff\xff\xff\x16\xcf\xfe\xff\xff\xff\xfc\xf7\xfc\xf7\xff\xff\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00\x19\xe7\xff\xff\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xff\xff\x00\x00\x00\x00\xaf\x9d\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xfc\xf7\x00\x00\x00\x00\xfe\xff\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xff\xff\x19\xcf\x00\x00\x00\x00\x00\x00\x20\x42\xff\xff\xfe\xff\xfc\xf7\xff\xff\x99\xe7\x13\xb7\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xff\xff\xff\x00\x00\x00\x00\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xfe\xff\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xfe\xff\xff\xff\x20\x42\x00\x00\x00\x00\x00\x00\xfe\xff\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\x99\xe7\x00\x00\x00\x00\x16\xcf\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xfc\xf7\x00\x00\x00\x00\xec\x84\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xff\xff\x00\x00\x00\x00\x00\x00\xaf\x7d\xff\xff\xfc\xf7\xfc\xf7\xff\xff\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xff\xff\xff\x00\x00\x00\x00\xfe\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xf0\x84\x28\x63\x00\x00\x00\x00\x00\x00\x00\x00\xfc\xf7\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xaf\x7d\x00\x00\x00\x00\x00\x00\xff\xff\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xfe\xff\x00\x00\x00\x00\x00\x00'
-_background1_p18 = b'\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xff\xff\xff\x00\x00\x00\x00\x00\x00\xfc\xf7\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xff\xff\x00\x00\x00\x00\x00\x00\xfc\xf7\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\x99\xe7\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x99\xe7\xff\xff\x20\x42\x00\x00\x00\x00\x00\x00\xfe\xff\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xff\xff\xff\x00\x00\x00\x00\x00\x00\xff\xff\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xfe\xff\x00\x00\x00\x00\x00\x00\x16\xb7\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\x99\xe7\x00\x00\x00\x00\x00\x00\xfe\xff\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xff\xff\x00\x00\x00\x00\x28\x43\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xaf\x9d\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\xaf\x9d\x00\x00\x00\x00\x00\x00\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xf9\xe7\x00\x00\x00\x00\xf9\xe7\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xff\xff\xff\x00\x00\x00\x00\xf0\x84\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xaf\x9d\x00\x00\x00\x00\x00\x00\x76\xce\xff\xff\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\x28\x63\x00\x00\x28\x42\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xff\xff\xff\x13\xb7\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\x73\xb6\x00\x00\x00\x00\x00\x00\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\x99\xe7\x00\x00\x00\x00\xff\xff\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xff\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xfc\xf7\x16\xcf\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xff\xff\xff\x0c\x84\x00\x00\x00\x00\x00\x00\x28\x43\xff\xff\xff\xff\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xff\xff\xff\x20\x02\x00\x00\x28\x43\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\x28\x42\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\xfc\xf7\x00\x00\x00\x00\x00\x00\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xff\xff\xff\x00\x00\x00\x00\x16\xcf\xff\xff\xfe\xff\xfe\xff\xff\xff\xff\xff\xfc\xf7\xff\xff\xfe\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7'
-_background1_p19 = b'\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xff\xff\xff\x99\xe7\x00\x00\x00\x00\x00\x00\x00\x00\xef\x9c\xff\xff\xff\xff\xff\xff\xfe\xff\xfe\xff\xff\xff\xf9\xe7\x00\x00\x00\x00\x13\xb7\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xff\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xfc\xf7\xfe\xff\x00\x00\x00\x00\xaf\x9d\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\x28\x43\x00\x00\x00\x00\xf9\xe7\xff\xff\xff\xff\xfe\xff\x00\x00\x00\x00\x73\xb6\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xff\xff\xff\xff\xff\x99\xe7\x16\xcf\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xfe\xff\x28\x42\x00\x00\x00\x00\x00\x00\x00\x00\x76\xce\xfe\xff\xff\xff\xff\xff\xfe\xff\x00\x00\x00\x00\x00\x00\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\x73\x9e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x99\xe7\xfe\xff\x00\x00\x20\x02\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xfe\xff\x00\x00\x00\x00\x00\x00\x28\x42\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xff\xff\xff\xff\x16\xcf\x28\x43\x00\x00\x00\x00\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\x0c\x64\x73\xb6\xff\xff\xff\xff\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xff\xff\x99\xe7\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xff\xff\x00\x00\x00\x00\x00\x00\x20\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x16\xcf\x73\xb6\x00\x00\xff\xff\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xfe\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x28\x42\xfe\xff\xfe\xff\xfc\xf7\xfc\xf7\xfe\xff\xff\xff\xff\xff\xff\xff\xf0\x84\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x73\xb6\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xfc\xf7\x00\x00\x00\x00\x00\x00\x0c\x84\xfc\xf7\xff\xff\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xff\xff\x76\xce\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x99\xe7\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xff\xff\x99\xe7\x00\x00\x00\x00\x00\x00\xfc\xff\xff\xff\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x16\xcf\x0c\x84\x00\x00\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xfe\xff\x73\xb6\x0c\x64\x0c\x64\xaf\x9d\xfc\xf7\xff\xff\xff\xff\xfc\xf7\xff\xff\xff\xff\xff\xff\x73\xb6\x28\x43\x00\x00\x00\x00\x00\x00\x00\x00\x20\x42\x20\x02\x00\x00\x00\x00\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\x16\xcf\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x20\x42\x99\xe7\xff\xff\xff\xff\xff\xff\xfe\xff\xfc\xf7\xfe\xff\xff\xff\xff\xff\xfc\xf7\xec\x84\x20\x42\x28\x42\xaf\x9d\xff\xff\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7'
-_background1_p20 = b'\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xff\xff\xff\xff\xff\x28\x43\x00\x00\x00\x00\xef\x9c\xff\xff\xff\xff\xfe\xff\xff\xff\x99\xe7\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x99\xe7\xaf\x9d\x00\x00\xff\xff\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfe\xff\xff\xff\xff\xff\xff\xff\xaf\x9d\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x16\xcf\xff\xff\xfe\xff\x00\x00\x00\x00\xfc\xf7\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xff\xff\xff\x99\xe7\x28\x42\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x28\x43\x9c\xf7\xff\xff\xff\xff\xff\xff\xfc\xf7\xfc\xf7\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xff\xff\x10\x84\x00\x00\x00\x00\x00\x00\xfe\xff\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xff\xff\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\xb3\xb5\x00\x00\x00\x00\xff\xff\xff\xff\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xff\xff\xff\xff\xff\xff\xff\x16\xcf\x20\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x73\xb6\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x00\x00\x00\x00\xec\x84\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xff\xff\xff\xff\xfc\xf7\xf0\x84\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x73\xb6\xfc\xf7\xff\xff\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xff\xff\x20\x02\x00\x00\x00\x00\xb3\x9d\xff\xff\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xff\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00\x76\xce\xff\xff\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xff\xff\xff\xfc\xf7\xb3\x9d\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x28\x63\x00\x00\x00\x00\xfe\xff\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xff\xff\xf0\x84\x00\x00\x00\x00\xff\xff\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xff\xff\xff\xff\xfc\xf7\x28\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x28\x42\x9c\xf7\xff\xff\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xff\xff\x00\x00\x00\x00\x00\x00\xff\xff\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xaf\x9d\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x16\xcf\x73\xb6\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x76\xce\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xff\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xf0\x84\xff\xff\xff\xff\x20\x42\x00\x00\x00\x00\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xff\xff\xfe\xff\x00\x00\x00\x00\xaf\x9d\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xff\xff\xff\xff\xff\xfe\xff\x76\xce\x20\x02\x00\x00\x00\x00\x00\x00\x00\x00\x28\x43\xff\xff\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xfe\xff\x00\x00\x00\x00\xb3\x9d\xff\xff\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xec\x84\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xb3\xb5\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x28\x63\xec\x84\x73\xb6\x99\xe7\xfe\xff\xff\xff\xff\xff\xff\xff'
-_background1_p21 = b'\xff\xff\xfe\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\x00\x00\x00\x00\x00\x00\x0c\x64\x16\xcf\xfe\xff\xff\xff\xff\xff\xff\xff\xf9\xe7\x00\x00\x00\x00\x99\xe7\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\x28\x42\x00\x00\x00\x00\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xff\xff\xff\xff\xfc\xf7\x28\x63\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\xfe\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xff\xff\x00\x00\x00\x00\x16\xcf\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xfc\xf7\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x16\xcf\x73\xb6\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x0c\x64\x16\xcf\xfe\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\x99\xe7\x00\x00\x00\x00\xff\xff\xff\xff\xff\xff\xfc\xf7\xfc\xf7\xfe\xff\xff\xff\x00\x00\x00\x00\x0c\x84\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xfc\xf7\x00\x00\x00\x00\xfe\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xff\xff\xff\xff\x28\x43\x00\x00\x00\x00\xfc\xf7\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xff\xff\x00\x00\x00\x00\x96\xcf\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xff\xff\xff\xff\xff\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\xfc\xf7\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x28\x43\xb3\x9d\xfc\xf7\xff\xff\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xff\xff\xff\x00\x00\x00\x00\x00\x00\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\x73\xb6\x00\x00\x00\x00\xfe\xff\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xff\xfc\xf7\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xff\xfc\xf7\xfc\xf7\xff\xff\xff\xff\x00\x00\x00\x00\x99\xe7\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xff\xff\x00\x00\x00\x00\xec\x84\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xff\xff\xff\xff\xff\xff\xff\xfe\xff\xfc\xf7\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x99\xe7\xff\xff\xfc\xf7\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xfe\xff\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\x16\xcf\x00\x00\x00\x00\xff\xff\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xfe\xff\x00\x00\x00\x00\xec\x84\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xff\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x00\x00\x00\x00\xfe\xff\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xff\xff\x00\x00\x00\x00\x00\x00\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x99\xe7\x0c\x64\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x73\xb6\xff\xff\xff\xff\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xff\xff\xff\x00\x00\x00\x00\x73\x9e\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\x28\x43\xec\x84\xfe\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7'
-_background1_p22 = b'\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\x99\xe7\x00\x00\xaf\x9d\xfc\xf7\xfe\xff\x00\x00\x00\x00\x00\x00\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xff\xff\xff\x0c\x64\x00\x00\x00\x00\xff\xff\xff\xff\xf9\xe7\xfe\xff\xff\xff\xfe\xff\x19\xcf\x73\xb6\x28\x63\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xb3\x9d\xff\xff\xfe\xff\xfe\xff\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xfe\xff\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\x28\x42\x00\x00\x00\x00\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x16\xcf\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xff\xff\xff\xaf\x9d\x00\x00\x00\x00\x20\x02\xff\xff\xff\xff\xfe\xff\xff\xff\x0c\x64\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x16\xcf\x2c\x63\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xec\x84\xff\xff\xfe\xff\xfc\xf7\xff\xff\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x16\xcf\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xfc\xf7\x00\x00\x00\x00\xec\x84\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xff\x16\xcf\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x73\xb6\xff\xff\xfe\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xb3\x9d\x00\x00\x00\x00\x00\x00\x00\x00\x20\x42\xff\xff\xff\xff\xec\x84\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x73\xb6\xff\xff\xfe\xff\x19\xcf\x00\x00\x00\x00\x00\x00\xf0\x84\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xff\xff\x99\xe7\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x20\x02\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\x00\x00\x00\x00\x28\x63\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xff\xff\xfe\xff\x16\xcf\x13\xb7\xfc\xf7\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xfc\xf7\x00\x00\x00\x00\xff\xff\xff\xff\x00\x00\x00\x00\x00\x00\x19\xe7\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\xff\xff\xff\xff\xf9\xe7\x00\x00\x00\x00\x20\x02\xff\xff\xfe\xff\xfc\xf7\xff\xff\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xf9\xe7\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\x99\xe7\x16\xcf\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7'
-_background1_p23 = b'\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xff\xff\xff\xff\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xfc\xf7\x00\x00\x00\x00\xfe\xff\xff\xff\xff\xff\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xaf\x9d\xff\xff\xff\xff\x0c\x64\x00\x00\x00\x00\x00\x00\x16\xcf\xff\xff\xfc\xf7\xff\xff\x28\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xff\xff\x00\x00\x00\x00\xfc\xf7\xff\xff\xfc\xf7\xfc\xf7\xff\xff\xff\xff\x0c\x64\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\xff\xff\xfe\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x16\xcf\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xff\xff\xff\x00\x00\x00\x00\x99\xe7\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xff\xff\xb3\x9d\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xfe\xff\xff\xff\x00\x00\x00\x00\x16\xcf\x00\x00\x00\x00\xfc\xf7\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\x13\xb7\x00\x00\xf0\x84\xff\xff\xfc\xf7\xff\xff\xff\xff\xff\xff\xfc\xf7\xfc\xf7\xff\xff\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x73\xb6\xfe\xff\x00\x00\x00\x00\xff\xff\x13\xb7\x00\x00\x20\x02\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\x00\x00\x00\x00\xfe\xff\xff\xff\xff\xff\x99\xe7\x00\x00'
-_background1_p24 = b'\x99\xe7\xff\xff\xfe\xff\xff\xff\xfc\xf7\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x0c\x64\xff\xff\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00\x0c\x84\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x28\x43\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xfe\xff\x00\x00\x00\x00\xff\xff\xff\xff\x20\x02\x00\x00\x00\x00\x00\x00\xaf\x9d\xff\xff\xff\xff\xaf\x9d\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xaf\x9d\xff\xff\xff\xff\xf9\xe7\x00\x00\x00\x00\x20\x02\xfe\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x0c\x84\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xfe\xff\x00\x00\x00\x00\xff\xff\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x0c\x64\xff\xff\x20\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xf9\xe7\xff\xff\xfe\xff\xff\xff\x00\x00\x00\x00\xfe\xff\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x28\x42\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\x19\xcf\x00\x00\x00\x00\xfc\xf7\xff\xff\x96\xcf\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\xfe\xff\xfc\xf7\xff\xff\x99\xe7\x00\x00\xff\xff\x96\xcf\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xfe\xff\x00\x00\x00\x00\xfe\xff\xff\xff\xff\xff\x20\x42\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xff\xff\xf9\xe7\xff\xff\xf0\x84\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x73\xb6\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7'
-_background1_p25 = b'\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\x73\x9e\x00\x00\x99\xe7\xff\xff\xfe\xff\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xfc\xf7\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xff\xff\x0c\x64\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\x28\x63\x00\x00\xfe\xff\xfe\xff\xff\xff\x13\xb7\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x28\x42\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\x0c\x64\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xfc\xf7\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xff\xff\xff\x00\x00\x00\x00\xff\xff\xff\xff\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\xff\xff\xfc\xf7\xff\xff\xff\xff\xff\xff\x28\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x20\x42\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xf9\xe7\x00\x00\x0c\x64\xff\xff\xff\xff\x13\xb7\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x20\x02\xff\xff\xff\xff\x96\xcf\xfc\xf7\xff\xff\x20\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xfc\xf7\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7'
-_background1_p26 = b'\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xff\xff\xff\x00\x00\x00\x00\xfe\xff\xff\xff\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xfc\xf7\xff\xff\x20\x02\x00\x00\xff\xff\x20\x42\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x73\xb6\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xaf\x9d\x00\x00\x28\x43\xff\xff\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x28\x43\xff\xff\x13\xb7\x00\x00\xf9\xe7\x28\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xf0\x84\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\x99\xe7\x00\x00\x00\x00\xff\xff\x19\xe7\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xff\xff\xff\x00\x00\x00\x00\xff\xff\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x0c\x64\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x28\x43\xff\xff\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7'
-_background1_p27 = b'\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\x13\xb7\x00\x00\x73\xb6\xff\xff\x08\x64\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xfc\xf7\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\x28\x43\x00\x00\xff\xff\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xfc\xf7\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\x28\x42\x00\x00\xff\xff\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x9c\xf7\x73\xb6\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x73\xb6\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xf0\x84\x00\x00\xff\xff\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x96\xcf\xff\xff\xff\xff\x08\x64\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x28\x63\xf0\x84\xaf\x9d\xaf\x9d\xef\x9c\x0c\x84\x28\x42\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x0c\x64\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xb3\x9d\x00\x00\xfe\xff\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x0c\x64\xff\xff\xfc\xf7\xff\xff\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
-_background1_p28 = b'\x00\x00\x28\x42\xb3\xb5\x16\xcf\xfc\xf7\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xff\xfc\xf7\x16\xcf\xaf\x9d\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xf0\x84\x00\x00\xfe\xff\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xff\xff\x73\x9e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xef\x9c\xff\xff\xff\xff\x00\x00\x00\x00\x10\x84\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xfe\xff\x99\xe7\xaf\x9d\x19\xe7\x20\x42\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xf7\xff\xff\x00\x00\x00\x00\xff\xff\xfe\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xf9\xe7\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\xff\xff\xfc\xf7\x99\xe7\x16\xb7\xaf\x9d\xec\x84\xec\x84\xec\x84\x16\xcf\xfe\xff\xff\xff\xfe\xff\xfe\xff\x0c\x64\x00\x00\xb3\x9d\xff\xff\xfe\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xfc\xf7\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x73\xb6\x28\x42\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xff\xff\xff\x00\x00\x00\x00\xff\xff\xf9\xe7\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x0c\x64\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\x28\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xfe\xff\xff\xff\xfe\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xaf\x9d\x28\x63\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xaf\x9d\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xaf\x7d\xff\xff\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xff\xff\xff\xff\xff\x16\xcf\x00\x00\x00\x00\x00\x00\x28\x42\xec\x84\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xff\xff\xff\x00\x00\x00\x00\xaf\x9d\x20\x42\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\x0c\x64\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xfc\xf7\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xaf\x9d\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x99\xe7\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x20\x02\xff\xff\xff\xff\x20\x02\xfe\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xff\xff\xff\xfe\xff\x73\xb6\x00\x00\x00\x00\xff\xff\xfc\xf7\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7'
-_background1_p29 = b'\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\x28\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xaf\x9d\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xaf\x9d\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xaf\x9d\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\x13\xb7\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x28\x42\xff\xff\x0c\x64\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\xff\xff\x00\x00\x00\x00\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xff\xff\x16\xcf\x00\x00\xaf\x9d\xff\xff\xec\x84\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xfc\xf7\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\x16\xcf\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\x73\x9e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xfc\xf7\xff\xff\x28\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x20\x42\xff\xff\x28\x43\x00\x00\xaf\x9d\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xaf\x9d\x00\x00\x00\x00\xff\xff\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\x0c\x64\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xfe\xff\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\x99\xe7\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\x0c\x64\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x10\x84\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\xff\xff\xff\xff\xfc\xf7\xfc\xf7\xff\xff\xff\xff\xfc\xf7\xff\xff\xff\xff\x00\x00\x00\x00\x00\x00\xff\xff\xff\xff\x16\xb7\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x99\xe7\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xfe\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xaf\x9d\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00\x0c\x84\xfc\xf7\xff\xff\xf0\x84\x00\x00\x08\x64\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x73\xb6\xff\xff\x96\xcf\xff\xff\xff\xff\xfc\xf7\xaf\x9d\xff\xff\xff\xff\x28\x43\x00\x00\x00\x00\x20\x02\xff\xff\xff\xff\xf9\xe7\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x73\xb6\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7'
-_background1_p30 = b'\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x20\x02\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xff\xff\xff\x00\x00\x00\x00\x00\x00\x20\x02\xff\xff\xff\xff\xff\xff\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00\xaf\x9d\xfc\xf7\xfe\xff\xff\xff\x16\xcf\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x2c\x63\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x99\xe7\xff\xff\x00\x00\xf0\x84\xff\xff\xfc\xf7\x00\x00\x00\x00\x00\x00\x16\xcf\xff\xff\xff\xff\xfc\xf7\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xaf\x9d\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xff\xfe\xff\xfe\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xf9\xe7\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xef\x9c\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xf9\xe7\x00\x00\x00\x00\x00\x00\x20\x42\xff\xff\xff\xff\xff\xff\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x0c\x64\xff\xff\xff\xff\xff\xff\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00\xfc\xf7\xff\xff\xff\xff\xfe\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xfc\xf7\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfe\xff\xfe\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfe\xff\xfe\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\x99\xe7\x99\xe7\x99\xe7\x99\xe7\x99\xe7\x16\xcf\x16\xcf\x16\xcf\x16\xcf\x16\xcf\x16\xcf\x96\xcf\x16\xcf\x73\xb6\x13\xb7\x13\xb7\x13\xb7\x13\xb7\x13\xb7\x13\xb7\x13\xb7\x13\xb7\x13\xb7\x13\xb7\x13\xb7\x19\xcf\x99\xe7\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x28\x63\xfe\xff\x9c\xf7\x16\xcf\x16\xcf\x16\xcf\x16\xcf\x16\xcf\x96\xcf\x99\xe7\x99\xe7\xff\xff\x16\xcf\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x0c\x64\xf9\xe7\xff\xff\xff\xff\xff\xff\xfe\xff\x16\xcf\xb3\x9d\x28\x63\x28\x42\x20\x02\x28\x43\x0c\x84\x73\xb6\xf9\xe7\xff\xff\xff\xff\xff\xff\xff\xff\xfc\xf7\x2c\x63\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x76\xce\xf0\x84\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x73\xb6\x99\xe7\x13\xb7\x13\xb7\x13\xb7\x13\xb7\x13\xb7\x13\xb7\x13\xb7\x13\xb7\x16\xcf\x16\xcf\x16\xcf\x16\xcf\x16\xcf\x16\xcf\x16\xcf\x96\xcf\x99\xe7\x99\xe7\x99\xe7\x99\xe7\xf9\xe7\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xff\xfc\xf7\xfe\xff\xfe\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xfe\xff\x16\xcf\x0c\x64\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x28\x43\x13\xb7\xfe\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xf9\xe7\xb3\xb5\x20\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x28\x42\xf0\x84\x99\xe7\xff\xff\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\x9c\xf7\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
-_background1_p31 = b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xff\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x20\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x08\x64\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xf9\xe7\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x0c\x64\xfe\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfe\xff\x16\xcf\x0c\x64\x00\x00\x00\x00\x0c\x84\x73\xb6\xfc\xf7\xff\xff\xff\xff\xff\xff\xfc\xf7\x96\xcf\x96\xcf\x16\xcf\x13\xb7\x13\xb7\x73\xb6\xef\x9c\x00\x00\x00\x00\x28\x43\xb3\xb5\x9c\xf7\xfe\xff\xff\xff\xfe\xff\x99\xe7\x13\xb7\x73\xb6\xaf\x9d\x0c\x84\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x2c\x63\x73\xb6\x16\xcf\x9c\xf7\x99\xe7\x99\xe7\x99\xe7\x99\xe7\x99\xe7\x99\xe7\x99\xe7\x16\xcf\xef\x9c\x28\x42\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x28\x42\xf0\x84\xaf\x9d\x73\xb6\x16\xcf\xfc\xf7\xff\xff\xff\xff\xfe\xff\x99\xe7\xef\x9c\x20\x02\x00\x00\x28\x42\x73\xb6\x73\xb6\x13\xb7\x13\xb7\x16\xcf\x96\xcf\x99\xe7\xfe\xff\xff\xff\xff\xff\xfe\xff\x99\xe7\xb3\xb5\x28\x43\x00\x00\x00\x00\xf0\x84\xf9\xe7\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x99\xe7\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xff\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfe\xff\x19\xcf\x99\xe7\x99\xe7\x76\xce\xb3\xb5\xfc\xf7\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfc\xf7\x73\xb6\x16\xb7\x73\xb6\xaf\x9d\xef\x9c\x9c\xf7\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfc\xf7\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xaf\x9d\x99\xe7\xaf\x9d\xb3\x9d\xb3\xb5\x0c\x84\x20\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x28\x42\xef\x9c\xb3\xb5\xef\x9c\x76\xce\x99\xe7\x28\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x28\x42\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x16\xcf\xf0\x84\xb3\xb5\x76\xce\x73\xb6\x16\xb7\xfe\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x16\xcf\xb3\xb5\x19\xe7\x99\xe7\x99\xe7\x99\xe7\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00\x08\x64\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\x16\xcf\x00\x00\x00\x00\x00\x00\x00\x00\xec\x84\xec\x84\x00\x00\x00\x00\x00\x00\x00\x00\x28\x43\xaf\x9d\x16\xcf\x99\xe7\x99\xe7\x16\xcf\x73\xb6\xaf\x9d\xaf\x9d\xaf\x9d\xaf\x9d\xaf\x9d\xaf\x9d\xaf\x9d\xaf\x9d\xaf\x9d\xb3\x9d\xaf\x9d\x73\xb6\x13\xb7\x19\xcf\xfc\xf7\xfe\xff\xfe\xff\x9c\xf7\x73\xb6\x2c\x63\x00\x00\x00\x00\x08\x64\xaf\x9d\x16\xcf\xfc\xf7\xfe\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfe\xff\x16\xcf\xec\x84\xf0\x84\x16\xcf\x99\xe7\xfc\xf7\xff\xff\xff\xff\xff\xff\x20\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xef\x9c\x9c\xf7\x99\xe7\x0c\x84\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
-_background1_p32 = b'\x00\x00\xaf\x9d\xfc\xf7\x16\xcf\x0c\x84\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x16\xcf\xff\xff\xff\xff\xfe\xff\xfc\xf7\x99\xe7\x73\xb6\x0c\x84\xef\x9c\x99\xe7\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfe\xff\x99\xe7\x73\xb6\xec\x84\x20\x42\x00\x00\x00\x00\x10\x84\x16\xcf\xfc\xf7\xfe\xff\xfe\xff\xfc\xf7\x16\xcf\x73\xb6\x73\xb6\xaf\x9d\xb3\x9d\xaf\x9d\xaf\x9d\xaf\x9d\xaf\x9d\xaf\x9d\xaf\x9d\xaf\x9d\xaf\x9d\xb3\x9d\x16\xb7\x16\xcf\x99\xe7\x99\xe7\x16\xb7\xec\x84\x20\x42\x00\x00\x00\x00\x00\x00\x20\x02\xaf\x9d\x28\x42\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xff\xff\xff\x28\x43\x00\x00\x00\x00\x00\x00\x00\x00\xfc\xf7\xfe\xff\xec\x84\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x28\x43\x0c\x84\xb3\x9d\x73\xb6\x16\xcf\x19\xcf\x19\xcf\x16\xcf\x73\xb6\xaf\x9d\x0c\x64\x08\x64\x28\x43\x28\x43\x20\x42\x20\x02\x20\x02\x00\x00\x00\x00\x00\x00\x20\x42\x0c\x84\x0c\x84\x28\x42\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xec\x84\xaf\x9d\xaf\x9d\xef\x9c\x73\xb6\xb3\x9d\x2c\x63\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x16\xcf\x00\x00\x00\x00\x00\x00\x00\x00\x0c\x64\xfe\xff\x73\xb6\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x28\x42\xf0\x84\x19\xcf\xfe\xff\xff\xff\xfe\xff\xfc\xf7\x73\xb6\xec\x84\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x28\x42\xfc\xf7\xfc\xf7\x00\x00\x00\x00\x00\x00\x00\x00\x28\x43\xb3\xb5\x00\x00\x00\x00\x00\x00\x00\x00\x20\x02\x0c\x84\xb3\xb5\x73\x9e\xf0\x84\xaf\x9d\xaf\x9d\x0c\x64\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x28\x63\xec\x84\x0c\x64\x00\x00\x00\x00\x00\x00\x00\x00\x20\x02\x20\x42\x20\x42\x28\x43\x28\x43\x0c\x64\xec\x84\xaf\x9d\x73\xb6\x16\xcf\x19\xcf\x19\xcf\x16\xcf\x73\xb6\xaf\x9d\x0c\x84\x20\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x20\x02\x73\x9e\xff\xff\x0c\x64\x00\x00\x00\x00\x00\x00\x00\x00\x99\xe7\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xff\xff\x0c\x64\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfe\xff\x99\xe7\xb3\x9d\x0c\x84\xec\x84\xf0\x84\xb3\xb5\x76\xce\x76\xce\x73\xb6\x73\xb6\x16\xcf\xfc\xf7\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xff\xff\xff\xff\xfe\xff\xfc\xf7\x73\xb6\x28\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x2c\x63\x73\xb6\x16\xcf\x73\xb6\xaf\x9d\x73\x9e\xaf\x9d\x28\x43\x0c\x84\x00\x00\x00\x00\x00\x00\x00\x00\x73\xb6\xfc\xf7\x20\x02\x00\x00\x00\x00\x00\x00\x00\x00\x10\x84\x99\xe7\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfe\xff\xb3\xb5\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xef\x9c\xfc\xf7\x0c\x64\x00\x00\x00\x00\x00\x00\x00\x00\x10\x84\x0c\x64\x73\x9e\xaf\x9d\xaf\x9d\x16\xb7\x16\xcf\xaf\x9d\x20\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x0c\x64\x16\xcf\xfc\xf7\xfe\xff\xff\xff\xff\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x9c\xf7\x16\xb7\x73\xb6\x73\xb6\x73\xb6\x73\xb6\xb3\x9d\xec\x84\x0c\x84\xf0\x84\x73\xb6\x9c\xf7\xfe\xff\xff\xff\xff\xff\xff\xff\xff\xff\x16\xcf\x00\x00\x00\x00\x00\x00\x00\x00\x99\xe7\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xff\xff\xff\x16\xb7\x00\x00\x00\x00\x00\x00\x00\x00\xef\x9c\xff\xff\xff\xff\xfe\xff\xfe\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfe\xff\x9c\xf7\x16\xb7\xaf\x9d\x0c\x64\x00\x00\x00\x00\x00\x00\x00\x00\x20\x02\x28\x43\xf0\x84\x73\xb6\x99\xe7\xfc\xf7\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfe\xff\xfe\xff\xfe\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfe\xff\x16\xcf\xef\x9c\x0c\x84\xf0\x84\x76\xce\xfe\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x00\x00\x00\x00\x00\x00\xfe\xff\x16\xb7\x00\x00\x00\x00\x00\x00\x00\x00\x16\xcf\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xef\x9c\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x28\x43\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x73\xb6\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xfe\xff\x73\xb6\x00\x00\x00\x00\x28\x63\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfc\xf7\xb3\x9d\x0c\x84\x0c\x84\xb3\xb5\xf9\xe7\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfe\xff\xfe\xff\xfe\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfe\xff\xfc\xf7\x16\xcf\xb3\xb5\xec\x84\x20\x42\x00\x00\x00\x00\x00\x00\x00\x00\x28\x42\xec\x84\x73\xb6\x16\xcf\xfc\xf7\xfe\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfe\xff\xfe\xff\xff\xff\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xff\xff\xff\xfe\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x9c\xf7\xff\xff\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfe\xff\x99\xe7\x73\x9e\xec\x84\x0c\x64\xec\x84\xf0\x84\xec\x84\x0c\x84\x28\x43\x28\x43\xec\x84\xb3\xb5\xfc\xf7\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x99\xe7\xaf\x9d\xf0\x84\x0c\x84\x20\x02\x00\x00\x9c\xf7\x00\x00\x00\x00\x00\x00\x99\xe7\xef\x9c\x00\x00\x00\x00\x00\x00\x28\x43\xff\xff\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xff\xff\x28\x42\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\xff\xff\xfc\xf7\xfe\xff\xff\xff\x99\xe7\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xfc\xf7\xaf\x9d\x00\x00\x00\x00\xaf\x9d\x76\xce\x00\x00\x28\x43\x10\x84\xf0\x84\xb3\xb5\xfe\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfe\xff\x19\xcf\xaf\x9d\x28\x63\x28\x43\x28\x63\x0c\x84\xf0\x84\xec\x84\xec\x84\xec\x84\xec\x84\x13\xb7\xfc\xf7\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfe\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xff\xff\xb3\xb5\x00\x00'
-_background1_p33 = b'\x00\x00\x00\x00\x00\x00\x0c\x84\xff\xff\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xff\xff\x28\x43\x00\x00\x00\x00\x00\x00\x00\x00\xaf\x9d\xff\xff\xff\xff\xfe\xff\xfe\xff\xfe\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfc\xf7\x16\xcf\x10\x84\x28\x42\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x28\x43\xaf\x9d\xb3\x9d\xec\x84\xec\x84\xec\x84\xb3\x9d\x73\xb6\x73\xb6\xaf\x9d\xec\x84\x0c\x64\x0c\x64\x0c\x84\x28\x42\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x99\xe7\x73\xb6\x00\x00\x00\x00\x00\x00\xaf\x9d\xff\xff\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xf9\xe7\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xaf\x9d\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\x73\xb6\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\x0c\x84\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x28\x63\x0c\x84\x0c\x84\x0c\x64\xec\x84\xaf\x9d\x73\xb6\x73\xb6\xaf\x9d\xec\x84\xec\x84\xec\x84\x73\xb6\xf0\x84\x20\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x28\x63\xaf\x9d\x99\xe7\xfe\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfe\xff\xfe\xff\xfe\xff\xff\xff\xff\xff\xff\xff\x20\x02\x00\x00\x00\x00\x00\x00\x00\x00\x16\xcf\xff\xff\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xff\xff\xfc\xf7\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x99\xe7\xff\xff\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xf9\xe7\x16\xcf\x73\xb6\x73\x9e\xaf\x9d\xec\x84\x28\x43\x28\x42\x20\x02\x00\x00\x00\x00\x00\x00\x00\x00\x28\x42\x2c\x63\xf0\x84\xb3\x9d\x73\xb6\xb3\x9d\xec\x84\x00\x00\x20\x42\x28\x43\xaf\x9d\xec\x84\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xf0\x84\x16\xcf\xfc\xf7\xff\xff\xff\xff\xff\xff\xff\xff\x00\x00\x00\x00\x0c\x64\x16\xcf\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\x0c\x64\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xfc\xf7\x00\x00\x00\x00\xaf\x9d\xff\xff\xff\xff\xff\xff\xff\xff\xf9\xe7\x73\xb6\x0c\x64\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x20\x02\xaf\x9d\xec\x84\x28\x43\x20\x02\x28\x42\xaf\x9d\x73\xb6\x73\xb6\xaf\x9d\xec\x84\x28\x63\x20\x02\x00\x00\x00\x00\x00\x00\x00\x00\x20\x42\x28\x42\x28\x63\xf0\x84\xaf\x9d\x73\xb6\x16\xb7\x99\xe7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xff\xff\xff\xff\xff\xef\x9c\x00\x00\x00\x00\x00\x00\x00\x00\x28\x42\xff\xff\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xff\xff\x28\x63\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x28\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x28\x43\xf0\x84\x16\xb7\xf9\xe7\xfe\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfe\xff\x99\xe7\x16\xcf\x73\xb6\xb3\xb5\x76\xce\x73\xb6\xaf\x9d\x0c\x64\x1c\xf7\xaf\x7d\x00\x00\x00\x00\xfe\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x9c\xf7\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\x08\x64\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xfe\xff\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xf0\x84\x99\xe7\x00\x00\x00\x00\x96\xcf\x73\xb6\x0c\x84\x73\xb6\x16\xb7\xb3\xb5\x73\xb6\xb3\xb5\x16\xcf\x9c\xf7\xfe\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfe\xff\xfc\xf7\x99\xe7\x73\xb6\x0c\x84\x28\x42\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x28\x42\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x73\xb6\xff\xff\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xff\xff\xfe\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xb3\x9d\xff\xff\xff\xff\x99\xe7\x16\xcf\x16\xcf\x73\xb6\xaf\x9d\xec\x84\x0c\x84\x0c\x84\x2c\x63\x0c\x84\x0c\x64\x0c\x84\xaf\x9d\xb3\xb5\x16\xb7\x16\xcf\x99\xe7\xfc\xf7\xfe\xf7\xfe\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfc\xf7\x73\xb6\x28\x42\x00\x00\x00\x00\x00\x00\x28\x43\x00\x00\x00\x00\x16\xcf\x73\xb6\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\x0c\x64\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x20\x02\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xff\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xfe\xff\x28\x43\x00\x00\x00\x00\x28\x42\x00\x00\x00\x00\x00\x00\x0c\x84\x16\xcf\xfe\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfe\xff\xfe\xff\xfc\xf7\x99\xe7\x16\xcf\x16\xcf\x73\xb6\xb3\xb5\xef\x9c\x0c\x64\x0c\x84\x0c\x64\x0c\x64\xec\x84\x0c\x64\xf0\x84\x73\xb6\x13\xb7\x16\xcf\x16\xcf\xfc\xf7\xff\xff\xff\xff\x28\x42\x00\x00\x00\x00\x00\x00\x00\x00\x28\x43\xff\xff\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7'
-_background1_p34 = b'\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xff\xff\x73\xb6\x00\x00\x00\x00\x00\x00\x00\x00\x28\x43\xfe\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfe\xff\xfc\xf7\x19\xcf\x73\xb6\xaf\x9d\xec\x84\x0c\x64\x28\x63\x0c\x64\xec\x84\xef\x9c\xaf\x9d\xaf\x9d\xb3\xb5\xb3\x9d\xaf\x9d\x0c\x64\x20\x42\x28\x43\xec\x84\x28\x63\x00\x00\x00\x00\x20\x02\x0c\x84\xb3\x9d\xb3\xb5\x73\xb6\x19\xcf\xfe\xff\xff\xff\xff\xff\xff\xff\x00\x00\x00\x00\x73\xb6\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x28\x42\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\x99\xe7\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xaf\x9d\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x10\x84\x73\xb6\x00\x00\x28\x43\xff\xff\xff\xff\xff\xff\xfc\xf7\x16\xcf\x73\xb6\xb3\xb5\xaf\x9d\x28\x63\x00\x00\x00\x00\x20\x02\x0c\x64\x0c\x64\x20\x42\x28\x43\xf0\x84\xaf\x9d\xb3\xb5\xaf\x9d\xaf\x9d\xaf\x9d\xec\x84\xec\x84\x0c\x64\x0c\x64\xec\x84\x0c\x84\xaf\x9d\x16\xcf\x99\xe7\xfc\xf7\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x19\xcf\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x99\xe7\xff\xff\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xff\xff\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x28\x43\xff\xff\xff\xff\xff\xff\xfc\xf7\xfc\xf7\xfe\xff\xfe\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfc\xf7\x16\xcf\xaf\x9d\x28\x63\x00\x00\x00\x00\x00\x00\x00\x00\x20\x02\x20\x42\x00\x00\x00\x00\x00\x00\x00\x00\x28\x42\x0c\x84\xb3\x9d\x19\xcf\xfc\xf7\xfc\xf7\xfe\xff\x0c\x64\x00\x00\x28\x42\xf0\x84\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x28\x43\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xff\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xfe\xff\xff\xff\xfc\xf7\xfc\xf7\xff\xff\xff\xff\x0c\x64\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xef\x9c\x00\x00\x00\x00\x96\xcf\x9c\xf7\xfc\xf7\xfc\xf7\x16\xb7\xaf\x9d\x2c\x63\x28\x42\x00\x00\x00\x00\x00\x00\x00\x00\x28\x42\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x0c\x84\x73\xb6\x99\xe7\xfe\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xff\xff\xfe\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xef\x9c\xff\xff\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xff\xff\xfc\xf7\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x0c\x84\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfe\xff\x99\xe7\xaf\x9d\x0c\x64\x28\x43\x00\x00\x28\x42\x0c\x64\xaf\x9d\x73\xb6\x16\xcf\x99\xe7\xfe\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfe\xff\xfe\xff\x99\xe7\x0c\x84\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xf0\x84\xb3\xb5\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x28\x43\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xff\xff\x28\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xfc\xf7\xff\xff\xfc\xf7\xfc\xf7\xfe\xff\xff\xff\x28\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x73\xb6\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xaf\x9d\xfc\xf7\xfe\xff\xfe\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfc\xf7\x16\xcf\x16\xb7\xb3\xb5\xf0\x84\x28\x43\x28\x42\x00\x00\x28\x43\xf0\x84\x73\xb6\xfc\xf7\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfe\xff\x20\x02\x00\x00\x00\x00\x00\x00\x00\x00\x28\x63\xff\xff\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xff\xff\xff\xff\xff\xaf\x9d\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x99\xe7\xfe\xff\x99\xe7\x28\x63\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x0c\x64\x73\xb6\xfc\xf7\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfe\xff\xfc\xf7\x19\xe7\xaf\x9d\xb3\xb5\xfe\xff\xff\xff\x28\x43\x00\x00\x73\xb6\xaf\x9d\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x28\x43\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xff\xff\xfe\xff\xfc\xf7\xf9\xe7\xfc\xf7\xfe\xff\xff\xff\xff\xff\xfc\xf7\xfc\xf7\xfe\xff\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x16\xcf\x28\x42\x00\x00\xf9\xe7\xff\xff\x99\xe7\xaf\x9d\xb3\xb5\x99\xe7\xfc\xf7\xfe\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x99\xe7\xaf\x9d\x28\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xaf\x9d\xfc\xf7\xff\xff\xef\x9c\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x99\xe7\xff\xff\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xff\xff\xff\xff\xff\xf0\x84\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x2c\x63\x2c\x63\x00\x00\x00\x00\x28\x63\xf0\x84\x10\x84\x28\x63\x28\x42\x00\x00\x00\x00\x00\x00\x00\x00'
-_background1_p35 = b'\x00\x00\x20\x02\x28\x43\xec\x84\xaf\x9d\xf0\x84\x28\x63\xec\x84\x28\x43\x00\x00\x00\x00\x00\x00\x28\x42\xf0\x84\x16\xcf\xfe\xff\xff\xff\xff\xff\x00\x00\x00\x00\x16\xcf\xef\x9c\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x28\x43\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xff\xff\xff\xff\xff\xff\xff\xfe\xff\xfe\xff\xff\xff\xff\xff\xff\xff\xfe\xff\xfc\xf7\xfe\xf7\xff\xff\x99\xe7\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x16\xcf\x28\x43\x00\x00\x73\xb6\xff\xff\xff\xff\xfc\xf7\x73\xb6\x0c\x64\x00\x00\x00\x00\x00\x00\x00\x00\x0c\x84\x0c\x64\x0c\x64\xaf\x9d\xaf\x9d\xec\x84\x28\x43\x20\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x28\x43\x0c\x84\xec\x84\xec\x84\x28\x43\x00\x00\x20\x02\x0c\x84\x20\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x99\xe7\xff\xff\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xff\xff\xfc\xf7\x28\x63\x00\x00\x00\x00\x00\x00\x00\x00\xb3\x9d\xff\xff\xff\xff\xff\xff\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\x99\xe7\x99\xe7\x96\xcf\x99\xe7\xfc\xf7\xfc\xf7\xf0\x84\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x28\x43\x20\x42\x0c\x64\xaf\x9d\xec\x84\x0c\x64\xaf\x9d\xb3\xb5\x00\x00\x00\x00\x00\x00\x00\x00\xb3\xb5\xaf\x9d\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x28\x43\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xff\xff\xf0\x84\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xef\x9c\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xff\xff\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x16\xcf\x28\x42\x00\x00\x00\x00\x00\x00\x28\x42\x73\xb6\xec\x84\x0c\x64\xaf\x9d\xf0\x84\x28\x43\x28\x42\x28\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x73\xb6\xfc\xf7\xfc\xf7\x99\xe7\x96\xcf\x99\xe7\x99\xe7\xfc\xf7\xfc\xf7\xfe\xff\xfe\xff\xff\xff\xff\xff\xff\xff\xfe\xff\x28\x63\x00\x00\x00\x00\x00\x00\x00\x00\xaf\x9d\xff\xff\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xff\xff\xfe\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x20\x02\xfe\xff\xff\xff\xff\xff\xfe\xff\xfe\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfe\xff\x76\xce\x10\x84\x0c\x84\xb3\x9d\x9c\xf7\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfe\xff\xf0\x84\x28\x63\xff\xff\xef\x9c\x00\x00\xf0\x84\xb3\x9d\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x28\x42\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xff\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xec\x84\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xfe\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xb3\xb5\x00\x00\x00\x00\xfc\xf7\x19\xe7\x28\x43\x76\xce\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x16\xcf\xef\x9c\x0c\x64\xf0\x84\x99\xe7\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfe\xff\xff\xff\xff\xff\xff\xff\x16\xcf\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xf0\x84\xff\xff\xff\xff\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xff\xff\x99\xe7\x28\x43\x00\x00\x00\x00\x00\x00\x00\x00\x28\x43\x99\xe7\xff\xff\xff\xff\xfc\xf7\xec\x84\x28\x63\xf0\x84\xf0\x84\x10\x84\x16\xb7\xff\xff\xff\xff\xff\xff\xff\xff\xfe\xff\xfc\xf7\xfe\xff\xff\xff\xff\xff\xfc\xf7\x0c\x64\x00\x00\x00\x00\x28\x43\xfe\xff\xff\xff\x73\xb6\x00\x00\x00\x00\xf0\x84\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x28\x43\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\x16\xcf\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xfe\xff\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\x28\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xaf\x9d\x00\x00\x00\x00\xff\xff\xff\xff\x16\xcf\x00\x00\x20\x02\x00\x00\xaf\x9d\xfe\xff\xff\xff\xff\xff\xfc\xf7\xfc\xf7\xfe\xff\xff\xff\xff\xff\xff\xff\xfc\xf7\xaf\x9d\xf0\x84\xef\x9c\xf0\x84\x28\x43\xb3\x9d\xff\xff\xff\xff\xff\xff\xb3\x9d\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xef\x9c\xfe\xff\xff\xff\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xff\xff\xff\xff\xff\x99\xe7\x20\x02\x00\x00\x00\x00\x00\x00\x00\x00\x28\x43\x28\x42\x00\x00\x00\x00\x00\x00\x28\x43\xec\x84\xef\x9c\xec\x84\x28\x43\x00\x00\x00\x00\x00\x00\x28\x43\xef\x9c\x28\x63\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x0c\x84\x0c\x64\xf0\x84\x00\x00\x00\x00\x00\x00\x00\x00\x16\xcf\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x0c\x64\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xaf\x9d\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xfc\xf7\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xaf\x9d\x73\xb6\x00\x00\x00\x00\x00\x00'
-_background1_p36 = b'\x28\x43\x0c\x84\x0c\x64\x28\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xf0\x84\x0c\x84\x20\x42\x00\x00\x00\x00\x20\x02\x28\x63\xf0\x84\xef\x9c\x0c\x64\x20\x42\x00\x00\x00\x00\x00\x00\x2c\x63\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x2c\x63\xfe\xff\xff\xff\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xff\xff\xfe\xff\x28\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x99\xe7\xff\xff\xff\xff\xff\xff\xfc\xf7\xf9\xe7\xfc\xf7\xfc\xf7\xff\xff\xff\xff\xfe\xff\x0c\x84\x00\x00\x28\x42\x99\xe7\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x99\xe7\x20\x42\xff\xff\xb3\x9d\x00\x00\x73\xb6\x99\xe7\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\xfc\xf7\xfc\xf7\xfe\xff\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x0c\x64\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xfe\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xfe\xff\x00\x00\x00\x00\xfc\xf7\x99\xe7\x00\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfe\xff\xb3\xb5\x00\x00\x00\x00\x76\xce\xff\xff\xff\xff\xff\xff\xfc\xf7\xfc\xf7\xf9\xe7\xfc\xf7\xff\xff\xff\xff\xff\xff\xaf\x9d\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xaf\x9d\xff\xff\xff\xff\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xff\xff\x99\xe7\x28\x63\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x76\xce\xfe\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfc\xf7\x16\xcf\x73\xb6\xb3\xb5\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfc\xf7\x00\x00\x00\x00\x0c\x64\xff\xff\x0c\x64\x00\x00\x00\x00\xfc\xf7\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x73\xb6\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\x20\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xaf\x9d\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xfc\xf7\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xef\x9c\x73\xb6\x00\x00\x00\x00\xff\xff\xff\xff\xf0\x84\x00\x00\xf0\x84\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfc\xf7\xaf\x9d\x76\xce\x16\xcf\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfc\xf7\xef\x9c\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xf0\x84\xfe\xff\xff\xff\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xff\xff\xff\xff\x28\x63\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x28\x42\xff\xff\xff\xff\x28\x43\x00\x00\x00\x00\x10\x84\xb3\xb5\x0c\x64\x20\x02\x00\x00\x0c\x84\x28\x42\x00\x00\x00\x00\x00\x00\x16\xcf\x99\xe7\x00\x00\x00\x00\x00\x00\x00\x00\x28\x42\xfc\xf7\x00\x00\x00\x00\x00\x00\x00\x00\xfc\xf7\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xec\x84\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x96\xcf\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\x28\x63\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xfc\xf7\x00\x00\x00\x00\x00\x00\x00\x00\xaf\x9d\x73\xb6\x20\x02\x00\x00\x00\x00\x00\x00\xf0\x84\xec\x84\x00\x00\x08\x64\x73\xb6\x16\xcf\x2c\x63\x00\x00\x00\x00\xf0\x84\xff\xff\x99\xe7\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xb3\x9d\xff\xff\xff\xff\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xff\xff\xfe\xff\xaf\x9d\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x16\xb7\xff\xff\x16\xcf\xaf\x7d\xec\x84\x99\xe7\xff\xff\x2c\x63\x00\x00\xaf\x9d\xff\xff\xff\xff\xff\xff\x08\x64\xaf\x9d\xff\xff\xff\xff\x00\x00\x00\x00\x73\xb6\x16\xb7\x00\x00\x00\x00\x00\x00\x96\xcf\xff\xff\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xfe\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xff\xff\xfe\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xfe\xff\x28\x43\x00\x00\x28\x43\xff\xff\xb3\x9d\x20\x02\xfe\xff\xff\xff\xff\xff\xfc\xf7\x00\x00\x00\x00\x0c\x84\x9c\xf7\xaf\x7d\xec\x84\xaf\x9d\x99\xe7\xff\xff\x28\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x20\x02\x16\xcf\xff\xff\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7'
-_background1_p37 = b'\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xff\xff\xff\xff\xb3\xb5\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x20\x02\x16\xcf\xff\xff\xff\xff\xff\xff\xff\xff\xf0\x84\x00\x00\x99\xe7\xff\xff\xfc\xf7\xaf\x9d\x00\x00\x16\xcf\xff\xff\xff\xff\x28\x43\x00\x00\x00\x00\x00\x00\x99\xe7\x16\xcf\x00\x00\x00\x00\x00\x00\x28\x43\xff\xff\xff\xff\xff\xff\xfc\xf7\xfc\xf7\xff\xff\xaf\x9d\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xfc\xf7\xff\xff\xfc\xf7\xfe\xff\xff\xff\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xfe\xff\x2c\x63\x00\x00\x00\x00\x00\x00\x19\xe7\xff\xff\x16\xcf\x28\x42\x19\xe7\xfe\xff\xff\xff\xff\xff\x16\xcf\x00\x00\xfe\xff\xff\xff\xff\xff\xff\xff\xff\xff\xf0\x84\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x99\xe7\xff\xff\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xff\xff\xff\xff\xfc\xf7\x28\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xef\x9c\x00\x00\x00\x00\xfc\xf7\x99\xe7\x73\xb6\x99\xe7\x16\xcf\xfe\xff\xfe\xff\x00\x00\x00\x00\x00\x00\x28\x43\x0c\x64\x00\x00\x00\x00\x16\xcf\xf9\xe7\x00\x00\x00\x00\x00\x00\x00\x00\xf0\x84\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfc\xf7\x28\x43\x00\x00\x00\x00\x00\x00\x00\x00\x28\x63\xfe\xff\xff\xff\xff\xff\xff\xff\xff\xff\x16\xcf\x00\x00\x00\x00\x00\x00\x00\x00\x28\x43\xfe\xff\x0c\x64\x00\x00\x00\x00\xb3\x9d\x00\x00\x00\x00\x00\x00\xb3\x9d\x76\xce\xaf\x9d\x19\xe7\xaf\x9d\xaf\x9d\xfc\xf7\xf0\x84\x00\x00\x28\x43\x10\x84\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xef\x9c\xfe\xff\xff\xff\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xff\xff\xff\xff\xff\xfe\xff\x0c\x84\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x28\x42\xb3\x9d\x99\xe7\xfe\xff\x99\xe7\xef\x9c\x00\x00\x00\x00\x00\x00\x00\x00\x16\xcf\xff\xff\xff\xff\x00\x00\x00\x00\x00\x00\xb3\xb5\xfc\xf7\x2c\x63\x00\x00\x00\x00\x00\x00\x00\x00\x0c\x64\x99\xe7\xfe\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfe\xff\x99\xe7\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xb3\x9d\xfe\xff\x28\x42\x00\x00\x00\x00\xb3\x9d\xff\xff\xff\xff\xaf\x9d\x00\x00\x00\x00\x00\x00\x28\x42\xf0\x84\x99\xe7\xf9\xe7\xb3\xb5\x0c\x84\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xb3\xb5\xff\xff\xff\xff\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xff\xff\xff\xff\xfe\xff\x0c\x84\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xf0\x84\xff\xff\xff\xff\xfe\xff\xff\xff\x28\x63\x00\x00\x00\x00\x00\x00\xfc\xf7\xfc\xf7\x28\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x28\x63\xaf\x9d\x73\xb6\x73\xb6\xb3\x9d\x0c\x64\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xef\x9c\xfe\xff\x73\xb6\x00\x00\x00\x00\x00\x00\x99\xe7\xff\xff\xfc\xf7\xff\xff\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xb3\xb5\xff\xff\xff\xff\xff\xff\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7'
-_background1_p38 = b'\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xff\xff\xff\xff\xff\xff\xff\x19\xcf\x73\x9e\x28\x43\x00\x00\x00\x00\x00\x00\x00\x00\xef\x9c\xaf\x9d\x00\x00\x00\x00\x00\x00\x0c\x64\xff\xff\xff\xff\xff\xff\xff\xff\x16\xcf\x00\x00\x00\x00\x00\x00\x0c\x84\x73\xb6\x19\xcf\x76\xce\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x2c\x63\x99\xe7\x16\xb7\x73\xb6\x00\x00\x00\x00\x00\x00\x00\x00\xfe\xff\xff\xff\xfc\xf7\xff\xff\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00\x19\xe7\x28\x42\x00\x00\x00\x00\x00\x00\x00\x00\x0c\x64\x73\xb6\xfc\xf7\xff\xff\xff\xff\xff\xff\xfe\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfc\xf7\xfc\xf7\xff\xff\xff\xff\xff\xff\x0c\x64\x00\x00\x00\x00\x00\x00\x0c\x64\xff\xff\xff\xff\xfc\xf7\xff\xff\xff\xff\x20\x42\x00\x00\x00\x00\x00\x00\x28\x42\x16\xcf\x9c\xf7\x99\xe7\xaf\x9d\x2c\x63\x28\x43\x20\x02\x00\x00\x00\x00\x00\x00\x00\x00\x28\x42\x28\x42\x0c\x84\xb3\xb5\x99\xe7\x9c\xf7\xb3\x9d\x00\x00\x00\x00\x00\x00\x00\x00\xef\x9c\xff\xff\xff\xff\xfc\xf7\xff\xff\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00\xfe\xff\xff\xff\xff\xff\xfe\xff\xfc\xf7\xfe\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xff\xff\xff\xff\xff\xfe\xff\xfc\xf7\xfe\xff\xff\xff\x28\x43\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\xff\xff\xfc\xf7\xff\xff\xff\xff\xfc\xff\x2c\x63\x00\x00\x00\x00\x00\x00\x00\x00\x28\x43\x10\x84\x0c\x84\xaf\x9d\xb3\xb5\x16\xcf\x16\xcf\x16\xcf\x16\xb7\xb3\xb5\xf0\x84\x0c\x84\x0c\x84\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xb3\xb5\xff\xff\xff\xff\xfe\xff\xfe\xff\xff\xff\x99\xe7\x00\x00\x00\x00\x00\x00\x00\x00\x99\xe7\xff\xff\xfc\xf7\xfc\xf7\xff\xff\xff\xff\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xff\xff\x28\x63\x00\x00\x00\x00\x00\x00\x00\x00\x9c\xf7\xff\xff\xff\xff\xfc\xf7\xff\xff\xff\xff\xfe\xff\x0c\x84\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x73\xb6\xff\xff\xff\xff\xff\xff\xfc\xf7\xff\xff\xff\xff\xef\x9c\x00\x00\x00\x00\x00\x00\x00\x00\x99\xe7\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7'
-_background1_p39 = b'\xfc\xf7\xfc\xf7\xff\xff\xff\xff\x73\xb6\x00\x00\x00\x00\x00\x00\x00\x00\x28\x42\xff\xff\xff\xff\xff\xff\xfc\xf7\xff\xff\xff\xff\xff\xff\xfe\xff\x19\xcf\xec\x84\x20\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x28\x43\xaf\x9d\xfc\xf7\xff\xff\xff\xff\xff\xff\xfe\xff\xfe\xff\xff\xff\xff\xff\x99\xe7\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xfe\xff\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xff\xff\xff\x99\xe7\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xef\x9c\xfc\xf7\xff\xff\xff\xff\xfe\xff\xfe\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfe\xff\xfe\xff\xff\xff\xff\xff\xff\xff\x99\xe7\x28\x43\x00\x00\x00\x00\x00\x00\x00\x00\x28\x42\xff\xff\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xff\xff\x28\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x20\x02\x99\xe7\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfe\xff\xfe\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfe\xff\xfe\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xb3\xb5\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x16\xcf\xff\xff\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xff\xff\xfe\xff\x28\x42\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xec\x84\x99\xe7\xfe\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfc\xf7\x16\xb7\x28\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xb3\x9d\xff\xff\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xff\xff\x99\xe7\x28\x42\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x20\x02\x28\x43\x0c\x64\xec\x84\x0c\x64\x0c\x64\x28\x42\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x0c\x84\xff\xff\xff\xff\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7'
-_background1_p40 = b'\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xff\xff\xff\xff\x73\xb6\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x28\x43\x9c\xf7\xff\xff\xff\xff\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xff\xff\xff\xff\xfe\xff\x73\x9e\x0c\x64\x28\x42\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x28\x43\x0c\x84\x16\xcf\xff\xff\xff\xff\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfe\xff\xfc\xf7\x99\xe7\x16\xcf\x16\xcf\x16\xcf\x96\xcf\xf9\xe7\xfe\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfe\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7'
-_background1_p41 = b'\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7'
-_background1_p42 = b'\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7'
-_background1_p43 = b'\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xf7\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xff\xfe\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xff\xfe\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xff\xfe\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xff\xfe\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xff\xff\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xff\xff\xff\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xff\xff\xff\xff\xff\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xff\xff\xff\xff\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xfc\xf7\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xec\x84\xff\xff\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\x13\xb7\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xfc\xf7\xff\xff\xfc\xf7\xfe\xff\xfe\xff\x00\x00\x00\x00\x00\x00\xff\xff\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xff\xff\xff\x20\x02\x00\x00\x00\x00\xff\xff\xfe\xff\xfc\xf7\xff\xff\xf0\x84\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x16\xcf\xff\xff\xfc\xf7\xff\xff\xaf\x9d\x00\x00\x00\x00\xaf\x9d\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xff\xfe\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xaf\x9d\xff\xff\xfc\xf7\xfe\xff\xff\xff\x00\x00\x00\x00\x00\x00\x28\x43\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xff\xff\x00\x00\x00\x00\x00\x00\xaf\x7d\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xfc\xf7\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xfc\xf7\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xaf\x9d\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xfc\xf7\xff\xff\xfc\xf7\xff\xff\xfe\xff\x00\x00\x00\x00\x00\x00\x28\x42\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xff\xff\xff\x00\x00\x00\x00\x00\x00\xff\xff\xfe\xff\xfc\xf7\xff\xff\x20\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x73\xb6\xff\xff\xfc\xf7\xff\xff\x28\x63\x00\x00\x00\x00\x0c\x64\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xfe\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x28\x43\xff\xff\xfc\xf7\xfc\xf7\xff\xff\x99\xe7\x00\x00\x00\x00\x00\x00\xaf\x9d\xff\xff\xfc\xf7\xfc\xf7'
-_background1_p44 = b'\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xff\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xfc\xf7\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xfe\xff\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\x13\xb7\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xfc\xf7\xff\xff\xfc\xf7\xff\xff\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00\xaf\x7d\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xff\xff\xff\x00\x00\x00\x00\x00\x00\xff\xff\xfe\xff\xfc\xf7\xff\xff\x0c\x64\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x16\xcf\xff\xff\xfc\xf7\xff\xff\xf0\x84\x00\x00\x00\x00\xaf\x9d\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xec\x84\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\x16\xcf\x00\x00\x00\x00\x00\x00\xf9\xe7\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xec\x84\x00\x00\x00\x00\x00\x00\xff\xff\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xfc\xf7\x00\x00\x00\x00\x00\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x96\xcf\x00\x00\x00\x00\x00\x00\x13\xb7\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\x13\xb7\x00\x00\x00\x00\xf0\x84\xff\xff\xff\xff\xfe\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfe\xff\xfe\xff\xfc\xf7\xfc\xf7\xff\xff\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x16\xcf\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xff\xff\xff\x00\x00\x00\x00\x00\x00\xff\xff\xfe\xff\xfc\xf7\xfe\xff\xfe\xff\xfe\xff\xff\xff\xff\xff\xfe\xff\xff\xff\xaf\x9d\x00\x00\x00\x00\x73\xb6\xff\xff\xfe\xff\xff\xff\xff\xff\xfe\xff\xfe\xff\xfc\xf7\xfc\xf7\xff\xff\xf0\x84\x00\x00\x00\x00\xaf\x9d\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xff\xff\x00\x00\x00\x00\x00\x00\xff\xff\xff\xff\xfe\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfe\xff\xfe\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xff\xff\xff\xaf\x7d\x00\x00\x00\x00\x00\x00\xfe\xff\xff\xff\xfc\xf7\xfc\xf7\xff\xff\x16\xcf\x00\x00\x00\x00\x00\x00\xfe\xff\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xfc\xf7\x00\x00\x00\x00\x00\x00\xff\xff\xff\xff\xfe\xff\xfe\xff\xfe\xff\xff\xff\xff\xff\xec\x84\x00\x00\x00\x00\xf0\x84\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\x13\xb7\x00\x00\x00\x00\xf0\x84\xff\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xfe\xff\xff\xff\xfc\xf7\xfc\xf7\xfe\xff\xff\xff\x00\x00\x00\x00\x00\x00\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xfe\xff\xff\xff\xff\xff\xff\xff\xfe\xff\xff\xff\xaf\x9d\x00\x00\x00\x00\x13\xb7\xff\xff\xfe\xff\xff\xff\xff\xff\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xff\xff\xf0\x84\x00\x00\x00\x00\xaf\x9d\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xff\xff\x00\x00\x00\x00\x00\x00\xff\xff\xff\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xff\xff\xff\xff\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xff\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\xff\xff\xff\xff\xff\xff\x00\x00\x00\x00\x00\x00\x13\xb7\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xfc\xf7\x00\x00\x00\x00\x00\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x20\x42\x00\x00\x00\x00\x13\xb7\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\x13\xb7\x00\x00\x00\x00\xaf\x9d\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xff\xff\x00\x00\x00\x00\x10\x84\x73\x9e\x00\x00\x00\x00\x00\x00\xff\xff\xff\xff\xfc\xf7\xfe\xff\xff\xff\x00\x00\x00\x00\x00\x00\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xf0\x84\x00\x00\x00\x00\xb3\x9d\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xf0\x84\x00\x00\x00\x00\xaf\x9d\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xff\xff\x00\x00\x00\x00\x00\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\xff\xff\x00\x00\x00\x00\x00\x00\xec\x84\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7'
-_background1_p45 = b'\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xfc\xf7\x00\x00\x00\x00\x00\x00\xfe\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xff\x0c\x64\x00\x00\x00\x00\x00\x00\xff\xff\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\x13\xb7\x00\x00\x00\x00\x0c\x64\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\x99\xe7\xfc\xf7\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xff\xff\x00\x00\x00\x00\x0c\x64\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\xff\xff\xfc\xf7\xff\xff\x00\x00\x00\x00\x00\x00\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xf0\x84\x00\x00\x00\x00\x73\x9e\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xf0\x84\x00\x00\x00\x00\xaf\x9d\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xff\xff\x00\x00\x00\x00\x00\x00\xfe\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\x99\xe7\xfe\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xff\xff\x00\x00\x00\x00\x00\x00\x16\xcf\xec\x84\x00\x00\x00\x00\x00\x00\xff\xff\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xfc\xf7\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xfc\xf7\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\x13\xb7\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\xfe\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xff\xff\x00\x00\x00\x00\x00\x00\xff\xff\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\xff\xff\xff\xff\x00\x00\x00\x00\x00\x00\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xf0\x84\x00\x00\x00\x00\x73\x9e\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xf0\x84\x00\x00\x00\x00\xaf\x9d\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xfc\xf7\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xfc\xf7\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xfc\xf7\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x16\xcf\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\x13\xb7\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xff\xff\x00\x00\x00\x00\x00\x00\xff\xff\xff\xff\xfe\xff\x00\x00\x00\x00\x00\x00\x0c\x64\xff\xff\xff\xff\x00\x00\x00\x00\x00\x00\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xf0\x84\x00\x00\x00\x00\x73\x9e\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xf0\x84\x00\x00\x00\x00\xaf\x9d\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xfc\xf7\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\x73\xb6\x00\x00\x00\x00\x00\x00\x00\x00\xfe\xff\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xfc\xf7\x00\x00\x00\x00\x00\x00\xfe\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\x28\x43\x00\x00\x00\x00\x00\x00\xfe\xff\xff\xff\xfc\xf7\xfc\xf7\xff\xff\x13\xb7\x00\x00\x00\x00\x28\x63\xfe\xff\x16\xcf\x16\xcf\x16\xcf\x16\xcf\x16\xcf\x96\xcf\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xff\xff\x00\x00\x00\x00\x00\x00\xff\xff\xfc\xf7\xff\xff\x99\xe7\x00\x00\x00\x00\x00\x00\x13\xb7\xff\xff\x00\x00\x00\x00\x00\x00\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xf0\x84\x00\x00\x00\x00\x73\x9e\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xf0\x84\x00\x00\x00\x00\xaf\x9d\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xff\xff\x00\x00\x00\x00\x00\x00\xf9\xe7\x99\xe7\x16\xcf\x16\xcf\x16\xcf\x16\xcf\x13\xb7\xfc\xf7\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xff\xff\xff\x28\x42\x00\x00\x00\x00\x16\xcf\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xfc\xf7\x00\x00\x00\x00\x00\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff'
-_background1_p46 = b'\xff\xff\xff\xff\xff\xff\x28\x43\x00\x00\x00\x00\x08\x64\xff\xff\xfc\xf7\xfc\xf7\xff\xff\x13\xb7\x00\x00\x00\x00\xaf\x9d\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xff\xff\x00\x00\x00\x00\x00\x00\xff\xff\xfc\xf7\xfc\xf7\xff\xff\xaf\x9d\x00\x00\x00\x00\x00\x00\xff\xff\xec\x84\x00\x00\x00\x00\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xf0\x84\x00\x00\x00\x00\x73\x9e\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xf0\x84\x00\x00\x00\x00\xaf\x9d\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xff\xff\x00\x00\x00\x00\x00\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\x28\x63\x00\x00\x00\x00\x16\xcf\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xfc\xf7\x00\x00\x00\x00\x00\x00\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xb3\x9d\x00\x00\x00\x00\x00\x00\xff\xff\xfc\xf7\xfc\xf7\xff\xff\x13\xb7\x00\x00\x00\x00\x0c\x64\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xff\xff\x00\x00\x00\x00\x00\x00\xff\xff\xfc\xf7\xfc\xf7\xfe\xff\xff\xff\x08\x64\x00\x00\x00\x00\x00\x00\x20\x02\x00\x00\x00\x00\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xf0\x84\x00\x00\x00\x00\x73\x9e\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xf0\x84\x00\x00\x00\x00\xaf\x9d\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xff\xff\x00\x00\x00\x00\x00\x00\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\x28\x43\x00\x00\x00\x00\x13\xb7\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xfc\xf7\x00\x00\x00\x00\x00\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x00\x00\x00\x00\x00\x00\x08\x64\xff\xff\xfc\xf7\xfc\xf7\xff\xff\x13\xb7\x00\x00\x00\x00\x73\xb6\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xff\xff\xff\xff\x00\x00\x00\x00\x00\x00\xff\xff\xfe\xf7\xfc\xf7\xfc\xf7\xff\xff\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xf0\x84\x00\x00\x00\x00\x73\x9e\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xf0\x84\x00\x00\x00\x00\x96\xcf\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfc\xf7\xfc\xf7\xff\xff\xff\xff\x00\x00\x00\x00\x00\x00\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\x28\x43\x00\x00\x00\x00\x13\xb7\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xfc\xf7\x00\x00\x00\x00\x00\x00\x73\x9e\xaf\x9d\xf0\x84\xf0\x84\xf0\x84\xaf\x9d\xf0\x84\x00\x00\x00\x00\x00\x00\x00\x00\xfc\xf7\xff\xff\xfc\xf7\xfc\xf7\xff\xff\x13\xb7\x00\x00\x00\x00\x20\x42\xb3\x9d\x0c\x64\x0c\x64\x0c\x64\x0c\x64\x0c\x64\x0c\x64\x0c\x64\x0c\x64\x28\x43\x99\xe7\xff\xff\xfc\xf7\xff\xff\xff\xff\x00\x00\x00\x00\x00\x00\xff\xff\xfe\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xf0\x84\x00\x00\x00\x00\x73\x9e\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xf0\x84\x00\x00\x00\x00\x28\x42\xb3\x9d\x0c\x64\x0c\x64\x0c\x64\x0c\x64\x0c\x64\x0c\x64\x0c\x64\x08\x64\x16\xcf\xff\xff\xfc\xf7\xff\xff\xff\xff\x00\x00\x00\x00\x00\x00\xaf\x9d\xf0\x84\x0c\x64\x0c\x64\x0c\x64\x0c\x64\x0c\x64\x0c\x64\x0c\x64\x0c\x64\xb3\x9d\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\x28\x43\x00\x00\x00\x00\x13\xb7\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xfc\xf7\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x73\xb6\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\x73\xb6\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x73\x9e\xff\xff\xfc\xf7\xff\xff\xfe\xff\x00\x00\x00\x00\x00\x00\xff\xff\xfe\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\x0c\x64\x00\x00\x00\x00\xaf\x9d\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7'
-_background1_p47 = b'\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\x0c\x64\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x28\x43\xff\xff\xfc\xf7\xff\xff\xfe\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\x00\x00\x00\x00\x00\x00\x73\xb6\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xfc\xf7\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x20\x42\xb3\xb5\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\x73\xb6\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x16\xcf\xff\xff\xfc\xf7\xfe\xff\xfe\xff\x00\x00\x00\x00\x00\x00\xff\xff\xfe\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\x99\xe7\x00\x00\x00\x00\x00\x00\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\x0c\x64\x00\x00\x00\x00\xaf\x9d\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\x0c\x64\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xf0\x84\xff\xff\xfc\xf7\xfe\xff\xfe\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x20\x02\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\x20\x02\x00\x00\x00\x00\x73\xb6\xff\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xff\xff\xff\xff\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xf7\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xff\xff\xfe\xff\xfe\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfc\xf7\xfc\xf7\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xff\xfe\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xff\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xff\xff\xff\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfe\xff\xff\xff\xff\xff\xfe\xff\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7'
-_background1_p48 = b'\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7'
-_background1_p49 = b'\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7'
-_background1_p50 = b'\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7'
-_background1_p51 = b'\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7'
-_background1_p52 = b'\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7'
-_background1_p53 = b'\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7'
-_background1_p54 = b'\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7'
-_background1_p55 = b'\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7'
-_background1_p56 = b'\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7\xfc\xf7'
-
-background1 = (_background1_p0, _background1_p1, _background1_p2, _background1_p3, _background1_p4, _background1_p5, _background1_p6, _background1_p7, _background1_p8, _background1_p9, _background1_p10, _background1_p11, _background1_p12, _background1_p13, _background1_p14, _background1_p15, _background1_p16, _background1_p17, _background1_p18, _background1_p19, _background1_p20, _background1_p21, _background1_p22, _background1_p23, _background1_p24, _background1_p25, _background1_p26, _background1_p27, _background1_p28, _background1_p29, _background1_p30, _background1_p31, _background1_p32, _background1_p33, _background1_p34, _background1_p35, _background1_p36, _background1_p37, _background1_p38, _background1_p39, _background1_p40, _background1_p41, _background1_p42, _background1_p43, _background1_p44, _background1_p45, _background1_p46, _background1_p47, _background1_p48, _background1_p49, _background1_p50, _background1_p51, _background1_p52, _background1_p53, _background1_p54, _background1_p55, _background1_p56)
-
-
-
-# Dictionary for easy access to images
-
-IMAGES = {
-      'background1': background1
-  }
+# Index of the converted images for display on Waveshare RP2350
+
+# Generated by tools/build_assets.py from assets.json - do not edit.
+# To add or change an image:
+# 1. Add it to assets.json (name, source file, optional size/gamma/format)
+# 2. On your PC, run: python3 tools/build_assets.py
+# 3. Upload this file and the image modules to the RP2350:
+#    mpremote cp image_data.py img_*.py :
+#
+# Each image is in its own module (img_<name>.py), imported only when
+# get_image() asks for it, so importing this index costs a few hundred
+# bytes however many images there are. image_cache.py keeps loaded images
+# within a RAM budget.
+
+import sys
+
+# Image name -> (module, format, width, height, bytes of RAM once loaded)
+ASSETS = {
+    'background1': ('img_background1', 'GS8', 240, 240, 57672),
+}
+
+NAMES = ('background1',)
 
 
 def get_image(name):
     """
-    Get image byte array by name.
+    Load an image by name (imports its module).
 
     Args:
         name: String name of the image
 
     Returns:
-        bytes object with image data, or None if not found
+        The image (tuple of bytes chunks, or an indexed image tuple), or
+        None if not found
 
     Example:
         img = get_image('background1')
         if img:
             display_image_background(lcd, img)
     """
-    return IMAGES.get(name)
+    asset = ASSETS.get(name)
+    if asset is None:
+        return None
+    return getattr(__import__(asset[0]), name)
+
+
+def unload_image(name):
+    """
+    Drop an image's module, so its data is freed once nothing else refers to it.
+
+    Args:
+        name: String name of the image
+    """
+    asset = ASSETS.get(name)
+    if asset is not None and asset[0] in sys.modules:
+        del sys.modules[asset[0]]
+
+
+def get_image_info(name):
+    """
+    Get an image's size without loading it.
+
+    Args:
+        name: String name of the image
+
+    Returns:
+        Tuple of (format, width, height, bytes of RAM once loaded), or None
+        if not found. format is 'RGB565', 'GS8' or 'GS4'.
+    """
+    asset = ASSETS.get(name)
+    return asset[1:] if asset else None
 
 
 def get_image_names():
@@ -114,12 +77,12 @@ def get_image_names():
     Get list of available image names.
 
     Returns:
-        List of strings with image names
+        List of strings with image names, in assets.json order
 
     Example:
         print("Available images:", get_image_names())
     """
-    return list(IMAGES.keys())
+    return list(NAMES)
 
 
 def get_image_count():
@@ -129,7 +92,7 @@ def get_image_count():
     Returns:
         Integer count of images
     """
-    return len(IMAGES)
+    return len(NAMES)
 
 
 def has_image(name):
@@ -146,4 +109,4 @@ def has_image(name):
         if has_image('background1'):
             img = get_image('background1')
     """
-    return name in IMAGES
+    return name in ASSETS
@@ -1,5 +1,107 @@
 # Image Display Utilities for Waveshare RP2350 Display
 # Provides functions for displaying images as backgrounds with text/graphics overlay
+#
+# Images are either RGB565 (bytes, a memoryview from asset_store.py, or a
+# tuple of bytes chunks, copied straight into the framebuffer) or
+# palette-indexed tuples from convert_image.py --format gs8/gs4: ('GS8' or
+# 'GS4', width, height, RGB565 palette bytes, index chunks or one buffer).
+# Indexed images are drawn with one FrameBuffer.blit() through their
+# palette; prepare_image() sets that up once so later draws cost only the
+# blit. restore_background() redraws just a rectangle of an image.
+#
+# The display_image_with_*() overlay helpers are one-shot renders of a
+# compositor.Compositor; keep a Compositor to update overlays in place.
+
+import framebuf
+
+_INDEXED_FORMATS = {'GS8': framebuf.GS8, 'GS4': framebuf.GS4_HMSB}
+
+
+class IndexedImage:
+    """
+    A palette-indexed image ready to blit: index data and palette as
+    FrameBuffers (framebuf needs writable buffers, so the chunks are
+    copied into one bytearray).
+    """
+
+    def __init__(self, image_data):
+        """
+        Args:
+            image_data: ('GS8' or 'GS4', width, height, palette, data) tuple;
+                        data is a tuple of chunks or one buffer
+        """
+        fmt, width, height, palette, chunks = image_data
+        self.format = _INDEXED_FORMATS[fmt]
+        self.width = width
+        self.height = height
+        self.colors = len(palette) // 2
+        size = width * height if fmt == 'GS8' else (width * height + 1) // 2
+        if not isinstance(chunks, tuple):
+            chunks = (chunks,)
+        buf = bytearray(size)
+        offset = 0
+        for chunk in chunks:
+            buf[offset:offset + len(chunk)] = chunk
+            offset += len(chunk)
+        if offset != size:
+            raise ValueError(f"{fmt} image data must be {size} bytes, got {offset}")
+        self.buffer = buf
+        self.fb = framebuf.FrameBuffer(buf, width, height, self.format)
+        self.palette = framebuf.FrameBuffer(bytearray(palette), self.colors, 1, framebuf.RGB565)
+
+    def blit(self, fb, x=0, y=0):
+        """Draw the image into fb (e.g. the LCD) with its top-left corner at x, y."""
+        fb.blit(self.fb, x, y, -1, self.palette)
+
+    def blit_rect(self, fb, x, y, w, h):
+        """
+        Draw only the image's rectangle x, y, w, h into fb at the same place.
+
+        Blits a FrameBuffer view of the rectangle (no copy). GS4 packs two
+        pixels per byte, so there the rectangle starts at an even x.
+
+        Returns:
+            The rectangle drawn (x, y, w, h)
+        """
+        if self.format == framebuf.GS4_HMSB and x & 1:
+            x -= 1
+            w += 1
+        if self.format == framebuf.GS8:
+            start = x + y * self.width
+        else:
+            start = (x + y * self.width) >> 1
+        view = framebuf.FrameBuffer(memoryview(self.buffer)[start:], w, h, self.format,
+                                    self.width)
+        fb.blit(view, x, y, -1, self.palette)
+        return x, y, w, h
+
+
+def is_indexed(image_data):
+    """True for a palette-indexed image tuple (or a prepared IndexedImage)."""
+    if isinstance(image_data, IndexedImage):
+        return True
+    return (isinstance(image_data, tuple) and len(image_data) == 5
+            and isinstance(image_data[0], str) and image_data[0] in _INDEXED_FORMATS)
+
+
+def prepare_image(image_data):
+    """
+    Get an image ready for repeated drawing.
+
+    Args:
+        image_data: Image from image_data.get_image()
+
+    Returns:
+        IndexedImage for palette-indexed images, otherwise image_data unchanged
+
+    Example:
+        background = prepare_image(get_image('background1'))
+        display_image_background(lcd, background)
+    """
+    if is_indexed(image_data) and not isinstance(image_data, IndexedImage):
+        return IndexedImage(image_data)
+    return image_data
+
 
 def load_image_to_framebuffer(lcd, image_data):
     """
@@ -7,7 +109,8 @@ def load_image_to_framebuffer(lcd, image_data):
 
     Args:
         lcd: LCD_1inch28 instance
-        image_data: bytes object OR tuple of bytes chunks (total 115,200 bytes for 240x240 RGB565)
+        image_data: bytes object OR tuple of bytes chunks (total 115,200 bytes for 240x240 RGB565),
+                    OR a palette-indexed image (tuple or IndexedImage)
 
     Returns:
         True if successful, False otherwise
@@ -18,6 +121,15 @@ def load_image_to_framebuffer(lcd, image_data):
         load_image_to_framebuffer(lcd, img)
         lcd.show()
     """
+    # Palette-indexed: one blit through the palette
+    if is_indexed(image_data):
+        try:
+            prepare_image(image_data).blit(lcd)
+        except ValueError as e:
+            print(f"Error: {e}")
+            return False
+        return True
+
     # Handle chunked image data (tuple of bytes objects)
     if isinstance(image_data, tuple):
         # Calculate total size
@@ -26,12 +138,11 @@ def load_image_to_framebuffer(lcd, image_data):
             print(f"Error: Image data must be 115,200 bytes, got {total_size}")
             return False
 
-        # Copy chunks sequentially to framebuffer
+        # Copy chunks sequentially to framebuffer (one memcpy per chunk)
         offset = 0
         for chunk in image_data:
             chunk_len = len(chunk)
-            for i in range(chunk_len):
-                lcd.buffer[offset + i] = chunk[i]
+            lcd.buffer[offset:offset + chunk_len] = chunk
             offset += chunk_len
 
         return True
@@ -53,6 +164,65 @@ def load_image_to_framebuffer(lcd, image_data):
     return True
 
 
+def restore_background(lcd, image_data, x, y, w, h):
+    """
+    Redraw one rectangle of a full-screen background image, e.g. to erase
+    an overlay. Rows are copied straight from the image's buffer (bytes,
+    memoryview or chunks) into the framebuffer, with no copy in between;
+    prepared indexed images blit a view of the rectangle.
+
+    Args:
+        lcd: LCD_1inch28 instance
+        image_data: RGB565 image (bytes, memoryview or tuple of chunks) or
+                    prepared IndexedImage (see prepare_image())
+        x, y, w, h: Rectangle to restore (clipped to the screen)
+
+    Returns:
+        The rectangle restored (x, y, w, h), which for GS4 images may start
+        one pixel further left, or None if nothing was restored
+
+    Example:
+        lcd.text("42%", 100, 116, lcd.white)
+        ...
+        restore_background(lcd, background, 100, 116, 24, 8)
+        lcd.show_rect(100, 116, 24, 8)
+    """
+    x0 = max(0, x)
+    y0 = max(0, y)
+    x1 = min(lcd.width, x + w)
+    y1 = min(lcd.height, y + h)
+    if x0 >= x1 or y0 >= y1:
+        return None
+    if isinstance(image_data, IndexedImage):
+        return image_data.blit_rect(lcd, x0, y0, x1 - x0, y1 - y0)
+    if is_indexed(image_data):
+        print("Error: prepare_image() an indexed image before restoring from it")
+        return None
+
+    buf = lcd.buffer
+    row = lcd.width * 2
+    n = (x1 - x0) * 2
+    if isinstance(image_data, tuple):
+        # Chunks are all the same size but rows can straddle two of them
+        size = len(image_data[0])
+        for yy in range(y0, y1):
+            start = yy * row + x0 * 2
+            done = 0
+            while done < n:
+                src = start + done
+                chunk = image_data[src // size]
+                offset = src % size
+                k = min(n - done, size - offset)
+                buf[src:src + k] = memoryview(chunk)[offset:offset + k]
+                done += k
+    else:
+        src = memoryview(image_data)
+        for yy in range(y0, y1):
+            start = yy * row + x0 * 2
+            buf[start:start + n] = src[start:start + n]
+    return x0, y0, x1 - x0, y1 - y0
+
+
 def display_image_background(lcd, image_data, show=True):
     """
     Display image as background and optionally push to screen.
@@ -79,6 +249,18 @@ def display_image_background(lcd, image_data, show=True):
     return True
 
 
+def _add_text_items(layer, text_items):
+    """Add (text, x, y, color[, size]) tuples to a compositor layer."""
+    for item in text_items:
+        if len(item) == 5:
+            text, x, y, color, size = item
+            layer.add_text(text, x, y, color, size)
+        elif len(item) == 4:
+            # Support 4-tuple format (text, x, y, color) - defaults to standard text
+            text, x, y, color = item
+            layer.add_text(text, x, y, color)
+
+
 def display_image_with_text(lcd, image_data, text_items, show=True):
     """
     Display image background with text overlay.
@@ -101,28 +283,7 @@ def display_image_with_text(lcd, image_data, text_items, show=True):
             ("Humidity", 10, 150, lcd.white, None),  # None = standard text
         ])
     """
-    # Load background image
-    if not load_image_to_framebuffer(lcd, image_data):
-        return False
-
-    # Draw text overlays
-    for item in text_items:
-        if len(item) == 5:
-            text, x, y, color, size = item
-            if size is None:
-                lcd.text(text, x, y, color)
-            else:
-                lcd.write_text(text, x, y, size, color)
-        elif len(item) == 4:
-            # Support 4-tuple format (text, x, y, color) - defaults to standard text
-            text, x, y, color = item
-            lcd.text(text, x, y, color)
-
-    # Display
-    if show:
-        lcd.show()
-
-    return True
+    return display_image_with_overlays(lcd, image_data, text_items=text_items, show=show)
 
 
 def display_image_with_gauge(lcd, image_data, gauge, gauge_value, show=True):
@@ -147,19 +308,8 @@ def display_image_with_gauge(lcd, image_data, gauge, gauge_value, show=True):
                              start_angle=135, end_angle=405, color=lcd.white)
         display_image_with_gauge(lcd, get_image('background1'), gauge, 75)
     """
-    # Load background
-    if not load_image_to_framebuffer(lcd, image_data):
-        return False
-
-    # Draw gauge on top (gauge draws directly to framebuffer)
-    gauge.set_value(gauge_value)
-    gauge.draw()
-
-    # Display
-    if show:
-        lcd.show()
-
-    return True
+    return display_image_with_overlays(lcd, image_data, gauge_items=[(gauge, gauge_value)],
+                                       show=show)
 
 
 def display_image_with_bitmap_text(lcd, image_data, bitmap_font_module, text, x, y, color, spacing=2, show=True):
@@ -169,7 +319,8 @@ def display_image_with_bitmap_text(lcd, image_data, bitmap_font_module, text, x,
     Args:
         lcd: LCD_1inch28 instance
         image_data: bytes object with image data
-        bitmap_font_module: Imported bitmap font module (bitmap_fonts, bitmap_fonts_32, or bitmap_fonts_48)
+        bitmap_font_module: fonts.Font, or a font data module (bitmap_fonts,
+                            bitmap_fonts_32, or bitmap_fonts_48)
         text: Text string to display
         x: X coordinate
         y: Y coordinate
@@ -187,32 +338,23 @@ def display_image_with_bitmap_text(lcd, image_data, bitmap_font_module, text, x,
         display_image_with_bitmap_text(lcd, get_image('background1'),
                                        bitmap_fonts_48, "12:34", 60, 100, lcd.white)
     """
-    # Load background
-    if not load_image_to_framebuffer(lcd, image_data):
-        return False
+    from compositor import Compositor
 
-    # Draw bitmap text
-    # Try different function name variations for different font modules
-    if hasattr(bitmap_font_module, 'draw_text_48'):
-        bitmap_font_module.draw_text_48(lcd, text, x, y, color, spacing)
-    elif hasattr(bitmap_font_module, 'draw_text_32'):
-        bitmap_font_module.draw_text_32(lcd, text, x, y, color, spacing)
-    elif hasattr(bitmap_font_module, 'draw_text'):
-        bitmap_font_module.draw_text(lcd, text, x, y, color, spacing)
-    else:
-        print("Error: Bitmap font module does not have a draw_text function")
+    page = Compositor(lcd, image_data)
+    try:
+        page.layer("text").add_bitmap_text(bitmap_font_module, text, x, y, color, spacing)
+    except ValueError as e:
+        print(f"Error: {e}")
         return False
-
-    # Display
-    if show:
-        lcd.show()
-
-    return True
+    return page.render(show)
 
 
 def display_image_with_overlays(lcd, image_data, text_items=None, gauge_items=None, show=True):
     """
     Display image with multiple types of overlays (text and gauges).
+    A one-shot compositor.Compositor render: gauges are drawn below text.
+    To update the overlays later without redrawing the whole screen, keep
+    a Compositor and use its render_dirty().
 
     Args:
         lcd: LCD_1inch28 instance
@@ -238,31 +380,13 @@ def display_image_with_overlays(lcd, image_data, text_items=None, gauge_items=No
             gauge_items=[(temp_gauge, 72), (humidity_gauge, 55)]
         )
     """
-    # Load background
-    if not load_image_to_framebuffer(lcd, image_data):
-        return False
+    from compositor import Compositor
 
-    # Draw text overlays
-    if text_items:
-        for item in text_items:
-            if len(item) == 5:
-                text, x, y, color, size = item
-                if size is None:
-                    lcd.text(text, x, y, color)
-                else:
-                    lcd.write_text(text, x, y, size, color)
-            elif len(item) == 4:
-                text, x, y, color = item
-                lcd.text(text, x, y, color)
-
-    # Draw gauge overlays
+    page = Compositor(lcd, image_data)
     if gauge_items:
+        gauges = page.layer("gauges")
         for gauge, value in gauge_items:
-            gauge.set_value(value)
-            gauge.draw()
-
-    # Display
-    if show:
-        lcd.show()
-
-    return True
+            gauges.add_gauge(gauge, value)
+    if text_items:
+        _add_text_items(page.layer("text"), text_items)
+    return page.render(show)
@@ -6,7 +6,7 @@
 from LCD_1inch28 import LCD_1inch28
 from circular_gauge import CircularGauge, rgb_to_brg565
 from image_data import get_image, get_image_names, get_image_count
-from image_display import display_image_with_overlays
+from compositor import Compositor
 import time
 import random
 
@@ -86,10 +86,10 @@ voltage = read_voltage()
 soc = voltage_to_soc(voltage)
 print(f"Initial: {voltage:.2f}V = {soc}% SOC")
 
-display_image_with_overlays(
-    lcd, img_data,
-    gauge_items=[(soc_gauge, soc)]
-)
+page = Compositor(lcd, img_data)
+gauges = page.layer("gauges")
+gauges.add_gauge(soc_gauge, soc)
+page.render()
 
 # Main loop - update SOC every second
 try:
@@ -100,11 +100,9 @@ try:
 
         print(f"Voltage: {voltage:.2f}V, SOC: {soc}%")
 
-        # Update display with new SOC value
-        display_image_with_overlays(
-            lcd, img_data,
-            gauge_items=[(soc_gauge, soc)]
-        )
+        # Update display with new SOC value (only the changed segments)
+        gauges.set_gauge(soc_gauge, soc)
+        page.render_dirty()
 
         time.sleep(1)  # Update every 1 second
 
@@ -1,41 +1,100 @@
+import time
+_boot_t0 = time.ticks_us()
+
+# Boot profile: ms per import and init step, printed with the first frame.
+# Large modules are not imported here: image_data is only an index and
+# each image module loads on the first render that needs it (image_cache),
+# json only while layouts.json is compiled.
+from bootprof import BootProfiler
+boot = BootProfiler(_boot_t0)
 from machine import UART, Pin, RTC
+boot.mark("import machine")
 from LCD_1inch28 import LCD_1inch28, Touch_CST816T
-import time
-import json
-import bitmap_fonts
-import bitmap_fonts_32
-import bitmap_fonts_48
+boot.mark("import LCD_1inch28")
 from battery_monitor import BatteryMonitor
+from image_cache import ImageCache
+from sprites import SpriteAtlas
+from sprite_data import SPRITES
+boot.mark("import battery_monitor, image_cache")
+from uart_link import DisplayLink
+from uart_rx import UartRx
+boot.mark("import uart_link, uart_rx")
+from numfmt import parse_fixed
+from display_list import load as load_layouts, BLANK
+boot.mark("import display_list")
+from devices import DeviceTable, KIND_NAMES, TAG_MAX, parse_kind
+from dualcore import StateBuffer
+from scheduler import Scheduler
+from snapshot import SnapshotStore
+boot.mark("import devices, scheduler, ...")
 
 # Initialize UART for communication with Raspberry Pi Pico
 uart = UART(0, baudrate=115200, tx=Pin(16), rx=Pin(17))
 
+# Received bytes are moved from interrupts into a 2 KB ring buffer, so a
+# long render never overruns the driver's 256 byte buffer; the main loop
+# sleeps until a complete line is waiting
+rx = UartRx(uart)
+
+# Link layer: acknowledged mode replies ACK/NAK/REJ with flow-control
+# credits so the Pico never overruns the UART buffer while we are busy
+# rendering. Legacy (unframed) lines are always accepted.
+LINK_ACK_MODE = True
+LINK_WINDOW = 8  # Frames the Pico may have in flight
+link = DisplayLink(rx, ack_mode=LINK_ACK_MODE, window=LINK_WINDOW)
+
 # Initialize RTC
 rtc = RTC()
+boot.mark("uart, rtc init")
 
-# Initialize display
-lcd = LCD_1inch28()
-lcd.set_bl_pwm(65535)  # Set brightness to maximum
+# Initialize display: no clear frame, and the backlight stays off until
+# the first frame is on the panel (the render side turns it on)
+lcd = LCD_1inch28(clear=False)
+boot.mark("lcd init")
 
 # Initialize touch controller
 touch = Touch_CST816T(mode=1, LCD=lcd)  # Mode 1 = point mode
+boot.mark("touch init")
+
+# Background images load on demand and stay loaded within this RAM
+# budget, least recently used evicted first; the active page's background
+# is pinned (see page_background())
+IMAGE_CACHE_BUDGET = 128 * 1024
+image_cache = ImageCache(IMAGE_CACHE_BUDGET)
+image_cache_reported = None  # Counters at the last report
 
 # Initialize battery monitor
 print("Initializing battery monitor...")
-battery_monitor = BatteryMonitor(lcd, image_index=0)
-battery_monitor.render()  # Show initial state (0%)
+battery_monitor = BatteryMonitor(lcd, image_index=0, images=image_cache)
 print("Battery monitor ready")
+boot.mark("battery monitor init")
+
+# Last known state, saved every SNAPSHOT_PERIOD_MS (see save_snapshot()).
+# With a snapshot, boot draws it straight away marked stale; the initial
+# 0% gauge and welcome message are only shown on a first boot.
+SNAPSHOT_FORMAT = "<BiiiiiiBi"  # page, soc, mV, mA, m°C, wifi, demo, charging, brightness
+SNAPSHOT_PERIOD_MS = 5 * 60000
+# The scheduler sets the pace (one period from deadline to deadline); the
+# store's rate limit counts from the last actual write, so it is only a
+# backstop well under the period and a late run does not get the next
+# one skipped.
+snapshots = SnapshotStore(SNAPSHOT_FORMAT, min_interval_ms=SNAPSHOT_PERIOD_MS // 2)
+saved_state = snapshots.load()
+boot.mark("snapshot load")
+
+if saved_state is None:
+    # Display welcome message
+    lcd.fill(lcd.white)
+    lcd.text("Victron Battery", 60, 100, lcd.black)
+    lcd.text("Display", 85, 120, lcd.black)
+    lcd.text("Ready!", 90, 140, lcd.black)
+    lcd.show()
+    lcd.set_bl_pwm(65535)
+    print("Welcome message displayed")
 
-# Display welcome message
-lcd.fill(lcd.white)
-lcd.text("Victron Battery", 60, 100, lcd.black)
-lcd.text("Display", 85, 120, lcd.black)
-lcd.text("Ready!", 90, 140, lcd.black)
-lcd.show()
-print("Welcome message displayed")
-
-# Wait for 2 seconds to show welcome message
-time.sleep(2)
+    # Wait for 2 seconds to show welcome message
+    time.sleep(2)
+    boot.mark("welcome screen")
 
 # Display settings
 current_brightness = 100
@@ -43,38 +102,150 @@ current_mode = "Battery"  # Start with Battery page
 display_color = lcd.black
 
 # Battery system data
+# Voltage, current and temperature are fixed-point ints in thousandths
+# (mV, mA, m°C) so rendering never needs float formatting
 battery_soc = 0  # State of Charge (0-100%)
-battery_voltage = 0.0  # Voltage in V
-battery_current = 0.0  # Current in A (positive=charging, negative=discharging)
-battery_temp = 0.0  # Temperature in °C
+battery_voltage_mv = 0  # Voltage in mV
+battery_current_ma = 0  # Current in mA (positive=charging, negative=discharging)
+battery_temp_mc = 0  # Temperature in thousandths of °C
 is_charging = False  # Charging state
+state_stale = False  # Showing the boot snapshot until fresh telemetry arrives
+
+# Page layouts (SystemInfo, Charging, Status, About) compiled from
+# layouts.json into a display list; values are drawn from its slots
+layouts = load_layouts("layouts.json")
+boot.mark("layouts.json compile")
+
+# Page icons from the sprite atlas (sprite_data.py, packed from icons/ by
+# convert_image.py --atlas), drawn over the page's layout
+icons = SpriteAtlas(SPRITES)
+PAGE_SPRITES = {
+    "Charging": (("bolt", 58, 12),),  # Left of the title
+}
+SLOT_SOC = layouts.slot("soc")
+SLOT_VOLTAGE = layouts.slot("voltage")
+SLOT_CURRENT = layouts.slot("current")
+SLOT_CHARGE_CURRENT = layouts.slot("charge_current")
+SLOT_TEMP = layouts.slot("temp")
+SLOT_WIFI = layouts.slot("wifi")
+SLOT_DEMO = layouts.slot("demo")
+SLOT_TOTAL_CHARGE = layouts.slot("total_charge")
+SLOT_CHARGERS = layouts.slot("chargers")
+
+# Tagged devices (e.g. BATSYS@mppt1:...), one Devices page row each
+devices = DeviceTable()
+SLOT_DEV_TAG = tuple(layouts.slot("dev_tag", i) for i in range(devices.max_devices))
+SLOT_DEV_CURRENT = tuple(layouts.slot("dev_current", i) for i in range(devices.max_devices))
 
 # System status data
 wifi_status = -1  # WiFi connection status: -1=Unknown, 0=Disconnected, 1=Connected, 2=Skipped (demo mode)
 demo_mode = 0  # Demo mode status: 0=Inactive, 1=Active
 
+# Rendering: core 0 owns UART, touch and this state; the render side
+# (core 1 when DUAL_CORE, else the end of each main loop pass) draws
+# snapshots of it published through a lock-protected double buffer, so a
+# 115 KB show() never holds up UART lines or touches.
+DUAL_CORE = True
+PAGES = ("Battery", "SystemInfo", "Charging", "Status", "Devices", "About")
+
+# Snapshot fields (ints); the device tags follow as bytes
+ST_PAGE = 0          # Index into PAGES, -1 = unknown page (blank screen)
+ST_REDRAW = 1        # Full redraws requested so far
+ST_CLEAR = 2         # CMD:CLEAR requests so far
+ST_SOC = 3
+ST_VOLTAGE = 4
+ST_CURRENT = 5
+ST_TEMP = 6
+ST_WIFI = 7
+ST_DEMO = 8
+ST_TOTAL_CHARGE = 9
+ST_CHARGERS = 10
+ST_POWER = 11        # POWER_AWAKE, POWER_DIM or POWER_SLEEP
+ST_BRIGHT = 12       # Backlight percent when awake
+ST_WAKE_AT = 13      # ticks_ms() of the last wake from sleep
+ST_STALE = 14        # 1 while showing the boot snapshot
+ST_DEV_CURRENT = 15
+ST_DEV_TAG_LEN = ST_DEV_CURRENT + devices.max_devices
+ST_SIZE = ST_DEV_TAG_LEN + devices.max_devices
+
+frames = StateBuffer(ST_SIZE, len(devices.tags))
+render_core_running = False
+
+# Render requests (state side); the render side compares the counters
+# with what it last drew, so requests made within one frame coalesce
+redraw_requests = 0
+clear_requests = 0
+state_changed = True  # Shown state changed since the last snapshot
+
+# What the render side last drew
+drawn_redraws = -1
+drawn_clears = 0
+drawn_soc = -1
+drawn_power = 0
+drawn_backlight = -1
+
 # Page navigation settings
 AUTO_RETURN_TIMEOUT_MS = 10000  # 10 seconds to auto-return to Battery page
 last_page_change_time = time.ticks_ms()
 MODE_CHANGE_COOLDOWN_MS = 1000  # Prevent rapid mode switching (1 second cooldown)
 last_mode_change_time = 0
 
+# Timed work (auto-return, staleness check, stats) runs from a deadline
+# scheduler; the main loop sleeps until the next deadline or input
+sched = Scheduler()
+STALE_CHECK_MS = 30000
+STATS_PERIOD_MS = 60000
+IDLE_MAX_MS = 60000  # Longest sleep with nothing scheduled
+
+# Idle policy: no touch (or explicit UART command) for IDLE_DIM_MS dims
+# the backlight, IDLE_SLEEP_MS puts the panel to sleep and stops
+# rendering; telemetry is still processed. A touch, a MODE/BRIGHT/
+# CMD:CLEAR/WAKE command or a critical alarm (SOC falling to
+# CRITICAL_SOC, charging starting) wakes it on the current page.
+POWER_AWAKE = 0
+POWER_DIM = 1
+POWER_SLEEP = 2
+IDLE_DIM_MS = 2 * 60000
+IDLE_SLEEP_MS = 10 * 60000
+IDLE_DIM_PERCENT = 10  # Backlight while dimmed (capped at the brightness)
+CRITICAL_SOC = 10
+power_state = POWER_AWAKE
+wake_at = 0            # ticks_ms() of the last wake from sleep
+last_wake_ms = -1      # Wake to first frame on the panel, last wake
+
+# Main loop wakeups since the last stats report, by reason
+wakeups_line = 0
+wakeups_touch = 0
+wakeups_timer = 0
+wakeups_per_min = 0
+
 def process_command(cmd_line):
-    """Process incoming commands from Raspberry Pi Pico via UART"""
+    """
+    Process incoming commands from Raspberry Pi Pico via UART
+
+    Returns:
+        True if the command was handled, False if it was malformed or
+        unknown (reported back to the Pico as REJ in acknowledged mode)
+    """
     global current_brightness, current_mode, display_color
-    global battery_soc, battery_voltage, battery_current, battery_temp, is_charging
-    global wifi_status, demo_mode
-    global battery_monitor, last_page_change_time, last_mode_change_time
+    global battery_soc, battery_voltage_mv, battery_current_ma, battery_temp_mc, is_charging
+    global wifi_status, demo_mode, clear_requests
 
     try:
         print(f"Received command: {cmd_line}")
 
+        # Device-tagged command: NAME@tag:data
+        colon = cmd_line.find(b':')
+        at = cmd_line.find(b'@', 0, colon) if colon > 0 else -1
+        if at > 0:
+            return process_device_command(cmd_line, at, colon)
+
         if cmd_line.startswith(b'BRIGHT:'):
             # Adjust brightness
             brightness = int(cmd_line[7:].decode().strip())
-            current_brightness = brightness
-            lcd.set_bl_pwm(int(brightness * 65535 / 100))
+            current_brightness = brightness  # Applied by the render side
             print(f"Brightness set to: {brightness}%")
+            wake_display("brightness")
 
         elif cmd_line.startswith(b'MODE:'):
             # Change display mode (for compatibility)
@@ -84,22 +255,26 @@ def process_command(cmd_line):
             current_time = time.ticks_ms()
             if time.ticks_diff(current_time, last_mode_change_time) < MODE_CHANGE_COOLDOWN_MS:
                 print(f"Mode change ignored (cooldown active): {mode}")
-                return
+                return True
 
             if mode != current_mode:
                 print(f"Mode changed via UART: {current_mode} → {mode}")
                 current_mode = mode
-                update_display_for_mode(mode)
-                last_page_change_time = time.ticks_ms()
-                last_mode_change_time = time.ticks_ms()
+                request_redraw()
+                page_changed()
             else:
                 print(f"Mode unchanged: {mode}")
+            wake_display("mode")
 
         elif cmd_line.startswith(b'CMD:CLEAR'):
             # Clear display
-            lcd.fill(lcd.white)
-            lcd.show()
+            clear_requests += 1
             print("Display cleared")
+            wake_display("clear")
+
+        elif cmd_line.startswith(b'WAKE'):
+            # Wake the display (and restart the idle timers)
+            wake_display("command")
 
         elif cmd_line.startswith(b'SETTIME:'):
             # Set RTC time from Pico
@@ -117,6 +292,9 @@ def process_command(cmd_line):
                 yearday = int(time_parts[7])
                 rtc.datetime((year, month, day, weekday, hour, minute, second, 0))
                 print(f"Time set to: {year}-{month:02d}-{day:02d} {hour:02d}:{minute:02d}:{second:02d}")
+            else:
+                print(f"Invalid time format: {time_str}")
+                return False
 
         elif cmd_line.startswith(b'BATTERY:'):
             # Update battery SOC
@@ -124,35 +302,44 @@ def process_command(cmd_line):
             soc_str = cmd_line[8:].decode().strip()
             try:
                 soc = int(soc_str)
+                if not 0 <= soc <= 100:
+                    print(f"Battery SOC out of range: {soc}")
+                    return False
+                fresh_telemetry()
+                if soc <= CRITICAL_SOC < battery_soc:
+                    print(f"Battery critical: {soc}%")
+                    wake_display("low battery")
                 battery_soc = soc
                 print(f"Battery SOC: {soc}%")
 
-                # Only update battery monitor (which renders) if on Battery page
-                if current_mode == "Battery":
-                    if battery_monitor.update_soc(soc):
-                        # Battery monitor rendered successfully
-                        pass
-                    else:
-                        print(f"Battery SOC update failed: {soc}")
+                # Validate and timestamp (the render side draws the gauge)
+                if not battery_monitor.update_soc(soc, render=False):
+                    print(f"Battery SOC update failed: {soc}")
+                    return False
             except ValueError:
                 print(f"Invalid battery SOC format: {soc_str}")
+                return False
 
         elif cmd_line.startswith(b'BATSYS:'):
             # Update battery system data
             # Format: BATSYS:voltage,current,temp
-            data_str = cmd_line[7:].decode().strip()
-            data_parts = data_str.split(',')
-            if len(data_parts) == 3:
+            # Fields are parsed in place as fixed-point (no float, no split)
+            c1 = cmd_line.find(b',', 7)
+            c2 = cmd_line.find(b',', c1 + 1) if c1 > 0 else -1
+            if c2 > 0 and cmd_line.find(b',', c2 + 1) < 0:
+                data_str = cmd_line[7:].decode().strip()
                 try:
-                    battery_voltage = float(data_parts[0])
-                    battery_current = float(data_parts[1])
-                    battery_temp = float(data_parts[2])
-                    print(f"Battery system: {battery_voltage}V, {battery_current}A, {battery_temp}°C")
-                    # Refresh display if on SystemInfo or Charging page (both show this data)
-                    if current_mode == "SystemInfo" or current_mode == "Charging":
-                        update_display_for_mode(current_mode)
+                    battery_voltage_mv = parse_fixed(cmd_line, 3, 7, c1)
+                    battery_current_ma = parse_fixed(cmd_line, 3, c1 + 1, c2)
+                    battery_temp_mc = parse_fixed(cmd_line, 3, c2 + 1)
+                    print(f"Battery system: {data_str} (V,A,°C)")
+                    fresh_telemetry()
                 except ValueError:
                     print(f"Invalid battery system data format: {data_str}")
+                    return False
+            else:
+                print(f"Invalid battery system data format: {cmd_line}")
+                return False
 
         elif cmd_line.startswith(b'CHARGING:'):
             # Update charging state
@@ -167,19 +354,20 @@ def process_command(cmd_line):
                 if is_charging and not was_charging:
                     print("Charging started - auto-switching to Charging page")
                     current_mode = "Charging"
-                    update_display_for_mode(current_mode)
-                    last_page_change_time = time.ticks_ms()
-                    last_mode_change_time = time.ticks_ms()
+                    request_redraw()
+                    page_changed()
+                    wake_display("charging")
                 # Log when charging stops (but don't reset timer - let auto-return handle it)
                 elif not is_charging and was_charging:
                     print("Charging stopped - page will auto-return to Battery in 10s")
-
-                # Refresh display if on Charging page (without resetting timer)
-                if current_mode == "Charging":
-                    update_display_for_mode(current_mode)
+                    if current_mode == "Charging":
+                        # Held while charging: due AUTO_RETURN_TIMEOUT_MS after the page change
+                        elapsed = time.ticks_diff(time.ticks_ms(), last_page_change_time)
+                        sched.schedule(auto_return_task, AUTO_RETURN_TIMEOUT_MS - elapsed)
 
             except ValueError:
                 print(f"Invalid charging state format: {state_str}")
+                return False
 
         elif cmd_line.startswith(b'WIFI:'):
             # Update WiFi status
@@ -191,9 +379,7 @@ def process_command(cmd_line):
                 print(f"WiFi status: {wifi_status} ({status_text})")
             except (ValueError, IndexError):
                 print(f"Invalid WiFi status format: {status_str}")
-            # Refresh display if on Status page
-            if current_mode == "Status":
-                update_display_for_mode(current_mode)
+                return False
 
         elif cmd_line.startswith(b'DEMO:'):
             # Update demo mode status
@@ -205,20 +391,91 @@ def process_command(cmd_line):
                 print(f"Demo mode: {demo_mode} ({mode_text})")
             except ValueError:
                 print(f"Invalid demo mode format: {state_str}")
-            # Refresh display if on Status page
-            if current_mode == "Status":
-                update_display_for_mode(current_mode)
+                return False
+
+        else:
+            print(f"Unknown command: {cmd_line}")
+            return False
 
     except Exception as e:
         print(f"Error processing command: {e}")
+        return False
+
+    return True
+
+def process_device_command(cmd_line, at, colon):
+    """
+    Process a device-tagged command, e.g. BATSYS@mppt1:52.10,14.5,31.0
+
+    Supported: BATSYS, CHARGING, BATTERY and DEVICE (kind declaration).
+    A new tag gets the next free row of the device table.
+
+    Returns:
+        True if handled, False if malformed, unknown or the table is full
+    """
+    name = cmd_line[:at]
+    end = len(cmd_line)
+    while end > colon + 1 and cmd_line[end - 1] in b'\r\n ':
+        end -= 1
+
+    # Parse the data first so a malformed line never takes a row
+    if name == b'BATSYS':
+        # Format: BATSYS@tag:voltage,current,temp
+        c1 = cmd_line.find(b',', colon + 1, end)
+        c2 = cmd_line.find(b',', c1 + 1, end) if c1 > 0 else -1
+        if c2 < 0 or cmd_line.find(b',', c2 + 1, end) >= 0:
+            print(f"Invalid device data format: {cmd_line}")
+            return False
+        voltage_mv = parse_fixed(cmd_line, 3, colon + 1, c1)
+        current_ma = parse_fixed(cmd_line, 3, c1 + 1, c2)
+        temp_mc = parse_fixed(cmd_line, 3, c2 + 1, end)
+    elif name == b'CHARGING' or name == b'BATTERY':
+        # Format: CHARGING@tag:state (0/1), BATTERY@tag:soc (0-100), integers
+        # only like the untagged commands (parse_fixed() would round 1.6 to 2)
+        if cmd_line.find(b'.', colon + 1, end) >= 0:
+            print(f"Invalid device data format: {cmd_line}")
+            return False
+        value = parse_fixed(cmd_line, 0, colon + 1, end)
+        if not 0 <= value <= 100:
+            print(f"Invalid device data format: {cmd_line}")
+            return False
+    elif name == b'DEVICE':
+        # Format: DEVICE@tag:kind (charger, battery or other)
+        kind = parse_kind(cmd_line, colon + 1, end)
+        if kind < 0:
+            print(f"Unknown device kind: {cmd_line}")
+            return False
+    else:
+        print(f"Unknown device command: {cmd_line}")
+        return False
+
+    i = devices.lookup(cmd_line, at + 1, colon, add=True)
+    if i < 0:
+        print(f"Device table full or invalid tag: {cmd_line}")
+        return False
+
+    if name == b'BATSYS':
+        devices.set_batsys(i, voltage_mv, current_ma, temp_mc)
+    elif name == b'CHARGING':
+        devices.set_charging(i, value == 1)
+    elif name == b'BATTERY':
+        devices.set_soc(i, value)
+    else:
+        devices.set_kind(i, kind)
+        print(f"Device {devices.tag(i).decode()}: {KIND_NAMES[kind].decode()}")
+
+    return True
 
 def cycle_mode():
     """Cycle to the next display page"""
-    global current_mode, last_page_change_time, last_mode_change_time
+    global current_mode
 
     # Normal page cycling: Battery → SystemInfo → Status → About → Battery
-    # (Charging page is only shown when charging is active)
+    # (Charging page is only shown when charging is active, Devices page
+    # once a tagged device has reported)
     modes = ["Battery", "SystemInfo", "Status", "About"]
+    if devices.count:
+        modes.insert(2, "Devices")
 
     old_mode = current_mode
     try:
@@ -230,173 +487,369 @@ def cycle_mode():
         current_mode = "Battery"
 
     print(f"Page changed via touch: {old_mode} → {current_mode}")
-    update_display_for_mode(current_mode)
-    last_page_change_time = time.ticks_ms()
-    last_mode_change_time = time.ticks_ms()
+    request_redraw()
+    page_changed()
 
-def update_display_for_mode(mode):
-    """Update display based on selected page"""
+def page_changed():
+    """Restart the page timers after a page change (arms the auto-return)"""
+    global last_page_change_time, last_mode_change_time
+    last_page_change_time = time.ticks_ms()
+    last_mode_change_time = last_page_change_time
+    if current_mode == "Battery":
+        sched.cancel(auto_return_task)
+    else:
+        sched.schedule(auto_return_task, AUTO_RETURN_TIMEOUT_MS)
+
+def request_redraw():
+    """Ask the render side for a full redraw of the current page"""
+    global redraw_requests, state_changed
+    redraw_requests += 1
+    state_changed = True
+
+def capture_state(snap):
+    """Copy the displayed state into a snapshot (state side, under the buffer lock)"""
+    v = snap.ints
+    v[ST_PAGE] = PAGES.index(current_mode) if current_mode in PAGES else -1
+    v[ST_REDRAW] = redraw_requests
+    v[ST_CLEAR] = clear_requests
+    v[ST_SOC] = battery_soc
+    v[ST_VOLTAGE] = battery_voltage_mv
+    v[ST_CURRENT] = battery_current_ma
+    v[ST_TEMP] = battery_temp_mc
+    v[ST_WIFI] = wifi_status
+    v[ST_DEMO] = demo_mode
+    v[ST_TOTAL_CHARGE] = devices.total_charge_ma
+    v[ST_CHARGERS] = devices.chargers_charging
+    v[ST_POWER] = power_state
+    v[ST_BRIGHT] = current_brightness
+    v[ST_WAKE_AT] = wake_at
+    v[ST_STALE] = state_stale
+    for i in range(devices.max_devices):
+        v[ST_DEV_CURRENT + i] = devices.current_ma[i]
+        v[ST_DEV_TAG_LEN + i] = devices.tag_len[i]
+    snap.data[:] = devices.tags
+
+def publish_state():
+    """Hand the state to the render side if it changed (drawn inline without the render core)"""
+    global state_changed
+    if not state_changed:
+        return
+    state_changed = False
+    frames.publish(capture_state)
+    if not render_core_running:
+        render_state(frames.take())
+
+def update_layout_values(snap):
+    """Copy a snapshot into the layout slots (changed slots become dirty)"""
+    v = snap.ints
+    current = v[ST_CURRENT]
+    layouts.set(SLOT_SOC, v[ST_SOC])
+    layouts.set(SLOT_VOLTAGE, v[ST_VOLTAGE])
+    layouts.set(SLOT_CURRENT, current)
+    layouts.set(SLOT_CHARGE_CURRENT, current if current > 0 else 0)
+    layouts.set(SLOT_TEMP, v[ST_TEMP])
+    layouts.set(SLOT_WIFI, v[ST_WIFI])
+    layouts.set(SLOT_DEMO, v[ST_DEMO])
+    layouts.set(SLOT_TOTAL_CHARGE, v[ST_TOTAL_CHARGE])
+    layouts.set(SLOT_CHARGERS, v[ST_CHARGERS])
+    for i in range(len(SLOT_DEV_TAG)):
+        n = v[ST_DEV_TAG_LEN + i]
+        layouts.set_text(SLOT_DEV_TAG[i], snap.data, i * TAG_MAX, i * TAG_MAX + n)
+        # Unused rows stay BLANK (nothing drawn) rather than showing 0.0A
+        layouts.set(SLOT_DEV_CURRENT[i], v[ST_DEV_CURRENT + i] if n else BLANK)
+
+def page_background(mode):
+    """Name of the background image mode draws, or None"""
+    if mode == "Battery":
+        battery_monitor.load_image()
+        return battery_monitor.image_name
+    return None
 
-    lcd.fill(lcd.black)  # Start with black background for all pages
+def update_display_for_mode(mode, soc, stale=False):
+    """Draw the whole page for mode (render side); stale marks snapshot values"""
+    # Keep this page's background loaded; other pages' may be evicted
+    image_cache.pin_only(page_background(mode))
 
     if mode == "Battery":
         # Battery monitor page - circular gauge with background image
-        battery_monitor.render()
-
-    elif mode == "SystemInfo":
-        # System Information page - detailed battery metrics
-        # Title
-        lcd.text("SYSTEM INFO", 70, 15, lcd.white)
-
-        # Draw horizontal line separator
-        lcd.hline(10, 35, 220, lcd.white)
-
-        # SOC
-        lcd.text("SOC:", 20, 60, lcd.white)
-        soc_text = f"{battery_soc}%"
-        lcd.write_text(soc_text, 140, 57, 2, lcd.white)
-
-        # Voltage
-        lcd.text("Voltage:", 20, 95, lcd.white)
-        voltage_text = f"{battery_voltage:.1f}V"
-        lcd.write_text(voltage_text, 140, 92, 2, lcd.white)
-
-        # Current
-        lcd.text("Current:", 20, 130, lcd.white)
-        # Show charging/discharging indicator
-        if battery_current > 0:
-            current_color = 0x07E0  # Green (charging)
-            current_text = f"+{battery_current:.1f}A"
-        elif battery_current < 0:
-            current_color = 0xF800  # Red (discharging)
-            current_text = f"{battery_current:.1f}A"
-        else:
-            current_color = lcd.white
-            current_text = "0.0A"
-        lcd.write_text(current_text, 140, 127, 2, current_color)
-
-        # Temperature
-        lcd.text("Temperature:", 20, 165, lcd.white)
-        temp_text = f"{battery_temp:.1f}"
-        lcd.write_text(temp_text, 140, 162, 2, lcd.white)
-        lcd.text("o", 200, 163, lcd.white)
-        lcd.text("C", 208, 168, lcd.white)
-
-    elif mode == "Charging":
-        # Charging page - displayed when battery is charging
-        # Title
-        lcd.text("CHARGING", 80, 20, lcd.white)
-
-        # Draw horizontal line separator
-        lcd.hline(10, 40, 220, lcd.white)
-
-        # Charging metrics
-        lcd.text("Current:", 20, 70, lcd.white)
-        if battery_current > 0:
-            charge_text = f"+{battery_current:.1f}A"
-        else:
-            charge_text = "0.0A"
-        lcd.write_text(charge_text, 130, 67, 2, 0x07E0)  # Green
-
-        lcd.text("Voltage:", 20, 105, lcd.white)
-        voltage_text = f"{battery_voltage:.1f}V"
-        lcd.write_text(voltage_text, 130, 102, 2, lcd.white)
-
-        lcd.text("SOC:", 20, 140, lcd.white)
-        soc_text = f"{battery_soc}%"
-        lcd.write_text(soc_text, 130, 137, 2, lcd.white)
-
-        lcd.text("Temperature:", 20, 175, lcd.white)
-        temp_text = f"{battery_temp:.1f}"
-        lcd.write_text(temp_text, 130, 172, 2, lcd.white)
-        lcd.text("o", 190, 173, lcd.white)
-        lcd.text("C", 198, 178, lcd.white)
-
-    elif mode == "Status":
-        # Status page - system status information
-        # Title
-        lcd.text("SYSTEM STATUS", 65, 20, lcd.white)
-
-        # Draw horizontal line separator
-        lcd.hline(10, 40, 220, lcd.white)
-
-        # WiFi Status
-        lcd.text("WiFi Status:", 20, 70, lcd.white)
-        # Display WiFi status based on numeric value
-        if wifi_status == 1:
-            wifi_text = "Connected"
-            wifi_color = 0x07E0  # Green
-        elif wifi_status == 0:
-            wifi_text = "Disconnected"
-            wifi_color = 0xF800  # Red
-        elif wifi_status == 2:
-            wifi_text = "Skipped"
-            wifi_color = lcd.white  # White
-        else:
-            wifi_text = "Unknown"
-            wifi_color = lcd.white  # White
-        lcd.write_text(wifi_text, 20, 87, 2, wifi_color)
-
-        # Demo Mode - only display if active
-        if demo_mode == 1:
-            lcd.write_text("Demo Mode", 20, 140, 2, 0x07E0)  # Green
-
-    elif mode == "About":
-        # About page - application and author information
-        # Application title (centered, large)
-        lcd.text("Victron Battery", 55, 70, lcd.white)
-        lcd.text("Display System", 55, 90, lcd.white)
+        lcd.fill(lcd.black)
+        battery_monitor.render(soc, show=False)
+        if stale:
+            draw_stale_marker()
+        lcd.show()
+        return
 
-        # Version/build info
-        lcd.text("v1.0", 105, 120, lcd.white)
+    # Layout pages: SystemInfo, Charging, Status, Devices, About (see layouts.json)
+    page = layouts.page(mode) if mode else -1
+    if page >= 0:
+        layouts.render(lcd, page)
+        for name, x, y in PAGE_SPRITES.get(mode, ()):
+            icons.blit(lcd, name, x, y)
+    else:
+        lcd.fill(lcd.black)  # Unknown page - blank screen
+    if stale:
+        draw_stale_marker()
 
-        # Horizontal separator
-        lcd.hline(40, 145, 160, lcd.white)
+    lcd.show()
 
-        # Author information
-        lcd.text("Developed by", 75, 160, lcd.white)
-        lcd.text("Paul Williams", 70, 180, lcd.white)
+def draw_stale_marker():
+    """Label the frame as last known values (boot snapshot)"""
+    lcd.fill_rect(88, 210, 64, 12, lcd.black)
+    lcd.text("SAVED", 100, 212, lcd.red)
+
+def backlight_duty(brightness, power):
+    """PWM duty for the brightness percent in a power state"""
+    if power == POWER_SLEEP:
+        return 0
+    if power == POWER_DIM and brightness > IDLE_DIM_PERCENT:
+        brightness = IDLE_DIM_PERCENT
+    return int(brightness * 65535 / 100)
+
+def set_backlight(duty):
+    """Set the backlight PWM if it changed (render side)"""
+    global drawn_backlight
+    if duty != drawn_backlight:
+        drawn_backlight = duty
+        lcd.set_bl_pwm(duty)
+
+def render_state(snap):
+    """
+    Draw a state snapshot (render side): the whole page after a redraw
+    request, otherwise only the values that changed. Nothing is drawn
+    while the panel sleeps; waking draws the current page in one frame.
+    """
+    global drawn_redraws, drawn_clears, drawn_soc, drawn_power, last_wake_ms
+    v = snap.ints
+    power = v[ST_POWER]
+    if power == POWER_SLEEP:
+        if drawn_power != POWER_SLEEP:
+            drawn_power = POWER_SLEEP
+            set_backlight(0)
+            lcd.sleep()
+        return
 
-    lcd.show()
+    update_layout_values(snap)
+    mode = PAGES[v[ST_PAGE]] if v[ST_PAGE] >= 0 else None
+    soc = v[ST_SOC]
+
+    if drawn_power == POWER_SLEEP:
+        # Sleep out first, draw and flush while the panel settles, then
+        # turn the display and backlight on with the frame already there
+        drawn_power = power
+        lcd.wake()
+        if v[ST_CLEAR] != drawn_clears and v[ST_REDRAW] == drawn_redraws:
+            lcd.fill(lcd.white)  # Woken by CMD:CLEAR
+            lcd.show()
+        else:
+            update_display_for_mode(mode, soc, v[ST_STALE])
+        drawn_redraws = v[ST_REDRAW]
+        drawn_clears = v[ST_CLEAR]
+        drawn_soc = soc if mode == "Battery" else -1
+        lcd.display_on()
+        set_backlight(backlight_duty(v[ST_BRIGHT], power))
+        last_wake_ms = time.ticks_diff(time.ticks_ms(), v[ST_WAKE_AT])
+        print(f"Display awake: first frame in {last_wake_ms}ms")
+        return
+    drawn_power = power
+
+    if v[ST_REDRAW] != drawn_redraws:
+        drawn_redraws = v[ST_REDRAW]
+        drawn_clears = v[ST_CLEAR]
+        update_display_for_mode(mode, soc, v[ST_STALE])
+    elif v[ST_CLEAR] != drawn_clears:
+        drawn_clears = v[ST_CLEAR]
+        lcd.fill(lcd.white)
+        lcd.show()
+    elif mode == "Battery":
+        if soc != drawn_soc:
+            # Only the gauge segments that changed, flushed one by one
+            battery_monitor.update_gauge(soc)
+    elif mode:
+        layouts.render_dirty(lcd, layouts.page(mode))
+    drawn_soc = soc if mode == "Battery" else -1
+
+    if drawn_backlight < 0:
+        lcd.wait()  # Boot: backlight on once the first frame is on the panel
+    set_backlight(backlight_duty(v[ST_BRIGHT], power))
+
+def render_loop():
+    """Render core: draw each new snapshot as soon as it is published"""
+    while True:
+        snap = frames.take()
+        if snap is None:
+            time.sleep_ms(2)
+            continue
+        try:
+            render_state(snap)
+        except Exception as e:
+            print(f"Render error: {e}")
+
+def start_render_core():
+    """
+    Move rendering and the SPI flush to the second core.
+
+    Returns:
+        True if the render core was started, False without _thread
+    """
+    global render_core_running
+    try:
+        import _thread
+    except ImportError:
+        print("No _thread - rendering on the main core")
+        return False
+    render_core_running = True
+    _thread.start_new_thread(render_loop, ())
+    print("Render core started")
+    return True
 
 def check_auto_return_to_battery():
-    """Check if we should auto-return to Battery page after timeout"""
-    global current_mode, last_page_change_time, last_mode_change_time
+    """Auto-return to Battery page (runs AUTO_RETURN_TIMEOUT_MS after a page change)"""
+    global current_mode
 
     # Don't auto-return if already on Battery page
     if current_mode == "Battery":
         return
 
     # Don't auto-return if on Charging page and battery is actively charging
+    # (re-armed when charging stops)
     if current_mode == "Charging" and is_charging:
         return
 
-    # Check if timeout has elapsed
     elapsed = time.ticks_diff(time.ticks_ms(), last_page_change_time)
-    if elapsed > AUTO_RETURN_TIMEOUT_MS:
-        old_mode = current_mode
-        print(f"Auto-return triggered: {old_mode} → Battery (after {elapsed}ms)")
-        current_mode = "Battery"
-        update_display_for_mode(current_mode)
-        last_page_change_time = time.ticks_ms()
-        last_mode_change_time = time.ticks_ms()
-        print(f"Auto-return complete, timer reset")
-
-# Display initial Battery page after welcome message
-update_display_for_mode(current_mode)
+    old_mode = current_mode
+    print(f"Auto-return triggered: {old_mode} → Battery (after {elapsed}ms)")
+    current_mode = "Battery"
+    request_redraw()
+    page_changed()
+    print(f"Auto-return complete, timer reset")
+
+def wake_display(reason):
+    """Leave dim or sleep (next frame) and restart the idle timers"""
+    global power_state, wake_at, state_changed
+    if power_state == POWER_SLEEP:
+        wake_at = time.ticks_ms()
+        print(f"Waking display ({reason})")
+    if power_state != POWER_AWAKE:
+        power_state = POWER_AWAKE
+        state_changed = True
+    sched.schedule(idle_task, IDLE_DIM_MS)
+
+def idle_timeout():
+    """Dim after IDLE_DIM_MS without activity, sleep after IDLE_SLEEP_MS"""
+    global power_state, state_changed
+    if power_state == POWER_AWAKE:
+        power_state = POWER_DIM
+        print("Idle: backlight dimmed")
+        sched.schedule(idle_task, IDLE_SLEEP_MS - IDLE_DIM_MS)
+    elif power_state == POWER_DIM:
+        power_state = POWER_SLEEP
+        print("Idle: display asleep")
+    state_changed = True
+
+def fresh_telemetry():
+    """First live battery data after boot: redraw without the stale marker"""
+    global state_stale
+    if state_stale:
+        state_stale = False
+        request_redraw()
+
+def restore_snapshot(saved):
+    """Take the state saved by save_snapshot() as the (stale) boot state"""
+    global current_mode, battery_soc, battery_voltage_mv, battery_current_ma, battery_temp_mc
+    global wifi_status, demo_mode, is_charging, current_brightness, state_stale
+    page, battery_soc, battery_voltage_mv, battery_current_ma, battery_temp_mc, \
+        wifi_status, demo_mode, charging, current_brightness = saved
+    current_mode = PAGES[page] if 0 <= page < len(PAGES) else "Battery"
+    is_charging = charging == 1
+    state_stale = True
+    print(f"Restored snapshot: {current_mode} page, SOC {battery_soc}%")
+    if current_mode != "Battery":
+        page_changed()
+
+def save_snapshot():
+    """Persist the displayed state (every SNAPSHOT_PERIOD_MS; unchanged state is not rewritten)"""
+    if state_stale:
+        return  # Nothing new since boot
+    page = PAGES.index(current_mode) if current_mode in PAGES else 0
+    try:
+        if snapshots.save(page, battery_soc, battery_voltage_mv, battery_current_ma,
+                          battery_temp_mc, wifi_status, demo_mode, 1 if is_charging else 0,
+                          current_brightness):
+            print("Snapshot saved")
+    except Exception as e:
+        print(f"Error saving snapshot: {e}")
+
+def check_battery_staleness():
+    """Warn about stale battery data and UART overflow (every STALE_CHECK_MS)"""
+    global rx_overflow_reported
+    if battery_monitor.is_stale():
+        status = battery_monitor.get_status()
+        print(f"WARNING: Battery data stale (age: {status['age_ms']}ms)")
+    if rx.overflow != rx_overflow_reported:
+        print(f"WARNING: UART receive buffer overflowed ({rx.overflow - rx_overflow_reported} bytes dropped)")
+        rx_overflow_reported = rx.overflow
+
+def report_wakeups():
+    """Log main loop wakeups over the last minute (every STATS_PERIOD_MS)"""
+    global wakeups_line, wakeups_touch, wakeups_timer, wakeups_per_min
+    wakeups_per_min = wakeups_line + wakeups_touch + wakeups_timer
+    print(f"Wakeups/min: {wakeups_per_min} (line {wakeups_line}, touch {wakeups_touch}, timer {wakeups_timer})")
+    wakeups_line = wakeups_touch = wakeups_timer = 0
+
+def report_image_cache():
+    """Log image cache use and counters when they changed (every STATS_PERIOD_MS)"""
+    global image_cache_reported
+    status = image_cache.get_status()
+    counters = (status['hits'], status['misses'], status['evictions'], status['failures'])
+    if counters == image_cache_reported:
+        return
+    image_cache_reported = counters
+    print(f"Image cache: {status['images']} images, {status['used']}/{status['budget']} bytes, "
+          f"{status['pinned']} pinned; hits {status['hits']}, misses {status['misses']}, "
+          f"evictions {status['evictions']}, failures {status['failures']}")
+
+auto_return_task = sched.add(check_auto_return_to_battery, start=False)
+idle_task = sched.add(idle_timeout, delay_ms=IDLE_DIM_MS)
+sched.add(save_snapshot, delay_ms=SNAPSHOT_PERIOD_MS, period_ms=SNAPSHOT_PERIOD_MS)
+sched.add(check_battery_staleness, delay_ms=STALE_CHECK_MS, period_ms=STALE_CHECK_MS)
+sched.add(report_wakeups, delay_ms=STATS_PERIOD_MS, period_ms=STATS_PERIOD_MS)
+sched.add(report_image_cache, delay_ms=STATS_PERIOD_MS, period_ms=STATS_PERIOD_MS)
+
+# Display the snapshot's page (marked stale), or the Battery page after
+# the welcome message
+if saved_state is not None:
+    restore_snapshot(saved_state)
+request_redraw()
+publish_state()
+lcd.wait()  # First frame on the panel
+boot.report(f"first frame ({current_mode})")
 print(f"Started on {current_mode} page")
 
+# Ask the Pico for its full state now that we are ready to receive it
+link.request_resync()
+
 # Main loop
-last_battery_check = time.ticks_ms()
 last_touch_time = 0
+rx_overflow_reported = 0
+
+def main_loop_pass():
+    """
+    One pass of the main loop: UART commands, touch and due scheduled
+    tasks, then hand the new state to the render side. Host replay tools
+    call this directly.
+    """
+    global last_touch_time, state_changed
 
-while True:
     # Check for incoming commands from Raspberry Pi Pico
-    if uart.any():
-        cmd_line = uart.readline()
-        if cmd_line:
-            # print(f"Raw UART data received: {cmd_line}")
-            process_command(cmd_line)
+    # Drain up to one window of lines per pass, then acknowledge them all
+    for _ in range(LINK_WINDOW):
+        cmd_line = link.readline()
+        if not cmd_line:
+            break
+        # print(f"Raw UART data received: {cmd_line}")
+        link.complete(process_command(cmd_line))
+        state_changed = True
+    link.flush()
 
     # Check for touch events - full screen touch for page navigation
     if touch.Flag == 1:
@@ -407,22 +860,43 @@ while True:
             x = touch.X_point
             y = touch.Y_point
 
-            # Full screen touch - cycle to next page
-            print(f"Screen touched at ({x}, {y}) - cycling to next page")
-            cycle_mode()
+            if power_state != POWER_AWAKE:
+                # Dimmed or asleep: the touch only wakes the display
+                print(f"Screen touched at ({x}, {y}) - waking display")
+                wake_display("touch")
+            else:
+                # Full screen touch - cycle to next page
+                print(f"Screen touched at ({x}, {y}) - cycling to next page")
+                cycle_mode()
+                wake_display("touch")
             last_touch_time = current_time
         else:
             # Reset flag even if we ignore the touch
             touch.Flag = 0
 
-    # Check for auto-return to Battery page
-    check_auto_return_to_battery()
-
-    # Check battery data staleness (every 30 seconds)
-    if time.ticks_diff(time.ticks_ms(), last_battery_check) > 30000:
-        if battery_monitor.is_stale():
-            status = battery_monitor.get_status()
-            print(f"WARNING: Battery data stale (age: {status['age_ms']}ms)")
-        last_battery_check = time.ticks_ms()
-
-    time.sleep(0.1)
+    # Auto-return to Battery page, staleness check, stats
+    sched.run_due()
+
+    # Draw (single core) or publish to the render core
+    publish_state()
+
+def touch_pending():
+    """True when a touch is waiting to be handled (wakes the main loop)"""
+    return touch.Flag == 1
+
+def wait_for_work():
+    """Sleep until a command line, a touch or the next scheduled task is due"""
+    global wakeups_line, wakeups_touch, wakeups_timer
+    if rx.wait(sched.next_delay_ms(IDLE_MAX_MS), touch_pending):
+        wakeups_line += 1
+    elif touch_pending():
+        wakeups_touch += 1
+    else:
+        wakeups_timer += 1
+
+if __name__ == "__main__":
+    if DUAL_CORE:
+        start_render_core()
+    while True:
+        main_loop_pass()
+        wait_for_work()
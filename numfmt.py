@@ -0,0 +1,268 @@
+# Fixed-Point Number Formatter for Waveshare RP2350 Display
+# Formats ints and fixed-point values into a reusable bytearray without
+# float formatting or per-call string allocation
+#
+# A fixed-point value is an int holding value * 10**scale, e.g. 48500 with
+# scale=3 is 48.500 V. Formatting writes sign, integer part, decimals and an
+# optional unit suffix into FixedFormatter.buf and records the length in .n.
+#
+# Example:
+#     from numfmt import FixedFormatter, parse_fixed, UNIT_V
+#
+#     fmt = FixedFormatter()
+#     mv = parse_fixed(b"48.52", 3)          # 48520
+#     fmt.format(mv, scale=3, decimals=1, unit=UNIT_V)
+#     fmt.write_text(lcd, 140, 92, 2, lcd.white)   # draws "48.5V"
+
+# Unit suffixes
+UNIT_NONE = 0
+UNIT_V = 1
+UNIT_A = 2
+UNIT_PERCENT = 3
+UNIT_DEG_C = 4
+
+# Degree sign is stored as Latin-1 0xB0; the draw helpers render it as a
+# small raised 'o' since the built-in 8x8 font has no degree glyph
+DEGREE = 0xB0
+
+_UNIT_BYTES = (b'', b'V', b'A', b'%', b'\xb0C')
+
+# Powers of ten used for rescaling (scale and decimals are small)
+_POW10 = (1, 10, 100, 1000, 10000, 100000, 1000000, 10000000, 100000000)
+
+# Interned single-character strings so framebuf.text() can be fed one
+# character at a time without allocating
+_CHARS = tuple(chr(i) for i in range(128))
+
+
+def parse_fixed(data, scale, start=0, end=None):
+    """
+    Parse an ASCII decimal number into a fixed-point int without using float.
+
+    Args:
+        data: bytes/bytearray/memoryview holding e.g. b"-12.35"
+        scale: Number of implied decimals in the result (3 -> thousandths)
+        start: Index of first byte to parse (default 0)
+        end: Index one past the last byte (default len(data))
+
+    Returns:
+        int equal to round(value * 10**scale), halves rounded away from zero
+
+    Raises:
+        ValueError: If the field is empty or contains invalid characters
+    """
+    if end is None:
+        end = len(data)
+
+    # Skip surrounding whitespace (lines arrive with trailing \r\n)
+    while start < end and data[start] in (0x20, 0x09, 0x0D, 0x0A):
+        start += 1
+    while end > start and data[end - 1] in (0x20, 0x09, 0x0D, 0x0A):
+        end -= 1
+
+    negative = False
+    if start < end and data[start] in (0x2D, 0x2B):  # '-' or '+'
+        negative = data[start] == 0x2D
+        start += 1
+
+    value = 0
+    digits = 0
+    frac = -1  # Number of fractional digits seen, -1 before the point
+    round_up = False
+
+    for i in range(start, end):
+        c = data[i]
+        if c == 0x2E:  # '.'
+            if frac >= 0:
+                raise ValueError("invalid fixed-point number")
+            frac = 0
+            continue
+        if c < 0x30 or c > 0x39:
+            raise ValueError("invalid fixed-point number")
+        digits += 1
+        if frac >= 0:
+            if frac >= scale:
+                # Beyond requested precision: only the first dropped digit
+                # decides rounding
+                if frac == scale:
+                    round_up = c >= 0x35
+                frac += 1
+                continue
+            frac += 1
+        value = value * 10 + (c - 0x30)
+
+    if digits == 0:
+        raise ValueError("invalid fixed-point number")
+
+    if frac < 0:
+        frac = 0
+    if frac < scale:
+        value *= _POW10[scale - frac]
+    if round_up:
+        value += 1
+
+    return -value if negative else value
+
+
+def format_fixed(buf, value, scale=0, decimals=0, plus=False, unit=UNIT_NONE):
+    """
+    Write a fixed-point value into buf as ASCII.
+
+    Sign handling matches f-strings: a negative value that rounds to zero
+    still prints as "-0.0", and plus=True prefixes "+" for values > 0.
+    When decimals < scale the value is rounded half away from zero.
+
+    Args:
+        buf: bytearray to write into (must be large enough)
+        value: int holding value * 10**scale
+        scale: Implied decimals of value
+        decimals: Decimals to print
+        plus: If True, print "+" for positive values
+        unit: One of the UNIT_* constants
+
+    Returns:
+        Number of bytes written
+    """
+    n = 0
+    if value < 0:
+        buf[0] = 0x2D  # '-'
+        n = 1
+        value = -value
+    elif plus and value > 0:
+        buf[0] = 0x2B  # '+'
+        n = 1
+
+    # Rescale to the number of decimals we print
+    if decimals < scale:
+        div = _POW10[scale - decimals]
+        value = (value + (div >> 1)) // div
+    elif decimals > scale:
+        value *= _POW10[decimals - scale]
+
+    div = _POW10[decimals]
+    int_part = value // div
+    frac_part = value - int_part * div
+
+    # Integer digits, written backwards into place
+    count = 1
+    t = int_part
+    while t >= 10:
+        t //= 10
+        count += 1
+    i = n + count - 1
+    while True:
+        buf[i] = 0x30 + int_part % 10
+        int_part //= 10
+        i -= 1
+        if int_part == 0:
+            break
+    n += count
+
+    # Fractional digits, zero padded
+    if decimals:
+        buf[n] = 0x2E  # '.'
+        n += 1
+        i = n + decimals - 1
+        for _ in range(decimals):
+            buf[i] = 0x30 + frac_part % 10
+            frac_part //= 10
+            i -= 1
+        n += decimals
+
+    # Unit suffix
+    for c in _UNIT_BYTES[unit]:
+        buf[n] = c
+        n += 1
+
+    return n
+
+
+def draw_text(fb, buf, n, x, y, color):
+    """
+    Draw the first n bytes of buf with the built-in 8x8 font.
+
+    Args:
+        fb: framebuf.FrameBuffer (e.g. LCD_1inch28 instance)
+        buf: bytearray filled by format_fixed()
+        n: Number of bytes to draw
+        x, y: Top-left position
+        color: RGB565 color
+
+    Returns:
+        Width drawn in pixels
+    """
+    for i in range(n):
+        c = buf[i]
+        if c == DEGREE:
+            fb.text('o', x + 8 * i, y - 3, color)
+        else:
+            fb.text(_CHARS[c], x + 8 * i, y, color)
+    return 8 * n
+
+
+def write_text(lcd, buf, n, x, y, size, color):
+    """
+    Draw the first n bytes of buf with LCD_1inch28.write_text() scaling.
+
+    Args:
+        lcd: LCD_1inch28 instance
+        buf: bytearray filled by format_fixed()
+        n: Number of bytes to draw
+        x, y: Top-left position
+        size: Scale factor (1 = 8x8 pixels per character)
+        color: RGB565 color
+
+    Returns:
+        Width drawn in pixels
+    """
+    step = 8 * size
+    for i in range(n):
+        c = buf[i]
+        if c == DEGREE:
+            # Small raised degree sign, like the hand-placed "o" in main.py
+            lcd.text('o', x + step * i, y - 2, color)
+        else:
+            lcd.write_text(_CHARS[c], x + step * i, y, size, color)
+    return step * n
+
+
+class FixedFormatter:
+    """
+    Reusable formatter holding one preallocated output buffer.
+
+    Example:
+        fmt = FixedFormatter()
+        fmt.format(-12345, scale=3, decimals=1, unit=UNIT_A)  # "-12.3A"
+        fmt.text(lcd, 20, 60, lcd.white)
+        bitmap_fonts_32.draw_text_32(lcd, fmt.buf, 60, 100, lcd.white,
+                                     length=fmt.n)
+    """
+
+    def __init__(self, size=16):
+        """
+        Args:
+            size: Buffer size in bytes (default 16, enough for any reading)
+        """
+        self.buf = bytearray(size)
+        self.n = 0
+
+    def format(self, value, scale=0, decimals=0, plus=False, unit=UNIT_NONE):
+        """Format value into self.buf (see format_fixed). Returns length."""
+        self.n = format_fixed(self.buf, value, scale, decimals, plus, unit)
+        return self.n
+
+    def text(self, fb, x, y, color):
+        """Draw the formatted value with the 8x8 font (framebuf.text)."""
+        return draw_text(fb, self.buf, self.n, x, y, color)
+
+    def write_text(self, lcd, x, y, size, color):
+        """Draw the formatted value scaled with LCD_1inch28.write_text()."""
+        return write_text(lcd, self.buf, self.n, x, y, size, color)
+
+    def __str__(self):
+        """Formatted value as str (allocates - for logging and host tools)."""
+        s = ''
+        for i in range(self.n):
+            c = self.buf[i]
+            s += '°' if c == DEGREE else _CHARS[c]
+        return s
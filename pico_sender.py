@@ -0,0 +1,197 @@
+# Change-Driven Telemetry Sender (Pico side)
+# Sends a command to the display only when one of its values moved by
+# at least a deadband since it was last sent, no more often than the
+# command's minimum interval. A keep-alive resends any command that has
+# not gone out for keepalive_ms, so the display always holds a full
+# snapshot no older than that and recovers from a missed line.
+# Runs on MicroPython (Pico) and CPython (tools/bench_sender.py).
+#
+# Values are fixed-point ints like the display uses (mV, mA, m°C, %), so
+# deadbands are in the same units: 50 mV, 100 mA, 1 %.
+#
+# Example (Pico):
+#     from uart_link import PicoLink
+#     from pico_sender import ChangeSender
+#
+#     link = PicoLink(display_uart)
+#     sender = ChangeSender(link.send, keepalive_ms=10000)
+#     SOC = sender.add(b'BATTERY', deadbands=(1,), min_interval_ms=1000)
+#     SYS = sender.add(b'BATSYS', deadbands=(50, 100, 500), scales=(3, 3, 3),
+#                      decimals=(2, 2, 1), min_interval_ms=250)
+#     CHG = sender.add(b'CHARGING', deadbands=(0,))   # Every change, at once
+#
+#     while True:
+#         sender.set(SOC, soc)
+#         sender.set(SYS, mv, ma, mc)
+#         sender.set(CHG, 1 if charging else 0)
+#         sender.service()
+#         link.poll()
+#         time.sleep_ms(10)
+
+import time
+from array import array
+from numfmt import format_fixed
+
+DEFAULT_KEEPALIVE_MS = 10000
+LINE_MAX = 64  # Longest command built (key + ':' + values)
+
+
+class ChangeSender:
+    """
+    Deadband / rate-limited sender for display commands.
+
+    Each command (e.g. BATSYS) has one or more values. service() sends a
+    command when any value differs from the last sent one by at least its
+    deadband (deadband 0 = any change) and at least min_interval_ms have
+    passed since the command was last sent; a change that arrives sooner
+    is held and the latest value goes out when the interval ends. A
+    command not sent for keepalive_ms is resent even if unchanged.
+    """
+
+    def __init__(self, send, keepalive_ms=DEFAULT_KEEPALIVE_MS):
+        """
+        Args:
+            send: Callable taking a payload without newline, e.g.
+                  PicoLink.send or lambda p: uart.write(p + b'\\n')
+            keepalive_ms: Resend unchanged commands this often (0 = never)
+        """
+        self.send = send
+        self.keepalive_ms = keepalive_ms
+
+        self.keys = []
+        self.first = array('H')     # Per command: index of its first value
+        self.count = array('B')     # Per command: number of values
+        self.min_interval = array('i')
+        self.last_sent = array('i')
+        self.has_value = bytearray()
+        self.ever_sent = bytearray()
+        self.pending = bytearray()  # Change held back by min_interval_ms
+
+        self.current = array('i')   # Per value
+        self.sent = array('i')
+        self.deadband = array('i')
+        self.scale = array('B')
+        self.decimals = array('B')
+
+        self._buf = bytearray(LINE_MAX)
+        self._num = bytearray(16)
+
+        # Counters
+        self.lines = 0
+        self.bytes = 0
+        self.keepalives = 0  # Unchanged commands resent by the keep-alive
+        self.held = 0        # Sends delayed by min_interval_ms
+
+    def add(self, key, deadbands=(0,), scales=None, decimals=None, min_interval_ms=0):
+        """
+        Register a command.
+
+        Args:
+            key: Command name, e.g. b'BATSYS' (or b'BATSYS@mppt1')
+            deadbands: Per value, smallest change worth sending (0 = any)
+            scales: Per value, implied decimals of the int (default 0)
+            decimals: Per value, decimals to send (default = scale)
+            min_interval_ms: Minimum time between two sends of this command
+
+        Returns:
+            Command index for set()
+        """
+        n = len(deadbands)
+        scales = scales or (0,) * n
+        decimals = decimals or scales
+        self.keys.append(key)
+        self.first.append(len(self.current))
+        self.count.append(n)
+        self.min_interval.append(min_interval_ms)
+        self.last_sent.append(time.ticks_ms())
+        self.has_value.append(0)
+        self.ever_sent.append(0)
+        self.pending.append(0)
+        for j in range(n):
+            self.current.append(0)
+            self.sent.append(0)
+            self.deadband.append(deadbands[j])
+            self.scale.append(scales[j])
+            self.decimals.append(decimals[j])
+        return len(self.keys) - 1
+
+    def set(self, cmd, *values):
+        """Store the latest values of a command (sent by service() if needed)."""
+        first = self.first[cmd]
+        current = self.current
+        for j in range(self.count[cmd]):
+            current[first + j] = values[j]
+        self.has_value[cmd] = 1
+
+    def _changed(self, cmd):
+        if not self.ever_sent[cmd]:
+            return True
+        first = self.first[cmd]
+        for k in range(first, first + self.count[cmd]):
+            diff = self.current[k] - self.sent[k]
+            if diff < 0:
+                diff = -diff
+            if diff and diff >= self.deadband[k]:
+                return True
+        return False
+
+    def _send(self, cmd, now):
+        buf = self._buf
+        key = self.keys[cmd]
+        n = len(key)
+        buf[:n] = key
+        buf[n] = 0x3A  # ':'
+        n += 1
+        first = self.first[cmd]
+        for k in range(first, first + self.count[cmd]):
+            if k > first:
+                buf[n] = 0x2C  # ','
+                n += 1
+            num = self._num
+            for j in range(format_fixed(num, self.current[k], self.scale[k], self.decimals[k])):
+                buf[n] = num[j]
+                n += 1
+            self.sent[k] = self.current[k]
+        self.send(bytes(buf[:n]))
+        self.last_sent[cmd] = now
+        self.ever_sent[cmd] = 1
+        self.pending[cmd] = 0
+        self.lines += 1
+        self.bytes += n + 1  # Newline (framing overhead not included)
+
+    def service(self, now=None):
+        """
+        Send what changed and what the keep-alive is due for. Call often.
+
+        Returns:
+            Number of commands sent
+        """
+        if now is None:
+            now = time.ticks_ms()
+        keepalive_ms = self.keepalive_ms
+        sent = 0
+        for cmd in range(len(self.keys)):
+            if not self.has_value[cmd]:
+                continue
+            age = time.ticks_diff(now, self.last_sent[cmd])
+            if not self._changed(cmd):
+                if not keepalive_ms or age < keepalive_ms:
+                    continue
+                self.keepalives += 1
+            elif self.ever_sent[cmd] and age < self.min_interval[cmd]:
+                if not self.pending[cmd]:
+                    self.pending[cmd] = 1
+                    self.held += 1
+                continue
+            self._send(cmd, now)
+            sent += 1
+        return sent
+
+    def get_status(self):
+        """Dictionary of sender counters for logging."""
+        return {
+            'lines': self.lines,
+            'bytes': self.bytes,
+            'keepalives': self.keepalives,
+            'held': self.held,
+        }
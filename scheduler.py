@@ -0,0 +1,175 @@
+# Deadline Scheduler for One-Shot and Periodic Tasks
+# Keeps pending tasks in a min-heap ordered by deadline, so the main loop
+# can ask how long it may sleep (next_delay_ms()) and run whatever is due
+# (run_due()) instead of comparing timestamps on every pass.
+#
+# Deadlines are kept in milliseconds since the scheduler was created,
+# accumulated from time.ticks_diff(), so they order correctly across the
+# ticks_ms() wrap-around. Cancelling or rescheduling a task leaves its old
+# heap entry behind; the entry is recognised as stale (generation number)
+# and skipped when it comes up.
+#
+# Example:
+#     from scheduler import Scheduler
+#
+#     sched = Scheduler()
+#     sched.add(check_battery, period_ms=30000)          # Periodic
+#     timeout = sched.add(return_home, delay_ms=10000)   # One-shot
+#     sched.schedule(timeout, 10000)                     # Re-arm (e.g. on touch)
+#
+#     while True:
+#         sched.run_due()
+#         rx.wait(sched.next_delay_ms(1000))             # Sleep until due
+
+import time
+from heapq import heappush, heappop
+
+
+class Task:
+    """A scheduled callable; period_ms > 0 makes it repeat."""
+
+    def __init__(self, fn, period_ms=0, name=None):
+        self.fn = fn
+        self.period_ms = period_ms
+        self.name = name or getattr(fn, '__name__', 'task')
+        self.due = 0           # Deadline, ms since the scheduler started
+        self.active = False    # Waiting to run
+        self.runs = 0
+        self._gen = 0          # Bumped on every (re)schedule or cancel
+
+
+class Scheduler:
+    """
+    Min-heap of task deadlines.
+
+    Heap entries are (due_ms, seq, generation, task); seq breaks ties in
+    insertion order so tasks themselves are never compared.
+    """
+
+    def __init__(self):
+        self._heap = []
+        self._seq = 0
+        self._last = time.ticks_ms()
+        self._now = 0
+        self.tasks = []
+
+        # Counters
+        self.runs = 0          # Task runs
+        self.late_ms = 0       # Largest delay past a deadline seen
+
+    def now(self):
+        """Milliseconds since the scheduler was created."""
+        t = time.ticks_ms()
+        self._now += time.ticks_diff(t, self._last)
+        self._last = t
+        return self._now
+
+    def add(self, fn, delay_ms=0, period_ms=0, name=None, start=True):
+        """
+        Create a task.
+
+        Args:
+            fn: Callable run with no arguments
+            delay_ms: First run this long from now
+            period_ms: Repeat every period_ms after that (0 = one-shot)
+            name: Name for get_status() (default: fn.__name__)
+            start: Schedule it now; otherwise wait for schedule()
+
+        Returns:
+            The Task, for schedule() and cancel()
+        """
+        task = Task(fn, period_ms, name)
+        self.tasks.append(task)
+        if start:
+            self.schedule(task, delay_ms)
+        return task
+
+    def schedule(self, task, delay_ms):
+        """(Re)arm task to run delay_ms from now, replacing any pending run."""
+        self._push(task, self.now() + (delay_ms if delay_ms > 0 else 0))
+
+    def cancel(self, task):
+        """Drop the task's pending run (if any)."""
+        task._gen += 1
+        task.active = False
+
+    def _push(self, task, due):
+        task._gen += 1
+        task.due = due
+        task.active = True
+        self._seq += 1
+        heappush(self._heap, (due, self._seq, task._gen, task))
+
+    def _drop_stale(self):
+        heap = self._heap
+        while heap:
+            entry = heap[0]
+            if entry[2] == entry[3]._gen and entry[3].active:
+                return
+            heappop(heap)
+
+    def run_due(self):
+        """
+        Run every task whose deadline has passed, in deadline order.
+
+        A periodic task is re-armed one period after its previous
+        deadline (so it does not drift); periods missed entirely are
+        skipped rather than run back to back.
+
+        Returns:
+            Number of tasks run
+        """
+        now = self.now()
+        heap = self._heap
+        ran = 0
+        while heap and heap[0][0] <= now:
+            due, _, gen, task = heappop(heap)
+            if gen != task._gen or not task.active:
+                continue  # Cancelled or rescheduled
+            if now - due > self.late_ms:
+                self.late_ms = now - due
+            if task.period_ms:
+                nxt = due + task.period_ms
+                if nxt <= now:
+                    nxt = now + task.period_ms
+                self._push(task, nxt)
+            else:
+                task.active = False
+            task.runs += 1
+            self.runs += 1
+            ran += 1
+            task.fn()
+        return ran
+
+    def next_delay_ms(self, limit):
+        """
+        Milliseconds until the next deadline (0 if one is due).
+
+        Args:
+            limit: Returned when no task is pending, and the maximum returned
+        """
+        self._drop_stale()
+        if not self._heap:
+            return limit
+        delay = self._heap[0][0] - self.now()
+        if delay < 0:
+            return 0
+        return delay if delay < limit else limit
+
+    def get_status(self):
+        """Dictionary of tasks and counters for logging."""
+        now = self.now()
+        return {
+            'tasks': [
+                {
+                    'name': t.name,
+                    'due_in_ms': t.due - now if t.active else None,
+                    'period_ms': t.period_ms,
+                    'runs': t.runs,
+                }
+                for t in self.tasks
+            ],
+            'runs': self.runs,
+            'late_ms': self.late_ms,
+            'heap': len(self._heap),
+        }
@@ -0,0 +1,114 @@
+# Persistent Last-Known-State Snapshot
+# Keeps a compact binary copy of the displayed state in flash so the next
+# boot can draw meaningful values at once (marked stale) instead of 0%
+# and a welcome screen.
+#
+# Each snapshot is one struct-packed record behind a magic/version
+# header. Writes go to a temp file that is then renamed over the
+# snapshot, so a reset mid-write leaves the previous snapshot intact. To
+# spare the flash, save() skips records identical to the one on flash
+# and writes at most once per min_interval_ms.
+#
+# Example:
+#     from snapshot import SnapshotStore
+#
+#     store = SnapshotStore("<bBi")          # page, soc, voltage
+#     saved = store.load()                   # Tuple, or None on first boot
+#     ...
+#     store.save(page, soc, voltage_mv)      # e.g. from a periodic task
+
+import os
+import struct
+import time
+
+SNAPSHOT_FILE = "snapshot.bin"
+MAGIC = b'VBS1'               # Bump the digit when a record layout changes
+MIN_INTERVAL_MS = 5 * 60000   # At most 12 writes per hour
+
+
+class SnapshotStore:
+    """
+    One fixed-layout record persisted with atomic, rate-limited writes.
+    """
+
+    def __init__(self, fmt, path=None, min_interval_ms=MIN_INTERVAL_MS):
+        """
+        Args:
+            fmt: struct format of the record (little-endian, without header)
+            path: Snapshot file (default: SNAPSHOT_FILE)
+            min_interval_ms: Shortest time between two writes
+        """
+        self.path = path or SNAPSHOT_FILE
+        self.tmp_path = self.path + ".tmp"
+        self.fmt = "<4s" + fmt.lstrip("<")
+        self.size = struct.calcsize(self.fmt)
+        self.min_interval_ms = min_interval_ms
+        self._saved = None        # Record on flash (bytes)
+        self._last_write = None   # ticks_ms() of the last write
+
+        # Counters
+        self.writes = 0
+        self.skipped = 0          # Changed records held back by the rate limit
+        self.errors = 0
+
+    def load(self):
+        """
+        Read the saved record.
+
+        Returns:
+            Tuple of the record's values, or None if there is no valid snapshot
+        """
+        try:
+            with open(self.path, "rb") as f:
+                data = f.read(self.size + 1)
+        except OSError:
+            return None
+        if len(data) != self.size or data[:4] != MAGIC:
+            print(f"Snapshot ignored: {self.path} ({len(data)} bytes)")
+            return None
+        self._saved = data
+        return struct.unpack(self.fmt, data)[1:]
+
+    def save(self, *values):
+        """
+        Write a record unless it is unchanged or the last write was too recent.
+
+        Args:
+            values: Record values in fmt order
+
+        Returns:
+            True if the record was written
+        """
+        data = struct.pack(self.fmt, MAGIC, *values)
+        if data == self._saved:
+            return False
+        now = time.ticks_ms()
+        if (self._last_write is not None
+                and time.ticks_diff(now, self._last_write) < self.min_interval_ms):
+            self.skipped += 1
+            return False
+        try:
+            with open(self.tmp_path, "wb") as f:
+                f.write(data)
+            try:
+                os.rename(self.tmp_path, self.path)
+            except OSError:
+                # FAT does not rename over an existing file
+                os.remove(self.path)
+                os.rename(self.tmp_path, self.path)
+        except OSError as e:
+            self.errors += 1
+            print(f"Snapshot write failed: {e}")
+            return False
+        self._saved = data
+        self._last_write = now
+        self.writes += 1
+        return True
+
+    def get_status(self):
+        """Dictionary of write counters for logging."""
+        return {
+            'writes': self.writes,
+            'skipped': self.skipped,
+            'errors': self.errors,
+        }
@@ -0,0 +1,106 @@
+# Sprites
+# Draws icons out of a sprite atlas from convert_image.py --atlas: one
+# RGB565 image holding every icon, an index of where each one sits
+# (name -> x, y, w, h) and a transparent key colour.
+#
+# Each sprite is one FrameBuffer.blit() of a view of its rectangle in the
+# atlas, with the key colour left out, so the framebuffer keeps whatever
+# was under the icon's transparent pixels. blit() returns the rectangle it
+# drew for a partial flush with lcd.show_rect().
+#
+# Example:
+#     from sprites import SpriteAtlas
+#     from sprite_data import SPRITES
+#
+#     icons = SpriteAtlas(SPRITES)
+#     rect = icons.blit(lcd, "bolt", 62, 12)
+#     if rect:
+#         lcd.show_rect(*rect)
+
+import framebuf
+
+
+class SpriteAtlas:
+    """
+    A sprite atlas ready to blit. framebuf needs a writable buffer, so the
+    atlas pixels are copied into one bytearray (2 bytes per atlas pixel,
+    plus one atlas row of padding).
+    """
+
+    def __init__(self, atlas):
+        """
+        Args:
+            atlas: ('ATLAS', width, height, key, index, data) tuple from
+                   convert_image.py --atlas; data is a tuple of chunks or
+                   one buffer
+        """
+        tag, width, height, key, index, chunks = atlas
+        if tag != 'ATLAS':
+            raise ValueError(f"Not a sprite atlas: {tag}")
+        size = width * height * 2
+        if not isinstance(chunks, tuple):
+            chunks = (chunks,)
+        # A sprite's view starts at its top-left pixel and framebuf wants
+        # h full atlas rows from there, so a sprite at x > 0 in the bottom
+        # rows reaches up to one row past the pixels: pad by one row
+        buf = bytearray(size + width * 2)
+        offset = 0
+        for chunk in chunks:
+            buf[offset:offset + len(chunk)] = chunk
+            offset += len(chunk)
+        if offset != size:
+            raise ValueError(f"Sprite atlas must be {size} bytes, got {offset}")
+        self.buffer = buf
+        self.width = width
+        self.height = height
+        self.key = key
+        self.index = index
+        self._views = {}  # name -> FrameBuffer over the sprite's rectangle
+
+    def names(self):
+        """Sprite names."""
+        return list(self.index)
+
+    def size(self, name):
+        """(w, h) of a sprite, or None if unknown."""
+        rect = self.index.get(name)
+        return (rect[2], rect[3]) if rect else None
+
+    def _view(self, name):
+        view = self._views.get(name)
+        if view is None:
+            sx, sy, w, h = self.index[name]
+            start = (sx + sy * self.width) * 2
+            view = framebuf.FrameBuffer(memoryview(self.buffer)[start:], w, h,
+                                        framebuf.RGB565, self.width)
+            self._views[name] = view
+        return view
+
+    def blit(self, fb, name, x, y):
+        """
+        Draw a sprite with its top-left corner at x, y; transparent pixels
+        leave fb unchanged.
+
+        Args:
+            fb: LCD_1inch28 (a FrameBuffer with width and height)
+            name: Sprite name
+            x, y: Position
+
+        Returns:
+            The rectangle drawn (x, y, w, h) clipped to fb, or None if
+            the sprite is unknown or off screen
+        """
+        rect = self.index.get(name)
+        if rect is None:
+            print(f"Sprites: unknown sprite '{name}'")
+            return None
+        fb.blit(self._view(name), x, y, self.key)
+        w = rect[2]
+        h = rect[3]
+        x0 = max(0, x)
+        y0 = max(0, y)
+        x1 = min(x + w, fb.width)
+        y1 = min(y + h, fb.height)
+        if x0 >= x1 or y0 >= y1:
+            return None
+        return x0, y0, x1 - x0, y1 - y0
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Memory and copy cost of the image asset formats (asset_store.py).
+
+Builds one image (--image, --format) four ways with tools/build_assets.py
+and, in a fresh process per store, loads it and draws it:
+
+    chunks    img_<name>.py with 2 KB bytes chunks (the default bundle),
+              ModuleStore
+    single    img_<name>.py with one bytes object ("chunk_size": 0, the
+              layout to freeze into the firmware), ModuleStore
+    bin-mmap  <name>.bin memory-mapped, BinStore
+    bin-read  <name>.bin read into memory, BinStore without mmap (what
+              the device does with bin files)
+
+For each it reports the process RSS growth split into anonymous memory
+(heap: what the image costs in RAM) and file-backed pages (the mapped
+file, shared and reclaimable), the Python heap held after loading
+(tracemalloc), the time of a full-screen load_image_to_framebuffer() and
+of restore_background() of a --rect square, and the heap allocated
+during one restore (copies would show up there; the host framebuf
+stand-in's palette blit allocates a row at a time, the device's does
+not). Every store must draw the same framebuffer.
+
+On the device a frozen "single" image is read in place from flash (XIP)
+like bin-mmap here, while "chunks" imported from a .py or .mpy file sits
+in the heap like chunks here.
+
+Usage:
+    python3 tools/bench_assets.py [--image jatj_v2.png]
+        [--format rgb565_brg] [--rect 48] [--repeat 50]
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import hostenv
+
+STORES = ('chunks', 'single', 'bin-mmap', 'bin-read')
+
+
+def rss_kb():
+    """(anonymous, file-backed) resident KB of this process (Linux)."""
+    fields = {}
+    with open('/proc/self/status') as f:
+        for line in f:
+            key, _, value = line.partition(':')
+            fields[key] = value.split()[0] if value.split() else '0'
+    return int(fields.get('RssAnon', 0)), int(fields.get('RssFile', 0))
+
+
+def build(tmp, image, fmt):
+    """Write the three bundles under tmp; returns {store: bundle dir}."""
+    sys.path.insert(0, hostenv.TOOLS_DIR)
+    import build_assets
+    dirs = {}
+    for kind, bundle in (('chunks', {'type': 'module', 'path': 'image_data.py'}),
+                         ('single', {'type': 'module', 'path': 'image_data.py',
+                                     'chunk_size': 0}),
+                         ('bin', {'type': 'bin', 'path': 'images'})):
+        base = os.path.join(tmp, kind)
+        os.makedirs(base)
+        manifest = os.path.join(base, 'assets.json')
+        with open(manifest, 'w') as f:
+            json.dump({'bundle': bundle, 'defaults': {'format': fmt},
+                       'images': [{'name': 'bg', 'source': os.path.abspath(image)}]}, f)
+        build_assets.build(manifest, jobs=1)
+        dirs[kind] = os.path.join(base, 'images') if kind == 'bin' else base
+    return dirs
+
+
+def child(store_name, path, rect, repeat):
+    """One store in this (fresh) process; returns the measurements."""
+    hostenv.install()
+    sys.path.insert(0, path)
+    import asset_store
+    import image_display
+    from LCD_1inch28 import LCD_1inch28
+
+    lcd = LCD_1inch28(clear=False)
+    lcd.fill(lcd.black)  # Fault the framebuffer's pages in before measuring
+    if store_name == 'bin-read':
+        asset_store.mmap = None
+    if store_name.startswith('bin'):
+        store = asset_store.BinStore(path)
+    else:
+        store = asset_store.ModuleStore()
+
+    anon0, file0 = rss_kb()
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    image = image_display.prepare_image(store.image('bg'))
+    store.release('bg')
+    load_ms = (time.perf_counter() - t0) * 1000
+    heap = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()  # Tracing slows allocations: time without it
+
+    t0 = time.perf_counter()
+    for _ in range(repeat):
+        image_display.load_image_to_framebuffer(lcd, image)
+    full_ms = (time.perf_counter() - t0) * 1000 / repeat
+    anon1, file1 = rss_kb()
+
+    x = y = (240 - rect) // 2
+    t0 = time.perf_counter()
+    for _ in range(repeat):
+        lcd.fill_rect(x, y, rect, rect, 0)
+        image_display.restore_background(lcd, image, x, y, rect, rect)
+    rect_ms = (time.perf_counter() - t0) * 1000 / repeat
+
+    tracemalloc.start()
+    image_display.restore_background(lcd, image, x, y, rect, rect)
+    rect_peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return {
+        'load_ms': load_ms, 'heap': heap, 'anon_kb': anon1 - anon0, 'file_kb': file1 - file0,
+        'full_ms': full_ms, 'rect_ms': rect_ms, 'rect_peak': rect_peak,
+        'frame': hashlib.sha1(bytes(lcd.buffer)).hexdigest()[:12],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--image', default=os.path.join(hostenv.ROOT_DIR, 'jatj_v2.png'))
+    parser.add_argument('--format', default='rgb565_brg', choices=('rgb565_brg', 'gs8', 'gs4'))
+    parser.add_argument('--rect', type=int, default=48, help='side of the restored square')
+    parser.add_argument('--repeat', type=int, default=50)
+    parser.add_argument('--child', nargs=2, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        result = child(args.child[0], args.child[1], args.rect, args.repeat)
+        sys.stdout.write(json.dumps(result) + '\n')
+        return
+
+    tmp = tempfile.mkdtemp(prefix='bench-assets-')
+    try:
+        dirs = build(tmp, args.image, args.format)
+        results = {}
+        for name in STORES:
+            path = dirs['bin' if name.startswith('bin') else name]
+            cmd = [sys.executable, os.path.abspath(__file__), '--child', name, path,
+                   '--rect', str(args.rect), '--repeat', str(args.repeat)]
+            subprocess.run(cmd, stdout=subprocess.DEVNULL, check=True)  # Warm .pyc files
+            out = subprocess.run(cmd, stdout=subprocess.PIPE, check=True).stdout
+            results[name] = json.loads(out.decode().strip().splitlines()[-1])
+    finally:
+        shutil.rmtree(tmp)
+
+    print('%s as %s, restore %dx%d:' % (os.path.basename(args.image), args.format,
+                                         args.rect, args.rect))
+    print('%-10s %9s %9s %9s %9s %9s %9s %10s  %s'
+          % ('store', 'load ms', 'heap KB', 'anon KB', 'file KB', 'full ms', 'rect ms',
+             'rect alloc', 'frame'))
+    for name, r in results.items():
+        print('%-10s %9.2f %9.1f %9d %9d %9.3f %9.3f %10d  %s'
+              % (name, r['load_ms'], r['heap'] / 1024, r['anon_kb'], r['file_kb'],
+                 r['full_ms'], r['rect_ms'], r['rect_peak'], r['frame']))
+    frames = set(r['frame'] for r in results.values())
+    print()
+    print('frames identical' if len(frames) == 1 else 'FRAMES DIFFER')
+    print('heap = Python heap held by the loaded image; anon/file = RSS growth while '
+          'loading and drawing; rect alloc = peak bytes allocated by one restore')
+
+
+if __name__ == '__main__':
+    main()
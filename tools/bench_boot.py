@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Cold-boot time of main.py to the first frame on the panel.
+
+Boots main.py on the host in a fresh process per run (stand-in
+machine/rp2 modules, real clock, SPI at the driver's 100 MHz) and reads
+the boot profile main.py records (bootprof.py): ms per import and init
+step, and the total from main.py's first line to the first frame. The
+device prints the same profile at every boot.
+
+Scenarios:
+    first      no snapshot: welcome screen (2 s), then the Battery page
+    battery    snapshot saved on the Battery page (drawn at once, stale)
+    page       snapshot saved on --page
+
+Host imports come from warm .pyc files and host drawing is faster than
+the device's, so compare steps and scenarios here, and take absolute
+numbers from the device log.
+
+Usage:
+    python3 tools/bench_boot.py [--runs 5] [--page SystemInfo]
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+import hostenv
+
+
+def boot(snapshot_file, save_page=None):
+    """Import main.py (one boot) and return its profile."""
+    hostenv.install()
+    import snapshot
+    snapshot.SNAPSHOT_FILE = snapshot_file
+    os.chdir(hostenv.ROOT_DIR)  # main.py opens layouts.json relative to cwd
+    with contextlib.redirect_stdout(io.StringIO()):
+        import main
+        if save_page:
+            # Leave a snapshot for the next boot
+            main.current_mode = save_page
+            main.battery_soc = 77
+            main.save_snapshot()
+    return {'steps': main.boot.steps, 'total_us': main.boot.total_us}
+
+
+def run_child(args, snapshot_file, save_page=None):
+    cmd = [sys.executable, os.path.abspath(__file__), '--child', snapshot_file]
+    if save_page:
+        cmd += ['--save-page', save_page]
+    out = subprocess.run(cmd, stdout=subprocess.PIPE, check=True).stdout
+    return json.loads(out.decode().strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--runs', type=int, default=5, help='boots per scenario')
+    parser.add_argument('--page', default='SystemInfo', help='page of the "page" scenario')
+    parser.add_argument('--child', help=argparse.SUPPRESS)
+    parser.add_argument('--save-page', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        result = boot(args.child, args.save_page)
+        sys.stdout.write(json.dumps(result) + '\n')
+        return
+
+    tmp = tempfile.mkdtemp(prefix='bench-boot-')
+    scenarios = {}
+    for name, page in (('first', None), ('battery', 'Battery'), ('page', args.page)):
+        path = os.path.join(tmp, name + '.bin')
+        if page:
+            run_child(args, path, save_page=page)
+        print('Booting %s x%d...' % (name, args.runs), file=sys.stderr)
+        scenarios[name] = [run_child(args, path) for _ in range(args.runs)]
+        if page and os.path.exists(path):
+            os.remove(path)
+
+    print('%-12s %10s %10s %10s' % ('scenario', 'p50 ms', 'min ms', 'max ms'))
+    for name, runs in scenarios.items():
+        ms = sorted(r['total_us'] / 1000 for r in runs)
+        print('%-12s %10.1f %10.1f %10.1f' % (name, ms[len(ms) // 2], ms[0], ms[-1]))
+
+    for name, runs in scenarios.items():
+        print()
+        print('%s: median ms per step' % name)
+        for i, (step, _) in enumerate(runs[0]['steps']):
+            us = sorted(r['steps'][i][1] for r in runs)
+            print('  %-32s %8.1f' % (step, us[len(us) // 2] / 1000))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Throughput of convert_image.py: per-pixel vs. lookup table vs. NumPy.
+
+Single image: times the RGB565 conversion of one image (already loaded
+and resized) with the original per-pixel code (getpixel + pow), the
+gamma table applied pixel by pixel (the no-NumPy fallback) and the NumPy
+path, plus the whole conversion with Python code generation. Every path
+must produce the same bytes as the reference.
+
+Batch: converts --batch-size images (variants of the repository images)
+to Python files with one process and with a process pool.
+
+Usage:
+    python3 tools/bench_convert.py [--image joeandthejuice.jpg]
+        [--repeat 5] [--batch-size 24] [--jobs N]
+"""
+
+import argparse
+import io
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+import hostenv
+
+hostenv.install()
+
+import convert_image  # noqa: E402
+from PIL import Image  # noqa: E402
+
+
+def best_of(repeat, fn, *args):
+    best = None
+    result = None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        result = fn(*args)
+        elapsed = time.perf_counter() - t0
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def without_numpy(img, gamma):
+    np = convert_image.np
+    convert_image.np = None
+    try:
+        return convert_image.rgb_to_rgb565_brg(img, gamma)
+    finally:
+        convert_image.np = np
+
+
+def full_conversion(path):
+    data, info = convert_image.convert_image_to_rgb565_brg(path, 'bg')
+    out = io.StringIO()
+    convert_image.generate_python_code(data, 'bg', path, info, file=out)
+    return data
+
+
+def make_batch(directory, count):
+    """Write count distinct 240x240 images (rotated/flipped repository images)."""
+    sources = [os.path.join(hostenv.ROOT_DIR, name) for name in ('joeandthejuice.jpg', 'jatj_v2.png')]
+    images = [Image.open(path).convert('RGB').resize((240, 240)) for path in sources]
+    for i in range(count):
+        img = images[i % len(images)].rotate(15 * (i // len(images)))
+        img.save(os.path.join(directory, 'asset_%02d.png' % i))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--image', default=os.path.join(hostenv.ROOT_DIR, 'joeandthejuice.jpg'))
+    parser.add_argument('--gamma', type=float, default=2.2)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--batch-size', type=int, default=24)
+    parser.add_argument('--jobs', type=int, help='pool workers (default: CPUs)')
+    args = parser.parse_args()
+
+    if convert_image.np is None:
+        print('NumPy is not installed: the numpy row runs the table fallback', file=sys.stderr)
+
+    img, _ = convert_image.load_rgb_image(args.image)
+    ref_s, reference = best_of(1, convert_image.rgb_to_rgb565_brg_reference, img, args.gamma)
+    rows = [('per-pixel (reference)', ref_s, reference)]
+    rows.append(('gamma table, per pixel',) + best_of(args.repeat, without_numpy, img, args.gamma))
+    rows.append(('numpy',) + best_of(args.repeat, convert_image.rgb_to_rgb565_brg, img, args.gamma))
+
+    print('Single image (%s), RGB565 conversion only:' % os.path.basename(args.image))
+    print('  %-24s %10s %10s %10s' % ('path', 'ms', 'speedup', 'bytes'))
+    for name, seconds, data in rows:
+        print('  %-24s %10.1f %9.1fx %10s' % (name, seconds * 1000, ref_s / seconds,
+                                             'same' if data == reference else 'DIFFERENT'))
+    seconds, data = best_of(args.repeat, full_conversion, args.image)
+    print('  %-24s %10.1f' % ('load + convert + codegen', seconds * 1000))
+
+    tmp = tempfile.mkdtemp(prefix='bench-convert-')
+    try:
+        src = os.path.join(tmp, 'src')
+        os.mkdir(src)
+        make_batch(src, args.batch_size)
+        print()
+        print('Batch of %d images to Python files:' % args.batch_size)
+        print('  %-24s %10s %10s' % ('mode', 'seconds', 'images/s'))
+        for name, jobs in (('1 process', 1), ('process pool (%d)' % (args.jobs or os.cpu_count()),
+                                              args.jobs)):
+            out = os.path.join(tmp, 'out_%s' % (jobs or 0))
+            t0 = time.perf_counter()
+            convert_image.convert_directory(src, out, args.gamma, jobs=jobs)
+            seconds = time.perf_counter() - t0
+            print('  %-24s %10.2f %10.1f' % (name, seconds, args.batch_size / seconds))
+    finally:
+        shutil.rmtree(tmp)
+
+
+if __name__ == '__main__':
+    main()
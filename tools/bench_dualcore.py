@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""
+Input latency with rendering on the second core vs. in the main loop.
+
+Runs main.py on the host twice, each in its own process (main.py can
+only be imported once): once with the single-core loop (every pass
+draws what changed before it reads the UART again) and once with
+main.start_render_core() drawing on a second thread, like core 1 on the
+RP2350. Both get the same real-time input: a tools/loadgen.py telemetry
+stream into the stand-in UART and a screen touch every --touch-every
+seconds (each touch changes page, i.e. a full 115 KB frame).
+
+SPI transfers take real time at --spi-mhz (DMA flushes through the rp2
+stand-in, blocking writes slept), so the other thread can run like on
+the device. Drawing itself is host Python on the stand-in framebuf; the
+two threads share the GIL, so the host understates what a second core
+gains. Lines are read from main.py's receive ring (uart_rx.py) and the
+main loop sleeps in wait_for_work() like main.py's own loop.
+
+Reports per mode:
+    line latency    arrival in the UART buffer -> read for processing
+    touch latency   touch -> page changed (state updated)
+    touch to frame  touch -> the new page has been pushed to the panel
+
+Usage:
+    python3 tools/bench_dualcore.py [--seconds 20] [--rate 5]
+        [--touch-every 1.5] [--spi-mhz 75] [--rxbuf 256]
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+import types
+
+import hostenv
+
+hostenv.install()
+
+import loadgen  # noqa: E402
+import machine  # noqa: E402  (stand-in)
+
+
+class TimedPort(machine.MemoryPort):
+    """Stand-in UART port recording when each line arrives and is read."""
+
+    def __init__(self, rxbuf):
+        super().__init__(rxbuf)
+        self.ring = None  # main.rx once main.py is imported
+        self._arrivals = []
+        self.latencies = []
+        self.dropped = 0
+
+    def deliver(self, data):
+        before = self.overflow + self.ring.overflow
+        t = time.monotonic()
+        with self._lock:
+            self._arrivals.append(t)
+        self.receive(data)  # main.rx's IRQ handler drains it at once
+        if self.overflow + self.ring.overflow != before or not data.endswith(b'\n'):
+            self.dropped += 1
+            with self._lock:
+                self._arrivals.remove(t)
+
+    def line_read(self, line):
+        """Record the latency of a line main.py took from the ring."""
+        now = time.monotonic()
+        with self._lock:
+            if self._arrivals:
+                self.latencies.append(now - self._arrivals.pop(0))
+
+
+def _pct(values, p):
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(len(values) - 1, int(p / 100 * len(values)))]
+
+
+def records(args):
+    gen_args = types.SimpleNamespace(
+        seconds=args.seconds, rate=str(args.rate), baud=115200, burst=0, burst_every=10.0,
+        malformed=0.0, transition_every=None, wifi_flap=0.0, settime_every=60.0,
+        epoch=1767225600, framed=False, seed=args.seed)
+    return list(loadgen.LoadGenerator(gen_args).lines())
+
+
+def run_mode(mode, args):
+    """Run main.py in this process and return its latencies (seconds)."""
+    port = TimedPort(args.rxbuf)
+    machine.bind_uart(0, port)
+    os.chdir(hostenv.ROOT_DIR)  # main.py opens layouts.json relative to cwd
+
+    sleep = time.sleep
+    time.sleep = lambda s: None  # Skip the 2 s welcome screen
+    with contextlib.redirect_stdout(io.StringIO()):
+        import main
+    time.sleep = sleep
+
+    rx = main.rx
+    rx_readline = rx.readline
+
+    def timed_readline():
+        line = rx_readline()
+        if line:
+            port.line_read(line)
+        return line
+
+    rx.readline = timed_readline
+    port.ring = rx
+
+    spi = main.lcd.spi
+    spi.baudrate = int(args.spi_mhz * 1e6)
+    spi_write = spi.write
+    byte_s = 8 / (args.spi_mhz * 1e6)
+
+    def timed_spi_write(buf):
+        time.sleep(len(buf) * byte_s)
+        spi_write(buf)
+
+    spi.write = timed_spi_write
+
+    touches = []       # Touch times waiting for cycle_mode()
+    shown = []         # Touch times waiting for their full frame
+    touch_latency = []
+    frame_latency = []
+    cycle_mode = main.cycle_mode
+    update_display_for_mode = main.update_display_for_mode
+
+    def timed_cycle_mode():
+        cycle_mode()
+        if touches:
+            t = touches.pop(0)
+            touch_latency.append(time.monotonic() - t)
+            shown.append(t)
+
+    def timed_update_display_for_mode(*args):
+        update_display_for_mode(*args)
+        now = time.monotonic()
+        while shown:
+            frame_latency.append(now - shown.pop(0))
+
+    main.cycle_mode = timed_cycle_mode
+    main.update_display_for_mode = timed_update_display_for_mode
+
+    stream = records(args)
+    done = threading.Event()
+
+    def feed():
+        start = time.monotonic()
+        next_touch = args.touch_every
+        for t, line in stream:
+            while next_touch <= t:
+                delay = start + next_touch - time.monotonic()
+                if delay > 0:
+                    sleep(delay)
+                touches.append(time.monotonic())
+                main.touch.Flag = 1
+                next_touch += args.touch_every
+            delay = start + t - time.monotonic()
+            if delay > 0:
+                sleep(delay)
+            port.deliver(line)
+        sleep(0.5)
+        done.set()
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        if mode == 'dual':
+            main.start_render_core()
+        threading.Thread(target=feed, daemon=True).start()
+        passes = 0
+        while not done.is_set():
+            main.main_loop_pass()
+            passes += 1
+            main.wait_for_work()  # As main.py's own loop
+
+    return {
+        'lines': port.latencies,
+        'dropped': port.dropped,
+        'touch': touch_latency,
+        'frame': frame_latency,
+        'passes': passes,
+        'published': main.frames.published,
+        'skipped': main.frames.skipped(),
+    }
+
+
+def report(results):
+    print('%-16s %-7s %8s %8s %8s %8s' % ('latency ms', 'mode', 'count', 'p50', 'p95', 'max'))
+    for key, label in (('lines', 'line'), ('touch', 'touch'), ('frame', 'touch to frame')):
+        for mode, r in results.items():
+            ms = [x * 1000 for x in r[key]]
+            print('%-16s %-7s %8d %8.1f %8.1f %8.1f'
+                  % (label, mode, len(ms), _pct(ms, 50), _pct(ms, 95), max(ms) if ms else 0))
+    print()
+    for mode, r in results.items():
+        print('%-7s passes %d, snapshots published %d (%d replaced before drawn), '
+              'lines dropped %d' % (mode, r['passes'], r['published'], r['skipped'], r['dropped']))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--seconds', type=float, default=20, help='length of each run')
+    parser.add_argument('--rate', type=float, default=5, help='telemetry sets per second')
+    parser.add_argument('--touch-every', type=float, default=1.5, help='seconds between touches')
+    parser.add_argument('--spi-mhz', type=float, default=75,
+                        help='SPI clock (the rp2 caps the driver\'s 100 MHz at clk_peri / 2)')
+    parser.add_argument('--rxbuf', type=int, default=256, help='device UART receive buffer')
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--child', choices=('single', 'dual'), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        result = run_mode(args.child, args)
+        sys.stdout.write(json.dumps(result) + '\n')
+        sys.stdout.flush()
+        os._exit(0)  # Don't wait for the render thread
+
+    results = {}
+    for mode in ('single', 'dual'):
+        print('Running %s (%.0f s)...' % (mode, args.seconds), file=sys.stderr)
+        out = subprocess.run([sys.executable, os.path.abspath(__file__), '--child', mode]
+                             + sys.argv[1:], stdout=subprocess.PIPE, check=True).stdout
+        results[mode] = json.loads(out.decode().strip().splitlines()[-1])
+    report(results)
+
+
+if __name__ == '__main__':
+    main()
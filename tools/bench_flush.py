@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Blocking vs. DMA flushes of LCD_1inch28 on a virtual clock.
+
+Draws a stream of frames from layouts.json with the real LCD_1inch28
+class on the stand-in machine/framebuf/rp2 modules, once with blocking
+spi.write() flushes (dma=False) and once with the double-buffered DMA
+flush. Device time is simulated: drawing takes the host time multiplied
+by --cost-scale (or a fixed --draw-ms), and SPI transfers take
+len * 8 / baudrate at the driver's configured clock (--spi-mhz to
+override). With DMA, drawing the next frame overlaps the transfer of
+the previous one; only LCD_1inch28.wait() holds the CPU.
+
+Workloads:
+    full      every frame redraws a whole page and show()s it (page
+              changes, Battery page)
+    partial   every frame changes the values and flushes only the
+              damaged rectangles (render_dirty -> show_rect)
+
+Usage:
+    python3 tools/bench_flush.py [--frames 200] [--cost-scale 20]
+        [--draw-ms 5] [--spi-mhz 100] [--page SystemInfo]
+"""
+
+import argparse
+import os
+import time
+
+import hostenv
+
+clock = hostenv.use_virtual_clock()
+
+from LCD_1inch28 import LCD_1inch28  # noqa: E402
+from display_list import load  # noqa: E402
+
+
+class Meter:
+    """Splits the virtual time of a run into drawing and SPI waits."""
+
+    def __init__(self, lcd, args):
+        self.args = args
+        self.draw_s = 0.0
+        self.blocked_s = 0.0
+        self._t0 = None  # Host time drawing started (inside draw())
+        spi = lcd.spi
+        if args.spi_mhz:
+            spi.baudrate = int(args.spi_mhz * 1e6)
+        spi_write = spi.write
+
+        def timed_spi_write(buf):
+            seconds = len(buf) * 8 / spi.baudrate
+            self.blocked_s += seconds
+            clock.advance(seconds)
+            spi_write(buf)
+
+        spi.write = timed_spi_write
+        if lcd._dma is not None:
+            wait = lcd.wait
+
+            def timed_wait():
+                t0 = clock.now
+                wait()
+                self.blocked_s += clock.now - t0
+
+            lcd.wait = timed_wait
+
+        # render_dirty() flushes box by box: charge the drawing done so far
+        # before each flush so it overlaps the previous transfer correctly
+        show_rect = lcd.show_rect
+
+        def timed_show_rect(x, y, w, h):
+            self._charge()
+            show_rect(x, y, w, h)
+            if args.draw_ms is None:
+                self._t0 = time.perf_counter()
+
+        lcd.show_rect = timed_show_rect
+
+    def _charge(self):
+        if self._t0 is None:
+            return
+        seconds = (time.perf_counter() - self._t0) * self.args.cost_scale
+        self._t0 = None
+        self.draw_s += seconds
+        clock.advance(seconds)
+
+    def draw(self, fn, *args):
+        """Run a drawing call and charge its device time (SPI excluded)."""
+        if self.args.draw_ms is not None:
+            # Fixed cost, charged before the frame's flushes
+            self.draw_s += self.args.draw_ms / 1000
+            clock.advance(self.args.draw_ms / 1000)
+            fn(*args)
+            return
+        self._t0 = time.perf_counter()
+        fn(*args)
+        self._charge()
+
+
+def run(dma, workload, args):
+    lcd = LCD_1inch28(dma=dma)
+    layouts = load(os.path.join(hostenv.ROOT_DIR, 'layouts.json'))
+    page = layouts.page(args.page)
+    voltage = layouts.slot('voltage')
+    current = layouts.slot('current')
+    temp = layouts.slot('temp')
+    soc = layouts.slot('soc')
+    layouts.render(lcd, page)
+    lcd.show()
+    lcd.wait()
+
+    meter = Meter(lcd, args)
+    spi_bytes = lcd.spi.bytes_written
+    start = clock.now
+    for i in range(args.frames):
+        layouts.set(voltage, 48000 + (i * 37) % 8000)
+        layouts.set(current, -15000 + (i * 1237) % 30000)
+        layouts.set(temp, 20000 + (i * 300) % 10000)
+        layouts.set(soc, i % 101)
+        if workload == 'full':
+            meter.draw(layouts.render, lcd, page)
+            lcd.show()
+        else:
+            # Draws and flushes each damaged box in turn
+            meter.draw(layouts.render_dirty, lcd, page)
+    lcd.wait()
+    total = clock.now - start
+    return {
+        'frames': args.frames,
+        'seconds': total,
+        'draw': meter.draw_s,
+        'blocked': meter.blocked_s,
+        'bytes': lcd.spi.bytes_written - spi_bytes,
+        'waits': lcd.flush_waits,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--frames', type=int, default=200)
+    parser.add_argument('--cost-scale', type=float, default=20.0,
+                        help='device draw time = host draw time x this')
+    parser.add_argument('--draw-ms', type=float, help='fixed device draw time per frame')
+    parser.add_argument('--spi-mhz', type=float, help='SPI clock (default: the driver\'s 100 MHz)')
+    parser.add_argument('--page', default='SystemInfo')
+    args = parser.parse_args()
+
+    print('%-8s %-9s %9s %9s %10s %10s %9s'
+          % ('workload', 'flush', 'frame ms', 'fps', 'draw ms', 'blocked ms', 'KB/frame'))
+    for workload in ('full', 'partial'):
+        for dma in (False, True):
+            r = run(dma, workload, args)
+            n = r['frames']
+            print('%-8s %-9s %9.2f %9.1f %10.2f %10.2f %9.1f'
+                  % (workload, 'dma' if dma else 'blocking', r['seconds'] / n * 1000,
+                     n / r['seconds'], r['draw'] / n * 1000, r['blocked'] / n * 1000,
+                     r['bytes'] / n / 1024))
+    print()
+    print('blocked = CPU time spent in SPI transfers (blocking) or waiting for the '
+          'previous DMA flush (dma)')
+
+
+if __name__ == '__main__':
+    main()
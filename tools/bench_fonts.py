@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+Memory and draw cost of the bitmap fonts: row-int dicts vs. fonts.Font.
+
+The font modules used to hold each glyph as a list of row ints in a
+dict, drawn with one lcd.pixel() call per set pixel. They now hold one
+fonts.Font over glyph bytes, drawn with one blit per character. This
+rebuilds the old representation of each font from its glyphs (the same
+source the modules had) and compares, per font:
+
+    source KB   size of the module source
+    heap KB     Python heap held after executing the module (tracemalloc)
+    compile ms  host time to compile the module source (the device parses
+                and compiles a .py font module on import the same way)
+    est. KB     estimated MicroPython heap for the glyph data: 4 bytes per
+                row int plus list and dict entry overhead, vs. the glyph
+                bytearray plus one FrameBuffer view per glyph (the palette
+                is shared by all fonts)
+    calls       framebuf calls to draw the test string (pixel() per set
+                pixel vs. blit() per character): on the device each call
+                is a trip through the interpreter, the pixels themselves
+                are C either way
+    host ms     draw time of the test string on the host (the stand-in
+                blit writes a glyph a row at a time, like the device's C
+                blit, where the old loop makes a pixel() call per pixel)
+
+All figures are host measurements except est. KB; nothing here is
+measured on the device.
+
+Both draws must produce the same framebuffer.
+
+Usage:
+    python3 tools/bench_fonts.py [--text 12:34] [--repeat 20]
+"""
+
+import argparse
+import time
+import tracemalloc
+
+import hostenv
+
+hostenv.install()
+
+import bitmap_fonts  # noqa: E402
+import bitmap_fonts_32  # noqa: E402
+import bitmap_fonts_48  # noqa: E402
+from LCD_1inch28 import LCD_1inch28  # noqa: E402
+
+FONTS = (('16x24', bitmap_fonts), ('24x32', bitmap_fonts_32), ('24x48', bitmap_fonts_48))
+
+
+def glyph_rows(font):
+    """Dictionary char -> list of row ints (the old module layout)."""
+    rows = {}
+    shift = font.row_bytes * 8 - font.width
+    for i, char in enumerate(font.chars):
+        glyph = font.glyphs[i * font.glyph_bytes:(i + 1) * font.glyph_bytes]
+        rows[char] = [int.from_bytes(glyph[r:r + font.row_bytes], 'big') >> shift
+                      for r in range(0, len(glyph), font.row_bytes)]
+    return rows
+
+
+def old_source(font):
+    """Module source in the old format: a dict of lists of binary literals."""
+    lines = ['LARGE_DIGITS = {']
+    for char, rows in glyph_rows(font).items():
+        lines.append('    %r: [' % char)
+        lines.extend('        0b%s,' % format(row, '0%db' % font.width) for row in rows)
+        lines.append('    ],')
+    lines.append('}')
+    return '\n'.join(lines) + '\n'
+
+
+def compile_ms(source, repeat):
+    return best_ms(repeat, compile, source, '<font>', 'exec')
+
+
+def held_heap(source):
+    """Heap bytes still held after executing source (its module namespace)."""
+    code = compile(source, '<font>', 'exec')
+    tracemalloc.start()
+    namespace = {}
+    exec(code, namespace)
+    held = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return held
+
+
+def old_draw(lcd, rows, width, text, x, y, color, spacing):
+    """The old modules' draw_text: a pixel() call per set pixel."""
+    current_x = x
+    for char in text:
+        bitmap = rows.get(char)
+        if bitmap is not None:
+            for row_idx, row_data in enumerate(bitmap):
+                for col in range(width):
+                    if row_data & (1 << (width - 1 - col)):
+                        lcd.pixel(current_x + col, y + row_idx, color)
+        current_x += width + spacing
+
+
+def estimate_old(font):
+    # Row ints are small ints stored in the list slots; list object and
+    # one dict entry with a one-character str key per glyph
+    return len(font.chars) * (font.height * 4 + 32 + 16)
+
+
+def estimate_new(font):
+    # Glyph bytearray (the module's bytes literal is garbage after import),
+    # one FrameBuffer (about 32 bytes) per glyph; the 2x1 palette is
+    # shared by all fonts
+    return len(font.glyphs) + 32 * len(font.chars)
+
+
+class CallCounter:
+    """Counts the framebuf calls a draw makes on an LCD."""
+
+    def __init__(self, lcd):
+        self.calls = 0
+        for name in ('pixel', 'blit'):
+            setattr(self, name, self._counted(getattr(lcd, name)))
+
+    def _counted(self, fn):
+        def call(*args):
+            self.calls += 1
+            return fn(*args)
+        return call
+
+
+def best_ms(repeat, fn, *args):
+    best = None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn(*args)
+        elapsed = (time.perf_counter() - t0) * 1000
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--text', default='12:34')
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    lcd_old = LCD_1inch28(clear=False)
+    lcd_new = LCD_1inch28(clear=False)
+    print('Drawing %r:' % args.text)
+    print('%-6s %-8s %10s %10s %9s %8s %7s %9s' % ('font', 'layout', 'source KB', 'compile ms',
+                                                 'heap KB', 'est. KB', 'calls', 'host ms'))
+    for size, module in FONTS:
+        font = module.FONT
+        rows = glyph_rows(font)
+        text = ''.join(c for c in args.text if font.has_char(c)) or font.chars[:4]
+        spacing = font.spacing
+
+        with open(module.__file__) as f:
+            new_src = f.read()
+        old_src = old_source(font)
+
+        lcd_old.fill(0)
+        lcd_new.fill(0)
+        counter = CallCounter(lcd_old)
+        old_draw(counter, rows, font.width, text, 10, 100, 0xFFFF, spacing)
+        old_calls = counter.calls
+        counter = CallCounter(lcd_new)
+        font.draw(counter, text, 10, 100, 0xFFFF, spacing)
+        new_calls = counter.calls
+        same = bytes(lcd_old.buffer) == bytes(lcd_new.buffer)
+
+        old_ms = best_ms(args.repeat, old_draw, lcd_old, rows, font.width, text, 10, 100,
+                         0xFFFF, spacing)
+        new_ms = best_ms(args.repeat, font.draw, lcd_new, text, 10, 100, 0xFFFF, spacing)
+
+        print('%-6s %-8s %10.1f %10.2f %9.1f %8.1f %7d %9.3f'
+              % (size, 'rows', len(old_src) / 1024, compile_ms(old_src, args.repeat),
+                 held_heap(old_src) / 1024, estimate_old(font) / 1024, old_calls, old_ms))
+        print('%-6s %-8s %10.1f %10.2f %9.1f %8.1f %7d %9.3f  %s'
+              % ('', 'Font', len(new_src) / 1024, compile_ms(new_src, args.repeat),
+                 held_heap(new_src) / 1024, estimate_new(font) / 1024, new_calls, new_ms,
+                 'same pixels' if same else 'PIXELS DIFFER'))
+
+
+if __name__ == '__main__':
+    main()
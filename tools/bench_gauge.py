@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Battery page SOC updates: full frame vs. changed gauge segments only.
+
+Walks the SOC down from 100 to 0 and back up in --step increments, as a
+discharge/charge cycle reported by the BMV, and draws each value three
+ways with the real LCD_1inch28 and BatteryMonitor classes on the
+stand-in modules (virtual clock and SPI timing from bench_flush.py):
+
+    full (arc)     what every update did before: background image, all
+                   segments drawn pixel by pixel with trigonometry, show()
+    full (spans)   BatteryMonitor.render(): the same frame, segments drawn
+                   from their precomputed row spans
+    partial        BatteryMonitor.update_gauge(): only the segments whose
+                   state changed, each flushed with show_rect()
+
+Per update it reports the device time (drawing = host time x --cost-scale,
+plus SPI), the CPU time blocked on SPI and the bytes sent. Updates where
+no segment changes cost nothing on the partial path. After every partial
+update the framebuffer must match a full render of the same SOC.
+
+Usage:
+    python3 tools/bench_gauge.py [--step 1] [--cost-scale 20] [--spi-mhz 100]
+        [--blocking]
+"""
+
+import argparse
+import hashlib
+
+from bench_flush import Meter, clock
+
+from LCD_1inch28 import LCD_1inch28  # noqa: E402
+from battery_monitor import BatteryMonitor  # noqa: E402
+from image_display import load_image_to_framebuffer  # noqa: E402
+
+
+def soc_walk(step):
+    down = list(range(100, -1, -step))
+    return down + down[-2::-1]
+
+
+def full_arc(monitor, soc):
+    """The frame as rendered before segment spans (per-pixel arcs)."""
+    gauge = monitor.gauge
+    load_image_to_framebuffer(monitor.lcd, monitor.background())
+    filled = gauge.filled_count(soc)
+    for i, (start_deg, end_deg) in enumerate(gauge.segment_angles):
+        gauge._draw_thick_arc(start_deg, end_deg,
+                              gauge.color if i < filled else gauge.background_color)
+
+
+def run(path, walk, args):
+    lcd = LCD_1inch28(dma=not args.blocking)
+    monitor = BatteryMonitor(lcd)
+    monitor.render(walk[0])
+    lcd.wait()
+
+    meter = Meter(lcd, args)
+    spi_bytes = lcd.spi.bytes_written
+    start = clock.now
+    for soc in walk[1:]:
+        if path == 'full (arc)':
+            meter.draw(full_arc, monitor, soc)
+            lcd.show()
+        elif path == 'full (spans)':
+            meter.draw(monitor.render, soc, False)
+            lcd.show()
+        else:
+            meter.draw(monitor.update_gauge, soc)
+    lcd.wait()
+    return {
+        'seconds': clock.now - start,
+        'blocked': meter.blocked_s,
+        'bytes': lcd.spi.bytes_written - spi_bytes,
+    }
+
+
+def check(walk):
+    """Partial updates must leave the same frame as full renders."""
+    lcd = LCD_1inch28()
+    ref = LCD_1inch28()
+    monitor = BatteryMonitor(lcd)
+    reference = BatteryMonitor(ref, images=monitor.images)
+    monitor.render(walk[0])
+    for soc in walk[1:]:
+        monitor.update_gauge(soc)
+        reference.render(soc)
+        if bytes(lcd.buffer) != bytes(ref.buffer):
+            return 'DIFFERENT at SOC %d' % soc
+    return 'identical (%s)' % hashlib.sha1(bytes(lcd.buffer)).hexdigest()[:12]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--step', type=int, default=1, help='SOC change per update')
+    parser.add_argument('--cost-scale', type=float, default=20.0,
+                        help='device draw time = host draw time x this')
+    parser.add_argument('--spi-mhz', type=float, help='SPI clock (default: the driver\'s 100 MHz)')
+    parser.add_argument('--blocking', action='store_true', help='blocking flushes instead of DMA')
+    args = parser.parse_args()
+    args.draw_ms = None
+
+    walk = soc_walk(args.step)
+    n = len(walk) - 1
+    print('%d SOC updates (%d%% steps), %s flushes:'
+          % (n, args.step, 'blocking' if args.blocking else 'dma'))
+    print('%-13s %10s %10s %12s %10s' % ('path', 'ms/update', 'blocked ms', 'bytes/update',
+                                         'KB total'))
+    for path in ('full (arc)', 'full (spans)', 'partial'):
+        r = run(path, walk, args)
+        print('%-13s %10.2f %10.2f %12d %10.1f'
+              % (path, r['seconds'] / n * 1000, r['blocked'] / n * 1000, r['bytes'] / n,
+                 r['bytes'] / 1024))
+    print()
+    print('partial frames vs. full renders:', check(walk))
+
+
+if __name__ == '__main__':
+    main()
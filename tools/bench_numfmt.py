@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Benchmark and equivalence check for numfmt against f-string formatting.
+
+Checks that numfmt produces the same text as the f-strings main.py used to
+use, over the full value ranges the display sees:
+    Voltage      0.00 .. 70.00 V
+    Current   -300.00 .. +300.00 A
+    Temperature -40.00 .. +85.00 °C
+    SOC            0 .. 100 %
+
+Values arrive from the Pico with two decimals and are shown with one. The
+old path went float() -> f"{x:.1f}", whose rounding of exact ties (x.x5)
+depends on binary float representation. numfmt rounds ties half away from
+zero; those cases are counted separately and every other value must match.
+
+Runs on CPython (python3 tools/bench_numfmt.py) and on the device
+(mpremote mount . run tools/bench_numfmt.py).
+"""
+
+import sys
+
+sys.path.insert(0, '.')
+sys.path.insert(0, '..')
+
+from numfmt import FixedFormatter, parse_fixed, UNIT_V, UNIT_A, UNIT_PERCENT
+
+try:
+    from time import ticks_us, ticks_diff
+except ImportError:
+    from time import perf_counter
+
+    def ticks_us():
+        return int(perf_counter() * 1000000)
+
+    def ticks_diff(a, b):
+        return a - b
+
+
+def old_current_text(current):
+    """Current text exactly as the old main.py built it."""
+    if current > 0:
+        return f"+{current:.1f}A"
+    elif current < 0:
+        return f"{current:.1f}A"
+    return "0.0A"
+
+
+def check_range(name, lo, hi, unit, plus, suffix):
+    """Compare Pico-string -> display-string over lo..hi in hundredths."""
+    fmt = FixedFormatter()
+    checked = ties = mismatches = 0
+    for hundredths in range(lo, hi + 1):
+        sent = f"{hundredths / 100:.2f}"  # What the Pico puts on the wire
+        value = float(sent)
+        if plus:
+            expected = old_current_text(value)
+        else:
+            expected = f"{value:.1f}{suffix}"
+
+        fmt.format(parse_fixed(sent.encode(), 3), scale=3, decimals=1,
+                   plus=plus, unit=unit)
+        got = str(fmt)
+        checked += 1
+
+        if got != expected:
+            if abs(hundredths) % 10 == 5:
+                ties += 1  # Binary-float tie, numfmt rounds away from zero
+            else:
+                mismatches += 1
+                if mismatches <= 5:
+                    print(f"  MISMATCH {name}: {sent!r} -> {got!r}, f-string {expected!r}")
+
+        # Same-precision formatting must always match exactly
+        fmt.format(hundredths, scale=2, decimals=2)
+        if str(fmt) != f"{hundredths / 100:.2f}":
+            mismatches += 1
+
+    print(f"{name:12s} {checked:6d} values, {ties:4d} float ties, {mismatches} mismatches")
+    return mismatches
+
+
+def check_soc():
+    fmt = FixedFormatter()
+    mismatches = 0
+    for soc in range(0, 101):
+        fmt.format(soc, unit=UNIT_PERCENT)
+        if str(fmt) != f"{soc}%":
+            mismatches += 1
+    print(f"{'SOC':12s} {101:6d} values, {0:4d} float ties, {mismatches} mismatches")
+    return mismatches
+
+
+def bench(label, fn, iterations):
+    start = ticks_us()
+    fn(iterations)
+    elapsed = ticks_diff(ticks_us(), start)
+    per_call = elapsed / iterations
+    print(f"{label:34s} {per_call:8.2f} us/iteration")
+    return per_call
+
+
+def run_fstring(n):
+    voltage = 48.52
+    current = -12.34
+    for _ in range(n):
+        f"{voltage:.1f}V"
+        old_current_text(current)
+
+
+def run_numfmt(n):
+    fmt = FixedFormatter()
+    voltage_mv = 48520
+    current_ma = -12340
+    for _ in range(n):
+        fmt.format(voltage_mv, 3, 1, False, UNIT_V)
+        fmt.format(current_ma, 3, 1, True, UNIT_A)
+
+
+def run_parse_float(n):
+    field = "48.52"
+    for _ in range(n):
+        float(field)
+
+
+def run_parse_fixed(n):
+    line = b"BATSYS:48.52,-12.34,25.50"
+    for _ in range(n):
+        parse_fixed(line, 3, 7, 12)
+
+
+def main():
+    print("=== Equivalence (Pico .2f string -> display .1f text) ===")
+    failures = 0
+    failures += check_range("Voltage", 0, 7000, UNIT_V, False, "V")
+    failures += check_range("Current", -30000, 30000, UNIT_A, True, "A")
+    failures += check_range("Temperature", -4000, 8500, 0, False, "")
+    failures += check_soc()
+
+    iterations = 20000 if sys.implementation.name != 'micropython' else 2000
+    print()
+    print(f"=== Timing ({iterations} iterations, 2 values per iteration) ===")
+    t_old = bench("f-string format (float)", run_fstring, iterations)
+    t_new = bench("numfmt.format_fixed (int)", run_numfmt, iterations)
+    print(f"{'speedup':34s} {t_old / t_new:8.2f} x")
+    t_old = bench("float() parse", run_parse_float, iterations)
+    t_new = bench("numfmt.parse_fixed", run_parse_fixed, iterations)
+    print(f"{'speedup':34s} {t_old / t_new:8.2f} x")
+
+    if failures:
+        print(f"\nFAILED: {failures} mismatches")
+        sys.exit(1)
+    print("\nAll values match")
+
+
+main()
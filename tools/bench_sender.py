@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+Link bytes saved by pico_sender.ChangeSender against a recorded stream.
+
+Takes a Pico -> display capture (tools/uart_record.py or
+tools/loadgen.py --out) that resends every value each period, rebuilds
+the values the Pico had at each moment and feeds them to ChangeSender on
+a virtual clock (service() every 10 ms, like the Pico loop). Commands
+the sender does not manage (WIFI, SETTIME, ...) pass through unchanged.
+
+Reports bytes/second and lines per command for both streams (framing
+overhead included if the capture is framed), and how closely the
+display's view tracks the true values: the largest difference seen per
+value and the longest time a value stayed outside its deadband (held
+back by the per-command rate limit).
+
+Without a capture, a 10 minute 1 Hz stream from tools/loadgen.py is
+used (the PICO_INTEGRATION.md example's send pattern):
+
+    python3 tools/bench_sender.py [capture.txt] [--keepalive 10]
+        [--dv 0.05] [--di 0.1] [--dt 0.5] [--dsoc 1]
+        [--batsys-interval 0.25] [--battery-interval 1]
+"""
+
+import argparse
+import types
+
+import hostenv
+
+clock = hostenv.use_virtual_clock()
+
+import loadgen  # noqa: E402
+from numfmt import parse_fixed  # noqa: E402
+from pico_sender import ChangeSender  # noqa: E402
+from uart_link import decode_frame  # noqa: E402
+from uartcap import read_capture  # noqa: E402
+
+TICK = 0.010  # Pico loop period
+
+# Managed commands: key -> (value names, scales, decimals)
+FIELDS = {
+    b'BATTERY': (('soc',), (0,), (0,)),
+    b'BATSYS': (('voltage', 'current', 'temp'), (3, 3, 3), (2, 2, 1)),
+    b'CHARGING': (('charging',), (0,), (0,)),
+}
+
+
+def generated_records(seconds, rate, seed):
+    args = types.SimpleNamespace(
+        seconds=seconds, rate=str(rate), baud=115200, burst=0, burst_every=10.0,
+        malformed=0.0, transition_every=None, wifi_flap=0.0, settime_every=60.0,
+        epoch=1767225600, framed=False, seed=seed)
+    return list(loadgen.LoadGenerator(args).lines())
+
+
+def payload_of(line):
+    """Command payload of a capture line (framed or legacy), or None."""
+    if line[:1] == b'@':
+        seq, payload = decode_frame(line)
+        return payload if seq >= 0 else None
+    return line.rstrip(b'\r\n')
+
+
+def run(records, args):
+    deadbands = {
+        b'BATTERY': (int(args.dsoc),),
+        b'BATSYS': (round(args.dv * 1000), round(args.di * 1000), round(args.dt * 1000)),
+        b'CHARGING': (0,),
+    }
+    intervals = {
+        b'BATTERY': int(args.battery_interval * 1000),
+        b'BATSYS': int(args.batsys_interval * 1000),
+        b'CHARGING': 0,
+    }
+    sent_lines = {}
+    display = {}   # key -> last values the display received
+
+    def send(payload):
+        key = payload.split(b':', 1)[0]
+        sent_lines[key] = sent_lines.get(key, 0) + 1
+        scales = FIELDS[key][1]
+        parts = payload.split(b':', 1)[1].split(b',')
+        display[key] = [parse_fixed(p, s) for p, s in zip(parts, scales)]
+
+    sender = ChangeSender(send, keepalive_ms=int(args.keepalive * 1000))
+    cmds = {key: sender.add(key, deadbands[key], FIELDS[key][1], FIELDS[key][2],
+                            intervals[key]) for key in FIELDS}
+
+    original_bytes = 0
+    passthrough_bytes = 0
+    framed = False
+    original_lines = {}
+    truth = {}
+    max_error = {}
+    outside_since = {}
+    longest_outside = {}
+
+    def check():
+        now = clock.now
+        for key, values in truth.items():
+            shown = display.get(key)
+            names = FIELDS[key][0]
+            for j, name in enumerate(names):
+                err = abs(values[j] - shown[j]) if shown else abs(values[j])
+                max_error[name] = max(max_error.get(name, 0), err)
+                band = deadbands[key][j]
+                if err > 0 and err >= band:
+                    outside_since.setdefault(name, now)
+                elif name in outside_since:
+                    span = now - outside_since.pop(name)
+                    longest_outside[name] = max(longest_outside.get(name, 0.0), span)
+
+    records = sorted(records, key=lambda r: r[0])
+    start = records[0][0] if records else 0.0
+    clock.advance_to(0.0)
+    for t, line in records:
+        t -= start
+        # Pico loop ticks up to this record
+        while clock.now + TICK <= t:
+            clock.advance(TICK)
+            sender.service()
+            check()
+        clock.advance_to(max(t, clock.now))
+        original_bytes += len(line)
+        payload = payload_of(line)
+        if payload is None:
+            continue
+        framed = framed or line[:1] == b'@'
+        key = payload.split(b':', 1)[0]
+        original_lines[key] = original_lines.get(key, 0) + 1
+        if key not in FIELDS:
+            passthrough_bytes += len(line)
+            continue
+        parts = payload.split(b':', 1)[1].split(b',')
+        try:
+            values = [parse_fixed(p, s) for p, s in zip(parts, FIELDS[key][1])]
+        except ValueError:
+            continue
+        if len(values) != len(FIELDS[key][0]):
+            continue
+        truth[key] = values
+        sender.set(cmds[key], *values)
+        sender.service()
+        check()
+    for _ in range(int(1 / TICK)):
+        clock.advance(TICK)
+        sender.service()
+        check()
+    for name, since in outside_since.items():
+        longest_outside[name] = max(longest_outside.get(name, 0.0), clock.now - since)
+
+    span = clock.now
+    # Acknowledged-mode frames add '@SS' and '*CC' to every line
+    new_bytes = sender.bytes + (6 * sender.lines if framed else 0) + passthrough_bytes
+    print('Stream: %.1f s, %d lines' % (span, sum(original_lines.values())))
+    print()
+    print('%-10s %10s %10s' % ('command', 'recorded', 'sent'))
+    for key in sorted(original_lines):
+        sent = sent_lines.get(key, 0) if key in FIELDS else original_lines[key]
+        print('%-10s %10d %10d' % (key.decode(), original_lines[key], sent))
+    print()
+    print('Link bytes: recorded %d (%.1f B/s), change-driven %d (%.1f B/s), saved %.0f%%'
+          % (original_bytes, original_bytes / span, new_bytes, new_bytes / span,
+             100.0 * (original_bytes - new_bytes) / original_bytes if original_bytes else 0))
+    print('Sender: %s' % sender.get_status())
+    print()
+    print('%-10s %10s %14s %18s' % ('value', 'deadband', 'max |error|', 'longest outside s'))
+    for key, (names, scales, _) in FIELDS.items():
+        for j, name in enumerate(names):
+            div = 10 ** scales[j]
+            print('%-10s %10g %14g %18.2f' % (name, deadbands[key][j] / div,
+                                              max_error.get(name, 0) / div,
+                                              longest_outside.get(name, 0.0)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('capture', nargs='?', help='uartcap file (default: generated 1 Hz stream)')
+    parser.add_argument('--seconds', type=float, default=600, help='generated stream length')
+    parser.add_argument('--rate', default='1', help='generated telemetry sets per second')
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--keepalive', type=float, default=10, help='resend unchanged commands after this many s')
+    parser.add_argument('--dv', type=float, default=0.05, help='voltage deadband, V')
+    parser.add_argument('--di', type=float, default=0.1, help='current deadband, A')
+    parser.add_argument('--dt', type=float, default=0.5, help='temperature deadband, °C')
+    parser.add_argument('--dsoc', type=float, default=1, help='SOC deadband, %%')
+    parser.add_argument('--batsys-interval', type=float, default=0.25,
+                        help='minimum time between BATSYS lines, s')
+    parser.add_argument('--battery-interval', type=float, default=1.0,
+                        help='minimum time between BATTERY lines, s')
+    args = parser.parse_args()
+
+    if args.capture:
+        records = list(read_capture(args.capture))
+    else:
+        records = generated_records(args.seconds, args.rate, args.seed)
+    run(records, args)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""
+Correctness checks and throughput benchmark for the VE.Direct parser.
+
+Builds a stream of BMV-712 style text blocks (a main block with V, I, P,
+SOC, ... and a history block with H1..H18, each with a valid checksum,
+plus interleaved hex messages), then:
+
+    - feeds it in random chunk sizes and checks every block is parsed
+      with the right field values
+    - corrupts single bytes and checks each damaged block is rejected
+    - measures throughput of vedirect.VEDirectParser against the
+      decode/split line parser from PICO_INTEGRATION.md
+
+Pass a raw VE.Direct capture (e.g. `cat /dev/ttyUSB0 > ve.bin` at
+19200 baud) to benchmark against recorded frames instead:
+
+    python3 tools/bench_vedirect.py [ve.bin] [--blocks 60]
+
+Runs on CPython and on the Pico (mpremote mount . run tools/bench_vedirect.py),
+which has no argparse and always uses the synthetic stream.
+"""
+
+import sys
+
+sys.path.insert(0, '.')
+sys.path.insert(0, '..')
+
+from vedirect import VEDirectParser
+
+try:
+    from time import ticks_us, ticks_diff
+except ImportError:
+    from time import perf_counter
+
+    def ticks_us():
+        return int(perf_counter() * 1000000)
+
+    def ticks_diff(a, b):
+        return a - b
+
+VE_DIRECT_BAUD = 19200
+
+
+class Lcg:
+    """Tiny deterministic RNG (same sequence on MicroPython and CPython)."""
+
+    def __init__(self, seed=1):
+        self.state = seed
+
+    def next(self, n):
+        self.state = (self.state * 1103515245 + 12345) & 0x7FFFFFFF
+        return self.state % n
+
+
+def block(fields):
+    """Encode (label, value) pairs as a text block with its checksum byte."""
+    data = bytearray()
+    for label, value in fields:
+        data += b'\r\n' + label + b'\t' + value
+    data += b'\r\nChecksum\t'
+    data.append((256 - sum(data) % 256) % 256)
+    return bytes(data)
+
+
+def main_fields(i, rng):
+    v = 51200 + rng.next(2000)
+    current = rng.next(40000) - 20000
+    return [
+        (b'PID', b'0xA389'), (b'V', b'%d' % v), (b'VS', b'%d' % (13000 + rng.next(500))),
+        (b'I', b'%d' % current), (b'P', b'%d' % (v * current // 1000000)),
+        (b'CE', b'%d' % -rng.next(100000)), (b'SOC', b'%d' % rng.next(1001)),
+        (b'TTG', b'%d' % rng.next(10000)), (b'Alarm', b'OFF'), (b'Relay', b'OFF'),
+        (b'AR', b'0'), (b'BMV', b'712 Smart'), (b'FW', b'0413'), (b'MON', b'0'),
+        (b'T', b'%d' % (20 + rng.next(10))),
+    ]
+
+
+def history_fields(rng):
+    return [(b'H%d' % k, b'%d' % rng.next(1000000)) for k in range(1, 19)]
+
+
+def build_stream(blocks, rng):
+    """Return (stream bytes, list of expected main-block field lists)."""
+    parts = [b'OT\t1\r\nChecksum\t\x42']  # Start mid-block like a real capture
+    expected = []
+    for i in range(blocks):
+        fields = main_fields(i, rng)
+        expected.append(fields)
+        parts.append(block(fields))
+        if i % 5 == 4:
+            parts.append(b':A0102000543\n')  # Async hex message between blocks
+        expected.append(None)  # History block
+        parts.append(block(history_fields(rng)))
+    return b''.join(parts), expected
+
+
+def check_chunked(stream, expected, rng):
+    got = []
+    parser = VEDirectParser(on_frame=lambda f: got.append(
+        [(f.label_at(i), f.value_at(i)) for i in range(f.n)]))
+    pos = 0
+    while pos < len(stream):
+        n = 1 + rng.next(64)
+        parser.feed(stream[pos:pos + n])
+        pos += n
+    mismatches = 0
+    main_blocks = [f for f in expected if f is not None]
+    parsed_main = [f for f in got if f[0][0] == b'PID']
+    if len(parsed_main) != len(main_blocks):
+        mismatches += 1
+    for a, b in zip(parsed_main, main_blocks):
+        if a != b:
+            mismatches += 1
+    print("Chunked feed:  %d frames, %d hex messages, %d checksum errors, %d mismatches"
+          % (parser.frames, parser.hex_messages, parser.checksum_errors, mismatches))
+    return mismatches + parser.checksum_errors
+
+
+def check_corruption(rng, trials=200):
+    """Flip one byte per block; the parser must reject every damaged block."""
+    accepted = 0
+    for _ in range(trials):
+        good = block(main_fields(0, rng))
+        bad = bytearray(good)
+        k = 2 + rng.next(len(bad) - 2)
+        bad[k] = (bad[k] + 1 + rng.next(255)) & 0xFF
+        parser = VEDirectParser()
+        parser.feed(good)  # Sync on a good block first
+        before = parser.frames
+        parser.feed(bytes(bad) + good)
+        # The damaged block must not count; the following good one may
+        # or may not survive depending on where the damage landed
+        if parser.frames - before > 1:
+            accepted += 1
+    print("Corruption:    %d single-byte errors, %d accepted" % (trials, accepted))
+    return accepted
+
+
+def naive_parse(data, store, line_buffer):
+    """Line parser as in PICO_INTEGRATION.md (decode + split, no checksum)."""
+    line_buffer += data.decode('utf-8', 'ignore')
+    while '\n' in line_buffer:
+        line, line_buffer = line_buffer.split('\n', 1)
+        line = line.strip()
+        if '\t' in line:
+            key, value = line.split('\t', 1)
+            if key in store:
+                try:
+                    store[key] = int(value)
+                except ValueError:
+                    pass
+    return line_buffer
+
+
+def bench(label, fn, stream, repeats):
+    start = ticks_us()
+    for _ in range(repeats):
+        fn(stream)
+    elapsed = ticks_diff(ticks_us(), start)
+    rate = len(stream) * repeats / (elapsed / 1000000)
+    print("%-34s %10.0f bytes/s  (%5.1fx line rate)" % (label, rate, rate / (VE_DIRECT_BAUD / 10)))
+    return rate
+
+
+def parse_args():
+    """Return (capture bytes or None, synthetic block count)."""
+    try:
+        import argparse
+    except ImportError:
+        return None, 60  # MicroPython
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('capture', nargs='?',
+                        help='raw VE.Direct capture to benchmark (default: synthetic stream)')
+    parser.add_argument('--blocks', type=int, default=60,
+                        help='main/history block pairs in the synthetic stream')
+    args = parser.parse_args()
+    if args.capture is None:
+        return None, args.blocks
+    try:
+        with open(args.capture, 'rb') as f:
+            return f.read(), args.blocks
+    except OSError as e:
+        parser.error("cannot read %s: %s" % (args.capture, e))
+
+
+def main():
+    rng = Lcg(7)
+    failures = 0
+    capture, blocks = parse_args()
+    if capture is not None:
+        stream = capture
+        print("Recorded stream: %d bytes" % len(stream))
+    else:
+        stream, expected = build_stream(blocks, rng)
+        print("=== Correctness (%d bytes, %d blocks) ===" % (len(stream), len(expected)))
+        failures += check_chunked(stream, expected, rng)
+        failures += check_corruption(rng)
+
+    repeats = 20 if sys.implementation.name != 'micropython' else 2
+    chunk = 64  # Typical UART read size
+
+    def run_parser(data):
+        parser = VEDirectParser()
+        buf = memoryview(data)
+        for pos in range(0, len(buf), chunk):
+            parser.feed(buf[pos:pos + chunk])
+
+    def run_naive(data):
+        store = {'V': 0, 'I': 0, 'SOC': 0, 'T': 0, 'CS': 0}
+        line_buffer = ""
+        for pos in range(0, len(data), chunk):
+            line_buffer = naive_parse(data[pos:pos + chunk], store, line_buffer)
+
+    print()
+    print("=== Throughput (%d bytes x %d, %d byte chunks) ===" % (len(stream), repeats, chunk))
+    bench("vedirect.VEDirectParser", run_parser, stream, repeats)
+    bench("decode/split (no checksum)", run_naive, stream, repeats)
+
+    if failures:
+        print("\nFAILED")
+        sys.exit(1)
+    print("\nAll checks passed")
+
+
+main()
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Time from a wake event to the first frame on the panel after idle sleep.
+
+Imports main.py on the host (stand-in machine/rp2 modules, real clock),
+then for every page: lets the idle policy dim and sleep the display,
+waits until the panel has slept a while, touches the screen and runs
+main loop passes until the render side reports the page on the panel
+(main.last_wake_ms, measured on the device the same way).
+
+The wake sequence is sleep out, draw the page and flush it (DMA at
+--spi-mhz) while the GC9A01 settles, then display on and backlight, so
+the first frame costs max(settle, draw + flush) rather than the sum.
+Host drawing is faster than the device's; --draw-ms adds a fixed device
+draw time per frame to see where drawing starts to exceed the settle time.
+
+Usage:
+    python3 tools/bench_wake.py [--wakes 5] [--spi-mhz 75] [--draw-ms 0]
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import time
+
+import hostenv
+
+hostenv.install()
+
+
+def _pct(values, p):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(p / 100 * len(values)))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--wakes', type=int, default=5, help='wakes per page')
+    parser.add_argument('--spi-mhz', type=float, default=75,
+                        help='SPI clock (the rp2 caps the driver\'s 100 MHz at clk_peri / 2)')
+    parser.add_argument('--draw-ms', type=float, default=0, help='extra device draw time per frame')
+    args = parser.parse_args()
+
+    os.chdir(hostenv.ROOT_DIR)  # main.py opens layouts.json relative to cwd
+    sleep = time.sleep
+    time.sleep = lambda s: None  # Skip the 2 s welcome screen
+    with contextlib.redirect_stdout(io.StringIO()):
+        import main
+    time.sleep = sleep
+    from LCD_1inch28 import SLEEP_SETTLE_MS
+
+    main.lcd.spi.baudrate = int(args.spi_mhz * 1e6)
+    if args.draw_ms:
+        update_display_for_mode = main.update_display_for_mode
+
+        def slow_update_display_for_mode(*draw_args):
+            time.sleep(args.draw_ms / 1000)
+            update_display_for_mode(*draw_args)
+
+        main.update_display_for_mode = slow_update_display_for_mode
+
+    # Draw + flush alone, for comparison with the wake time
+    draw_ms = {}
+    results = {}
+    with contextlib.redirect_stdout(io.StringIO()):
+        for page in main.PAGES:
+            main.current_mode = page
+            main.request_redraw()
+            main.main_loop_pass()
+            main.lcd.wait()
+            t0 = time.perf_counter()
+            main.update_display_for_mode(page, main.battery_soc)
+            main.lcd.wait()
+            draw_ms[page] = (time.perf_counter() - t0) * 1000
+
+            results[page] = []
+            for _ in range(args.wakes):
+                main.idle_timeout()  # Dim
+                main.idle_timeout()  # Sleep
+                main.main_loop_pass()
+                sleep(0.15)  # Past the sleep-in settle time
+                main.touch.Flag = 1
+                main.last_touch_time = time.ticks_ms() - 1000
+                main.main_loop_pass()
+                results[page].append(main.last_wake_ms)
+
+    print('%-11s %8s %8s %8s %14s' % ('page', 'wakes', 'p50 ms', 'max ms', 'draw+flush ms'))
+    for page in main.PAGES:
+        ms = results[page]
+        print('%-11s %8d %8d %8d %14.1f'
+              % (page, len(ms), _pct(ms, 50), max(ms), draw_ms[page]))
+    print()
+    print('wake = touch -> display on with the page drawn (GC9A01 settle %d ms)'
+          % SLEEP_SETTLE_MS)
+
+
+if __name__ == '__main__':
+    main()
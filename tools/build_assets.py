@@ -0,0 +1,457 @@
+#!/usr/bin/env python3
+"""
+Incremental asset build: assets.json -> image_data.py + img_*.py (or raw .bin files).
+
+assets.json lists the images and their conversion parameters:
+
+    {
+        "bundle": {"type": "module", "path": "image_data.py"},
+        "defaults": {"size": [240, 240], "gamma": 2.2, "format": "rgb565_brg"},
+        "images": [
+            {"name": "background1", "source": "jatj_v2.png"},
+            {"name": "logo", "source": "art/logo.png", "size": [64, 64], "gamma": 1.0}
+        ]
+    }
+
+Each image's cache key is a hash of its source bytes, its parameters
+and convert_image.py, so only new or changed images are converted (in
+parallel); the others come from .asset_cache/ next to the manifest. The
+bundle is only rewritten when an image, the image list or the bundle
+settings changed.
+
+Formats:
+    rgb565_brg  2 bytes per pixel (the display's RGB565 BRG layout)
+    gs8         1 byte per pixel + a palette of up to 256 RGB565 colours
+    gs4         1/2 byte per pixel + a palette of up to 16 RGB565 colours
+Indexed images with more colours than their palette are quantized (the
+converter prints a note); image_display.py blits them through the palette.
+
+Bundle types:
+    module   an index module (image_data.py: names, formats and sizes,
+             get_image()/get_image_info()/... helpers) and one module per
+             image next to it (img_<name>.py), imported on demand: a tuple
+             of 2 KB bytes chunks (indexed: a (format, w, h, palette,
+             chunks) tuple)
+    bin      a directory with one raw <name>.bin per image (indexed images:
+             the index data, with the palette in <name>.pal) and an
+             index.json of names, formats and sizes; asset_store.BinStore
+             reads it (memory-mapped on a PC)
+
+A module bundle's "chunk_size" (default 2048) sets the bytes per literal.
+0 writes each image as one bytes object: frozen into the firmware it stays
+in flash and asset_store.ModuleStore reads it in place.
+
+Prints per image: size, format, bytes on flash in the bundle and bytes of
+RAM once it is loaded on the device, and whether it was converted.
+
+Usage:
+    python3 tools/build_assets.py [--manifest assets.json] [--force] [--jobs N]
+"""
+
+import argparse
+import hashlib
+import io
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import hostenv
+
+sys.path.insert(0, hostenv.ROOT_DIR)
+
+import convert_image  # noqa: E402
+
+CACHE_DIR = '.asset_cache'  # Next to the manifest
+FORMATS = ('rgb565_brg', 'gs8', 'gs4')
+PARAMS = ('size', 'gamma', 'format')
+BUNDLE_LAYOUT = 2  # Bump when the generated bundle files change shape
+
+MODULE_HEADER = '''\
+# Image Data Module
+# Index of the converted images for display on Waveshare RP2350
+
+# Generated by tools/build_assets.py from assets.json - do not edit.
+# To add or change an image:
+# 1. Add it to assets.json (name, source file, optional size/gamma/format)
+# 2. On your PC, run: python3 tools/build_assets.py
+# 3. Upload this file and the image modules to the RP2350:
+#    mpremote cp image_data.py img_*.py :
+#
+# Each image is in its own module (img_<name>.py), imported only when
+# get_image() asks for it, so importing this index costs a few hundred
+# bytes however many images there are. image_cache.py keeps loaded images
+# within a RAM budget.
+
+import sys
+
+'''
+
+IMAGE_MODULE_HEADER = '''\
+# Image module for image_data.py ({name})
+# Generated by tools/build_assets.py from assets.json - do not edit.
+
+'''
+
+MODULE_FOOTER = '''
+
+def get_image(name):
+    """
+    Load an image by name (imports its module).
+
+    Args:
+        name: String name of the image
+
+    Returns:
+        The image (tuple of bytes chunks, or an indexed image tuple), or
+        None if not found
+
+    Example:
+        img = get_image('background1')
+        if img:
+            display_image_background(lcd, img)
+    """
+    asset = ASSETS.get(name)
+    if asset is None:
+        return None
+    return getattr(__import__(asset[0]), name)
+
+
+def unload_image(name):
+    """
+    Drop an image's module, so its data is freed once nothing else refers to it.
+
+    Args:
+        name: String name of the image
+    """
+    asset = ASSETS.get(name)
+    if asset is not None and asset[0] in sys.modules:
+        del sys.modules[asset[0]]
+
+
+def get_image_info(name):
+    """
+    Get an image's size without loading it.
+
+    Args:
+        name: String name of the image
+
+    Returns:
+        Tuple of (format, width, height, bytes of RAM once loaded), or None
+        if not found. format is 'RGB565', 'GS8' or 'GS4'.
+    """
+    asset = ASSETS.get(name)
+    return asset[1:] if asset else None
+
+
+def get_image_names():
+    """
+    Get list of available image names.
+
+    Returns:
+        List of strings with image names, in assets.json order
+
+    Example:
+        print("Available images:", get_image_names())
+    """
+    return list(NAMES)
+
+
+def get_image_count():
+    """
+    Get number of images available.
+
+    Returns:
+        Integer count of images
+    """
+    return len(NAMES)
+
+
+def has_image(name):
+    """
+    Check if an image exists.
+
+    Args:
+        name: String name of the image
+
+    Returns:
+        True if image exists, False otherwise
+
+    Example:
+        if has_image('background1'):
+            img = get_image('background1')
+    """
+    return name in ASSETS
+'''
+
+
+def load_manifest(path):
+    """
+    Read assets.json.
+
+    Returns:
+        Tuple of (bundle dict, list of entry dicts with name, source, params)
+    """
+    with open(path) as f:
+        spec = json.load(f)
+    base = os.path.dirname(os.path.abspath(path))
+    bundle = dict(spec.get('bundle', {'type': 'module', 'path': 'image_data.py'}))
+    if bundle.get('type') not in ('module', 'bin'):
+        raise ValueError(f"bundle type must be 'module' or 'bin': {bundle.get('type')}")
+    bundle['path'] = os.path.join(base, bundle['path'])
+    bundle['chunk_size'] = int(bundle.get('chunk_size', convert_image.CHUNK_SIZE))
+    defaults = spec.get('defaults', {})
+    entries = []
+    names = set()
+    for image in spec['images']:
+        name = image['name']
+        if not name.isidentifier() or name in names:
+            raise ValueError(f"image name must be a unique identifier: {name!r}")
+        names.add(name)
+        params = {key: image.get(key, defaults.get(key)) for key in PARAMS}
+        params['size'] = list(params['size'] or (240, 240))
+        params['gamma'] = float(params['gamma'] if params['gamma'] is not None else 2.2)
+        params['format'] = params['format'] or 'rgb565_brg'
+        if params['format'] not in FORMATS:
+            raise ValueError(f"{name}: unknown format {params['format']!r} (expected {FORMATS})")
+        entries.append({'name': name, 'source': os.path.join(base, image['source']),
+                        'params': params, 'chunk_size': bundle['chunk_size']})
+    return bundle, entries
+
+
+def tool_hash():
+    """Hash of the converter, so changing it invalidates every cached image."""
+    with open(convert_image.__file__, 'rb') as f:
+        return hashlib.sha256(f.read()).digest()
+
+
+def asset_key(entry, tool):
+    h = hashlib.sha256(tool)
+    h.update(json.dumps([entry['params'], entry['chunk_size']], sort_keys=True).encode())
+    with open(entry['source'], 'rb') as f:
+        h.update(f.read())
+    return h.hexdigest()[:24]
+
+
+def convert_entry(entry):
+    """
+    Convert one image (pool worker).
+
+    Returns:
+        Tuple of (raw bytes, palette bytes or None, Python code fragment,
+        original (width, height))
+    """
+    params = entry['params']
+    code = io.StringIO()
+    if params['format'] in convert_image.INDEXED_FORMATS:
+        data, palette, info = convert_image.convert_image_indexed(
+            entry['source'], entry['name'], params['format'], params['gamma'],
+            size=params['size'])
+        convert_image.generate_indexed_python_code(data, palette, entry['name'],
+                                                   entry['source'], info, file=code,
+                                                   chunk_size=entry['chunk_size'])
+        return bytes(data), palette, code.getvalue(), info['original_size']
+    data, info = convert_image.convert_image_to_rgb565_brg(
+        entry['source'], entry['name'], params['gamma'], size=params['size'])
+    convert_image.generate_python_code(data, entry['name'], entry['source'], info, file=code,
+                                       chunk_size=entry['chunk_size'])
+    return bytes(data), None, code.getvalue(), info['original_size']
+
+
+def _write_atomic(path, data):
+    tmp = path + '.tmp'
+    with open(tmp, 'wb') as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+
+def image_module_name(name):
+    return 'img_' + name
+
+
+def write_module(path, entries, fragments):
+    """
+    Write the index module at path and one img_<name>.py per image next to it.
+
+    Image modules this build no longer lists are removed (only files
+    with the generated header, never hand-written ones).
+    """
+    base = os.path.dirname(path)
+    wanted = set()
+    for entry, fragment in zip(entries, fragments):
+        module = image_module_name(entry['name'])
+        wanted.add(module + '.py')
+        _write_atomic(os.path.join(base, module + '.py'),
+                      (IMAGE_MODULE_HEADER.format(name=entry['name']) + fragment).encode())
+    marker = IMAGE_MODULE_HEADER.split('(')[0]
+    for name in os.listdir(base or '.'):
+        if name.startswith('img_') and name.endswith('.py') and name not in wanted:
+            with open(os.path.join(base, name)) as f:
+                generated = f.readline().startswith(marker)
+            if generated:
+                os.remove(os.path.join(base, name))
+
+    out = [MODULE_HEADER]
+    out.append('# Image name -> (module, format, width, height, bytes of RAM once loaded)\n')
+    out.append('ASSETS = {\n')
+    for entry in entries:
+        w, h = entry['params']['size']
+        out.append(f"    '{entry['name']}': ('{image_module_name(entry['name'])}', "
+                   f"'{entry['tag']}', {w}, {h}, {entry['ram']}),\n")
+    out.append('}\n\n')
+    out.append('NAMES = %r\n' % (tuple(e['name'] for e in entries),))
+    out.append(MODULE_FOOTER)
+    _write_atomic(path, ''.join(out).encode())
+
+
+def write_bin_dir(path, entries, blobs):
+    """Write <name>.bin (+ .pal) per image and index.json, read by asset_store.BinStore."""
+    os.makedirs(path, exist_ok=True)
+    for entry, (blob, palette) in zip(entries, blobs):
+        _write_atomic(os.path.join(path, entry['name'] + '.bin'), blob)
+        if palette is not None:
+            _write_atomic(os.path.join(path, entry['name'] + '.pal'), palette)
+    index = {
+        'names': [e['name'] for e in entries],
+        'images': {e['name']: [e['tag'], e['params']['size'][0], e['params']['size'][1], e['ram']]
+                   for e in entries},
+    }
+    _write_atomic(os.path.join(path, 'index.json'), json.dumps(index, indent=1).encode())
+
+
+def build(manifest, force=False, jobs=None):
+    """
+    Bring the bundle up to date.
+
+    Returns:
+        Tuple of (bundle dict, rows for the summary, bundle written?)
+    """
+    bundle, entries = load_manifest(manifest)
+    cache_dir = os.path.join(os.path.dirname(os.path.abspath(manifest)), CACHE_DIR)
+    os.makedirs(cache_dir, exist_ok=True)
+    index_path = os.path.join(cache_dir, 'index.json')
+    try:
+        with open(index_path) as f:
+            index = json.load(f)
+    except (OSError, ValueError):
+        index = {}
+    cached = index.get('assets', {})
+
+    tool = tool_hash()
+    for entry in entries:
+        entry['key'] = asset_key(entry, tool)
+        entry['bin'] = os.path.join(cache_dir, entry['key'] + '.bin')
+        entry['py'] = os.path.join(cache_dir, entry['key'] + '.py')
+        entry['pal'] = None
+        if entry['params']['format'] in convert_image.INDEXED_FORMATS:
+            entry['pal'] = os.path.join(cache_dir, entry['key'] + '.pal')
+        entry['converted'] = False
+
+    todo = [e for e in entries
+            if force or e['key'] not in cached
+            or not (os.path.exists(e['bin']) and os.path.exists(e['py']))
+            or (e['pal'] and not os.path.exists(e['pal']))]
+    if todo:
+        if jobs == 1 or len(todo) < 2:
+            results = [convert_entry(e) for e in todo]
+        else:
+            with ProcessPoolExecutor(max_workers=jobs) as pool:
+                results = list(pool.map(convert_entry, todo))
+        for entry, (data, palette, code, original_size) in zip(todo, results):
+            _write_atomic(entry['bin'], data)
+            if palette is not None:
+                _write_atomic(entry['pal'], palette)
+            _write_atomic(entry['py'], code.encode())
+            cached[entry['key']] = {'original_size': list(original_size)}
+            entry['converted'] = True
+
+    # Keep only what the manifest uses
+    keys = set(e['key'] for e in entries)
+    cached = {k: v for k, v in cached.items() if k in keys}
+    for name in os.listdir(cache_dir):
+        stem, ext = os.path.splitext(name)
+        if ext in ('.bin', '.pal', '.py') and stem not in keys:
+            os.remove(os.path.join(cache_dir, name))
+
+    bundle_key = hashlib.sha256(json.dumps(
+        [BUNDLE_LAYOUT, bundle['type'], os.path.basename(bundle['path'])]
+        + [[e['name'], e['key']] for e in entries]).encode()).hexdigest()[:24]
+    write = (force or todo or index.get('bundle') != bundle_key
+             or not os.path.exists(bundle['path']))
+
+    rows = []
+    blobs = []
+    fragments = []
+    for entry in entries:
+        raw = os.path.getsize(entry['bin'])
+        if entry['pal']:
+            raw += os.path.getsize(entry['pal'])
+        entry['ram'] = raw
+        fmt = entry['params']['format']
+        entry['tag'] = convert_image.INDEXED_FORMATS[fmt][0] if entry['pal'] else 'RGB565'
+        if bundle['type'] == 'module':
+            flash = os.path.getsize(entry['py']) + len(IMAGE_MODULE_HEADER.format(name=entry['name']))
+            if write:
+                with open(entry['py']) as f:
+                    fragments.append(f.read())
+        else:
+            flash = raw
+            if write:
+                with open(entry['bin'], 'rb') as f:
+                    blob = f.read()
+                palette = None
+                if entry['pal']:
+                    with open(entry['pal'], 'rb') as f:
+                        palette = f.read()
+                blobs.append((blob, palette))
+        w, h = entry['params']['size']
+        rows.append((entry['name'], '%dx%d' % (w, h), entry['params']['format'],
+                     flash, raw, 'converted' if entry['converted'] else 'cached'))
+
+    if write:
+        if bundle['type'] == 'module':
+            write_module(bundle['path'], entries, fragments)
+        else:
+            write_bin_dir(bundle['path'], entries, blobs)
+
+    index = {'assets': cached, 'bundle': bundle_key}
+    _write_atomic(index_path, json.dumps(index, indent=1, sort_keys=True).encode())
+    return bundle, rows, write
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--manifest', default=os.path.join(hostenv.ROOT_DIR, 'assets.json'))
+    parser.add_argument('--force', action='store_true', help='reconvert every image')
+    parser.add_argument('--jobs', type=int, help='worker processes (default: CPUs)')
+    args = parser.parse_args()
+
+    t0 = time.perf_counter()
+    try:
+        bundle, rows, written = build(args.manifest, args.force, args.jobs)
+    except (OSError, ValueError, KeyError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+    elapsed = time.perf_counter() - t0
+
+    print('%-16s %-9s %-11s %10s %10s  %s' % ('image', 'size', 'format', 'flash', 'ram', ''))
+    for name, size, fmt, flash, ram, status in rows:
+        print('%-16s %-9s %-11s %10s %10s  %s' % (name, size, fmt, f'{flash:,}', f'{ram:,}', status))
+    print('%-16s %-9s %-11s %10s %10s' % ('total', '', '', f'{sum(r[3] for r in rows):,}',
+                                           f'{sum(r[4] for r in rows):,}'))
+    print()
+    if bundle['type'] == 'module':
+        print('flash = bytes of Python source in the module (about the raw size once '
+              'cross-compiled to .mpy); ram = heap bytes once the image is imported '
+              '(gs4/gs8: data + palette)')
+    else:
+        print('flash = bytes of the .bin file; ram = bytes if the whole file is read into memory')
+    converted = sum(1 for r in rows if r[5] == 'converted')
+    print('%s: %d converted, %d cached, %s in %.2f s'
+          % (os.path.relpath(bundle['path']), converted, len(rows) - converted,
+             'written' if written else 'up to date', elapsed))
+
+
+if __name__ == '__main__':
+    main()
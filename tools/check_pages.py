@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Check that the Devices page draws nothing in rows without a device.
+
+Imports main.py against the stand-in modules, feeds it tagged BATSYS
+lines the way the UART loop does (process_command(), then the state is
+published and rendered inline) and inspects the framebuffer: every pixel
+in the boxes of an unused row's tag and current items must be the page
+background, and the rows in use must have something drawn. This is
+checked after a full render with one device and again after a partial
+update adds a second one, which must also leave the same frame as a
+full render.
+
+Usage:
+    python3 tools/check_pages.py [--verbose]
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import sys
+
+import hostenv
+
+hostenv.use_virtual_clock()
+
+import machine  # noqa: E402  (stand-in)
+
+LINES = (b'BATSYS@mppt1:52.10,14.5,31.0\n', b'BATSYS@mppt2:52.05,8.9,30.5\n')
+
+
+def row_boxes(dl, row):
+    """Bounding boxes of the items showing device row `row`."""
+    boxes = []
+    for name in ('dev_tag', 'dev_current'):
+        for op in dl.slot_ops[dl.slot(name, row)]:
+            boxes.append(tuple(dl.bbox[op * 4:op * 4 + 4]))
+    return boxes
+
+
+def drawn(lcd, box, background):
+    """True if any pixel in box differs from the background."""
+    x, y, w, h = box
+    for yy in range(y, y + h):
+        for xx in range(x, x + w):
+            if lcd.pixel(xx, yy) != background:
+                return True
+    return False
+
+
+def check_rows(main, used):
+    """Return a list of problems with the Devices page rows as drawn."""
+    dl = main.layouts
+    page = dl.page("Devices")
+    background = dl.page_bg[page]
+    problems = []
+    for row in range(len(main.SLOT_DEV_TAG)):
+        boxes = row_boxes(dl, row)
+        shown = any(drawn(main.lcd, box, background) for box in boxes)
+        if row < used and not shown:
+            problems.append('row %d (in use) drew nothing' % row)
+        elif row >= used and shown:
+            problems.append('row %d (no device) drew something' % row)
+    return problems
+
+
+def feed(main, line):
+    main.process_command(line)
+    main.state_changed = True
+    main.publish_state()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--verbose', action='store_true', help='show main.py output')
+    args = parser.parse_args()
+
+    machine.bind_uart(0, machine.MemoryPort())
+    os.chdir(hostenv.ROOT_DIR)  # main.py opens layouts.json relative to cwd
+    out = sys.stdout if args.verbose else io.StringIO()
+    with contextlib.redirect_stdout(out):
+        import main as device_main
+        device_main.current_mode = "Devices"
+        device_main.request_redraw()
+        feed(device_main, LINES[0])
+    failures = 0
+
+    problems = check_rows(device_main, 1)
+    print('Full render, 1 device:      %s' % ('; '.join(problems) or 'ok'))
+    failures += len(problems)
+
+    with contextlib.redirect_stdout(out):
+        feed(device_main, LINES[1])
+        partial = bytes(device_main.lcd.buffer)
+    problems = check_rows(device_main, 2)
+    with contextlib.redirect_stdout(out):
+        device_main.request_redraw()
+        device_main.publish_state()
+    if bytes(device_main.lcd.buffer) != partial:
+        problems.append('partial update differs from a full render')
+    print('Partial update, 2 devices:  %s' % ('; '.join(problems) or 'ok'))
+    failures += len(problems)
+
+    if failures:
+        print('\nFAILED')
+        sys.exit(1)
+    print('\nAll checks passed')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,144 @@
+"""
+Host environment for running the device modules under CPython.
+
+install() puts the repository root and tools/standin (stand-in `machine`,
+`rp2` and friends) on sys.path and adds the MicroPython-only functions of the
+`time` module (ticks_ms, ticks_us, ticks_diff, ticks_add, sleep_ms,
+sleep_us) so modules such as main.py and uart_link.py import unchanged.
+It also points snapshot.py at a temporary file, so host runs start from
+a first boot.
+
+Example:
+    import hostenv
+    hostenv.install()
+    import uart_link
+
+For deterministic replays, use_virtual_clock() swaps the ticks and sleep
+functions for a VirtualClock that only moves when told to (sleep() and
+advance()), so a device module's time.sleep(2) costs nothing and its
+timeouts follow the simulated timeline instead of the host clock.
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+TOOLS_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT_DIR = os.path.dirname(TOOLS_DIR)
+STANDIN_DIR = os.path.join(TOOLS_DIR, 'standin')
+
+_TICKS_PERIOD = 1 << 30
+_TICKS_MAX = _TICKS_PERIOD - 1
+_TICKS_HALFPERIOD = _TICKS_PERIOD // 2
+
+_installed = False
+
+
+def ticks_ms():
+    return int(time.monotonic() * 1000) & _TICKS_MAX
+
+
+def ticks_us():
+    return int(time.monotonic() * 1000000) & _TICKS_MAX
+
+
+def ticks_cpu():
+    return ticks_us()
+
+
+def ticks_add(ticks, delta):
+    return (ticks + delta) & _TICKS_MAX
+
+
+def ticks_diff(ticks1, ticks2):
+    """Signed difference with MicroPython's wrap-around semantics."""
+    return ((ticks1 - ticks2 + _TICKS_HALFPERIOD) & _TICKS_MAX) - _TICKS_HALFPERIOD
+
+
+def sleep_ms(ms):
+    time.sleep(ms / 1000)
+
+
+def sleep_us(us):
+    time.sleep(us / 1000000)
+
+
+def install():
+    """Make device modules importable on the host. Safe to call repeatedly."""
+    global _installed
+    if _installed:
+        return
+    _installed = True
+
+    for path in (ROOT_DIR, STANDIN_DIR):
+        if path not in sys.path:
+            sys.path.insert(0, path)
+
+    time.ticks_ms = ticks_ms
+    time.ticks_us = ticks_us
+    time.ticks_cpu = ticks_cpu
+    time.ticks_add = ticks_add
+    time.ticks_diff = ticks_diff
+    time.sleep_ms = sleep_ms
+    time.sleep_us = sleep_us
+
+    # Files the device writes at runtime (snapshot.py) go to a temporary
+    # directory, so every host run boots like a fresh device and the
+    # checkout stays clean
+    import snapshot
+    snapshot.SNAPSHOT_FILE = os.path.join(tempfile.mkdtemp(prefix='vbd-'), snapshot.SNAPSHOT_FILE)
+
+
+class VirtualClock:
+    """Simulated monotonic clock in seconds, driven by sleep()/advance()."""
+
+    def __init__(self, start=0.0):
+        self.now = start
+
+    def advance(self, seconds):
+        if seconds > 0:
+            self.now += seconds
+
+    def advance_to(self, seconds):
+        if seconds > self.now:
+            self.now = seconds
+
+    def ticks_ms(self):
+        return int(self.now * 1000) & _TICKS_MAX
+
+    def ticks_us(self):
+        return int(self.now * 1000000) & _TICKS_MAX
+
+    def sleep(self, seconds):
+        self.advance(seconds)
+
+    def sleep_ms(self, ms):
+        self.advance(ms / 1000)
+
+    def sleep_us(self, us):
+        self.advance(us / 1000000)
+
+
+def use_virtual_clock(clock=None):
+    """
+    Drive time.ticks_*/sleep* from a VirtualClock (installs first).
+
+    Only the time functions device code uses are replaced; time.monotonic()
+    and time.perf_counter() keep measuring the host. Stand-in Timers stop
+    firing (nothing would advance them).
+
+    Returns:
+        The VirtualClock in use
+    """
+    install()
+    clock = clock or VirtualClock()
+    time.ticks_ms = clock.ticks_ms
+    time.ticks_us = clock.ticks_us
+    time.ticks_cpu = clock.ticks_us
+    time.sleep = clock.sleep
+    time.sleep_ms = clock.sleep_ms
+    time.sleep_us = clock.sleep_us
+    import machine  # Stand-in (on sys.path after install())
+    machine.virtual_clock = True
+    return clock
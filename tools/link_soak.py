@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""
+End-to-end check of the UART link layer over a pty pair.
+
+A stand-in display and a stand-in Pico run in two threads, each with a
+stand-in machine.UART on one end of a pseudo-terminal. The Pico streams
+BATTERY/BATSYS/CHARGING telemetry; the display handles it with a
+simulated busy render (like a 115 KB show() plus drawing) after every
+command, and part way through simulates a reboot that loses its state.
+
+The run is repeated in blind mode (legacy lines, no ACKs) and in
+acknowledged mode so the losses can be compared. Acknowledged mode must
+end with the display state identical to the Pico's snapshot.
+
+Usage:
+    python3 tools/link_soak.py [--seconds 5] [--rate 40] [--busy-ms 40]
+                               [--corrupt 0.01] [--baud 115200]
+"""
+
+import argparse
+import os
+import random
+import sys
+import threading
+import time
+import tty
+
+import hostenv
+
+hostenv.install()
+
+import machine  # noqa: E402  (stand-in)
+from uart_link import DisplayLink, PicoLink, SNAPSHOT_KEYS  # noqa: E402
+
+
+class PacedPort(machine.FdPort):
+    """FdPort that paces writes at the baud rate and can corrupt bytes."""
+
+    def __init__(self, fd, baud, corrupt=0.0, rng=None, **kwargs):
+        super().__init__(fd, **kwargs)
+        self.byte_time = 10.0 / baud  # 8N1 = 10 bits per byte
+        self.corrupt = corrupt
+        self.rng = rng or random.Random(1)
+        self.corrupted = 0
+
+    def send(self, data):
+        data = bytearray(data)
+        if self.corrupt and self.rng.random() < self.corrupt and len(data) > 2:
+            data[self.rng.randrange(len(data) - 1)] ^= 0x04
+            self.corrupted += 1
+        n = super().send(data)
+        time.sleep(len(data) * self.byte_time)
+        return n
+
+
+class StandinDisplay(threading.Thread):
+    """Display side: DisplayLink + a command handler with a busy render."""
+
+    def __init__(self, uart, ack_mode, busy_ms, window):
+        super().__init__(daemon=True)
+        self.uart = uart
+        self.link = DisplayLink(uart, ack_mode=ack_mode, window=window)
+        self.busy_ms = busy_ms
+        self.state = {}
+        self.commands = 0
+        self.stop = threading.Event()
+        self.reboot = threading.Event()
+
+    def handle(self, payload):
+        key, sep, _ = payload.partition(b':')
+        if not sep or key not in SNAPSHOT_KEYS:
+            return False  # Unknown command, like process_command()
+        self.state[key] = payload
+        self.commands += 1
+        time.sleep(self.busy_ms / 1000)  # Render + show()
+        return True
+
+    def run(self):
+        self.link.request_resync()
+        while not self.stop.is_set():
+            if self.reboot.is_set():
+                self.reboot.clear()
+                self.state.clear()
+                self.uart.port.take()
+                self.link = DisplayLink(self.uart, ack_mode=self.link.ack_mode,
+                                        window=self.link.window)
+                self.link.request_resync()
+            for _ in range(self.link.window):
+                payload = self.link.readline()
+                if not payload:
+                    break
+                self.link.complete(self.handle(payload.strip()))
+            self.link.flush()
+            time.sleep(0.005)
+
+
+class StandinPico(threading.Thread):
+    """Pico side: telemetry generator feeding PicoLink or blind writes."""
+
+    def __init__(self, uart, ack_mode, rate, window):
+        super().__init__(daemon=True)
+        self.uart = uart
+        self.ack_mode = ack_mode
+        self.link = PicoLink(uart, window=window, retransmit_ms=300)
+        self.rate = rate
+        self.snapshot = {}
+        self.generated = 0
+        self.stop_generating = threading.Event()
+        self.stop = threading.Event()
+        self.rng = random.Random(2)
+
+    def next_payloads(self, i):
+        soc = 50 + (i // 7) % 50
+        voltage = 48.0 + self.rng.random()
+        current = self.rng.uniform(-20, 20)
+        yield b'BATTERY:%d' % soc
+        yield b'BATSYS:%.2f,%.2f,%.1f' % (voltage, current, 25.0)
+        yield b'CHARGING:%d' % (1 if current > 0 else 0)
+
+    def run(self):
+        i = 0
+        interval = 1.0 / self.rate
+        next_time = time.monotonic()
+        while not self.stop.is_set():
+            if not self.stop_generating.is_set() and time.monotonic() >= next_time:
+                for payload in self.next_payloads(i):
+                    self.snapshot[payload.split(b':')[0]] = payload
+                    self.generated += 1
+                    if self.ack_mode:
+                        self.link.send(payload)
+                    else:
+                        self.uart.write(payload + b'\n')
+                i += 1
+                next_time += interval * 3
+            if self.ack_mode:
+                self.link.poll()
+            time.sleep(0.001)
+
+
+def run_once(args, ack_mode):
+    master, slave = os.openpty()
+    tty.setraw(master)
+    tty.setraw(slave)
+    display_port = PacedPort(master, args.baud, rxbuf=args.rxbuf)
+    pico_port = PacedPort(slave, args.baud, corrupt=args.corrupt, rxbuf=args.rxbuf)
+
+    display = StandinDisplay(machine.UART(0, port=display_port), ack_mode,
+                             args.busy_ms, args.window)
+    pico = StandinPico(machine.UART(0, port=pico_port), ack_mode,
+                       args.rate, args.window)
+    display.start()
+    pico.start()
+
+    time.sleep(args.seconds / 2)
+    display.reboot.set()  # Lose all state mid-run
+    time.sleep(args.seconds / 2)
+    pico.stop_generating.set()
+
+    # Let the link drain
+    deadline = time.monotonic() + 5
+    while time.monotonic() < deadline:
+        if not ack_mode or pico.link.in_flight() == 0 and not pico.link._order:
+            if not ack_mode or display.state == {k: v for k, v in pico.snapshot.items()
+                                                   if k in SNAPSHOT_KEYS}:
+                break
+        time.sleep(0.05)
+    time.sleep(0.2)
+    pico.stop.set()
+    display.stop.set()
+    pico.join(1)
+    display.join(1)
+
+    expected = {k: v for k, v in pico.snapshot.items() if k in SNAPSHOT_KEYS}
+    in_sync = display.state == expected
+
+    print(f"--- {'acknowledged' if ack_mode else 'blind'} mode ---")
+    print(f"  generated {pico.generated} commands, display handled {display.commands}")
+    print(f"  UART rx overflow: display {display_port.overflow} bytes")
+    print(f"  corrupted on the wire: {pico_port.corrupted} frames")
+    if ack_mode:
+        print(f"  pico:    {pico.link.get_status()}")
+        print(f"  display: {display.link.get_status()}")
+    print(f"  final display state matches Pico: {in_sync}")
+    # Stop the reader threads before the fds can be reused by the next run
+    display_port.close()
+    pico_port.close()
+    time.sleep(0.1)
+    for fd in (master, slave):
+        os.close(fd)
+    return in_sync
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--seconds', type=float, default=4)
+    parser.add_argument('--rate', type=float, default=40,
+                        help='telemetry sets per second (3 commands each)')
+    parser.add_argument('--busy-ms', type=float, default=40,
+                        help='simulated render time per command')
+    parser.add_argument('--corrupt', type=float, default=0.02,
+                        help='probability a Pico frame is corrupted')
+    parser.add_argument('--baud', type=int, default=115200)
+    parser.add_argument('--rxbuf', type=int, default=256)
+    parser.add_argument('--window', type=int, default=8)
+    args = parser.parse_args()
+
+    run_once(args, ack_mode=False)
+    ok = run_once(args, ack_mode=True)
+    if not ok:
+        print("FAILED: display state diverged in acknowledged mode")
+        sys.exit(1)
+    print("OK")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+"""
+Synthetic Pico -> display telemetry for soak and stress tests.
+
+Generates the command stream the Pico sends (BATTERY, BATSYS, CHARGING,
+WIFI, SETTIME) from a simulated 48 V battery, so the display can be
+tested without Victron hardware. The battery model reuses the random
+walk from jtj.py's read_voltage() (small steps with an occasional 3x
+jump) and adds charge/discharge transitions, current and temperature.
+
+Line times account for the wire: at --baud each byte takes 10 bit times
+(8N1), so --rate up to "max" (back-to-back lines at line rate) is honest.
+
+Stress options:
+    --burst N --burst-every S   N extra BATSYS lines back-to-back every S s
+    --malformed P               replace a line with a malformed one with
+                                probability P (truncated, bad number,
+                                unknown command, garbage bytes, overlong,
+                                missing newline)
+    --transition-every S        force a charge/discharge transition every S s
+    --framed                    send acknowledged-mode frames (@SS...*CC)
+
+Outputs (pick one):
+    --out FILE      capture file (tools/uartcap.py format) for uart_replay.py
+    --pty           create a pty pair, print the path to open, stream in real time
+    --device PATH   stream in real time to a serial device or pty
+    --standin       run the stream through main.py on the host (uart_replay.py)
+
+Usage:
+    python3 tools/loadgen.py --seconds 600 --rate 2 --out soak.txt
+    python3 tools/loadgen.py --seconds 30 --rate max --malformed 0.02 --standin
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+import tty
+
+import hostenv
+
+hostenv.install()
+
+from uart_link import encode_frame  # noqa: E402
+from uartcap import CaptureWriter  # noqa: E402
+
+# Battery model (48 V LiFePO4-ish pack, 16 cells)
+V_EMPTY = 44.0
+V_FULL = 56.0
+WALK_STEP = 0.15 * (V_FULL - V_EMPTY) / 5.0  # jtj.py: +-0.15 V per step on a 0-5 V scale
+
+
+class BatterySim:
+    """Random-walk battery with charge/discharge phases."""
+
+    def __init__(self, rng, transition_every=None):
+        self.rng = rng
+        self.voltage = (V_EMPTY + V_FULL) / 2
+        self.current = -8.0
+        self.temp = 22.0
+        self.charging = False
+        self.transition_every = transition_every
+        self._next_transition = transition_every
+
+    def step(self, t):
+        rng = self.rng
+        # Random walk as in jtj.py read_voltage()
+        change = (rng.random() - 0.5) * 2 * WALK_STEP
+        if rng.random() < 0.1:
+            change *= 3
+        # Drift with the charge direction
+        change += 0.02 if self.charging else -0.01
+        self.voltage = min(max(self.voltage + change, V_EMPTY), V_FULL)
+
+        if self.transition_every:
+            if t >= self._next_transition:
+                self.charging = not self.charging
+                self._next_transition += self.transition_every
+        elif rng.random() < 0.01:
+            self.charging = not self.charging
+
+        target = rng.uniform(5, 40) if self.charging else -rng.uniform(1, 25)
+        self.current += (target - self.current) * 0.3
+        self.temp = min(max(self.temp + (rng.random() - 0.5) * 0.2, -10.0), 45.0)
+
+    def soc(self):
+        """Linear voltage -> SOC mapping like jtj.py voltage_to_soc()."""
+        return int(min(max((self.voltage - V_EMPTY) / (V_FULL - V_EMPTY) * 100, 0), 100))
+
+
+def malformed(rng, line):
+    """Return a damaged version of line (bytes with newline)."""
+    kind = rng.randrange(6)
+    if kind == 0:
+        return line[:rng.randrange(1, len(line) - 1)] + b'\n'  # Truncated
+    if kind == 1:
+        return b'BATSYS:5x.2,abc,\n'  # Bad numbers
+    if kind == 2:
+        return b'FROB:1\n'  # Unknown command
+    if kind == 3:
+        return bytes(rng.randrange(256) for _ in range(rng.randrange(4, 40))) + b'\n'
+    if kind == 4:
+        return b'BATSYS:' + b'9' * 200 + b'\n'  # Overlong
+    return line[:-1]  # Missing newline: runs into the next line
+
+
+class LoadGenerator:
+    """Yields (time_s, line) with wire-accurate times."""
+
+    def __init__(self, args):
+        self.args = args
+        self.rng = random.Random(args.seed)
+        self.battery = BatterySim(self.rng, args.transition_every)
+        self.byte_time = 10.0 / args.baud
+        self.wire_free = 0.0  # When the TX line is next idle
+        self.seq = 0
+        self.wifi = 1
+        self.counts = {}
+        self.malformed_lines = 0
+
+    def _emit(self, t, payload):
+        key = payload.split(b':', 1)[0]
+        self.counts[key] = self.counts.get(key, 0) + 1
+        if self.args.framed:
+            line = encode_frame(self.seq, payload)
+            self.seq = (self.seq + 1) & 0xFF
+        else:
+            line = payload + b'\n'
+        if self.args.malformed and self.rng.random() < self.args.malformed:
+            line = malformed(self.rng, line)
+            self.malformed_lines += 1
+        start = max(t, self.wire_free)
+        self.wire_free = start + len(line) * self.byte_time
+        return self.wire_free, line
+
+    def _settime(self, t):
+        tm = time.gmtime(self.args.epoch + t)
+        return b'SETTIME:%d,%d,%d,%d,%d,%d,%d,%d' % (
+            tm.tm_year, tm.tm_mon, tm.tm_mday, tm.tm_hour, tm.tm_min, tm.tm_sec,
+            tm.tm_wday, tm.tm_yday)
+
+    def _telemetry(self):
+        b = self.battery
+        yield b'BATTERY:%d' % b.soc()
+        yield b'BATSYS:%.2f,%.2f,%.1f' % (b.voltage, b.current, b.temp)
+        yield b'CHARGING:%d' % (1 if b.charging else 0)
+
+    def lines(self):
+        args = self.args
+        max_rate = args.rate == 'max'
+        interval = 0.0 if max_rate else 1.0 / float(args.rate)
+        t = 0.0
+        next_settime = 0.0
+        next_burst = args.burst_every if args.burst else None
+        yield self._emit(t, b'WIFI:%d' % self.wifi)
+        while t < args.seconds:
+            if t >= next_settime:
+                yield self._emit(t, self._settime(t))
+                next_settime += args.settime_every
+            if args.wifi_flap and self.rng.random() < args.wifi_flap:
+                self.wifi = 0 if self.wifi == 1 else 1
+                yield self._emit(t, b'WIFI:%d' % self.wifi)
+            self.battery.step(t)
+            for payload in self._telemetry():
+                yield self._emit(t, payload)
+            if next_burst is not None and t >= next_burst:
+                b = self.battery
+                for _ in range(args.burst):
+                    yield self._emit(t, b'BATSYS:%.2f,%.2f,%.1f' % (b.voltage, b.current, b.temp))
+                next_burst += args.burst_every
+            t = self.wire_free if max_rate else t + interval
+
+
+def stream_realtime(fd, gen):
+    """Write lines to fd at their generated times."""
+    start = time.monotonic()
+    n = 0
+    for t, line in gen.lines():
+        delay = start + t - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+        os.write(fd, line)
+        n += 1
+    return n
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--seconds', type=float, default=60, help='length of the stream')
+    parser.add_argument('--rate', default='1',
+                        help='telemetry sets (BATTERY+BATSYS+CHARGING) per second, or "max"')
+    parser.add_argument('--baud', type=int, default=115200)
+    parser.add_argument('--burst', type=int, default=0, help='extra BATSYS lines per burst')
+    parser.add_argument('--burst-every', type=float, default=10.0)
+    parser.add_argument('--malformed', type=float, default=0.0,
+                        help='probability a line is malformed')
+    parser.add_argument('--transition-every', type=float,
+                        help='force charge/discharge transitions every S seconds')
+    parser.add_argument('--wifi-flap', type=float, default=0.0,
+                        help='probability per set that WiFi status toggles')
+    parser.add_argument('--settime-every', type=float, default=60.0)
+    parser.add_argument('--epoch', type=float, default=1767225600,
+                        help='wall-clock time of t=0 for SETTIME (default 2026-01-01)')
+    parser.add_argument('--framed', action='store_true', help='acknowledged-mode frames')
+    parser.add_argument('--seed', type=int, default=1)
+    out = parser.add_mutually_exclusive_group(required=True)
+    out.add_argument('--out', help='write a capture file')
+    out.add_argument('--pty', action='store_true', help='stream in real time to a new pty')
+    out.add_argument('--device', help='stream in real time to a serial device or pty')
+    out.add_argument('--standin', action='store_true', help='replay into main.py on the host')
+    args, rest = parser.parse_known_args()
+    if rest and not args.standin:
+        parser.error('unrecognized arguments: %s' % ' '.join(rest))
+
+    gen = LoadGenerator(args)
+    if args.out:
+        with CaptureWriter(args.out) as writer:
+            for t, line in gen.lines():
+                writer.write(t, line)
+        n = writer.records
+    elif args.pty or args.device:
+        if args.pty:
+            fd, slave = os.openpty()
+            tty.setraw(fd)
+            tty.setraw(slave)
+            print('Streaming to %s' % os.ttyname(slave), file=sys.stderr)
+        else:
+            fd = os.open(args.device, os.O_WRONLY | os.O_NOCTTY)
+        try:
+            n = stream_realtime(fd, gen)
+        except KeyboardInterrupt:
+            n = sum(gen.counts.values())
+    else:
+        import uart_replay  # Switches time to the virtual clock
+        replay_parser = argparse.ArgumentParser()
+        uart_replay.add_replay_arguments(replay_parser)
+        ropts = replay_parser.parse_args(rest)
+        records = list(gen.lines())
+        n = len(records)
+        uart_replay.run_replay(records, ropts.speed, ropts.cost_scale, ropts.rxbuf,
+                               ropts.late_ms, ropts.tail, ropts.verbose)
+
+    counts = ', '.join('%s %d' % (k.decode(), v) for k, v in sorted(gen.counts.items()))
+    print('Generated %d lines over %.1f s (%s; %d malformed)'
+          % (n, gen.wire_free, counts, gen.malformed_lines), file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,63 @@
+"""
+Minimal PNG writer (stdlib only) for host-side rendering tools.
+
+Converts the display's RGB565 framebuffer to an 8-bit RGB PNG. The panel
+is driven with the non-standard BRG565 layout described in COLOR_NOTES.md
+(bits 15-11 blue, 10-5 red, 4-0 green), so that is the default decoding;
+pass order="rgb" for a standard RGB565 buffer.
+
+Example:
+    from pngwrite import write_rgb565_png
+    write_rgb565_png("page.png", lcd.buffer, 240, 240)
+"""
+
+import struct
+import zlib
+
+
+def _chunk(kind, data):
+    body = kind + data
+    return struct.pack('>I', len(data)) + body + struct.pack('>I', zlib.crc32(body) & 0xFFFFFFFF)
+
+
+def _expand(v, bits):
+    return (v << (8 - bits)) | (v >> (2 * bits - 8))
+
+
+def rgb565_to_rgb888(buf, width, height, order="brg"):
+    """Return bytes of RGB888 rows from a little-endian RGB565 buffer."""
+    lut = {}
+    out = bytearray(width * height * 3)
+    o = 0
+    for i in range(0, width * height * 2, 2):
+        c = buf[i] | (buf[i + 1] << 8)
+        rgb = lut.get(c)
+        if rgb is None:
+            if order == "brg":
+                b = _expand(c >> 11, 5)
+                r = _expand((c >> 5) & 0x3F, 6)
+                g = _expand(c & 0x1F, 5)
+            else:
+                r = _expand(c >> 11, 5)
+                g = _expand((c >> 5) & 0x3F, 6)
+                b = _expand(c & 0x1F, 5)
+            rgb = lut[c] = bytes((r, g, b))
+        out[o:o + 3] = rgb
+        o += 3
+    return bytes(out)
+
+
+def write_png(path, rgb, width, height):
+    """Write RGB888 pixel bytes (row-major) as a PNG file."""
+    row = width * 3
+    raw = b''.join(b'\x00' + rgb[y * row:(y + 1) * row] for y in range(height))
+    with open(path, 'wb') as f:
+        f.write(b'\x89PNG\r\n\x1a\n')
+        f.write(_chunk(b'IHDR', struct.pack('>IIBBBBB', width, height, 8, 2, 0, 0, 0)))
+        f.write(_chunk(b'IDAT', zlib.compress(raw, 9)))
+        f.write(_chunk(b'IEND', b''))
+
+
+def write_rgb565_png(path, buf, width, height, order="brg"):
+    """Write a little-endian RGB565 framebuffer as a PNG file."""
+    write_png(path, rgb565_to_rgb888(buf, width, height, order), width, height)
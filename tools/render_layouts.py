@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Render the compiled page layouts (layouts.json) to PNG files on the host.
+
+Uses the same display_list module as the device, drawing into the real
+LCD_1inch28 framebuffer class on top of the stand-in machine/framebuf
+modules, so coordinates, write_text() scaling and clipping match the
+panel. The stand-in's 8x8 font uses classic 5x7 glyphs, which differ
+slightly in shape (not in size or placement) from the device font.
+
+Slot values are given as name=value using the same fixed-point ints the
+device uses (mV, mA, m°C, label index for enum slots); text slots take
+the text, and rows of counted slots are addressed as name.<row>.
+
+With --update, a second set of values is applied after the first render
+and only the damaged rectangles are redrawn; the tool reports the
+rectangles and the bytes a partial flush sends, and writes
+<page>_damage.png with the rectangles outlined.
+
+Usage:
+    python3 tools/render_layouts.py [--out renders] [--page SystemInfo]
+        [--set voltage=48520 current=-12300 ...]
+        [--update voltage=48610 ...]
+"""
+
+import argparse
+import os
+
+import hostenv
+
+hostenv.install()
+
+from LCD_1inch28 import LCD_1inch28  # noqa: E402
+from display_list import load  # noqa: E402
+from pngwrite import write_rgb565_png  # noqa: E402
+
+DEFAULT_VALUES = {
+    "soc": 75,
+    "voltage": 52340,
+    "current": -12500,
+    "charge_current": 8200,
+    "temp": 24500,
+    "wifi": 1,
+    "demo": 1,
+    "total_charge": 23400,
+    "chargers": 2,
+    "dev_tag.0": "mppt1",
+    "dev_current.0": 14500,
+    "dev_tag.1": "mppt2",
+    "dev_current.1": 8900,
+    "dev_tag.2": "inverter",
+    "dev_current.2": -3200,
+}
+
+OUTLINE = 0xFFE0  # Drawn around damaged rectangles in _damage.png
+
+
+def parse_values(pairs):
+    values = {}
+    for pair in pairs or ():
+        name, _, value = pair.partition('=')
+        try:
+            values[name] = int(value)
+        except ValueError:
+            values[name] = value  # Text slot
+    return values
+
+
+def apply(dl, values):
+    for name, value in values.items():
+        if isinstance(value, str):
+            dl.set_text(dl.slot(name), value.encode())
+        else:
+            dl.set(dl.slot(name), value)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--layouts', default=os.path.join(hostenv.ROOT_DIR, 'layouts.json'))
+    parser.add_argument('--out', default='renders')
+    parser.add_argument('--page', action='append', help='page to render (default: all)')
+    parser.add_argument('--set', nargs='*', help='initial slot values name=value')
+    parser.add_argument('--update', nargs='*', help='slot values applied after the first render')
+    parser.add_argument('--order', choices=('brg', 'rgb'), default='brg',
+                        help='RGB565 bit layout used to decode colors (see COLOR_NOTES.md)')
+    args = parser.parse_args()
+
+    os.makedirs(args.out, exist_ok=True)
+    lcd = LCD_1inch28()
+    dl = load(args.layouts, lcd.width, lcd.height)
+    initial = dict(DEFAULT_VALUES)
+    initial.update(parse_values(args.set))
+    update = parse_values(args.update)
+
+    for name in args.page or dl.page_names:
+        page = dl.page(name)
+        if page < 0:
+            parser.error('unknown page: %s' % name)
+        apply(dl, initial)
+        dl.render(lcd, page)
+        lcd.show()
+        path = os.path.join(args.out, name + '.png')
+        write_rgb565_png(path, lcd.buffer, lcd.width, lcd.height, args.order)
+        print('%-12s %3d ops -> %s' % (name, dl.page_count[page], path))
+
+        if update:
+            apply(dl, update)
+            damaged = dl.damage(page)
+            before = lcd.spi.bytes_written
+            dl.render_dirty(lcd, page)
+            sent = lcd.spi.bytes_written - before
+            for i in damaged:
+                x, y, w, h = dl.bbox[i * 4:i * 4 + 4]
+                print('    damage op %2d: x=%3d y=%3d w=%3d h=%3d' % (i, x, y, w, h))
+                lcd.rect(x - 1, y - 1, w + 2, h + 2, OUTLINE)
+            print('    partial flush %d bytes vs %d for show()' % (sent, len(lcd.buffer)))
+            path = os.path.join(args.out, name + '_damage.png')
+            write_rgb565_png(path, lcd.buffer, lcd.width, lcd.height, args.order)
+            # Restore the initial values for the next page
+            apply(dl, initial)
+
+
+if __name__ == '__main__':
+    main()
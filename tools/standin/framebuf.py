@@ -0,0 +1,361 @@
+"""
+Host stand-in for the MicroPython `framebuf` module.
+
+Pure Python, pixel-exact for the drawing primitives this project uses
+(fill, pixel, hline, vline, line, rect, fill_rect, text, blit, scroll)
+in the MONO_VLSB, MONO_HLSB, MONO_HMSB, GS2_HMSB, GS4_HMSB, GS8 and RGB565
+formats. RGB565 pixels are stored little-endian like on the device.
+FrameBuffer() rejects a buffer shorter than height rows of stride pixels
+with ValueError, as the device does.
+
+text() uses a classic 5x7 ASCII font inside the same 8x8 cell as the
+device's built-in font, so layout, extents and write_text() scaling match
+the device even though individual glyph shapes differ slightly.
+"""
+
+MONO_VLSB = 0
+MONO_HLSB = 3
+MONO_HMSB = 4
+RGB565 = 1
+GS2_HMSB = 5
+GS4_HMSB = 2
+GS8 = 6
+MVLSB = MONO_VLSB
+
+# 5x7 font, ASCII 32..126, 5 column bytes per glyph (bit 0 = top row)
+_FONT = bytes((
+    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x5F, 0x00, 0x00,
+    0x00, 0x07, 0x00, 0x07, 0x00, 0x14, 0x7F, 0x14, 0x7F, 0x14,
+    0x24, 0x2A, 0x7F, 0x2A, 0x12, 0x23, 0x13, 0x08, 0x64, 0x62,
+    0x36, 0x49, 0x55, 0x22, 0x50, 0x00, 0x05, 0x03, 0x00, 0x00,
+    0x00, 0x1C, 0x22, 0x41, 0x00, 0x00, 0x41, 0x22, 0x1C, 0x00,
+    0x08, 0x2A, 0x1C, 0x2A, 0x08, 0x08, 0x08, 0x3E, 0x08, 0x08,
+    0x00, 0x50, 0x30, 0x00, 0x00, 0x08, 0x08, 0x08, 0x08, 0x08,
+    0x00, 0x60, 0x60, 0x00, 0x00, 0x20, 0x10, 0x08, 0x04, 0x02,
+    0x3E, 0x51, 0x49, 0x45, 0x3E, 0x00, 0x42, 0x7F, 0x40, 0x00,
+    0x42, 0x61, 0x51, 0x49, 0x46, 0x21, 0x41, 0x45, 0x4B, 0x31,
+    0x18, 0x14, 0x12, 0x7F, 0x10, 0x27, 0x45, 0x45, 0x45, 0x39,
+    0x3C, 0x4A, 0x49, 0x49, 0x30, 0x01, 0x71, 0x09, 0x05, 0x03,
+    0x36, 0x49, 0x49, 0x49, 0x36, 0x06, 0x49, 0x49, 0x29, 0x1E,
+    0x00, 0x36, 0x36, 0x00, 0x00, 0x00, 0x56, 0x36, 0x00, 0x00,
+    0x08, 0x14, 0x22, 0x41, 0x00, 0x14, 0x14, 0x14, 0x14, 0x14,
+    0x00, 0x41, 0x22, 0x14, 0x08, 0x02, 0x01, 0x51, 0x09, 0x06,
+    0x32, 0x49, 0x79, 0x41, 0x3E, 0x7E, 0x11, 0x11, 0x11, 0x7E,
+    0x7F, 0x49, 0x49, 0x49, 0x36, 0x3E, 0x41, 0x41, 0x41, 0x22,
+    0x7F, 0x41, 0x41, 0x22, 0x1C, 0x7F, 0x49, 0x49, 0x49, 0x41,
+    0x7F, 0x09, 0x09, 0x09, 0x01, 0x3E, 0x41, 0x49, 0x49, 0x7A,
+    0x7F, 0x08, 0x08, 0x08, 0x7F, 0x00, 0x41, 0x7F, 0x41, 0x00,
+    0x20, 0x40, 0x41, 0x3F, 0x01, 0x7F, 0x08, 0x14, 0x22, 0x41,
+    0x7F, 0x40, 0x40, 0x40, 0x40, 0x7F, 0x02, 0x0C, 0x02, 0x7F,
+    0x7F, 0x04, 0x08, 0x10, 0x7F, 0x3E, 0x41, 0x41, 0x41, 0x3E,
+    0x7F, 0x09, 0x09, 0x09, 0x06, 0x3E, 0x41, 0x51, 0x21, 0x5E,
+    0x7F, 0x09, 0x19, 0x29, 0x46, 0x46, 0x49, 0x49, 0x49, 0x31,
+    0x01, 0x01, 0x7F, 0x01, 0x01, 0x3F, 0x40, 0x40, 0x40, 0x3F,
+    0x1F, 0x20, 0x40, 0x20, 0x1F, 0x3F, 0x40, 0x38, 0x40, 0x3F,
+    0x63, 0x14, 0x08, 0x14, 0x63, 0x07, 0x08, 0x70, 0x08, 0x07,
+    0x61, 0x51, 0x49, 0x45, 0x43, 0x00, 0x7F, 0x41, 0x41, 0x00,
+    0x02, 0x04, 0x08, 0x10, 0x20, 0x00, 0x41, 0x41, 0x7F, 0x00,
+    0x04, 0x02, 0x01, 0x02, 0x04, 0x40, 0x40, 0x40, 0x40, 0x40,
+    0x00, 0x01, 0x02, 0x04, 0x00, 0x20, 0x54, 0x54, 0x54, 0x78,
+    0x7F, 0x48, 0x44, 0x44, 0x38, 0x38, 0x44, 0x44, 0x44, 0x20,
+    0x38, 0x44, 0x44, 0x48, 0x7F, 0x38, 0x54, 0x54, 0x54, 0x18,
+    0x08, 0x7E, 0x09, 0x01, 0x02, 0x0C, 0x52, 0x52, 0x52, 0x3E,
+    0x7F, 0x08, 0x04, 0x04, 0x78, 0x00, 0x44, 0x7D, 0x40, 0x00,
+    0x20, 0x40, 0x44, 0x3D, 0x00, 0x7F, 0x10, 0x28, 0x44, 0x00,
+    0x00, 0x41, 0x7F, 0x40, 0x00, 0x7C, 0x04, 0x18, 0x04, 0x78,
+    0x7C, 0x08, 0x04, 0x04, 0x78, 0x38, 0x44, 0x44, 0x44, 0x38,
+    0x7C, 0x14, 0x14, 0x14, 0x08, 0x08, 0x14, 0x14, 0x18, 0x7C,
+    0x7C, 0x08, 0x04, 0x04, 0x08, 0x48, 0x54, 0x54, 0x54, 0x20,
+    0x04, 0x3F, 0x44, 0x40, 0x20, 0x3C, 0x40, 0x40, 0x20, 0x7C,
+    0x1C, 0x20, 0x40, 0x20, 0x1C, 0x3C, 0x40, 0x30, 0x40, 0x3C,
+    0x44, 0x28, 0x10, 0x28, 0x44, 0x0C, 0x50, 0x50, 0x50, 0x3C,
+    0x44, 0x64, 0x54, 0x4C, 0x44, 0x00, 0x08, 0x36, 0x41, 0x00,
+    0x00, 0x00, 0x7F, 0x00, 0x00, 0x00, 0x41, 0x36, 0x08, 0x00,
+    0x08, 0x04, 0x08, 0x10, 0x08,
+))
+
+_BLOCK = (0x7F, 0x7F, 0x7F, 0x7F, 0x7F)
+
+# Byte -> its 8 pixels as one byte each (0 or 1), leftmost pixel first
+_BITS = [bytes((b >> (7 - i)) & 1 for i in range(8)) for b in range(256)]
+
+_BPP = {MONO_VLSB: 1, MONO_HLSB: 1, MONO_HMSB: 1, GS2_HMSB: 2,
+        GS4_HMSB: 4, GS8: 8, RGB565: 16}
+
+
+class _Surface:
+    """Pixel access to (buffer, width, height, format, stride)."""
+
+    def __init__(self, buf, width, height, format, stride=None):
+        self.buf = buf
+        self.width = width
+        self.height = height
+        self.format = format
+        self.stride = width if stride is None else stride
+        if format not in _BPP:
+            raise ValueError("invalid format")
+
+    def get(self, x, y):
+        f = self.format
+        b = self.buf
+        if f == RGB565:
+            i = (x + y * self.stride) * 2
+            return b[i] | (b[i + 1] << 8)
+        if f == GS8:
+            return b[x + y * self.stride]
+        if f == GS4_HMSB:
+            v = b[(x + y * self.stride) >> 1]
+            return (v >> 4) if x % 2 == 0 else (v & 0x0F)
+        if f == GS2_HMSB:
+            v = b[(x + y * self.stride) >> 2]
+            return (v >> (6 - 2 * (x & 3))) & 0x03
+        if f == MONO_HLSB:
+            v = b[(x + y * ((self.stride + 7) & ~7)) >> 3]
+            return (v >> (7 - (x & 7))) & 1
+        if f == MONO_HMSB:
+            v = b[(x + y * ((self.stride + 7) & ~7)) >> 3]
+            return (v >> (x & 7)) & 1
+        v = b[(y >> 3) * self.stride + x]  # MONO_VLSB
+        return (v >> (y & 7)) & 1
+
+    def set(self, x, y, c):
+        f = self.format
+        b = self.buf
+        if f == RGB565:
+            i = (x + y * self.stride) * 2
+            b[i] = c & 0xFF
+            b[i + 1] = (c >> 8) & 0xFF
+        elif f == GS8:
+            b[x + y * self.stride] = c & 0xFF
+        elif f == GS4_HMSB:
+            i = (x + y * self.stride) >> 1
+            if x % 2 == 0:
+                b[i] = ((c & 0x0F) << 4) | (b[i] & 0x0F)
+            else:
+                b[i] = (b[i] & 0xF0) | (c & 0x0F)
+        elif f == GS2_HMSB:
+            i = (x + y * self.stride) >> 2
+            shift = 6 - 2 * (x & 3)
+            b[i] = (b[i] & ~(0x03 << shift) & 0xFF) | ((c & 0x03) << shift)
+        elif f == MONO_HLSB:
+            i = (x + y * ((self.stride + 7) & ~7)) >> 3
+            bit = 0x80 >> (x & 7)
+            b[i] = (b[i] | bit) if c else (b[i] & ~bit & 0xFF)
+        elif f == MONO_HMSB:
+            i = (x + y * ((self.stride + 7) & ~7)) >> 3
+            bit = 1 << (x & 7)
+            b[i] = (b[i] | bit) if c else (b[i] & ~bit & 0xFF)
+        else:
+            i = (y >> 3) * self.stride + x
+            bit = 1 << (y & 7)
+            b[i] = (b[i] | bit) if c else (b[i] & ~bit & 0xFF)
+
+
+def _surface(src):
+    if isinstance(src, FrameBuffer):
+        return src._s
+    return _Surface(*src)
+
+
+def _required_bytes(width, height, format, stride):
+    # As the device's framebuf_make_new(): rows are padded to whole bytes
+    # (MONO_HLSB/HMSB, GS2, GS4) or height to whole bytes (MONO_VLSB)
+    if format == MONO_VLSB:
+        height = (height + 7) & ~7
+    elif format in (MONO_HLSB, MONO_HMSB):
+        stride = (stride + 7) & ~7
+    elif format == GS2_HMSB:
+        stride = (stride + 3) & ~3
+    elif format == GS4_HMSB:
+        stride = (stride + 1) & ~1
+    return stride * height * _BPP[format] // 8
+
+
+class FrameBuffer:
+    def __init__(self, buffer, width, height, format, stride=None):
+        if stride is None:
+            stride = width
+        if (width < 1 or height < 1 or width > 0xFFFF or height > 0xFFFF
+                or stride > 0xFFFF or stride < width):
+            raise ValueError()
+        self._s = _Surface(buffer, width, height, format, stride)
+        if _required_bytes(width, height, format, stride) > len(memoryview(buffer).cast('B')):
+            raise ValueError()
+
+    def fill(self, c):
+        s = self._s
+        if s.format == RGB565 and s.stride == s.width:
+            n = s.width * s.height
+            s.buf[:n * 2] = bytes((c & 0xFF, (c >> 8) & 0xFF)) * n
+        else:
+            self.fill_rect(0, 0, s.width, s.height, c)
+
+    def pixel(self, x, y, c=None):
+        s = self._s
+        if not (0 <= x < s.width and 0 <= y < s.height):
+            return None
+        if c is None:
+            return s.get(x, y)
+        s.set(x, y, c)
+
+    def fill_rect(self, x, y, w, h, c):
+        s = self._s
+        x0 = max(0, x)
+        y0 = max(0, y)
+        x1 = min(s.width, x + w)
+        y1 = min(s.height, y + h)
+        if x0 >= x1 or y0 >= y1:
+            return
+        if s.format == RGB565:
+            row = bytes((c & 0xFF, (c >> 8) & 0xFF)) * (x1 - x0)
+            for yy in range(y0, y1):
+                i = (x0 + yy * s.stride) * 2
+                s.buf[i:i + len(row)] = row
+        else:
+            for yy in range(y0, y1):
+                for xx in range(x0, x1):
+                    s.set(xx, yy, c)
+
+    def hline(self, x, y, w, c):
+        self.fill_rect(x, y, w, 1, c)
+
+    def vline(self, x, y, h, c):
+        self.fill_rect(x, y, 1, h, c)
+
+    def rect(self, x, y, w, h, c, f=False):
+        if f:
+            self.fill_rect(x, y, w, h, c)
+            return
+        self.fill_rect(x, y, w, 1, c)
+        self.fill_rect(x, y + h - 1, w, 1, c)
+        self.fill_rect(x, y, 1, h, c)
+        self.fill_rect(x + w - 1, y, 1, h, c)
+
+    def line(self, x1, y1, x2, y2, c):
+        dx = abs(x2 - x1)
+        dy = -abs(y2 - y1)
+        sx = 1 if x1 < x2 else -1
+        sy = 1 if y1 < y2 else -1
+        err = dx + dy
+        while True:
+            self.pixel(x1, y1, c)
+            if x1 == x2 and y1 == y2:
+                break
+            e2 = 2 * err
+            if e2 >= dy:
+                err += dy
+                x1 += sx
+            if e2 <= dx:
+                err += dx
+                y1 += sy
+
+    def text(self, s, x0, y0, c=1):
+        if isinstance(s, (bytes, bytearray)):
+            s = s.decode('latin-1')
+        for ch in s:
+            code = ord(ch)
+            if 32 <= code <= 126:
+                glyph = _FONT[(code - 32) * 5:(code - 32) * 5 + 5]
+            else:
+                glyph = _BLOCK
+            for col, bits in enumerate(glyph):
+                for row in range(8):
+                    if bits & (1 << row):
+                        self.pixel(x0 + 1 + col, y0 + row, c)
+            x0 += 8
+
+    def scroll(self, dx, dy):
+        s = self._s
+        copy = _Surface(bytearray(s.buf), s.width, s.height, s.format, s.stride)
+        for y in range(s.height):
+            for x in range(s.width):
+                sx = x - dx
+                sy = y - dy
+                if 0 <= sx < s.width and 0 <= sy < s.height:
+                    s.set(x, y, copy.get(sx, sy))
+
+    def blit(self, source, x, y, key=-1, palette=None):
+        src = _surface(source)
+        pal = _surface(palette) if palette is not None else None
+        s = self._s
+        if (key == -1 and pal is not None and s.format == RGB565 and pal.format == RGB565
+                and src.format in (GS8, GS4_HMSB) and (src.format == GS8 or src.stride % 2 == 0)):
+            self._blit_indexed(src, pal, x, y)
+            return
+        if (pal is not None and s.format == RGB565 and pal.format == RGB565
+                and src.format == MONO_HLSB and pal.width >= 2):
+            self._blit_mono(src, pal, x, y, key)
+            return
+        for sy in range(src.height):
+            dy = y + sy
+            if not 0 <= dy < s.height:
+                continue
+            for sx in range(src.width):
+                dx = x + sx
+                if not 0 <= dx < s.width:
+                    continue
+                col = src.get(sx, sy)
+                if pal is not None:
+                    col = pal.get(col, 0)
+                if col != key:
+                    s.set(dx, dy, col)
+
+    def _blit_indexed(self, src, pal, x, y):
+        # Same pixels as the loop above, a row at a time via bytes.translate()
+        s = self._s
+        n = min(256 if src.format == GS8 else 16, pal.width * pal.height)
+        colours = [pal.get(i % pal.width, i // pal.width) for i in range(n)]
+        colours += [0] * (256 - n)
+        lo = bytes(c & 0xFF for c in colours)
+        hi = bytes(c >> 8 for c in colours)
+        x0 = max(0, -x)
+        x1 = min(src.width, s.width - x)
+        if x0 >= x1:
+            return
+        high = bytes(b >> 4 for b in range(256))
+        low = bytes(b & 0x0F for b in range(256))
+        for sy in range(max(0, -y), min(src.height, s.height - y)):
+            if src.format == GS8:
+                row = bytes(src.buf[sy * src.stride + x0:sy * src.stride + x1])
+            else:
+                start = sy * src.stride >> 1
+                packed = bytes(src.buf[start:start + (src.width + 1 >> 1)])
+                row = bytearray(len(packed) * 2)
+                row[0::2] = packed.translate(high)
+                row[1::2] = packed.translate(low)
+                row = bytes(row[x0:x1])
+            i = (x + x0 + (y + sy) * s.stride) * 2
+            s.buf[i:i + 2 * len(row):2] = row.translate(lo)
+            s.buf[i + 1:i + 2 * len(row):2] = row.translate(hi)
+
+    def _blit_mono(self, src, pal, x, y, key):
+        # Same pixels as the loop above for a MONO_HLSB source (e.g. a font
+        # glyph): each row is unpacked to one byte per pixel and every run
+        # of a non-key colour is written with a single slice assignment
+        s = self._s
+        x0 = max(0, -x)
+        x1 = min(src.width, s.width - x)
+        if x0 >= x1:
+            return
+        runs = []
+        for bit in (0, 1):
+            col = pal.get(bit, 0)
+            if col != key:
+                runs.append((bytes((bit,)), bytes((1 - bit,)), bytes((col & 0xFF, col >> 8))))
+        row_bytes = ((src.stride + 7) & ~7) >> 3
+        for sy in range(max(0, -y), min(src.height, s.height - y)):
+            start = sy * row_bytes
+            row = b''.join(_BITS[b] for b in src.buf[start:start + (x1 + 7 >> 3)])
+            base = (x + (y + sy) * s.stride) * 2
+            for bit, other, col in runs:
+                i = row.find(bit, x0, x1)
+                while i >= 0:
+                    j = row.find(other, i, x1)
+                    if j < 0:
+                        j = x1
+                    s.buf[base + 2 * i:base + 2 * j] = col * (j - i)
+                    i = row.find(bit, j, x1)
+
+
+def FrameBuffer1(buffer, width, height, format=MONO_VLSB, stride=None):
+    return FrameBuffer(buffer, width, height, format, stride)
@@ -0,0 +1,414 @@
+"""
+Host stand-in for the MicroPython `machine` module.
+
+Only the parts used by this project are provided. Hardware is simulated
+just far enough for the device code to run on a PC:
+
+    Pin, PWM, ADC, RTC, I2C         - record state, no side effects
+    Timer                           - callbacks from a thread on the host
+                                      clock (none under hostenv's virtual
+                                      clock, where time only moves when a
+                                      tool advances it)
+    SPI                             - counts bytes written (rp2.DMA
+                                      transfers to it included)
+    mem32                           - peripheral registers read as 0
+    UART                            - backed by a Port (memory or file
+                                      descriptor such as a pty), with a
+                                      bounded receive buffer that drops and
+                                      counts bytes on overflow like the real
+                                      rp2 driver; an irq() handler runs
+                                      as soon as bytes are received
+
+UART ports are looked up by UART id, so host tools bind a port before the
+device module creates its UART:
+
+    import machine
+    port = machine.FdPort(fd)
+    machine.bind_uart(0, port)
+    uart = machine.UART(0, baudrate=115200)   # now reads/writes the fd
+
+A UART can also be given a port directly with the host-only `port=` kwarg.
+"""
+
+import os
+import select
+import threading
+import time
+
+
+class Pin:
+    IN = 0
+    OUT = 1
+    OPEN_DRAIN = 2
+    PULL_UP = 1
+    PULL_DOWN = 2
+    IRQ_FALLING = 4
+    IRQ_RISING = 8
+
+    def __init__(self, id, mode=-1, pull=-1, value=None):
+        self.id = id
+        self.mode = mode
+        self._value = 0 if value is None else value
+        self._handler = None
+
+    def init(self, mode=-1, pull=-1, value=None):
+        if value is not None:
+            self._value = value
+
+    def value(self, v=None):
+        if v is None:
+            return self._value
+        self._value = 1 if v else 0
+
+    def __call__(self, v=None):
+        return self.value(v)
+
+    def on(self):
+        self._value = 1
+
+    def off(self):
+        self._value = 0
+
+    def irq(self, handler=None, trigger=IRQ_FALLING, hard=False):
+        self._handler = handler
+
+    def trigger(self):
+        """Host helper: fire the registered IRQ handler."""
+        if self._handler:
+            self._handler(self)
+
+
+class PWM:
+    def __init__(self, pin, freq=0, duty_u16=0):
+        self.pin = pin
+        self._freq = freq
+        self._duty = duty_u16
+
+    def freq(self, f=None):
+        if f is None:
+            return self._freq
+        self._freq = f
+
+    def duty_u16(self, d=None):
+        if d is None:
+            return self._duty
+        self._duty = d
+
+    def deinit(self):
+        pass
+
+
+class ADC:
+    def __init__(self, pin):
+        self.pin = pin
+
+    def read_u16(self):
+        return 0
+
+
+class RTC:
+    def __init__(self):
+        t = time.localtime()
+        self._dt = (t[0], t[1], t[2], t[6], t[3], t[4], t[5], 0)
+
+    def datetime(self, dt=None):
+        if dt is None:
+            return self._dt
+        self._dt = tuple(dt)
+
+
+# Set by hostenv.use_virtual_clock(): Timers do not fire
+virtual_clock = False
+
+
+class Timer:
+    ONE_SHOT = 0
+    PERIODIC = 1
+
+    def __init__(self, id=-1, **kwargs):
+        self._thread = None
+        self._stop = threading.Event()
+        if kwargs:
+            self.init(**kwargs)
+
+    def init(self, mode=PERIODIC, period=-1, freq=-1, callback=None):
+        self.deinit()
+        if freq > 0:
+            period = 1000 / freq
+        if callback is None or period <= 0 or virtual_clock:
+            return
+        self._stop = threading.Event()
+
+        def run(stop=self._stop):
+            while not stop.wait(period / 1000):
+                callback(self)
+                if mode == Timer.ONE_SHOT:
+                    break
+
+        self._thread = threading.Thread(target=run, daemon=True)
+        self._thread.start()
+
+    def deinit(self):
+        self._stop.set()
+
+
+class I2C:
+    """I2C stand-in that answers the CST816T identity registers."""
+
+    _REGISTERS = {0xA7: 0xB5, 0xA9: 0x01, 0x00: 0x05}
+
+    def __init__(self, id, scl=None, sda=None, freq=400000):
+        self.id = id
+
+    def readfrom_mem(self, addr, reg, n):
+        return bytes([self._REGISTERS.get(reg, 0)] + [0] * (n - 1))
+
+    def writeto_mem(self, addr, reg, buf):
+        pass
+
+
+_spis = {}  # SPI id -> last SPI created, for the rp2.DMA stand-in
+
+
+class SPI:
+    """SPI stand-in counting transferred bytes."""
+
+    def __init__(self, id, baudrate=1000000, polarity=0, phase=0, bits=8,
+                 sck=None, mosi=None, miso=None):
+        self.id = id
+        self.baudrate = baudrate
+        self.bytes_written = 0
+        self.writes = 0
+        _spis[id] = self
+
+    def write(self, buf):
+        self.bytes_written += len(buf)
+        self.writes += 1
+
+    def deinit(self):
+        pass
+
+
+class _Mem:
+    """mem8/mem16/mem32 stand-in: registers read as 0 (idle), writes ignored."""
+
+    def __getitem__(self, addr):
+        return 0
+
+    def __setitem__(self, addr, value):
+        pass
+
+
+mem8 = mem16 = mem32 = _Mem()
+
+
+# ---------------------------------------------------------------------------
+# UART
+# ---------------------------------------------------------------------------
+
+class Port:
+    """
+    Byte transport behind a stand-in UART.
+
+    Received bytes land in a bounded buffer (rxbuf bytes, like the rp2
+    driver's ring buffer); bytes that do not fit are dropped and counted
+    in `overflow`.
+    """
+
+    def __init__(self, rxbuf=256):
+        self.rxbuf = rxbuf
+        self._rx = bytearray()
+        self._lock = threading.Lock()
+        self.overflow = 0
+        self.rx_bytes = 0
+        self.tx_bytes = 0
+        self.peer = None
+        self.on_receive = None  # UART.irq() handler, called after receive()
+
+    def receive(self, data):
+        """Deliver bytes into the receive buffer (called by the transport)."""
+        with self._lock:
+            self.rx_bytes += len(data)
+            room = self.rxbuf - len(self._rx)
+            if room < len(data):
+                self.overflow += len(data) - max(room, 0)
+                data = data[:max(room, 0)]
+            self._rx += data
+        if self.on_receive is not None and data:
+            self.on_receive()
+
+    def pump(self):
+        """Pull any pending bytes from the transport. Overridden."""
+
+    def any(self):
+        self.pump()
+        with self._lock:
+            return len(self._rx)
+
+    def take(self, n=-1, until=None):
+        self.pump()
+        with self._lock:
+            if until is not None:
+                i = self._rx.find(until)
+                n = len(self._rx) if i < 0 else i + 1
+            elif n < 0 or n > len(self._rx):
+                n = len(self._rx)
+            data = bytes(self._rx[:n])
+            del self._rx[:n]
+            return data
+
+    def send(self, data):
+        self.tx_bytes += len(data)
+        if self.peer is not None:
+            self.peer.receive(bytes(data))
+        return len(data)
+
+
+class MemoryPort(Port):
+    """In-process port. Connect two with loopback() for a null-modem pair."""
+
+
+def loopback(rxbuf=256):
+    """Return two MemoryPorts wired TX->RX in both directions."""
+    a = MemoryPort(rxbuf)
+    b = MemoryPort(rxbuf)
+    a.peer = b
+    b.peer = a
+    return a, b
+
+
+class FdPort(Port):
+    """Port over a file descriptor, e.g. one side of a pty pair."""
+
+    def __init__(self, fd, rxbuf=256, threaded=True):
+        super().__init__(rxbuf)
+        self.fd = fd
+        os.set_blocking(fd, False)
+        self._closed = False
+        if threaded:
+            # Background reader emulates the RX interrupt filling the ring
+            # buffer while the application is busy
+            threading.Thread(target=self._reader, daemon=True).start()
+
+    def _read_available(self):
+        try:
+            data = os.read(self.fd, 4096)
+        except (BlockingIOError, InterruptedError):
+            return False
+        except OSError:
+            self._closed = True
+            return False
+        if data:
+            self.receive(data)
+        return bool(data)
+
+    def _reader(self):
+        while not self._closed:
+            try:
+                ready, _, _ = select.select([self.fd], [], [], 0.05)
+            except (OSError, ValueError):
+                return
+            if ready:
+                self._read_available()
+
+    def send(self, data):
+        data = bytes(data)
+        self.tx_bytes += len(data)
+        view = memoryview(data)
+        while view:
+            try:
+                n = os.write(self.fd, view)
+            except BlockingIOError:
+                select.select([], [self.fd], [], 0.05)
+                continue
+            view = view[n:]
+        return len(data)
+
+    def close(self):
+        self._closed = True
+
+
+_ports = {}
+
+
+def bind_uart(id, port):
+    """Host helper: make UART(id) use the given Port."""
+    _ports[id] = port
+
+
+class UART:
+    IRQ_RXIDLE = 4096
+    IRQ_TXIDLE = 32768
+    IRQ_BREAK = 8192
+
+    def __init__(self, id, baudrate=115200, bits=8, parity=None, stop=1,
+                 tx=None, rx=None, rxbuf=256, txbuf=256, timeout=0,
+                 timeout_char=0, port=None):
+        if port is None:
+            port = _ports.get(id)
+            if port is None:
+                port = MemoryPort(rxbuf)
+                _ports[id] = port
+        self.id = id
+        self.baudrate = baudrate
+        self.port = port
+
+    def init(self, baudrate=115200, **kwargs):
+        self.baudrate = baudrate
+
+    def any(self):
+        return self.port.any()
+
+    def read(self, nbytes=-1):
+        data = self.port.take(nbytes)
+        return data if data else None
+
+    def readline(self):
+        data = self.port.take(until=b'\n')
+        return data if data else None
+
+    def readinto(self, buf, nbytes=-1):
+        if nbytes < 0:
+            nbytes = len(buf)
+        data = self.port.take(nbytes)
+        if not data:
+            return None
+        buf[:len(data)] = data
+        return len(data)
+
+    def write(self, buf):
+        return self.port.send(buf)
+
+    def flush(self):
+        pass
+
+    def txdone(self):
+        return True
+
+    def irq(self, handler=None, trigger=0, hard=False):
+        self._irq_handler = handler
+        self._irq_trigger = trigger
+        # Every receive() stands in for the end of a burst (IRQ_RXIDLE)
+        if handler is not None and trigger & UART.IRQ_RXIDLE:
+            self.port.on_receive = lambda: handler(self)
+        else:
+            self.port.on_receive = None
+
+    def deinit(self):
+        pass
+
+
+def idle():
+    time.sleep(0.001)  # Virtual under hostenv.use_virtual_clock()
+
+
+def lightsleep(ms=None):
+    time.sleep((ms or 0) / 1000)
+
+
+def freq(hz=None):
+    return 150000000
+
+
+def reset():
+    raise SystemExit("machine.reset()")
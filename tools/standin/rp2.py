@@ -0,0 +1,80 @@
+"""
+Host stand-in for the MicroPython `rp2` module (DMA only).
+
+A DMA transfer whose write address is an SPI data register takes as
+long as the bytes need at that SPI's baudrate (len * 8 / baudrate),
+timed with time.ticks_us() so it follows hostenv's real or virtual
+clock: active() stays True until then. The bytes are counted on the
+stand-in machine.SPI (bytes_written, writes) without calling its
+write(), so tools that wrap SPI.write for blocking transfers do not
+count DMA transfers twice.
+
+    dma = rp2.DMA()
+    ctrl = dma.pack_ctrl(size=0, inc_write=False, treq_sel=26)
+    dma.config(read=buf, write=0x40088008, count=len(buf), ctrl=ctrl, trigger=True)
+    while dma.active():
+        time.sleep_us(10)
+"""
+
+import time
+
+import machine
+
+# SPI data register address -> SPI id (RP2040 and RP2350)
+_SPI_DR = {
+    0x4003C008: 0, 0x40040008: 1,   # RP2040
+    0x40080008: 0, 0x40088008: 1,   # RP2350
+}
+
+
+class DMA:
+    def __init__(self):
+        self._end_us = None
+        self.read = None
+        self.write = None
+        self.count = 0
+        self.ctrl = 0
+        self.transfers = 0
+        self.bytes = 0
+
+    def pack_ctrl(self, default=None, **kwargs):
+        # Only treq_sel matters to the stand-in
+        return kwargs.get('treq_sel', 0x3F) << 17
+
+    def unpack_ctrl(self, value):
+        return {'treq_sel': (value >> 17) & 0x3F}
+
+    def config(self, read=None, write=None, count=None, ctrl=None, trigger=False):
+        if read is not None:
+            self.read = read
+        if write is not None:
+            self.write = write
+        if count is not None:
+            self.count = count
+        if ctrl is not None:
+            self.ctrl = ctrl
+        if trigger:
+            self.active(1)
+
+    def active(self, value=None):
+        if value is None:
+            return self._end_us is not None and time.ticks_diff(self._end_us, time.ticks_us()) > 0
+        if value:
+            seconds = 0.0
+            spi = machine._spis.get(_SPI_DR.get(self.write))
+            if spi is not None:
+                seconds = self.count * 8 / spi.baudrate
+                spi.bytes_written += self.count
+                spi.writes += 1
+            self.transfers += 1
+            self.bytes += self.count
+            self._end_us = time.ticks_add(time.ticks_us(), max(1, round(seconds * 1e6)))
+        else:
+            self._end_us = None
+        return value
+
+    def irq(self, handler=None, hard=False):
+        pass
+
+    def close(self):
+        self._end_us = None
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Record the Pico -> display UART stream with timestamps.
+
+Reads a serial device (e.g. a USB-UART adapter tapped onto the Pico's TX
+line, GP16 -> display GP17) or a pty, and writes every received line with
+its arrival time to a capture file (format in tools/uartcap.py) for
+tools/uart_replay.py. Needs no packages beyond the standard library.
+
+Usage:
+    python3 tools/uart_record.py /dev/ttyUSB0 -o capture.txt [--baud 115200]
+                                 [--seconds 600] [--echo]
+
+Stop with Ctrl-C; the capture is flushed after every line.
+"""
+
+import argparse
+import os
+import select
+import sys
+import termios
+import time
+import tty
+
+from uartcap import CaptureWriter, LineSplitter
+
+_BAUDS = {9600: termios.B9600, 19200: termios.B19200, 38400: termios.B38400,
+          57600: termios.B57600, 115200: termios.B115200, 230400: termios.B230400}
+
+
+def open_serial(path, baud):
+    fd = os.open(path, os.O_RDONLY | os.O_NOCTTY | os.O_NONBLOCK)
+    if os.isatty(fd):
+        tty.setraw(fd)
+        attrs = termios.tcgetattr(fd)
+        if baud in _BAUDS:
+            attrs[4] = attrs[5] = _BAUDS[baud]
+        attrs[2] |= termios.CLOCAL | termios.CREAD
+        termios.tcsetattr(fd, termios.TCSANOW, attrs)
+    return fd
+
+
+def record(fd, writer, seconds=None, echo=False):
+    """Record lines from fd until EOF, timeout or Ctrl-C. Returns line count."""
+    splitter = LineSplitter()
+    start = None
+    t_end = None
+    while True:
+        now = time.monotonic()
+        if t_end is not None and now >= t_end:
+            break
+        ready, _, _ = select.select([fd], [], [], 0.2)
+        if not ready:
+            continue
+        try:
+            data = os.read(fd, 4096)
+        except BlockingIOError:
+            continue
+        if not data:
+            break
+        now = time.monotonic()
+        if start is None:
+            start = now
+            if seconds:
+                t_end = start + seconds
+        for line in splitter.feed(data):
+            writer.write(now - start, line)
+            if echo:
+                print('%10.3f  %r' % (now - start, line))
+        writer.flush()
+    rest = splitter.rest()
+    if rest and start is not None:
+        writer.write(time.monotonic() - start, rest)
+    return writer.records
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('device', help='serial device or pty path')
+    parser.add_argument('-o', '--out', required=True, help='capture file to write')
+    parser.add_argument('--baud', type=int, default=115200)
+    parser.add_argument('--seconds', type=float, help='stop after this long (from first byte)')
+    parser.add_argument('--echo', action='store_true', help='print lines as they arrive')
+    args = parser.parse_args()
+
+    fd = open_serial(args.device, args.baud)
+    with CaptureWriter(args.out) as writer:
+        try:
+            n = record(fd, writer, args.seconds, args.echo)
+        except KeyboardInterrupt:
+            n = writer.records
+    os.close(fd)
+    print('Recorded %d lines to %s' % (n, args.out), file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
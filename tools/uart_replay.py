@@ -0,0 +1,312 @@
+#!/usr/bin/env python3
+"""
+Replay a UART capture into main.py running on the host.
+
+main.py is imported against the stand-in `machine` module on a virtual
+clock, then its main loop is stepped with main_loop_pass() while the
+captured lines are delivered into the stand-in UART at their recorded
+times. Everything the device does is timed on the virtual clock:
+
+    - host processing time of each pass, multiplied by --cost-scale
+      (use it to approximate how much slower the device is)
+    - SPI time the CPU is held by a flush at the SPI baudrate: the
+      whole transfer for blocking flushes, only the wait for the
+      previous transfer to finish for DMA flushes (LCD_1inch28.wait())
+    - the main loop's sleep until the next line or scheduled task
+
+Received bytes go through the stand-in UART (--rxbuf bytes, like the
+driver) into main.py's interrupt-fed ring buffer (uart_rx.py), which
+fills and overflows the way it would on the display, and the page
+timeouts follow the capture's timeline.
+
+Pacing:
+    --speed 1      real time (wall clock follows the capture)
+    --speed 10     10x faster than real time
+    --speed 0      flat out (default): no waiting, as fast as the host runs
+
+Report:
+    per-command processing time (host ms, plus SPI ms on the device;
+    lines that are not NAME:, NAME@tag: or bare NAME commands count as
+    "malformed"),
+    lines delivered / dropped by buffer overflow / late (queued longer
+    than --late-ms), line latency, full frames and partial flushes, page
+    changes (to spot e.g. CHARGING flapping) and the link counters.
+
+Usage:
+    python3 tools/uart_replay.py capture.txt [--speed 0] [--cost-scale 1]
+                                 [--rxbuf 256] [--late-ms 200] [--verbose]
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import re
+import sys
+import time
+
+import hostenv
+
+real_sleep = time.sleep
+clock = hostenv.use_virtual_clock()
+
+import machine  # noqa: E402  (stand-in)
+from uartcap import escape, read_capture  # noqa: E402
+
+# A command line starts NAME: or NAME@tag: or is a bare NAME such as WAKE
+# (see main.process_command()); anything else (line noise, a corrupted
+# capture) is reported as one key
+COMMAND = re.compile(rb'([A-Z_]+(?:@[!-9;-~]+)?)(?::|[\r\n ]*$)')
+MALFORMED = 'malformed'
+
+
+class ReplayPort(machine.MemoryPort):
+    """Stand-in UART port that tracks per-line arrival, drops and latency."""
+
+    def __init__(self, rxbuf, late_ms):
+        super().__init__(rxbuf)
+        self.late_s = late_ms / 1000
+        self.ring = None  # main.rx (uart_rx.UartRx) once main.py is imported
+        self._arrivals = []
+        self.lines_delivered = 0
+        self.lines_dropped = 0
+        self.lines_late = 0
+        self.latencies = []
+
+    def dropped_bytes(self):
+        """Bytes lost in the driver buffer or the receive ring."""
+        return self.overflow + (self.ring.overflow if self.ring else 0)
+
+    def deliver(self, t, data):
+        """Put one captured line into the receive buffer at capture time t."""
+        before = self.dropped_bytes()
+        self.receive(data)  # The ring's IRQ handler drains it at once
+        self.lines_delivered += 1
+        if self.dropped_bytes() != before:
+            self.lines_dropped += 1
+        elif data.endswith(b'\n'):
+            self._arrivals.append(t)
+
+    def line_read(self, line):
+        """Record the latency of a line main.py took from the ring."""
+        if not line.endswith(b'\n') or not self._arrivals:
+            return
+        latency = clock.now - self._arrivals.pop(0)
+        self.latencies.append(latency)
+        if latency > self.late_s:
+            self.lines_late += 1
+
+
+class Stats:
+    def __init__(self):
+        self.commands = {}  # key -> list of (host_s, spi_s)
+        self.full_frames = 0
+        self.partial_flushes = 0
+        self.spi_bytes = 0
+        self.spi_seconds = 0.0
+        self.command_host_seconds = 0.0
+        self.page_changes = {}
+        self.passes = 0
+
+    def add_command(self, key, host_s, spi_s):
+        self.commands.setdefault(key, []).append((host_s, spi_s))
+        self.command_host_seconds += host_s
+
+
+def _pct(values, p):
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(len(values) - 1, int(p / 100 * len(values)))]
+
+
+def instrument(main, stats, cost_scale, port):
+    """Wrap process_command, show/show_rect, the SPI bus and the UART ring of main.py."""
+    lcd = main.lcd
+    spi = lcd.spi
+    spi_write = spi.write
+
+    def timed_spi_write(buf):
+        seconds = len(buf) * 8 / spi.baudrate
+        stats.spi_seconds += seconds
+        clock.advance(seconds)
+        spi_write(buf)
+
+    spi.write = timed_spi_write
+
+    # DMA flushes (rp2 stand-in) only cost the wait for the previous one
+    wait = lcd.wait
+
+    def timed_wait():
+        t0 = clock.now
+        wait()
+        stats.spi_seconds += clock.now - t0
+
+    lcd.wait = timed_wait
+
+    show = lcd.show
+    show_rect = lcd.show_rect
+
+    def counted_show():
+        stats.full_frames += 1
+        show()
+
+    def counted_show_rect(x, y, w, h):
+        stats.partial_flushes += 1
+        show_rect(x, y, w, h)
+
+    lcd.show = counted_show
+    lcd.show_rect = counted_show_rect
+
+    process_command = main.process_command
+
+    def timed_process_command(cmd_line):
+        match = COMMAND.match(bytes(cmd_line))
+        key = escape(match.group(1)[:12]) if match else MALFORMED
+        spi0 = stats.spi_seconds
+        t0 = time.perf_counter()
+        result = process_command(cmd_line)
+        host = time.perf_counter() - t0
+        clock.advance(host * cost_scale)
+        stats.add_command(key, host, stats.spi_seconds - spi0)
+        return result
+
+    main.process_command = timed_process_command
+
+    rx = main.rx
+    rx_readline = rx.readline
+
+    def timed_readline():
+        line = rx_readline()
+        if line:
+            port.line_read(line)
+        return line
+
+    rx.readline = timed_readline
+    port.ring = rx
+
+
+def replay(records, main, port, stats, speed, cost_scale, tail):
+    offset = clock.now  # Capture t=0 is when main.py finished booting
+    t_start = clock.now
+    wall_start = time.perf_counter()
+    end = offset + (records[-1][0] if records else 0) + tail
+    i = 0
+    mode = main.current_mode
+    while i < len(records) or port.any() or clock.now < end:
+        while i < len(records) and offset + records[i][0] <= clock.now:
+            port.deliver(offset + records[i][0], records[i][1])
+            i += 1
+
+        t0 = time.perf_counter()
+        command_s = stats.command_host_seconds
+        main.main_loop_pass()
+        # Command processing time was already added by the wrapper as each
+        # command ran; add the rest of the pass (touch, timeouts, link flush)
+        rest = time.perf_counter() - t0 - (stats.command_host_seconds - command_s)
+        clock.advance(rest * cost_scale)
+        stats.passes += 1
+        if main.current_mode != mode:
+            change = '%s -> %s' % (mode, main.current_mode)
+            stats.page_changes[change] = stats.page_changes.get(change, 0) + 1
+            mode = main.current_mode
+
+        # The main loop sleeps in wait_for_work() until a line is complete
+        # or a scheduled task is due; here a line means the next record
+        if not main.rx.lines():
+            wake = clock.now + main.sched.next_delay_ms(main.IDLE_MAX_MS) / 1000
+            if i < len(records):
+                wake = min(wake, offset + records[i][0])
+            clock.advance_to(wake)
+
+        if speed > 0:
+            ahead = (clock.now - t_start) / speed - (time.perf_counter() - wall_start)
+            if ahead > 0:
+                real_sleep(ahead)
+    return time.perf_counter() - wall_start
+
+
+def report(stats, port, link, capture_span, virtual_span, wall):
+    print('Capture span %.1f s, replayed %.1f s of device time in %.1f s wall (%.1fx)'
+          % (capture_span, virtual_span, wall, virtual_span / wall if wall else 0))
+    print()
+    print('%-12s %7s %9s %9s %9s %9s' % ('command', 'count', 'mean ms', 'p95 ms', 'max ms', 'spi ms'))
+    for key in sorted(stats.commands):
+        rows = stats.commands[key]
+        host = [h * 1000 for h, _ in rows]
+        spi = [s * 1000 for _, s in rows]
+        print('%-12s %7d %9.2f %9.2f %9.2f %9.2f'
+              % (key, len(rows), sum(host) / len(host), _pct(host, 95), max(host),
+                 sum(spi) / len(spi)))
+    print()
+    lat = [x * 1000 for x in port.latencies]
+    print('Lines: %d delivered, %d dropped (%d bytes overflowed), %d late (> %d ms)'
+          % (port.lines_delivered, port.lines_dropped, port.dropped_bytes(),
+             port.lines_late, port.late_s * 1000))
+    print('Line latency ms: p50 %.1f  p95 %.1f  max %.1f'
+          % (_pct(lat, 50), _pct(lat, 95), max(lat) if lat else 0))
+    print('Frames: %d full show(), %d partial flushes, %.2f MB over SPI (%.1f s blocked)'
+          % (stats.full_frames, stats.partial_flushes, stats.spi_bytes / 1e6,
+             stats.spi_seconds))
+    changes = sum(stats.page_changes.values())
+    print('Page changes: %d' % changes)
+    for change, n in sorted(stats.page_changes.items(), key=lambda kv: -kv[1]):
+        print('    %-28s %d' % (change, n))
+    print('Link: %s' % link.get_status())
+
+
+def run_replay(records, speed=0, cost_scale=1.0, rxbuf=256, late_ms=200,
+               tail=1.0, verbose=False):
+    """
+    Replay (time_s, bytes) records into main.py and print the report.
+
+    main.py can only be imported once per process, so call this once.
+
+    Returns:
+        (Stats, ReplayPort)
+    """
+    records = sorted(records, key=lambda r: r[0])
+    port = ReplayPort(rxbuf, late_ms)
+    machine.bind_uart(0, port)
+
+    out = sys.stdout if verbose else io.StringIO()
+    os.chdir(hostenv.ROOT_DIR)  # main.py opens layouts.json relative to cwd
+    with contextlib.redirect_stdout(out):
+        import main as device_main
+        stats = Stats()
+        instrument(device_main, stats, cost_scale, port)
+        start = clock.now
+        spi_bytes = device_main.lcd.spi.bytes_written
+        wall = replay(records, device_main, port, stats, speed, cost_scale, tail)
+        stats.spi_bytes = device_main.lcd.spi.bytes_written - spi_bytes
+    span = records[-1][0] - records[0][0] if records else 0
+    report(stats, port, device_main.link, span, clock.now - start, wall)
+    return stats, port
+
+
+def add_replay_arguments(parser):
+    """Replay options shared with tools/loadgen.py --standin."""
+    parser.add_argument('--speed', type=float, default=0,
+                        help='replay speed: 1 = real time, N = N times faster, 0 = flat out')
+    parser.add_argument('--cost-scale', type=float, default=1.0,
+                        help='multiply host processing time by this for device time')
+    parser.add_argument('--rxbuf', type=int, default=256, help='device UART receive buffer')
+    parser.add_argument('--late-ms', type=float, default=200,
+                        help='a line queued longer than this is counted late')
+    parser.add_argument('--tail', type=float, default=1.0,
+                        help='seconds to keep running after the last line')
+    parser.add_argument('--verbose', action='store_true', help="show main.py's output")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('capture', help='capture file (tools/uartcap.py format)')
+    add_replay_arguments(parser)
+    args = parser.parse_args()
+
+    run_replay(read_capture(args.capture), args.speed, args.cost_scale,
+               args.rxbuf, args.late_ms, args.tail, args.verbose)
+
+
+if __name__ == '__main__':
+    main()
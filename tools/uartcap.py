@@ -0,0 +1,106 @@
+"""
+Capture file format for the Pico -> display UART stream.
+
+A capture is a text file: a header line, then one record per received
+line with its arrival time in seconds from the start of the capture and
+the exact bytes received (including the trailing newline, if any), with
+non-printable bytes escaped:
+
+    # uartcap 1
+    0.000000	BATTERY:75\\n
+    0.012345	BATSYS:52.34,-12.50,24.5\\n
+    1.000120	@07BATTERY:75*72\\n
+
+Written by tools/uart_record.py and tools/loadgen.py, read by
+tools/uart_replay.py.
+"""
+
+HEADER = '# uartcap 1'
+
+
+def escape(data):
+    """bytes -> single-line ASCII text."""
+    return bytes(data).decode('latin-1').encode('unicode_escape').decode('ascii')
+
+
+def unescape(text):
+    """Inverse of escape()."""
+    return text.encode('ascii').decode('unicode_escape').encode('latin-1')
+
+
+class CaptureWriter:
+    """Append (time, bytes) records to a capture file."""
+
+    def __init__(self, path_or_file):
+        if hasattr(path_or_file, 'write'):
+            self.f = path_or_file
+            self._owned = False
+        else:
+            self.f = open(path_or_file, 'w')
+            self._owned = True
+        self.f.write(HEADER + '\n')
+        self.records = 0
+
+    def write(self, t, data):
+        self.f.write('%.6f\t%s\n' % (t, escape(data)))
+        self.records += 1
+
+    def flush(self):
+        self.f.flush()
+
+    def close(self):
+        if self._owned:
+            self.f.close()
+        else:
+            self.f.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def read_capture(path):
+    """
+    Yield (time_s, bytes) records from a capture file.
+
+    Raises:
+        ValueError: Not a capture file or a malformed record
+    """
+    with open(path) as f:
+        header = f.readline().rstrip('\n')
+        if header != HEADER:
+            raise ValueError('%s: not a uartcap file (header %r)' % (path, header))
+        for n, line in enumerate(f, 2):
+            line = line.rstrip('\n')
+            if not line or line.startswith('#'):
+                continue
+            t, sep, text = line.partition('\t')
+            if not sep:
+                raise ValueError('%s:%d: malformed record' % (path, n))
+            yield float(t), unescape(text)
+
+
+class LineSplitter:
+    """Split a byte stream into newline-terminated lines."""
+
+    def __init__(self):
+        self._partial = bytearray()
+
+    def feed(self, data):
+        """Return the list of complete lines (with '\\n') in data."""
+        self._partial += data
+        lines = []
+        while True:
+            i = self._partial.find(b'\n')
+            if i < 0:
+                return lines
+            lines.append(bytes(self._partial[:i + 1]))
+            del self._partial[:i + 1]
+
+    def rest(self):
+        """Return and clear any unterminated bytes."""
+        data = bytes(self._partial)
+        self._partial.clear()
+        return data
@@ -0,0 +1,324 @@
+#!/usr/bin/env python3
+"""
+Simulated Victron SmartShunt/BMV for VE.Direct text + HEX testing.
+
+SimulatedShunt sends a text block once per second and answers HEX Ping,
+Get and Set requests for the common battery registers (voltage, current,
+high-resolution current, SOC, temperature) after a short processing
+delay, optionally pushing async current updates. Its battery state moves
+every millisecond so polled values visibly change between text blocks.
+
+Run as a script, it wires the simulator to the Pico-side code
+(vedirect.VEDirectParser + vedirect_hex.HexClient) over a simulated
+19200 baud link on a virtual clock and reports the achieved poll rates,
+reply latency, line utilisation and whether the decoded values match the
+simulator:
+
+    python3 tools/vedirect_sim.py [--seconds 10] [--pipeline 2]
+                                  [--current-ms 100] [--voltage-ms 250]
+                                  [--soc-ms 1000] [--latency-ms 15]
+"""
+
+import argparse
+import math
+
+import hostenv
+
+clock = hostenv.use_virtual_clock()
+
+import machine  # noqa: E402  (stand-in)
+import vedirect_hex as vh  # noqa: E402
+from vedirect import VEDirectParser  # noqa: E402
+
+BAUD = 19200
+BYTE_TIME = 10.0 / BAUD  # 8N1
+
+
+class WirePort(machine.Port):
+    """Port whose transmissions reach the peer at the serial line rate."""
+
+    def __init__(self, rxbuf=256):
+        super().__init__(rxbuf)
+        self._queue = []   # (arrival time, byte)
+        self._free = 0.0   # When our TX line is next idle
+        self.busy = 0.0    # Seconds spent transmitting
+
+    def send(self, data):
+        data = bytes(data)
+        self.tx_bytes += len(data)
+        t = max(clock.now, self._free)
+        for b in data:
+            t += BYTE_TIME
+            self._queue.append((t, b))
+        self.busy += len(data) * BYTE_TIME
+        self._free = t
+        return len(data)
+
+    def deliver(self):
+        """Move bytes whose transmission has finished into the peer."""
+        q = self._queue
+        k = 0
+        while k < len(q) and q[k][0] <= clock.now:
+            k += 1
+        if k:
+            self.peer.receive(bytes(b for _, b in q[:k]))
+            del q[:k]
+
+
+class SimulatedShunt:
+    """VE.Direct device model answering text + HEX."""
+
+    PRODUCT_ID = 0xA389  # SmartShunt 500A/50mV
+    FIRMWARE = 0x0413
+
+    def __init__(self, uart, latency_ms=15, async_ms=0):
+        self.uart = uart
+        self.latency = latency_ms / 1000
+        self.async_period = async_ms / 1000
+        self.t = 0.0
+        self.voltage_cv = 5234   # 0.01 V
+        self.current_ma = -12500
+        self.soc = 75.0          # %
+        self.temp_ck = 29765     # 0.01 K (24.5 C)
+        self._rx = bytearray()
+        self._replies = []       # (due time, frame bytes, register, value)
+        self._next_block = 0.0
+        self._next_async = 0.0
+        self.requests = 0
+        self.sets = 0
+        self.sent = {}           # reg -> values sent in Get/async replies, in order
+
+    # Registers: id -> (size, signed, getter, setter)
+    def _registers(self):
+        return {
+            vh.REG_MAIN_VOLTAGE: (2, False, lambda: self.voltage_cv, None),
+            vh.REG_CURRENT: (2, True, lambda: int(round(self.current_ma / 100)), None),
+            vh.REG_CURRENT_HIRES: (4, True, lambda: self.current_ma, None),
+            vh.REG_SOC: (2, False, lambda: int(self.soc * 100), self._set_soc),
+            vh.REG_BATTERY_TEMP: (2, False, lambda: self.temp_ck, None),
+        }
+
+    def _set_soc(self, value):
+        self.soc = value / 100
+
+    def step(self):
+        """Advance the battery model to clock.now."""
+        t = clock.now
+        # Load steps every 0.7 s plus a 3 Hz ripple: current changes fast
+        base = -12500 if int(t / 0.7) % 2 == 0 else 8000
+        self.current_ma = base + int(1500 * math.sin(2 * math.pi * 3 * t))
+        self.voltage_cv = 5234 + self.current_ma // 2000
+        # 200 Ah battery: % per second = mA / 1000 / 200 Ah / 3600 s * 100
+        self.soc = max(0.0, min(100.0, self.soc + (t - self.t) * self.current_ma / 7200000))
+        self.t = t
+
+    def value(self, reg):
+        size, signed, get, _ = self._registers()[reg]
+        return get()
+
+    def text_block(self):
+        fields = [
+            (b'PID', b'0x%X' % self.PRODUCT_ID),
+            (b'V', b'%d' % (self.voltage_cv * 10)),
+            (b'I', b'%d' % self.current_ma),
+            (b'P', b'%d' % (self.voltage_cv * self.current_ma // 100000)),
+            (b'CE', b'-12345'),
+            (b'SOC', b'%d' % int(self.soc * 10)),
+            (b'TTG', b'-1'),
+            (b'Alarm', b'OFF'),
+            (b'AR', b'0'),
+            (b'T', b'%d' % ((self.temp_ck - 27315) // 100)),
+            (b'FW', b'%04X' % self.FIRMWARE),
+        ]
+        data = bytearray()
+        for label, value in fields:
+            data += b'\r\n' + label + b'\t' + value
+        data += b'\r\nChecksum\t'
+        data.append((256 - sum(data) % 256) % 256)
+        return bytes(data)
+
+    def _reply(self, frame, reg=None, value=None):
+        self._replies.append((clock.now + self.latency, frame, reg, value))
+
+    def _write(self, frame, reg=None, value=None):
+        if reg is not None:
+            self.sent.setdefault(reg, []).append(value)
+        self.uart.write(frame)
+
+    def _handle(self, line):
+        data = bytearray(vh.FRAME_MAX // 2)
+        cmd, n = vh.decode_into(line, len(line), data)
+        if cmd < 0:
+            return  # Real devices ignore bad frames
+        self.requests += 1
+        regs = self._registers()
+        if cmd == vh.CMD_PING:
+            self._reply(vh.encode_frame(vh.RESP_PING, bytes((self.FIRMWARE & 0xFF,
+                                                                self.FIRMWARE >> 8))))
+        elif cmd == vh.CMD_GET or cmd == vh.CMD_SET:
+            reg = data[0] | (data[1] << 8)
+            out = bytearray(data[:3])
+            if reg not in regs:
+                out[2] = vh.FLAG_UNKNOWN_ID
+            elif cmd == vh.CMD_GET:
+                size, signed, get, _ = regs[reg]
+                value = bytearray(size)
+                v = get()
+                vh.put_le(value, 0, v, size)
+                out += value
+                self._reply(vh.encode_frame(cmd, bytes(out)), reg, v)
+                return
+            else:
+                size, signed, get, setter = regs[reg]
+                if setter is None:
+                    out[2] = vh.FLAG_PARAMETER_ERROR
+                else:
+                    setter(vh.get_le(data, 3, size, signed))
+                    self.sets += 1
+                    value = bytearray(size)
+                    vh.put_le(value, 0, get(), size)
+                    out += value
+            self._reply(vh.encode_frame(cmd, bytes(out)))
+        else:
+            self._reply(vh.encode_frame(vh.RESP_UNKNOWN, bytes((cmd,))))
+
+    def poll(self):
+        """Process received requests and send due output. Call every tick."""
+        self.step()
+        self._rx += self.uart.read() or b''
+        while True:
+            start = self._rx.find(b':')
+            if start < 0:
+                self._rx.clear()
+                break
+            end = self._rx.find(b'\n', start)
+            if end < 0:
+                del self._rx[:start]
+                break
+            self._handle(bytes(self._rx[start:end + 1]))
+            del self._rx[:end + 1]
+
+        now = clock.now
+        while self._replies and self._replies[0][0] <= now:
+            self._write(*self._replies.pop(0)[1:])
+        if now >= self._next_block:
+            self.uart.write(self.text_block())
+            self._next_block += 1.0
+        if self.async_period and now >= self._next_async:
+            value = bytearray(4)
+            vh.put_le(value, 0, self.current_ma, 4)
+            reg = vh.REG_CURRENT_HIRES
+            self._write(vh.encode_frame(vh.RESP_ASYNC, bytes((reg & 0xFF, reg >> 8, 0)) + value),
+                        reg, self.current_ma)
+            self._next_async += self.async_period
+
+
+def run(args):
+    pico_port = WirePort()
+    device_port = WirePort()
+    pico_port.peer = device_port
+    device_port.peer = pico_port
+    pico_uart = machine.UART(1, baudrate=BAUD, port=pico_port)
+    device_uart = machine.UART(9, baudrate=BAUD, port=device_port)
+
+    device = SimulatedShunt(device_uart, args.latency_ms, args.async_ms)
+    client = vh.HexClient(pico_uart, pipeline=args.pipeline, timeout_ms=args.timeout_ms)
+    polls = [
+        ('current (ED8C)', client.add_poll(vh.REG_CURRENT_HIRES, args.current_ms, signed=True),
+         vh.REG_CURRENT_HIRES),
+        ('voltage (ED8D)', client.add_poll(vh.REG_MAIN_VOLTAGE, args.voltage_ms),
+         vh.REG_MAIN_VOLTAGE),
+        ('SOC (0FFF)', client.add_poll(vh.REG_SOC, args.soc_ms), vh.REG_SOC),
+    ]
+    parser = VEDirectParser(on_hex=client.handle_frame)
+    buf = bytearray(64)
+
+    updates = {slot: 0 for _, slot, _ in polls}
+    latency = {slot: [] for _, slot, _ in polls}
+    mismatches = 0
+    in_flight = []
+    text_current_changes = 0
+    last_text_current = None
+    client.ping()
+
+    tick = 0.001
+    steps = int(args.seconds / tick)
+    for _ in range(steps):
+        clock.advance(tick)
+        pico_port.deliver()
+        device_port.deliver()
+        device.poll()
+
+        responses = client.responses
+        n = pico_uart.readinto(buf)
+        if n and parser.feed(buf, n):
+            current = parser.frame.get_int(b'I')
+            if current != last_text_current:
+                text_current_changes += 1
+                last_text_current = current
+        for _, slot, reg in polls:
+            if client.fresh[slot]:
+                client.fresh[slot] = 0
+                updates[slot] += 1
+                if client.responses != responses:  # Get reply, not an async push
+                    latency[slot].append(hostenv.ticks_diff(clock.ticks_ms(), client._sent[slot]))
+                # Must equal the value the device put in its reply
+                if client.values[slot] != device.sent[reg].pop(0):
+                    mismatches += 1
+        client.service()
+        in_flight.append(client.get_status()['in_flight'])
+
+    # Set round trip: sync SOC to 100 %
+    client.set(vh.REG_SOC, 10000, 2)
+    for _ in range(200):
+        clock.advance(tick)
+        pico_port.deliver()
+        device_port.deliver()
+        device.poll()
+        n = pico_uart.readinto(buf)
+        if n:
+            parser.feed(buf, n)
+
+    print('Simulated %.1f s at %d baud, pipeline %d, device latency %d ms'
+          % (args.seconds, BAUD, args.pipeline, args.latency_ms))
+    print()
+    print('%-16s %9s %10s %16s %16s' % ('register', 'interval', 'updates/s',
+                                        'mean latency ms', 'max latency ms'))
+    for name, slot, _ in polls:
+        rate = updates[slot] / args.seconds
+        lat = latency[slot] or [0]
+        print('%-16s %6d ms %10.1f %16.1f %16d' % (name, client.interval[slot], rate,
+                                                  sum(lat) / len(lat), max(lat)))
+    print()
+    print('Text blocks: %d valid, %d checksum errors; battery current changed in %d of them'
+          % (parser.frames, parser.checksum_errors, text_current_changes))
+    print('HEX client: %s' % client.get_status())
+    print('Decoded values differing from the device reply: %d' % mismatches)
+    print('Set SOC=100.00%%: reply ok=%s, device SOC now %.2f%%' % (client.last_set_ok, device.soc))
+    print('Line utilisation: Pico->device %.0f%%, device->Pico %.0f%%'
+          % (100 * pico_port.busy / args.seconds, 100 * device_port.busy / args.seconds))
+    print('Mean requests in flight: %.2f' % (sum(in_flight) / len(in_flight)))
+    ok = parser.frames > 0 and client.timeouts == 0 and client.last_set_ok and not mismatches
+    print('OK' if ok else 'CHECK FAILED')
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--seconds', type=float, default=10)
+    parser.add_argument('--pipeline', type=int, default=2)
+    parser.add_argument('--current-ms', type=int, default=100)
+    parser.add_argument('--voltage-ms', type=int, default=250)
+    parser.add_argument('--soc-ms', type=int, default=1000)
+    parser.add_argument('--latency-ms', type=float, default=15,
+                        help='device processing time per request')
+    parser.add_argument('--timeout-ms', type=int, default=500)
+    parser.add_argument('--async-ms', type=float, default=0,
+                        help='device pushes async current updates this often (0 = off)')
+    args = parser.parse_args()
+    if not run(args):
+        raise SystemExit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,479 @@
+# UART Link Layer for Pico <-> Display Communication
+# Optional acknowledged mode with sequence numbers, checksums, resync and
+# credit-based flow control on top of the line-delimited command protocol
+#
+# Frames (Pico -> display):
+#     @SS<payload>*CC\n
+#         SS: sequence number, 2 hex digits (00-FF, wraps)
+#         CC: XOR of every byte between '@' and '*', 2 hex digits
+#     Lines without a leading '@' are legacy commands and pass through
+#     unchanged, so an old Pico keeps working with a new display.
+#
+# Replies (display -> Pico), plain lines:
+#     ACK:SS,N   every frame up to SS handled; N credits = number of frames
+#                the Pico may send beyond SS before the next ACK
+#     NAK:SS     frame SS was corrupt or missing - resend from SS
+#     REJ:SS     frame SS arrived intact but the command was rejected
+#     RESYNC     display has no state (boot) - resend the full snapshot
+#
+# Used by main.py on the display (DisplayLink) and by the Pico (PicoLink).
+# Runs on MicroPython and, with tools/hostenv.py, on CPython.
+
+import time
+
+# Default flow-control window in frames. Sized so a full window of typical
+# ~30 byte lines fits in the display's UART receive buffer.
+DEFAULT_WINDOW = 8
+
+# Typical line length used to turn buffered bytes into a backlog estimate
+AVG_LINE_BYTES = 24
+
+# Longest line accepted before the partial line is discarded
+MAX_LINE_BYTES = 128
+
+# Commands whose latest value makes up the state snapshot resent on RESYNC.
+# Device-tagged commands (BATSYS@mppt1) are kept per tag under their base
+# command; DEVICE comes first so kinds are declared before the data.
+SNAPSHOT_KEYS = (b'DEVICE', b'BATTERY', b'BATSYS', b'CHARGING', b'WIFI', b'DEMO', b'BRIGHT')
+
+_HEX = b'0123456789ABCDEF'
+
+
+def _xor(data, start, end):
+    ck = 0
+    for i in range(start, end):
+        ck ^= data[i]
+    return ck
+
+
+def _hexval(c):
+    if 0x30 <= c <= 0x39:
+        return c - 0x30
+    c |= 0x20  # Lower-case
+    if 0x61 <= c <= 0x66:
+        return c - 0x61 + 10
+    return -1
+
+
+def _hex2(data, i):
+    """Parse two hex digits at data[i]; -1 if invalid."""
+    hi = _hexval(data[i])
+    lo = _hexval(data[i + 1])
+    if hi < 0 or lo < 0:
+        return -1
+    return (hi << 4) | lo
+
+
+def _key(payload):
+    """Command key of a payload (text before ':'), e.g. b'BATSYS'."""
+    i = payload.find(b':')
+    return payload if i < 0 else payload[:i]
+
+
+def _base(key):
+    """Command of a key without its device tag, e.g. b'BATSYS@mppt1' -> b'BATSYS'."""
+    i = key.find(b'@')
+    return key if i < 0 else key[:i]
+
+
+def encode_frame(seq, payload):
+    """
+    Build an acknowledged-mode frame.
+
+    Args:
+        seq: Sequence number 0-255
+        payload: Command bytes without newline, e.g. b'BATTERY:75'
+
+    Returns:
+        bytes, e.g. b'@07BATTERY:75*72\\n'
+    """
+    frame = bytearray(len(payload) + 7)
+    frame[0] = 0x40  # '@'
+    frame[1] = _HEX[seq >> 4]
+    frame[2] = _HEX[seq & 0x0F]
+    frame[3:3 + len(payload)] = payload
+    end = 3 + len(payload)
+    ck = _xor(frame, 1, end)
+    frame[end] = 0x2A  # '*'
+    frame[end + 1] = _HEX[ck >> 4]
+    frame[end + 2] = _HEX[ck & 0x0F]
+    frame[end + 3] = 0x0A
+    return bytes(frame)
+
+
+def decode_frame(line):
+    """
+    Validate a frame.
+
+    Args:
+        line: bytes of one line, with or without trailing newline
+
+    Returns:
+        (seq, payload) on success, (-1, None) if corrupt
+    """
+    end = len(line)
+    while end and line[end - 1] in (0x0A, 0x0D):
+        end -= 1
+    if end < 6 or line[0] != 0x40 or line[end - 3] != 0x2A:
+        return -1, None
+    seq = _hex2(line, 1)
+    ck = _hex2(line, end - 2)
+    if seq < 0 or ck < 0 or ck != _xor(line, 1, end - 3):
+        return -1, None
+    return seq, line[3:end - 3]
+
+
+class DisplayLink:
+    """
+    Display side of the link: assembles lines, checks frames, sends replies.
+
+    Example (main loop):
+        link = DisplayLink(uart, ack_mode=True)
+        link.request_resync()
+        while True:
+            payload = link.readline()
+            while payload:
+                link.complete(process_command(payload))
+                payload = link.readline()
+            link.flush()
+    """
+
+    def __init__(self, uart, ack_mode=True, window=DEFAULT_WINDOW):
+        """
+        Args:
+            uart: machine.UART connected to the Pico
+            ack_mode: If True, reply to frames with ACK/NAK/REJ and credits
+            window: Maximum frames the Pico may have outstanding
+        """
+        self.uart = uart
+        self.ack_mode = ack_mode
+        self.window = window
+
+        self._line = bytearray(MAX_LINE_BYTES)
+        self._line_len = 0
+        self._discarding = False
+
+        self.expected = -1       # Next expected sequence number, -1 = any
+        self.last_seq = -1       # Last frame handled, -1 = none yet
+        self._current_seq = -1   # Frame being processed by the caller
+        self._nak_sent = False
+        self._ack_due = False
+
+        # Counters
+        self.frames = 0
+        self.legacy_lines = 0
+        self.corrupt = 0
+        self.gaps = 0
+        self.duplicates = 0
+        self.rejected = 0
+        self.overlong = 0
+
+    def _read_line(self):
+        """Return the next complete line (bytes) or None."""
+        while self.uart.any():
+            chunk = self.uart.readline()
+            if not chunk:
+                return None
+            n = len(chunk)
+            complete = chunk[n - 1] == 0x0A
+            if self._discarding:
+                # Rest of an overlong line; drop through its newline
+                if complete:
+                    self._discarding = False
+                continue
+            if not complete or self._line_len:
+                # Partial line (readline timed out mid-line): accumulate
+                if self._line_len + n > MAX_LINE_BYTES:
+                    self.overlong += 1
+                    self._line_len = 0
+                    self._discarding = not complete
+                    continue
+                self._line[self._line_len:self._line_len + n] = chunk
+                self._line_len += n
+                if not complete:
+                    continue
+                chunk = bytes(self._line[:self._line_len])
+                self._line_len = 0
+            return chunk
+        return None
+
+    def readline(self):
+        """
+        Return the next command payload ready for process_command(), or None.
+
+        Framed lines are verified and de-duplicated; corrupt or out-of-order
+        frames are answered with NAK and not returned. Call complete() after
+        processing each returned payload.
+        """
+        while True:
+            line = self._read_line()
+            if line is None:
+                return None
+
+            if line[0] != 0x40:  # Legacy line
+                self.legacy_lines += 1
+                self._current_seq = -1
+                return line
+
+            seq, payload = decode_frame(line)
+            if seq < 0:
+                self.corrupt += 1
+                self._nak()
+                continue
+
+            if self.expected >= 0 and seq != self.expected:
+                if (seq - self.expected) & 0x80:
+                    # Behind us: a retransmission of something already
+                    # handled (our ACK was lost) - just re-acknowledge
+                    self.duplicates += 1
+                    self._ack_due = True
+                else:
+                    self.gaps += 1
+                    self._nak()
+                continue
+
+            self.frames += 1
+            self._nak_sent = False
+            self._current_seq = seq
+            self.expected = (seq + 1) & 0xFF
+            return payload
+
+    def complete(self, ok=True):
+        """Report the result of processing the payload from readline()."""
+        seq = self._current_seq
+        if seq < 0:
+            return
+        self._current_seq = -1
+        self.last_seq = seq
+        self._ack_due = True
+        if not ok:
+            self.rejected += 1
+            self._send_reply(b'REJ:', seq)
+
+    def credits(self):
+        """Frames the Pico may send beyond the last ACK, given our backlog."""
+        backlog = self.uart.any() // AVG_LINE_BYTES
+        credits = self.window - backlog
+        return credits if credits > 0 else 0
+
+    def flush(self):
+        """Send one cumulative ACK (with credits) for everything handled."""
+        if not self.ack_mode or not self._ack_due or self.last_seq < 0:
+            return
+        self._ack_due = False
+        self.uart.write(b'ACK:%02X,%d\n' % (self.last_seq, self.credits()))
+
+    def request_resync(self):
+        """Ask the Pico to resend its full state snapshot."""
+        if not self.ack_mode:
+            return
+        self.expected = -1
+        self._nak_sent = False
+        self.uart.write(b'RESYNC\n')
+
+    def _nak(self):
+        # One NAK per gap; further frames are dropped until the resend
+        # arrives or the Pico's retransmit timer fires
+        if not self.ack_mode or self._nak_sent:
+            return
+        self._nak_sent = True
+        if self.expected < 0:
+            self.request_resync()
+        else:
+            self._send_reply(b'NAK:', self.expected)
+
+    def _send_reply(self, kind, seq):
+        if self.ack_mode:
+            self.uart.write(kind + b'%02X\n' % seq)
+
+    def get_status(self):
+        """Dictionary of link counters for logging."""
+        return {
+            'frames': self.frames,
+            'legacy': self.legacy_lines,
+            'corrupt': self.corrupt,
+            'gaps': self.gaps,
+            'duplicates': self.duplicates,
+            'rejected': self.rejected,
+            'overlong': self.overlong,
+        }
+
+
+class PicoLink:
+    """
+    Pico side of the link: numbers frames, retransmits, honours credits and
+    keeps the state snapshot for RESYNC.
+
+    Commands queued while the display has no credit are coalesced per
+    command key, so a busy display receives the latest BATSYS instead of a
+    backlog of stale ones.
+
+    Example:
+        link = PicoLink(uart)
+        while True:
+            link.send(b"BATTERY:%d" % soc)
+            link.send(b"BATSYS:%.2f,%.2f,%.1f" % (v, i, t))
+            link.poll()
+            time.sleep_ms(10)
+    """
+
+    def __init__(self, uart, window=DEFAULT_WINDOW, retransmit_ms=500,
+                 snapshot_keys=SNAPSHOT_KEYS):
+        """
+        Args:
+            uart: machine.UART connected to the display
+            window: Initial credit until the display's first ACK
+            retransmit_ms: Resend the oldest unacknowledged frame after this
+            snapshot_keys: Command keys included in the RESYNC snapshot
+        """
+        self.uart = uart
+        self.retransmit_ms = retransmit_ms
+        self.snapshot_keys = snapshot_keys
+
+        self.next_seq = 0
+        self.acked = -1           # Highest acknowledged seq, -1 = none
+        self.credits = window     # Frames allowed beyond `acked`
+        self._unacked = []        # [(seq, frame_bytes)] oldest first
+        self._last_tx_ms = time.ticks_ms()
+
+        self._pending = {}        # key -> payload awaiting credit
+        self._order = []          # keys in arrival order
+        self.snapshot = {}        # key -> latest payload
+
+        self._rx = bytearray()
+
+        # Counters
+        self.sent = 0
+        self.retransmits = 0
+        self.coalesced = 0
+        self.naks = 0
+        self.rejects = 0
+        self.resyncs = 0
+        self.throttled = 0
+
+    def send(self, payload):
+        """Queue a command (str or bytes, no newline) for delivery."""
+        if isinstance(payload, str):
+            payload = payload.encode()
+        key = _key(payload)
+        if _base(key) in self.snapshot_keys:
+            self.snapshot[key] = payload
+        if key in self._pending:
+            self.coalesced += 1
+        else:
+            self._order.append(key)
+        self._pending[key] = payload
+        self._transmit()
+
+    def resync(self):
+        """Queue the full snapshot (what a RESYNC request triggers)."""
+        self.resyncs += 1
+        for base in self.snapshot_keys:
+            for key, payload in self.snapshot.items():
+                if _base(key) == base and key not in self._pending:
+                    self._order.append(key)
+                    self._pending[key] = payload
+        self._transmit()
+
+    def in_flight(self):
+        return len(self._unacked)
+
+    def poll(self):
+        """Process replies from the display, retransmit and send queued data."""
+        self._read_replies()
+        if time.ticks_diff(time.ticks_ms(), self._last_tx_ms) > self.retransmit_ms:
+            if self._unacked:
+                # No ACK in time: probe with the oldest frame only, a busy
+                # display should not be flooded with the whole window again
+                self.retransmits += 1
+                self.uart.write(self._unacked[0][1])
+                self._last_tx_ms = time.ticks_ms()
+            elif self.credits == 0:
+                # Zero credit and nothing in flight to earn an ACK: allow
+                # one probe frame so the link cannot stall
+                self.credits = 1
+        self._transmit()
+
+    def _transmit(self):
+        while self._order:
+            if len(self._unacked) >= self.credits:
+                self.throttled += 1
+                return
+            key = self._order.pop(0)
+            payload = self._pending.pop(key)
+            seq = self.next_seq
+            self.next_seq = (seq + 1) & 0xFF
+            frame = encode_frame(seq, payload)
+            self._unacked.append((seq, frame))
+            self.uart.write(frame)
+            self.sent += 1
+            self._last_tx_ms = time.ticks_ms()
+
+    def _read_replies(self):
+        while self.uart.any():
+            data = self.uart.read()
+            if not data:
+                break
+            self._rx += data
+        while True:
+            i = self._rx.find(b'\n')
+            if i < 0:
+                if len(self._rx) > MAX_LINE_BYTES:
+                    self._rx = bytearray()
+                return
+            line = bytes(self._rx[:i]).strip()
+            self._rx = self._rx[i + 1:]
+            self._handle_reply(line)
+
+    def _handle_reply(self, line):
+        if line.startswith(b'ACK:') and len(line) >= 8:
+            seq = _hex2(line, 4)
+            if seq < 0:
+                return
+            try:
+                self.credits = int(line[7:])
+            except ValueError:
+                return
+            self.acked = seq
+            # Drop everything up to and including seq
+            while self._unacked and not ((seq - self._unacked[0][0]) & 0x80):
+                self._unacked.pop(0)
+            self._last_tx_ms = time.ticks_ms()
+
+        elif line.startswith(b'NAK:') and len(line) >= 6:
+            seq = _hex2(line, 4)
+            self.naks += 1
+            for i in range(len(self._unacked)):
+                if self._unacked[i][0] == seq:
+                    # Go-back-N: everything from seq onwards
+                    del self._unacked[:i]
+                    for _, frame in self._unacked:
+                        self.uart.write(frame)
+                        self.retransmits += 1
+                    self._last_tx_ms = time.ticks_ms()
+                    return
+            # Display expects a frame we no longer hold: start over
+            self._unacked = []
+            self.resync()
+
+        elif line.startswith(b'REJ:'):
+            self.rejects += 1
+            print(f"Display rejected frame {line[4:].decode()}")
+
+        elif line == b'RESYNC':
+            # Display restarted: forget in-flight frames and resend state
+            self._unacked = []
+            self.resync()
+
+    def get_status(self):
+        """Dictionary of link counters for logging."""
+        return {
+            'sent': self.sent,
+            'retransmits': self.retransmits,
+            'coalesced': self.coalesced,
+            'naks': self.naks,
+            'rejects': self.rejects,
+            'resyncs': self.resyncs,
+            'in_flight': len(self._unacked),
+            'credits': self.credits,
+        }
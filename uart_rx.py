@@ -0,0 +1,211 @@
+# Interrupt-Driven UART Receive Ring Buffer
+# Moves received bytes out of the UART driver's small buffer into a larger
+# fixed ring from an interrupt (UART IRQ_RXIDLE at the end of each burst,
+# plus a periodic Timer for continuous streams), so a long render or
+# show() on the main loop no longer overruns the driver's 256 bytes.
+# When the ring is full, whole lines are dropped (never a piece of one, so
+# two lines cannot run together) and counted in `overflow`.
+#
+# UartRx looks like the UART to uart_link.DisplayLink (any(), readline(),
+# write()), and readline() only hands out complete lines. wait() lets the
+# main loop sleep in machine.idle() until a whole line (or frame) is
+# buffered instead of polling on a fixed period.
+#
+# One writer (the IRQ handler) moves the head, one reader moves the tail,
+# so no lock is needed; the newline counters tell the reader how many
+# complete lines are waiting without scanning the ring.
+#
+# Example:
+#     from uart_rx import UartRx
+#
+#     rx = UartRx(uart)
+#     link = DisplayLink(rx)
+#     while True:
+#         line = rx.readline()      # or link.readline()
+#         ...
+#         rx.wait(100)              # Sleep until a line arrives (<= 100 ms)
+
+import time
+import machine
+from machine import UART, Timer
+
+RX_RING_BYTES = 2048  # ~0.18 s of back-to-back lines at 115200 baud
+DRAIN_MS = 10         # Timer drain period (~115 bytes at 115200 baud)
+CHUNK_BYTES = 64      # Bytes moved per readinto() in the handler
+MAX_LINE_BYTES = 128  # Longer lines are dropped (as uart_link does)
+
+_COUNT_MASK = 0x3FFFFFFF  # Newline counters wrap (small ints, no allocation)
+
+
+class UartRx:
+    """
+    Ring buffer filled from UART interrupts.
+
+    The ring holds up to size - 1 bytes. Complete lines are counted as
+    they arrive (lines()); readline() returns the oldest one as bytes.
+    Partial lines stay in the ring until their newline arrives.
+    """
+
+    def __init__(self, uart, size=RX_RING_BYTES, drain_ms=DRAIN_MS):
+        """
+        Args:
+            uart: machine.UART to read
+            size: Ring buffer size in bytes
+            drain_ms: Period of the backup Timer drain (0 = IRQ_RXIDLE only)
+        """
+        self.uart = uart
+        self.write = uart.write
+        self._ring = bytearray(size)
+        self._size = size
+        self._head = 0      # Next byte written (handler only)
+        self._tail = 0      # Next byte read (reader only)
+        self._nl_in = 0     # Newlines stored (handler only)
+        self._nl_out = 0    # Newlines read (reader only)
+        self._line_start = 0  # Start of the partial line being received
+        self._skip = False    # Dropping bytes up to the next newline
+        self._chunk = bytearray(CHUNK_BYTES)
+        self._draining = False
+
+        # Counters
+        self.overflow = 0   # Bytes dropped (ring full or overlong lines)
+        self.overlong = 0   # Lines longer than MAX_LINE_BYTES dropped
+        self.drains = 0     # Handler runs that moved bytes
+        self.peak = 0       # Highest ring fill in bytes
+
+        # Fall back to draining from the reader if no interrupt source works
+        self._irq = False
+        try:
+            uart.irq(handler=self.drain, trigger=UART.IRQ_RXIDLE)
+            self._irq = True
+        except (AttributeError, TypeError, ValueError):
+            pass
+        self._timer = None
+        if drain_ms:
+            self._timer = Timer(-1, mode=Timer.PERIODIC, period=drain_ms,
+                                callback=self.drain)
+            self._irq = True
+
+    def drain(self, _source=None):
+        """Move everything the UART driver holds into the ring (IRQ handler)."""
+        if self._draining:
+            return
+        self._draining = True
+        uart = self.uart
+        chunk = self._chunk
+        ring = self._ring
+        size = self._size
+        head = self._head
+        start = self._line_start
+        skip = self._skip
+        moved = False
+        while uart.any():
+            n = uart.readinto(chunk)
+            if not n:
+                break
+            moved = True
+            tail = self._tail  # Only grows the free space if it moves on
+            newlines = 0
+            dropped = 0
+            for i in range(n):
+                c = chunk[i]
+                if skip:
+                    # Rest of a dropped line
+                    dropped += 1
+                    if c == 0x0A:
+                        skip = False
+                    continue
+                nxt = head + 1
+                if nxt == size:
+                    nxt = 0
+                if nxt == tail or (head - start) % size >= MAX_LINE_BYTES:
+                    # Full, or overlong: drop the whole partial line so
+                    # no line is ever stored with a piece missing
+                    if nxt != tail:
+                        self.overlong += 1
+                    dropped += (head - start) % size + 1
+                    head = start
+                    skip = c != 0x0A
+                    continue
+                ring[head] = c
+                head = nxt
+                if c == 0x0A:
+                    newlines += 1
+                    start = head
+            self._head = head
+            if newlines:
+                self._nl_in = (self._nl_in + newlines) & _COUNT_MASK
+            if dropped:
+                self.overflow += dropped
+        self._line_start = start
+        self._skip = skip
+        if moved:
+            self.drains += 1
+            used = (head - self._tail) % size
+            if used > self.peak:
+                self.peak = used
+        self._draining = False
+
+    def any(self):
+        """Bytes buffered (complete lines and any partial line)."""
+        if not self._irq:
+            self.drain()
+        return (self._head - self._tail) % self._size
+
+    def lines(self):
+        """Complete lines buffered."""
+        if not self._irq:
+            self.drain()
+        return (self._nl_in - self._nl_out) & _COUNT_MASK
+
+    def readline(self):
+        """Return the oldest complete line (with its newline), or None."""
+        if not self.lines():
+            return None
+        ring = self._ring
+        size = self._size
+        tail = self._tail
+        i = tail
+        while ring[i] != 0x0A:
+            i += 1
+            if i == size:
+                i = 0
+        end = i + 1
+        if end > tail:
+            line = bytes(ring[tail:end])
+        else:
+            line = bytes(ring[tail:]) + bytes(ring[:end])
+        self._tail = end if end < size else 0
+        self._nl_out = (self._nl_out + 1) & _COUNT_MASK
+        return line
+
+    def wait(self, timeout_ms, wake=None):
+        """
+        Sleep until a complete line is buffered.
+
+        Args:
+            timeout_ms: Give up after this long
+            wake: Optional callable; return early when it returns True
+                  (e.g. a touch is pending)
+
+        Returns:
+            True if a line is waiting
+        """
+        start = time.ticks_ms()
+        while not self.lines():
+            if wake is not None and wake():
+                return False
+            if time.ticks_diff(time.ticks_ms(), start) >= timeout_ms:
+                return False
+            machine.idle()  # Until the next interrupt (UART, timer, tick)
+        return True
+
+    def get_status(self):
+        """Dictionary of receive counters for logging."""
+        return {
+            'buffered': self.any(),
+            'lines': self.lines(),
+            'overflow': self.overflow,
+            'overlong': self.overlong,
+            'drains': self.drains,
+            'peak': self.peak,
+        }
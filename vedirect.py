@@ -0,0 +1,298 @@
+# Streaming VE.Direct Text-Protocol Parser
+# Parses Victron VE.Direct text frames incrementally from raw UART bytes,
+# validates the block checksum and hands out complete frames as
+# preallocated field records (no per-line strings). Runs on MicroPython
+# (Pico) and CPython (host tools and tests).
+#
+# VE.Direct text protocol (19200 8N1): the device sends a block of lines
+#     \r\n<label>\t<value>
+# roughly once per second, ending with
+#     \r\nChecksum\t<byte>
+# where <byte> makes the sum of every byte of the block 0 modulo 256.
+# Hex-protocol messages (':' ... '\n') may be interleaved; they are not
+# part of the checksum. They are skipped, or collected and passed to an
+# on_hex callback (e.g. vedirect_hex.HexClient.handle_frame) so one UART
+# can carry both protocols.
+#
+# Example (Pico):
+#     from machine import UART, Pin
+#     from vedirect import VEDirectParser
+#
+#     victron_uart = UART(1, baudrate=19200, tx=Pin(4), rx=Pin(5))
+#     parser = VEDirectParser()
+#     buf = bytearray(64)
+#     while True:
+#         n = victron_uart.readinto(buf)
+#         if n and parser.feed(buf, n):
+#             frame = parser.frame
+#             mv = frame.get_int(b'V')        # Battery voltage, mV
+#             ma = frame.get_int(b'I')        # Battery current, mA
+
+# Field size limits (the protocol allows 9 byte labels, 33 byte values)
+LABEL_MAX = 16
+VALUE_MAX = 33
+MAX_FIELDS = 32
+HEX_MAX = 64  # Longest hex message passed to on_hex (longer ones are dropped)
+
+# Parser states
+_LABEL = 0      # Reading a label (after '\n')
+_VALUE = 1      # Reading a value (after '\t')
+_CHECKSUM = 2   # Next byte is the checksum byte
+_HEX = 3        # Inside a ':' hex message, skip to '\n' then resume
+_IDLE = 4       # Between lines ('\r' seen, waiting for '\n')
+
+_CHECKSUM_LABEL = b'Checksum'
+
+
+class Frame:
+    """
+    One VE.Direct text block as fixed-size field records.
+
+    Field i has its label in label[i*LABEL_MAX : i*LABEL_MAX+label_len[i]]
+    and its value in value[i*VALUE_MAX : i*VALUE_MAX+value_len[i]].
+    """
+
+    def __init__(self, max_fields=MAX_FIELDS):
+        self.max_fields = max_fields
+        self.n = 0
+        # One spare label slot so the label after the last field can still
+        # be checked for "Checksum"
+        self.label = bytearray((max_fields + 1) * LABEL_MAX)
+        self.label_len = bytearray(max_fields + 1)
+        self.value = bytearray(max_fields * VALUE_MAX)
+        self.value_len = bytearray(max_fields)
+
+    def find(self, label):
+        """
+        Return the index of the field with this label, or -1.
+
+        Args:
+            label: bytes, e.g. b'SOC'
+        """
+        n = len(label)
+        buf = self.label
+        lens = self.label_len
+        for i in range(self.n):
+            if lens[i] != n:
+                continue
+            base = i * LABEL_MAX
+            for j in range(n):
+                if buf[base + j] != label[j]:
+                    break
+            else:
+                return i
+        return -1
+
+    def int_at(self, i, default=None):
+        """Parse field i's value as a signed decimal int (no allocation)."""
+        buf = self.value
+        pos = i * VALUE_MAX
+        end = pos + self.value_len[i]
+        if pos == end:
+            return default
+        neg = buf[pos] == 0x2D  # '-'
+        if neg or buf[pos] == 0x2B:  # '+'
+            pos += 1
+            if pos == end:
+                return default
+        v = 0
+        while pos < end:
+            d = buf[pos] - 0x30
+            if d < 0 or d > 9:
+                return default
+            v = v * 10 + d
+            pos += 1
+        return -v if neg else v
+
+    def get_int(self, label, default=None):
+        """Value of the labelled field as int, or default if absent/not numeric."""
+        i = self.find(label)
+        return default if i < 0 else self.int_at(i, default)
+
+    def get_bytes(self, label, default=None):
+        """Value of the labelled field as bytes (allocates), or default."""
+        i = self.find(label)
+        if i < 0:
+            return default
+        base = i * VALUE_MAX
+        return bytes(self.value[base:base + self.value_len[i]])
+
+    def label_at(self, i):
+        """Label of field i as bytes (allocates)."""
+        base = i * LABEL_MAX
+        return bytes(self.label[base:base + self.label_len[i]])
+
+    def value_at(self, i):
+        """Value of field i as bytes (allocates)."""
+        base = i * VALUE_MAX
+        return bytes(self.value[base:base + self.value_len[i]])
+
+
+class VEDirectParser:
+    """
+    Incremental VE.Direct text-protocol parser.
+
+    feed() accepts any chunking of the byte stream. When a block's
+    checksum validates, the filled frame is swapped with the ready frame
+    (no copying) and becomes parser.frame; blocks that fail the checksum
+    or overflow the field limits are dropped and counted.
+    """
+
+    def __init__(self, on_frame=None, max_fields=MAX_FIELDS, on_hex=None):
+        """
+        Args:
+            on_frame: Optional callback(frame) for each valid frame
+            max_fields: Fields per block (a BMV sends up to ~20 per block)
+            on_hex: Optional callback(buf, n) for each hex message; buf[:n]
+                    is the message from ':' up to and including '\n'
+        """
+        self.on_frame = on_frame
+        self.on_hex = on_hex
+        self._hex = bytearray(HEX_MAX)
+        self._hex_len = 0
+        self.frame = Frame(max_fields)   # Last valid frame
+        self._work = Frame(max_fields)   # Frame being filled
+        self._state = _IDLE
+        self._resume = _IDLE  # State to return to after a hex message
+        self._sum = 0
+        self._len = 0        # Bytes in the current label/value
+        self._bad = False    # Current block overflowed
+        self._synced = False  # First block after start-up is usually partial
+
+        self.frames = 0
+        self.checksum_errors = 0
+        self.overflows = 0
+        self.hex_messages = 0
+
+    def reset(self):
+        """Drop any partial block (e.g. after a UART error)."""
+        self._state = _IDLE
+        self._synced = False
+        self._sum = 0
+        self._len = 0
+        self._bad = False
+        self._work.n = 0
+
+    def _end_block(self, ok):
+        work = self._work
+        if ok and not self._bad and work.n:
+            self._work = self.frame
+            self.frame = work
+            self.frames += 1
+            if self.on_frame:
+                self.on_frame(work)
+            done = 1
+        else:
+            if not ok and self._synced:
+                self.checksum_errors += 1
+            done = 0
+        self._synced = True
+        self._work.n = 0
+        self._sum = 0
+        self._bad = False
+        return done
+
+    def _is_checksum_label(self):
+        work = self._work
+        i = work.n
+        if self._len != 8:
+            return False
+        base = i * LABEL_MAX
+        label = work.label
+        for j in range(8):
+            if label[base + j] != _CHECKSUM_LABEL[j]:
+                return False
+        return True
+
+    def feed(self, data, n=-1):
+        """
+        Parse bytes.
+
+        Args:
+            data: bytes/bytearray/memoryview
+            n: Number of bytes of data to use (default: all)
+
+        Returns:
+            Number of valid frames completed by this chunk
+        """
+        if n < 0:
+            n = len(data)
+        done = 0
+        state = self._state
+        total = self._sum
+        length = self._len
+        work = self._work
+        for k in range(n):
+            c = data[k]
+            if state == _CHECKSUM:
+                total = (total + c) & 0xFF
+                self._sum = total
+                done += self._end_block(total == 0)
+                work = self._work
+                total = 0
+                state = _IDLE
+                continue
+            if state == _HEX:
+                hex_len = self._hex_len
+                if hex_len < HEX_MAX:
+                    self._hex[hex_len] = c
+                self._hex_len = hex_len + 1
+                if c == 0x0A:
+                    self.hex_messages += 1
+                    state = self._resume
+                    if self.on_hex and hex_len < HEX_MAX:
+                        self.on_hex(self._hex, hex_len + 1)
+                continue
+            if c == 0x3A:
+                # ':' starts a hex message, which may interrupt a text line
+                self._resume = state
+                state = _HEX
+                self._hex[0] = c
+                self._hex_len = 1
+                continue
+            total += c
+            if c == 0x0A:
+                state = _LABEL
+                length = 0
+            elif c == 0x0D:
+                if state == _VALUE:
+                    work.value_len[work.n] = length
+                    work.n += 1
+                state = _IDLE
+            elif state == _LABEL:
+                if c == 0x09:
+                    self._len = length
+                    if self._is_checksum_label():
+                        state = _CHECKSUM
+                    elif work.n >= work.max_fields:
+                        self._bad = True
+                        self.overflows += 1
+                        state = _IDLE
+                    else:
+                        work.label_len[work.n] = length
+                        state = _VALUE
+                    length = 0
+                elif length < LABEL_MAX:
+                    work.label[work.n * LABEL_MAX + length] = c
+                    length += 1
+                else:
+                    self._bad = True
+            elif state == _VALUE:
+                if length < VALUE_MAX:
+                    work.value[work.n * VALUE_MAX + length] = c
+                    length += 1
+                else:
+                    self._bad = True
+        self._state = state
+        self._sum = total & 0xFF
+        self._len = length
+        return done
+
+    def get_status(self):
+        """Dictionary of parser counters for logging."""
+        return {
+            'frames': self.frames,
+            'checksum_errors': self.checksum_errors,
+            'overflows': self.overflows,
+            'hex_messages': self.hex_messages,
+        }
@@ -0,0 +1,375 @@
+# VE.Direct HEX Protocol Client
+# Encodes/decodes Victron VE.Direct HEX frames and polls registers at a
+# higher rate than the ~1 Hz text protocol, with several Get requests in
+# flight at once. Runs on MicroPython (Pico) and CPython.
+#
+# Frame format: ':' <command nibble> <data bytes as hex pairs> <checksum> '\n'
+# All bytes (command, data, checksum) sum to 0x55 modulo 256. Multi-byte
+# values are little-endian. A Get is ":7" <register id LE> <flags>; the
+# reply repeats id and flags and appends the value.
+#
+# The device keeps sending text blocks while HEX traffic runs. Feed the
+# UART into vedirect.VEDirectParser with on_hex=client.handle_frame so
+# both protocols share one port.
+#
+# Example (Pico):
+#     from vedirect import VEDirectParser
+#     from vedirect_hex import HexClient, REG_CURRENT_HIRES, REG_MAIN_VOLTAGE
+#
+#     client = HexClient(victron_uart)
+#     CURRENT = client.add_poll(REG_CURRENT_HIRES, 100, signed=True)  # 10 Hz, mA
+#     VOLTAGE = client.add_poll(REG_MAIN_VOLTAGE, 250)                 # 4 Hz, 10 mV
+#     parser = VEDirectParser(on_hex=client.handle_frame)
+#     while True:
+#         n = victron_uart.readinto(buf)
+#         if n:
+#             parser.feed(buf, n)
+#         client.service()
+#         if client.fresh[CURRENT]:
+#             client.fresh[CURRENT] = 0
+#             send_current(client.values[CURRENT])
+
+import time
+from array import array
+
+# Commands (host -> device)
+CMD_PING = 0x1
+CMD_APP_VERSION = 0x3
+CMD_PRODUCT_ID = 0x4
+CMD_RESTART = 0x6
+CMD_GET = 0x7
+CMD_SET = 0x8
+
+# Responses (device -> host)
+RESP_DONE = 0x1
+RESP_UNKNOWN = 0x3
+RESP_ERROR = 0x4
+RESP_PING = 0x5
+RESP_GET = 0x7
+RESP_SET = 0x8
+RESP_ASYNC = 0xA
+
+# Response flags
+FLAG_UNKNOWN_ID = 0x01
+FLAG_NOT_SUPPORTED = 0x02
+FLAG_PARAMETER_ERROR = 0x04
+
+# Common registers (BMV-7xx / SmartShunt)
+REG_MAIN_VOLTAGE = 0xED8D   # un16, 0.01 V
+REG_CURRENT = 0xED8F        # sn16, 0.1 A
+REG_CURRENT_HIRES = 0xED8C  # sn32, 0.001 A
+REG_SOC = 0x0FFF            # un16, 0.01 %
+REG_BATTERY_TEMP = 0xEDEC   # un16, 0.01 K
+
+FRAME_MAX = 64  # Longest frame handled (': 7 id id flags + 32 bytes value + cs)
+
+_HEX = b'0123456789ABCDEF'
+
+
+def _nibble(c):
+    if 0x30 <= c <= 0x39:
+        return c - 0x30
+    if 0x41 <= c <= 0x46:
+        return c - 0x37
+    if 0x61 <= c <= 0x66:
+        return c - 0x57
+    return -1
+
+
+def encode_into(buf, cmd, data, n=-1):
+    """
+    Encode a frame into buf.
+
+    Args:
+        buf: bytearray with room for 5 + 2 * n bytes
+        cmd: Command nibble (0-15)
+        data: Data bytes
+        n: Number of data bytes to use (default: all)
+
+    Returns:
+        Frame length in bytes (including ':' and '\\n')
+    """
+    if n < 0:
+        n = len(data)
+    buf[0] = 0x3A  # ':'
+    buf[1] = _HEX[cmd]
+    total = cmd
+    pos = 2
+    for i in range(n):
+        b = data[i]
+        total += b
+        buf[pos] = _HEX[b >> 4]
+        buf[pos + 1] = _HEX[b & 0x0F]
+        pos += 2
+    ck = (0x55 - total) & 0xFF
+    buf[pos] = _HEX[ck >> 4]
+    buf[pos + 1] = _HEX[ck & 0x0F]
+    buf[pos + 2] = 0x0A
+    return pos + 3
+
+
+def encode_frame(cmd, data=b''):
+    """Encode a frame and return it as bytes, e.g. encode_frame(CMD_PING) == b':154\\n'."""
+    buf = bytearray(5 + 2 * len(data))
+    return bytes(buf[:encode_into(buf, cmd, data)])
+
+
+def decode_into(line, n, out):
+    """
+    Decode a frame into out.
+
+    Args:
+        line: Frame bytes starting with ':' (trailing '\\r'/'\\n' ignored)
+        n: Number of bytes of line to use
+        out: bytearray receiving the data bytes (without command/checksum)
+
+    Returns:
+        (command, data length), or (-1, 0) if malformed or checksum fails
+    """
+    while n and (line[n - 1] == 0x0A or line[n - 1] == 0x0D):
+        n -= 1
+    # ':' + command nibble + pairs of hex digits (data + checksum)
+    if n < 4 or line[0] != 0x3A or (n - 2) % 2:
+        return -1, 0
+    cmd = _nibble(line[1])
+    if cmd < 0:
+        return -1, 0
+    total = cmd
+    count = (n - 2) // 2  # Data bytes + checksum byte
+    if count - 1 > len(out):
+        return -1, 0
+    pos = 2
+    for i in range(count):
+        hi = _nibble(line[pos])
+        lo = _nibble(line[pos + 1])
+        if hi < 0 or lo < 0:
+            return -1, 0
+        b = (hi << 4) | lo
+        total += b
+        if i < count - 1:
+            out[i] = b
+        pos += 2
+    if total & 0xFF != 0x55:
+        return -1, 0
+    return cmd, count - 1
+
+
+def get_le(data, start, size, signed=False):
+    """Read a little-endian integer of size bytes from data[start:]."""
+    v = 0
+    for i in range(size - 1, -1, -1):
+        v = (v << 8) | data[start + i]
+    if signed and v & (1 << (8 * size - 1)):
+        v -= 1 << (8 * size)
+    return v
+
+
+def put_le(data, start, value, size):
+    """Write a little-endian integer of size bytes into data[start:]."""
+    for i in range(size):
+        data[start + i] = (value >> (8 * i)) & 0xFF
+
+
+def encode_get(reg, flags=0):
+    """Get-register request frame (bytes)."""
+    return encode_frame(CMD_GET, bytes((reg & 0xFF, reg >> 8, flags)))
+
+
+def encode_set(reg, value, size, flags=0):
+    """Set-register request frame (bytes) for a size-byte value."""
+    data = bytearray(3 + size)
+    data[0] = reg & 0xFF
+    data[1] = reg >> 8
+    data[2] = flags
+    put_le(data, 3, value, size)
+    return encode_frame(CMD_SET, data)
+
+
+class HexClient:
+    """
+    Pipelined VE.Direct HEX register poller.
+
+    Registers added with add_poll() get a slot; service() sends Get
+    requests for due slots while fewer than `pipeline` are in flight and
+    expires requests that got no reply within timeout_ms. Replies (and
+    async messages) for polled registers update values[slot], set
+    fresh[slot] = 1 and record the time in updated[slot].
+    """
+
+    def __init__(self, uart, pipeline=2, timeout_ms=500):
+        """
+        Args:
+            uart: machine.UART connected to the VE.Direct port
+            pipeline: Get requests allowed in flight at once
+            timeout_ms: Drop a request that got no reply after this long
+        """
+        self.uart = uart
+        self.pipeline = pipeline
+        self.timeout_ms = timeout_ms
+
+        self.regs = array('H')
+        self.signed = bytearray()
+        self.interval = array('i')
+        self.values = array('i')
+        self.updated = array('i')
+        self.fresh = bytearray()
+        self._due = array('i')
+        self._sent = array('i')
+        self._in_flight = bytearray()
+        self._flying = 0
+        self._next = 0  # Round-robin start for fairness between due slots
+
+        self._tx = bytearray(FRAME_MAX)
+        self._data = bytearray(FRAME_MAX // 2)
+        self._req = bytearray(8)
+
+        self.requests = 0
+        self.responses = 0
+        self.timeouts = 0
+        self.errors = 0
+        self.bad_frames = 0
+        self.async_updates = 0
+        self.last_set_ok = None
+
+    def add_poll(self, reg, interval_ms, signed=False):
+        """
+        Poll a register every interval_ms.
+
+        Returns:
+            Slot index for values/fresh/updated
+        """
+        now = time.ticks_ms()
+        self.regs.append(reg)
+        self.signed.append(1 if signed else 0)
+        self.interval.append(interval_ms)
+        self.values.append(0)
+        self.updated.append(now)
+        self.fresh.append(0)
+        self._due.append(now)
+        self._sent.append(now)
+        self._in_flight.append(0)
+        return len(self.regs) - 1
+
+    def slot(self, reg):
+        """Slot index of a polled register, or -1."""
+        for i in range(len(self.regs)):
+            if self.regs[i] == reg:
+                return i
+        return -1
+
+    def _send(self, cmd, n):
+        length = encode_into(self._tx, cmd, self._req, n)
+        self.uart.write(memoryview(self._tx)[:length])
+
+    def ping(self):
+        """Send a ping (device answers with its firmware version)."""
+        self._send(CMD_PING, 0)
+
+    def get(self, reg, flags=0):
+        """Send a one-off Get request (reply updates the slot if polled)."""
+        req = self._req
+        req[0] = reg & 0xFF
+        req[1] = reg >> 8
+        req[2] = flags
+        self._send(CMD_GET, 3)
+        self.requests += 1
+
+    def set(self, reg, value, size, flags=0):
+        """Send a Set request for a size-byte value (reply sets last_set_ok)."""
+        req = self._req
+        req[0] = reg & 0xFF
+        req[1] = reg >> 8
+        req[2] = flags
+        put_le(req, 3, value, size)
+        self.last_set_ok = None
+        self._send(CMD_SET, 3 + size)
+
+    def service(self, now=None):
+        """
+        Expire timed-out requests and send due polls. Call often.
+
+        Returns:
+            Number of requests sent
+        """
+        if now is None:
+            now = time.ticks_ms()
+        count = len(self.regs)
+        in_flight = self._in_flight
+        for i in range(count):
+            if in_flight[i] and time.ticks_diff(now, self._sent[i]) > self.timeout_ms:
+                in_flight[i] = 0
+                self._flying -= 1
+                self.timeouts += 1
+        sent = 0
+        start = self._next
+        for k in range(count):
+            if self._flying >= self.pipeline:
+                break
+            i = (start + k) % count
+            if in_flight[i] or time.ticks_diff(now, self._due[i]) < 0:
+                continue
+            self.get(self.regs[i])
+            in_flight[i] = 1
+            self._flying += 1
+            self._sent[i] = now
+            self._due[i] = time.ticks_add(now, self.interval[i])
+            self._next = (i + 1) % count
+            sent += 1
+        return sent
+
+    def handle_frame(self, line, n=-1):
+        """
+        Process one received hex frame (e.g. VEDirectParser on_hex callback).
+
+        Returns:
+            Slot index updated, or -1
+        """
+        if n < 0:
+            n = len(line)
+        data = self._data
+        cmd, size = decode_into(line, n, data)
+        if cmd < 0:
+            self.bad_frames += 1
+            return -1
+        if cmd == RESP_SET:
+            self.last_set_ok = size >= 3 and data[2] == 0
+            if not self.last_set_ok:
+                self.errors += 1
+            return -1
+        if cmd != RESP_GET and cmd != RESP_ASYNC:
+            if cmd == RESP_ERROR or cmd == RESP_UNKNOWN:
+                self.errors += 1
+            return -1
+        if size < 3:
+            self.bad_frames += 1
+            return -1
+        reg = data[0] | (data[1] << 8)
+        i = self.slot(reg)
+        if i < 0:
+            return -1
+        if cmd == RESP_GET:
+            self.responses += 1
+            if self._in_flight[i]:
+                self._in_flight[i] = 0
+                self._flying -= 1
+        else:
+            self.async_updates += 1
+        if data[2] or size == 3:
+            self.errors += 1  # Unknown id / not supported / parameter error
+            return -1
+        self.values[i] = get_le(data, 3, size - 3, self.signed[i])
+        self.updated[i] = time.ticks_ms()
+        self.fresh[i] = 1
+        return i
+
+    def get_status(self):
+        """Dictionary of client counters for logging."""
+        return {
+            'requests': self.requests,
+            'responses': self.responses,
+            'timeouts': self.timeouts,
+            'errors': self.errors,
+            'bad_frames': self.bad_frames,
+            'async': self.async_updates,
+            'in_flight': self._flying,
+        }